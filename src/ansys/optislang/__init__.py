@@ -27,17 +27,26 @@ optislang
 """
 
 
-from importlib import metadata as _metadata
 from pkgutil import extend_path as _extend_path
+from typing import Any as _Any
 
 # Allow third-party distributions to provide subpackages under ansys.optislang.
 __path__ = _extend_path(__path__, __name__)
 
 _DISTRIBUTION_NAME = "ansys-optislang-core"
 
-try:
-    __version__ = _metadata.version(_DISTRIBUTION_NAME)
-except _metadata.PackageNotFoundError:
-    __version__ = "0.0.dev0"
-
 __all__ = ["core", "parametric"]
+
+
+def __getattr__(name: str) -> _Any:
+    """Read the version of the distribution on first access, the metadata are slow to load."""
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import metadata
+
+    try:
+        version = metadata.version(_DISTRIBUTION_NAME)
+    except metadata.PackageNotFoundError:
+        version = "0.0.dev0"
+    globals()["__version__"] = version
+    return version
@@ -26,12 +26,10 @@ optiSLang.
 core
 """
 
-import importlib.metadata
-import importlib.util
+import importlib
 import os
-import sys
+from typing import TYPE_CHECKING, Any, List
 
-from ansys.optislang import __version__
 from ansys.optislang.core.logging import OslLogger
 
 LOG = OslLogger(loglevel="ERROR", log_to_file=False, log_to_stdout=True)
@@ -40,20 +38,51 @@ LOG.logger.debug("Loaded logging module as LOG")
 # First supported version of optiSLang: 2023R1
 FIRST_SUPPORTED_VERSION = 231
 
-from ansys.optislang.core.optislang import Optislang
-from ansys.optislang.core.osl_process import OslServerProcess, ServerNotification
-from ansys.optislang.core.placeholder_types import PlaceholderInfo, PlaceholderType, UserLevel
+if TYPE_CHECKING:
+    from ansys.optislang.core.optislang import Optislang
+    from ansys.optislang.core.osl_process import OslServerProcess, ServerNotification
+    from ansys.optislang.core.placeholder_types import PlaceholderInfo, PlaceholderType, UserLevel
+
+# Public classes are imported on first access, so that importing the package does not load
+# the whole TCP stack, e.g. for tools using only the ``utils`` module.
+_LAZY_ATTRIBUTES = {
+    "__version__": "ansys.optislang",
+    "Optislang": "ansys.optislang.core.optislang",
+    "OslServerProcess": "ansys.optislang.core.osl_process",
+    "ServerNotification": "ansys.optislang.core.osl_process",
+    "PlaceholderInfo": "ansys.optislang.core.placeholder_types",
+    "PlaceholderType": "ansys.optislang.core.placeholder_types",
+    "UserLevel": "ansys.optislang.core.placeholder_types",
+}
+
+__all__ = ["FIRST_SUPPORTED_VERSION", "LOG", *_LAZY_ATTRIBUTES]
 
-# Provide examples directory path
 EXAMPLES_MODULE = "ansys.optislang.core.examples"
-if spec := importlib.util.find_spec(EXAMPLES_MODULE):
-    if spec.origin:
-        os.environ["OSL_EXAMPLES"] = os.path.dirname(spec.origin)
+
+
+def _set_examples_path() -> None:
+    """Provide path to the examples directory by the ``OSL_EXAMPLES`` environment variable.
+
+    The path is set when a public class of the package is accessed for the first time.
+    """
+    examples_path = os.path.join(os.path.dirname(__file__), "examples")
+    if os.path.isfile(os.path.join(examples_path, "__init__.py")):
+        os.environ["OSL_EXAMPLES"] = examples_path
     else:
-        LOG.logger.warning(
-            f"Could not set path to examples. Missing spec for module {EXAMPLES_MODULE}."
-        )
-else:
-    LOG.logger.warning(
-        f"Could not set path to examples. Missing origin for module {EXAMPLES_MODULE}."
-    )
+        LOG.logger.warning(f"Could not set path to examples. Missing module {EXAMPLES_MODULE}.")
+
+
+def __getattr__(name: str) -> Any:
+    """Import public classes on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    _set_examples_path()
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List attributes including the classes not imported yet."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -23,6 +23,7 @@
 """Contains utility functions for encoding and decoding text."""
 
 import sys
+from typing import Union
 
 from ansys.optislang.core import utils
 
@@ -91,14 +92,14 @@ def force_bytes(text: str, encoding="ascii") -> bytes:
         return text.encode(encoding, "ignore")
 
 
-def force_text(data: bytes, encoding="utf-8") -> str:
+def force_text(data: Union[bytes, bytearray], encoding="utf-8") -> str:
     """Decode bytes to text ignoring all errors.
 
     Special characters are ignored.
 
     Parameters
     ----------
-    data : bytes
+    data : Union[bytes, bytearray]
         Bytes which is supposed to be decoded.
     encoding :
         The encoding with which to decode the bytes.
@@ -0,0 +1,309 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Contains cache of evaluation results keyed by parameter values."""
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Any, Iterable, Mapping, Optional, Tuple, Union
+
+from ansys.optislang.core.json_codec import JsonCodec, get_json_codec
+
+_DesignParameters = Union[Mapping[str, Any], Iterable[Tuple[str, Any]]]
+
+
+class EvaluationCache:
+    """Stores results of design evaluations keyed by the parameter values.
+
+    Results are stored in a SQLite database, either in memory or in a local file, which
+    persists between sessions. If the number of stored results exceeds ``max_entries``,
+    the least recently used results are evicted.
+
+    Parameter values are canonicalized before lookup, the order of parameters does not
+    matter and integer and float values are equal. If ``tolerance`` is greater than zero,
+    numeric values are snapped to a grid with the ``tolerance`` spacing, so values that
+    differ by less than the ``tolerance`` usually share a result. Values falling on different
+    sides of a grid boundary are not matched.
+
+    Results are stored separately for each namespace, so a single cache can serve several
+    evaluation paths. Results must be serializable to JSON. The cache does not know about
+    changes of the evaluated workflow, results which are not valid anymore must be removed
+    by the :py:meth:`clear` method.
+
+    Parameters
+    ----------
+    path : Optional[Union[str, Path]], optional
+        Path to the database file. If ``None``, results are stored in memory only.
+        Defaults to ``None``.
+    max_entries : Optional[int], optional
+        Maximum number of stored results. If ``None``, the number of results is not limited.
+        Defaults to ``10000``.
+    tolerance : float, optional
+        Absolute tolerance used for matching numeric parameter values. Defaults to ``0``,
+        which matches only equal values.
+    json_codec : Union[str, JsonCodec, None], optional
+        Codec used to serialize stored results. If ``None``, the default codec is used.
+        Defaults to ``None``.
+
+    Raises
+    ------
+    ValueError
+        Raised when the ``max_entries`` is not greater than zero or the ``tolerance`` is
+        negative.
+
+    Examples
+    --------
+    Cache results of evaluated designs in a file.
+
+    >>> from ansys.optislang.core import Optislang
+    >>> from ansys.optislang.core.evaluation_cache import EvaluationCache
+    >>> osl = Optislang(project_path="calculator.opf")
+    >>> root_system = osl.application.project.root_system
+    >>> cache = root_system.enable_evaluation_cache(EvaluationCache("results.sqlite"))
+    >>> design = root_system.get_reference_design()
+    >>> result = root_system.evaluate_design(design)
+    >>> result = root_system.evaluate_design(design)
+    >>> print(cache.hits, cache.misses)
+    1 1
+    >>> osl.dispose()
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_entries: Optional[int] = 10000,
+        tolerance: float = 0,
+        json_codec: Union[str, JsonCodec, None] = None,
+    ) -> None:
+        """Create a new instance of the ``EvaluationCache`` class."""
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError(f"Maximum number of entries must be positive, got {max_entries}.")
+        if tolerance < 0:
+            raise ValueError(f"Tolerance must not be negative, got {tolerance}.")
+        self.__path = Path(path) if path is not None else None
+        self.__max_entries = max_entries
+        self.__tolerance = tolerance
+        self.__json_codec = get_json_codec(json_codec)
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__connection = sqlite3.connect(
+            str(self.__path) if self.__path is not None else ":memory:",
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+            "last_used INTEGER NOT NULL, PRIMARY KEY (namespace, key))"
+        )
+        self.__connection.execute(
+            "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)"
+        )
+        self.__clock = self.__connection.execute(
+            "SELECT COALESCE(MAX(last_used), 0) FROM results"
+        ).fetchone()[0]
+
+    def __len__(self) -> int:
+        """Get number of stored results."""
+        with self.__lock:
+            return self.__connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def __repr__(self) -> str:
+        """Return printable representation of the cache."""
+        return (
+            f"{self.__class__.__name__}(path={self.__path}, max_entries={self.__max_entries}, "
+            f"tolerance={self.__tolerance})"
+        )
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups that found a stored result.
+
+        Returns
+        -------
+        int
+            Number of hits.
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups that did not find a stored result.
+
+        Returns
+        -------
+        int
+            Number of misses.
+        """
+        return self.__misses
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        """Maximum number of stored results.
+
+        Returns
+        -------
+        Optional[int]
+            Maximum number of results, ``None`` if not limited.
+        """
+        return self.__max_entries
+
+    @property
+    def path(self) -> Optional[Path]:
+        """Path to the database file.
+
+        Returns
+        -------
+        Optional[Path]
+            Path to the database file, ``None`` if results are stored in memory.
+        """
+        return self.__path
+
+    @property
+    def tolerance(self) -> float:
+        """Absolute tolerance used for matching numeric parameter values.
+
+        Returns
+        -------
+        float
+            Tolerance.
+        """
+        return self.__tolerance
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Remove stored results and reset the hit and miss counters.
+
+        Parameters
+        ----------
+        namespace : Optional[str], optional
+            Namespace of removed results. If ``None``, all results are removed.
+            Defaults to ``None``.
+        """
+        with self.__lock:
+            if namespace is None:
+                self.__connection.execute("DELETE FROM results")
+            else:
+                self.__connection.execute("DELETE FROM results WHERE namespace = ?", (namespace,))
+            self.__hits = 0
+            self.__misses = 0
+
+    def close(self) -> None:
+        """Close the database, the cache cannot be used afterwards."""
+        with self.__lock:
+            self.__connection.close()
+
+    def get(self, parameters: _DesignParameters, namespace: str = "") -> Optional[Any]:
+        """Get stored result of the design with given parameters.
+
+        Parameters
+        ----------
+        parameters : Union[Mapping[str, Any], Iterable[Tuple[str, Any]]]
+            Parameter values of the design, either a mapping or pairs of names and values.
+        namespace : str, optional
+            Namespace of the result. Defaults to ``""``.
+
+        Returns
+        -------
+        Optional[Any]
+            Stored result, ``None`` if the result is not stored.
+        """
+        key = self.create_key(parameters)
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT value FROM results WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            if row is None:
+                self.__misses += 1
+                return None
+            self.__hits += 1
+            self.__clock += 1
+            self.__connection.execute(
+                "UPDATE results SET last_used = ? WHERE namespace = ? AND key = ?",
+                (self.__clock, namespace, key),
+            )
+        return self.__json_codec.loads(row[0])
+
+    def put(self, parameters: _DesignParameters, value: Any, namespace: str = "") -> None:
+        """Store result of the design with given parameters.
+
+        Parameters
+        ----------
+        parameters : Union[Mapping[str, Any], Iterable[Tuple[str, Any]]]
+            Parameter values of the design, either a mapping or pairs of names and values.
+        value : Any
+            Result of the design, must be serializable to JSON.
+        namespace : str, optional
+            Namespace of the result. Defaults to ``""``.
+        """
+        key = self.create_key(parameters)
+        data = self.__json_codec.dumps(value)
+        with self.__lock:
+            self.__clock += 1
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO results (namespace, key, value, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                (namespace, key, data, self.__clock),
+            )
+            if self.__max_entries is not None:
+                self.__connection.execute(
+                    "DELETE FROM results WHERE last_used <= ("
+                    "SELECT last_used FROM results ORDER BY last_used DESC LIMIT 1 OFFSET ?)",
+                    (self.__max_entries,),
+                )
+
+    def create_key(self, parameters: _DesignParameters) -> str:
+        """Create canonical key of the design with given parameters.
+
+        Parameters
+        ----------
+        parameters : Union[Mapping[str, Any], Iterable[Tuple[str, Any]]]
+            Parameter values of the design, either a mapping or pairs of names and values.
+
+        Returns
+        -------
+        str
+            Key independent of the parameters order.
+        """
+        items = parameters.items() if isinstance(parameters, Mapping) else parameters
+        # Keys stored in persistent caches must not depend on the configured codec.
+        return json.dumps(
+            sorted([name, self.__canonicalize_value(value)] for name, value in items),
+            sort_keys=True,
+            separators=(",", ":"),
+            allow_nan=True,
+        )
+
+    def __canonicalize_value(self, value: Any) -> Any:
+        """Convert numeric values to a form shared by all values matching each other."""
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return value
+        if not math.isfinite(value):
+            return str(value)
+        if self.__tolerance:
+            return round(value / self.__tolerance)
+        # integral values and floats with the same value share the key
+        return repr(float(value))
@@ -0,0 +1,417 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Contains farm of optiSLang servers evaluating designs in parallel."""
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future
+import logging
+import os
+from pathlib import Path
+import queue
+import shutil
+import tempfile
+import threading
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ansys.optislang.core.errors import (
+    OslCommunicationError,
+    OslDisposedError,
+    OslServerStartError,
+)
+from ansys.optislang.core.optislang import Optislang
+from ansys.optislang.core.project_parametric import Design
+
+# errors after which the optiSLang instance of a worker is not usable anymore
+_WORKER_ERRORS = (
+    OslCommunicationError,
+    OslDisposedError,
+    OslServerStartError,
+    ConnectionError,
+    TimeoutError,
+)
+
+_WorkItem = Tuple[Design, "Future[Design]"]
+
+
+class EvaluationFarm:
+    """Evaluates designs in parallel by multiple optiSLang servers.
+
+    Each worker of the farm starts its own optiSLang server with a copy of the project and
+    evaluates designs by the ``evaluate_designs`` method of the project root system. Designs
+    wait in a queue shared by all workers, an idle worker takes the next designs, so that
+    faster workers evaluate more designs. If the server of a worker fails, the designs being
+    evaluated are queued again and the worker starts a new server, at most ``max_restarts``
+    times.
+
+    Parameters
+    ----------
+    project_path : Optional[Union[str, Path]], optional
+        Path to the project evaluating the designs. Must be given unless
+        ``optislang_factory`` is used. Defaults to ``None``.
+    workers : Optional[int], optional
+        Number of workers. If ``None``, the number of CPUs is used. Defaults to ``None``.
+    working_dir : Optional[Union[str, Path]], optional
+        Directory containing copies of the project, one subdirectory for each worker.
+        If ``None``, a temporary directory is created and removed by the ``dispose`` method.
+        Defaults to ``None``.
+    copy_project : bool, optional
+        Determines whether each worker opens its own copy of the project file.
+        The project working directory is not copied. Defaults to ``True``.
+    max_restarts : int, optional
+        Maximum number of restarts of the server of each worker. Defaults to ``3``.
+    chunk_size : int, optional
+        Maximum number of designs evaluated by a worker in a single request. Larger chunks
+        save round trips, smaller chunks balance the load better. Defaults to ``1``.
+    optislang_factory : Optional[Callable[[int, Optional[Path]], Optislang]], optional
+        Function creating the optiSLang instance of a worker from the worker index and path
+        to the project. If ``None``, the ``Optislang`` class is used. Defaults to ``None``.
+    **kwargs
+        Additional keyword arguments passed to the ``Optislang`` class, e.g. ``port_range``
+        or ``communication_channel``.
+
+    Raises
+    ------
+    ValueError
+        Raised when an argument is invalid.
+    OslServerStartError
+        Raised when no server could be started.
+
+    Examples
+    --------
+    Evaluate designs by four optiSLang servers.
+
+    >>> from ansys.optislang.core.evaluation_farm import EvaluationFarm
+    >>> from ansys.optislang.core.project_parametric import Design
+    >>> designs = [Design(parameters={"X1": x}) for x in range(100)]
+    >>> with EvaluationFarm("calculator.opf", workers=4) as farm:
+    ...     results = list(farm.evaluate_designs(designs))
+    """
+
+    def __init__(
+        self,
+        project_path: Optional[Union[str, Path]] = None,
+        workers: Optional[int] = None,
+        working_dir: Optional[Union[str, Path]] = None,
+        copy_project: bool = True,
+        max_restarts: int = 3,
+        chunk_size: int = 1,
+        optislang_factory: Optional[Callable[[int, Optional[Path]], Optislang]] = None,
+        **kwargs,
+    ) -> None:
+        """Create a new instance of the ``EvaluationFarm`` class."""
+        if project_path is None and optislang_factory is None:
+            raise ValueError("Either project path or optiSLang factory must be given.")
+        workers = workers if workers is not None else os.cpu_count() or 1
+        if workers <= 0:
+            raise ValueError(f"Number of workers must be positive, got {workers}.")
+        if max_restarts < 0:
+            raise ValueError(f"Maximum number of restarts must not be negative: {max_restarts}.")
+        if chunk_size <= 0:
+            raise ValueError(f"Chunk size must be positive, got {chunk_size}.")
+        self.__project_path = Path(project_path) if project_path is not None else None
+        self.__copy_project = copy_project and self.__project_path is not None
+        self.__remove_working_dir = working_dir is None and self.__copy_project
+        if working_dir is not None:
+            self.__working_dir: Optional[Path] = Path(working_dir)
+        elif self.__copy_project:
+            self.__working_dir = Path(tempfile.mkdtemp(prefix="pyoptislang_farm_"))
+        else:
+            self.__working_dir = None
+        self.__max_restarts = max_restarts
+        self.__chunk_size = chunk_size
+        self.__optislang_factory = optislang_factory
+        self.__kwargs = kwargs
+        self.__logger = logging.getLogger(__name__)
+
+        self.__queue: queue.Queue[Optional[_WorkItem]] = queue.Queue()
+        self.__lock = threading.Lock()
+        self.__disposed = False
+        self.__alive_workers = workers
+        self.__restarts = 0
+        self.__threads: List[threading.Thread] = []
+        started_events = []
+        for index in range(workers):
+            started = threading.Event()
+            thread = threading.Thread(
+                target=self.__run_worker,
+                args=(index, started),
+                name=f"PyOptiSLang.EvaluationFarm.Worker{index}",
+                daemon=True,
+            )
+            thread.start()
+            self.__threads.append(thread)
+            started_events.append(started)
+        for started in started_events:
+            started.wait()
+        if self.__alive_workers == 0:
+            self.dispose()
+            raise OslServerStartError("No optiSLang server of the evaluation farm was started.")
+
+    def __enter__(self) -> EvaluationFarm:
+        """Enter the context."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb) -> None:
+        """Exit the context and dispose the farm."""
+        self.dispose()
+
+    @property
+    def alive_workers(self) -> int:
+        """Number of workers able to evaluate designs.
+
+        Returns
+        -------
+        int
+            Number of workers which have not exceeded the maximum number of restarts.
+        """
+        return self.__alive_workers
+
+    @property
+    def restarts(self) -> int:
+        """Total number of server restarts of all workers.
+
+        Returns
+        -------
+        int
+            Number of restarts.
+        """
+        return self.__restarts
+
+    def dispose(self) -> None:
+        """Stop all workers, dispose their optiSLang instances and cancel queued designs."""
+        with self.__lock:
+            if self.__disposed:
+                return
+            self.__disposed = True
+        self.__fail_queued_designs(OslDisposedError("Evaluation farm was disposed."), cancel=True)
+        for _ in self.__threads:
+            self.__queue.put(None)
+        for thread in self.__threads:
+            thread.join()
+        if self.__remove_working_dir and self.__working_dir is not None:
+            shutil.rmtree(self.__working_dir, ignore_errors=True)
+
+    def evaluate_design(self, design: Design) -> Design:
+        """Evaluate a design by any of the servers.
+
+        Parameters
+        ----------
+        design : Design
+            Instance of the ``Design`` class with defined parameters.
+
+        Returns
+        -------
+        Design
+            Evaluated design.
+        """
+        return self.submit(design).result()
+
+    def evaluate_designs(
+        self, designs: Iterable[Design], max_pending: Optional[int] = None
+    ) -> Iterator[Design]:
+        """Evaluate designs by all servers and get results in order of the designs.
+
+        Parameters
+        ----------
+        designs : Iterable[Design]
+            Instances of the ``Design`` class with defined parameters.
+        max_pending : Optional[int], optional
+            Maximum number of designs submitted ahead of the consumed results. If ``None``,
+            twice the number of designs which can be evaluated at once is used.
+            Defaults to ``None``.
+
+        Returns
+        -------
+        Iterator[Design]
+            Evaluated designs in the order of given designs.
+        """
+        if max_pending is None:
+            max_pending = 2 * len(self.__threads) * self.__chunk_size
+        pending: Deque[Future[Design]] = deque()
+        try:
+            for design in designs:
+                pending.append(self.submit(design))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def submit(self, design: Design) -> Future[Design]:
+        """Queue a design for evaluation by the next idle server.
+
+        Parameters
+        ----------
+        design : Design
+            Instance of the ``Design`` class with defined parameters.
+
+        Returns
+        -------
+        Future[Design]
+            Future resolved with the evaluated design.
+
+        Raises
+        ------
+        OslDisposedError
+            Raised when the farm was already disposed.
+        RuntimeError
+            Raised when no worker is able to evaluate designs.
+        """
+        future: Future[Design] = Future()
+        with self.__lock:
+            if self.__disposed:
+                raise OslDisposedError("Cannot evaluate design, farm was already disposed.")
+            if self.__alive_workers == 0:
+                raise RuntimeError("No optiSLang server of the evaluation farm is running.")
+            self.__queue.put((design, future))
+        return future
+
+    def __run_worker(self, index: int, started: threading.Event) -> None:
+        """Start the optiSLang server of a worker and evaluate queued designs."""
+        optislang: Optional[Optislang] = None
+        restarts = 0
+        try:
+            while True:
+                if optislang is None:
+                    try:
+                        optislang = self.__start_optislang(index)
+                    except _WORKER_ERRORS as ex:
+                        self.__logger.warning(f"Worker {index} failed to start: {ex}")
+                        if not self.__restart(restarts):
+                            return
+                        restarts += 1
+                        continue
+                    started.set()
+                chunk = self.__get_chunk()
+                if chunk is None:
+                    return
+                if not chunk:
+                    continue
+                try:
+                    results = list(
+                        optislang.application.project.root_system.evaluate_designs(
+                            [design for design, _ in chunk], chunk_size=len(chunk)
+                        )
+                    )
+                except _WORKER_ERRORS as ex:
+                    self.__logger.warning(f"Worker {index} failed, designs are queued again: {ex}")
+                    for item in chunk:
+                        self.__queue.put(item)
+                    self.__dispose_optislang(optislang)
+                    optislang = None
+                    if not self.__restart(restarts):
+                        return
+                    restarts += 1
+                    continue
+                except Exception as ex:
+                    for _, future in chunk:
+                        future.set_exception(ex)
+                    continue
+                for (_, future), result in zip(chunk, results):
+                    future.set_result(result)
+        finally:
+            started.set()
+            if optislang is not None:
+                self.__dispose_optislang(optislang)
+
+    def __get_chunk(self) -> Optional[List[_WorkItem]]:
+        """Get designs to be evaluated, ``None`` if the worker is to be stopped."""
+        items = [self.__queue.get()]
+        while len(items) < self.__chunk_size and items[-1] is not None:
+            try:
+                items.append(self.__queue.get_nowait())
+            except queue.Empty:
+                break
+        stop = items[-1] is None
+        chunk = []
+        for item in items:
+            if item is None:
+                continue
+            # designs queued again after a failure are already running
+            if item[1].running() or item[1].set_running_or_notify_cancel():
+                chunk.append(item)
+        if stop:
+            if chunk:
+                self.__queue.put(None)
+                return chunk
+            return None
+        return chunk
+
+    def __restart(self, restarts: int) -> bool:
+        """Determine whether the worker may be restarted, update counters."""
+        with self.__lock:
+            if not self.__disposed and restarts < self.__max_restarts:
+                self.__restarts += 1
+                return True
+            self.__alive_workers -= 1
+            alive_workers = self.__alive_workers
+        if alive_workers == 0:
+            self.__fail_queued_designs(
+                RuntimeError("No optiSLang server of the evaluation farm is running.")
+            )
+        return False
+
+    def __fail_queued_designs(self, exception: BaseException, cancel: bool = False) -> None:
+        """Remove queued designs and set the exception, optionally cancel designs not running.
+
+        Designs queued again after a failure of their worker are running and cannot be
+        cancelled, the exception is set for them in any case.
+        """
+        while True:
+            try:
+                item = self.__queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is None:
+                continue
+            future = item[1]
+            if future.running():
+                future.set_exception(exception)
+            elif cancel:
+                future.cancel()
+            elif future.set_running_or_notify_cancel():
+                future.set_exception(exception)
+
+    def __start_optislang(self, index: int) -> Optislang:
+        """Start optiSLang instance of the worker with given index."""
+        project_path = self.__project_path
+        if self.__copy_project and project_path is not None and self.__working_dir is not None:
+            worker_dir = self.__working_dir / f"worker_{index}"
+            worker_dir.mkdir(parents=True, exist_ok=True)
+            project_copy = worker_dir / project_path.name
+            if not project_copy.exists():
+                shutil.copy2(project_path, project_copy)
+            project_path = project_copy
+        if self.__optislang_factory is not None:
+            return self.__optislang_factory(index, project_path)
+        return Optislang(project_path=project_path, **self.__kwargs)
+
+    def __dispose_optislang(self, optislang: Any) -> None:
+        """Dispose optiSLang instance of a worker, errors are only logged."""
+        try:
+            optislang.dispose()
+        except Exception as ex:
+            self.__logger.warning(f"Disposing optiSLang instance failed: {ex}")
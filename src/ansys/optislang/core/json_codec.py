@@ -0,0 +1,364 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Contains JSON codecs used for encoding of requests and decoding of server responses."""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import importlib.util
+import json
+from typing import Any, Dict, Optional, Tuple, Type, Union
+
+
+class JsonCodec(ABC):
+    """Base class for JSON codecs.
+
+    Codecs must produce and accept standard JSON documents. Encoded documents contain
+    non-ASCII characters as they are.
+    """
+
+    name: str = ""
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Determine whether the library required by the codec is installed.
+
+        Returns
+        -------
+        bool
+            ``True`` if the codec can be used; ``False`` otherwise.
+        """
+        return True
+
+    @abstractmethod
+    def dumps(self, obj: Any, sort_keys: bool = False) -> str:  # pragma: no cover
+        """Encode object to JSON string.
+
+        Parameters
+        ----------
+        obj : Any
+            Object to be encoded.
+        sort_keys : bool, optional
+            Whether the keys of dictionaries are sorted. Defaults to ``False``.
+
+        Returns
+        -------
+        str
+            JSON string.
+        """
+        pass
+
+    @abstractmethod
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:  # pragma: no cover
+        """Decode JSON document.
+
+        Parameters
+        ----------
+        data : Union[str, bytes, bytearray]
+            JSON document, either as string or UTF-8 encoded.
+
+        Returns
+        -------
+        Any
+            Decoded object.
+
+        Raises
+        ------
+        ValueError
+            Raised when the document is not a valid JSON document.
+        """
+        pass
+
+    def __repr__(self) -> str:
+        """Return printable representation of the codec."""
+        return f"{self.__class__.__name__}()"
+
+
+class StdlibJsonCodec(JsonCodec):
+    """JSON codec using the :py:mod:`json` module of the standard library."""
+
+    name = "json"
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> str:
+        """Encode object to JSON string.
+
+        Parameters
+        ----------
+        obj : Any
+            Object to be encoded.
+        sort_keys : bool, optional
+            Whether the keys of dictionaries are sorted. Defaults to ``False``.
+
+        Returns
+        -------
+        str
+            JSON string.
+        """
+        return json.dumps(obj, sort_keys=sort_keys, ensure_ascii=False)
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        """Decode JSON document.
+
+        Parameters
+        ----------
+        data : Union[str, bytes, bytearray]
+            JSON document, either as string or UTF-8 encoded.
+
+        Returns
+        -------
+        Any
+            Decoded object.
+
+        Raises
+        ------
+        ValueError
+            Raised when the document is not a valid JSON document.
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec using the `orjson <https://github.com/ijl/orjson>`_ library.
+
+    Objects not supported by orjson, e.g. integers exceeding 64 bits, are encoded by
+    the standard library. Unlike the standard library, orjson encodes ``NaN`` and infinite
+    floats as ``null`` and doesn't decode them.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Initialize a new instance of the ``OrjsonCodec`` class."""
+        import orjson  # type: ignore[import-not-found]
+
+        self.__orjson = orjson
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Determine whether the orjson library is installed.
+
+        Returns
+        -------
+        bool
+            ``True`` if the codec can be used; ``False`` otherwise.
+        """
+        return importlib.util.find_spec("orjson") is not None
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> str:
+        """Encode object to JSON string.
+
+        Parameters
+        ----------
+        obj : Any
+            Object to be encoded.
+        sort_keys : bool, optional
+            Whether the keys of dictionaries are sorted. Defaults to ``False``.
+
+        Returns
+        -------
+        str
+            JSON string.
+        """
+        try:
+            return self.__orjson.dumps(
+                obj, option=self.__orjson.OPT_SORT_KEYS if sort_keys else None
+            ).decode("utf-8")
+        except TypeError:
+            return json.dumps(obj, sort_keys=sort_keys, ensure_ascii=False)
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        """Decode JSON document.
+
+        Parameters
+        ----------
+        data : Union[str, bytes, bytearray]
+            JSON document, either as string or UTF-8 encoded.
+
+        Returns
+        -------
+        Any
+            Decoded object.
+
+        Raises
+        ------
+        ValueError
+            Raised when the document is not a valid JSON document.
+        """
+        return self.__orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec using the `msgspec <https://jcristharif.com/msgspec/>`_ library.
+
+    Objects not supported by msgspec are encoded by the standard library. Unlike the standard
+    library, msgspec encodes ``NaN`` and infinite floats as ``null`` and doesn't decode them.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """Initialize a new instance of the ``MsgspecCodec`` class."""
+        import msgspec  # type: ignore[import-not-found]
+
+        self.__msgspec = msgspec
+        self.__decoder = msgspec.json.Decoder()
+        self.__encoder = msgspec.json.Encoder()
+        self.__sorted_encoder = msgspec.json.Encoder(order="sorted")
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Determine whether the msgspec library is installed.
+
+        Returns
+        -------
+        bool
+            ``True`` if the codec can be used; ``False`` otherwise.
+        """
+        return importlib.util.find_spec("msgspec") is not None
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> str:
+        """Encode object to JSON string.
+
+        Parameters
+        ----------
+        obj : Any
+            Object to be encoded.
+        sort_keys : bool, optional
+            Whether the keys of dictionaries are sorted. Defaults to ``False``.
+
+        Returns
+        -------
+        str
+            JSON string.
+        """
+        encoder = self.__sorted_encoder if sort_keys else self.__encoder
+        try:
+            return encoder.encode(obj).decode("utf-8")
+        except (TypeError, OverflowError):
+            return json.dumps(obj, sort_keys=sort_keys, ensure_ascii=False)
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        """Decode JSON document.
+
+        Parameters
+        ----------
+        data : Union[str, bytes, bytearray]
+            JSON document, either as string or UTF-8 encoded.
+
+        Returns
+        -------
+        Any
+            Decoded object.
+
+        Raises
+        ------
+        ValueError
+            Raised when the document is not a valid JSON document.
+        """
+        try:
+            return self.__decoder.decode(data)
+        except self.__msgspec.DecodeError as ex:
+            raise ValueError(str(ex)) from ex
+
+
+# Codecs in the order of preference for the automatic selection.
+_CODECS: Tuple[Type[JsonCodec], ...] = (OrjsonCodec, MsgspecCodec, StdlibJsonCodec)
+_codec_instances: Dict[str, JsonCodec] = {}
+_default_codec: Optional[JsonCodec] = None
+
+
+def get_available_json_codecs() -> Tuple[str, ...]:
+    """Get names of the JSON codecs, whose libraries are installed.
+
+    Returns
+    -------
+    Tuple[str, ...]
+        Names of the available codecs in the order of preference.
+    """
+    return tuple(codec.name for codec in _CODECS if codec.is_available())
+
+
+def get_json_codec(codec: Union[str, JsonCodec, None] = None) -> JsonCodec:
+    """Get JSON codec.
+
+    Parameters
+    ----------
+    codec : Union[str, JsonCodec, None], optional
+        Either codec instance, which is returned as it is, or name of the codec: ``"json"``,
+        ``"orjson"``, ``"msgspec"`` or ``"auto"``. The ``"auto"`` codec is the fastest
+        available one. If ``None``, the default codec is returned, which is the ``"json"``
+        codec unless changed by :py:func:`set_default_json_codec`. Defaults to ``None``.
+
+    Returns
+    -------
+    JsonCodec
+        JSON codec.
+
+    Raises
+    ------
+    ValueError
+        Raised when the codec name is unknown.
+    ImportError
+        Raised when the library required by the codec is not installed.
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec is None:
+        return _default_codec if _default_codec is not None else get_json_codec("json")
+    if codec == "auto":
+        codec = get_available_json_codecs()[0]
+    if codec not in _codec_instances:
+        codec_classes = {codec_class.name: codec_class for codec_class in _CODECS}
+        if codec not in codec_classes:
+            raise ValueError(
+                f"Unknown JSON codec: {codec}. Available codecs: {', '.join(codec_classes)}."
+            )
+        if not codec_classes[codec].is_available():
+            raise ImportError(f"JSON codec {codec} requires the {codec} package to be installed.")
+        _codec_instances[codec] = codec_classes[codec]()
+    return _codec_instances[codec]
+
+
+def set_default_json_codec(codec: Union[str, JsonCodec, None]) -> None:
+    """Set JSON codec used when no codec is specified explicitly.
+
+    The default codec is used by the functions generating commands and queries and
+    by the optiSLang server instances created without a specific codec. Unless changed,
+    the ``"json"`` codec of the standard library is used, as the other codecs don't support
+    ``NaN`` and infinite floats.
+
+    Parameters
+    ----------
+    codec : Union[str, JsonCodec, None]
+        Codec instance or codec name, see :py:func:`get_json_codec`. If ``None``,
+        the ``"json"`` codec is used.
+
+    Raises
+    ------
+    ValueError
+        Raised when the codec name is unknown.
+    ImportError
+        Raised when the library required by the codec is not installed.
+    """
+    global _default_codec
+    _default_codec = None if codec is None else get_json_codec(codec)
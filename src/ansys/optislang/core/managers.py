@@ -24,7 +24,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Any, Iterable, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Tuple, Union
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -35,6 +35,7 @@ if TYPE_CHECKING:
         Criterion,
         Design,
         DesignStatus,
+        DesignTable,
         Parameter,
         Response,
     )
@@ -232,6 +233,8 @@ class DesignManager:
         hid: str = "0",
         include_design_values=True,
         include_non_scalar_design_values=False,
+        compact=False,
+        stream=False,
     ) -> Tuple[Design, ...]:  # pragma: no cover
         """Get designs for a given state.
 
@@ -243,6 +246,12 @@ class DesignManager:
             Include values. By default ``True``.
         include_non_scalar_design_values : Optional[bool], optional
             Include non scalar values. By default ``False``.
+        compact : bool, optional
+            Share names of design variables between designs, see
+            :py:meth:`Design.from_schema`. By default ``False``.
+        stream : bool, optional
+            Decode the designs while they are received, see :py:meth:`iter_designs`.
+            By default ``False``.
 
         Returns
         -------
@@ -251,6 +260,55 @@ class DesignManager:
         """
         pass
 
+    @abstractmethod
+    def get_designs_table(
+        self, hid: str = "0", include_non_scalar_design_values=False
+    ) -> DesignTable:  # pragma: no cover
+        """Get designs for a given state as table of columns.
+
+        Parameters
+        ----------
+        hid : str, optional
+            State/Design hierarchical id. Defaults to the "root" id ("0").
+        include_non_scalar_design_values : Optional[bool], optional
+            Include non scalar values. By default ``False``.
+
+        Returns
+        -------
+        DesignTable
+            Designs of a given state stored column by column.
+        """
+        pass
+
+    @abstractmethod
+    def iter_designs(
+        self,
+        hid: str = "0",
+        include_design_values=True,
+        include_non_scalar_design_values=False,
+        compact=False,
+    ) -> Iterator[Design]:  # pragma: no cover
+        """Get designs for a given state one by one.
+
+        Parameters
+        ----------
+        hid : str, optional
+            State/Design hierarchical id. Defaults to the "root" id ("0").
+        include_design_values : bool, optional
+            Include values. By default ``True``.
+        include_non_scalar_design_values : Optional[bool], optional
+            Include non scalar values. By default ``False``.
+        compact : bool, optional
+            Share names of design variables between designs, see
+            :py:meth:`Design.from_schema`. By default ``False``.
+
+        Yields
+        ------
+        Design
+            Designs of a given state.
+        """
+        pass
+
     @abstractmethod
     def save_designs_as_json(
         self, file_path: Union[Path, str], hid: str = "0"
@@ -25,7 +25,12 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Optional
+import json
+import os
+import pathlib
+import threading
+from typing import Dict, Iterable, List, Mapping, Optional, Union
+import uuid
 
 from ansys.optislang.core.nodes import NodeClassType
 from ansys.optislang.core.utils import enum_from_str
@@ -1147,6 +1152,253 @@ DLS = NodeType(
 # endregion
 
 
+# Node types predefined in this module indexed by the name, which is the node id
+# in the optiSLang server output format.
+_PREDEFINED_NODE_TYPES: Dict[str, NodeType] = {
+    name: value for name, value in globals().items() if isinstance(value, NodeType)
+}
+
+_CUSTOM_PREFIXES = {
+    "AlgorithmSystem_": AddinType.PYTHON_BASED_ALGORITHM_PLUGIN,
+    "AlgorithmSystemPlugin_": AddinType.ALGORITHM_PLUGIN,
+    "Custom_": AddinType.PYTHON_BASED_NODE_PLUGIN,
+    "CustomETKIntegration_": "",  # TODO: append add-in type
+    "CustomIntegration_": AddinType.PYTHON_BASED_INTEGRATION_PLUGIN,
+    "CustomMop_": AddinType.PYTHON_BASED_MOP_NODE_PLUGIN,
+    "IntegrationPlugin_": AddinType.INTEGRATION_PLUGIN,
+}
+
+# subtypes of node types by the keys of the ``AVAILABLE_NODES`` query output
+_AVAILABLE_NODES_SUBTYPES = {
+    "algorithm_plugins": AddinType.ALGORITHM_PLUGIN,
+    "builtin_nodes": AddinType.BUILT_IN,
+    "integration_plugins": AddinType.INTEGRATION_PLUGIN,
+    "python_based_algorithm_plugins": AddinType.PYTHON_BASED_ALGORITHM_PLUGIN,
+    "python_based_integration_plugins": AddinType.PYTHON_BASED_INTEGRATION_PLUGIN,
+    "python_based_mop_node_plugins": AddinType.PYTHON_BASED_MOP_NODE_PLUGIN,
+    "python_based_node_plugins": AddinType.PYTHON_BASED_NODE_PLUGIN,
+}
+
+_AVAILABLE_NODES_FILE_FORMAT = 1
+
+
+class NodeTypeRegistry:
+    """Registry resolving node types and storing node types available in optiSLang.
+
+    Node types created from node ids are reused, so resolving the same id again costs
+    only a dictionary lookup. Node types reported by optiSLang servers are stored per
+    optiSLang version, optionally in a JSON file shared between sessions, so they are
+    queried once per version. Available node types of a version may change, e.g. when
+    Python based plugins are installed, then stored node types must be removed by
+    the :py:meth:`clear` method.
+
+    Parameters
+    ----------
+    path : Optional[Union[str, pathlib.Path]], optional
+        Path to the JSON file storing available node types. If ``None``, available node types
+        are stored in memory only. Defaults to ``None``.
+    """
+
+    def __init__(self, path: Optional[Union[str, pathlib.Path]] = None) -> None:
+        """Create a new instance of the ``NodeTypeRegistry`` class."""
+        self.__path = pathlib.Path(path) if path is not None else None
+        self.__lock = threading.Lock()
+        self.__node_types: Dict[str, NodeType] = dict(_PREDEFINED_NODE_TYPES)
+        self.__available_nodes: Optional[Dict[str, Dict[str, List[str]]]] = None
+        # node types created from the available node ids by version, reused by further calls
+        self.__available_node_types: Dict[str, List[NodeType]] = {}
+
+    def __repr__(self) -> str:
+        """Return printable representation of the registry."""
+        return f"{self.__class__.__name__}(path={self.__path})"
+
+    @property
+    def path(self) -> Optional[pathlib.Path]:
+        """Path to the JSON file storing available node types.
+
+        Returns
+        -------
+        Optional[pathlib.Path]
+            Path to the file, ``None`` if available node types are stored in memory only.
+        """
+        return self.__path
+
+    def clear(self, osl_version: Optional[str] = None) -> None:
+        """Remove stored available node types.
+
+        Parameters
+        ----------
+        osl_version : Optional[str], optional
+            optiSLang version string of the removed node types. If ``None``, node types
+            of all versions are removed. Defaults to ``None``.
+        """
+        with self.__lock:
+            available_nodes = self.__load_available_nodes()
+            if osl_version is None:
+                available_nodes.clear()
+                self.__available_node_types.clear()
+            else:
+                available_nodes.pop(osl_version, None)
+                self.__available_node_types.pop(osl_version, None)
+            self.__store_available_nodes()
+
+    def get_available_node_types(self, osl_version: str) -> Optional[List[NodeType]]:
+        """Get stored node types available in the given optiSLang version.
+
+        Parameters
+        ----------
+        osl_version : str
+            optiSLang version string, as reported by the server.
+
+        Returns
+        -------
+        Optional[List[NodeType]]
+            Available node types, ``None`` if not stored.
+        """
+        with self.__lock:
+            node_types = self.__available_node_types.get(osl_version)
+            if node_types is None:
+                available_nodes = self.__load_available_nodes().get(osl_version)
+                if available_nodes is None:
+                    return None
+                node_types = self.__create_available_node_types(available_nodes)
+                self.__available_node_types[osl_version] = node_types
+        return list(node_types)
+
+    def get_node_type(self, node_id: str) -> NodeType:
+        """Get node type from the node id.
+
+        Parameters
+        ----------
+        node_id : str
+            Actor type in optiSLang server output format.
+
+        Returns
+        -------
+        NodeType
+            Predefined node type if exists, otherwise a new node type reused by further calls.
+        """
+        node_type = self.__node_types.get(node_id)
+        if node_type is None:
+            node_type = _create_node_type(node_id)
+            self.__node_types[node_id] = node_type
+        return node_type
+
+    def set_available_node_types(
+        self, osl_version: str, available_nodes: Mapping[str, Iterable[str]]
+    ) -> List[NodeType]:
+        """Store node types available in the given optiSLang version.
+
+        Parameters
+        ----------
+        osl_version : str
+            optiSLang version string, as reported by the server.
+        available_nodes : Mapping[str, Iterable[str]]
+            Node ids by the node subtype in the ``AVAILABLE_NODES`` query output format.
+
+        Returns
+        -------
+        List[NodeType]
+            Available node types.
+        """
+        available_nodes_lists = {
+            subtype: list(node_ids)
+            for subtype, node_ids in available_nodes.items()
+            if subtype in _AVAILABLE_NODES_SUBTYPES
+        }
+        node_types = self.__create_available_node_types(available_nodes_lists)
+        with self.__lock:
+            self.__load_available_nodes()[osl_version] = available_nodes_lists
+            self.__available_node_types[osl_version] = node_types
+            self.__store_available_nodes()
+        return list(node_types)
+
+    def __create_available_node_types(
+        self, available_nodes: Dict[str, List[str]]
+    ) -> List[NodeType]:
+        """Create node types from node ids in the ``AVAILABLE_NODES`` query output format."""
+        return [
+            NodeType(id=node_id, subtype=_AVAILABLE_NODES_SUBTYPES[subtype])
+            for subtype, node_ids in available_nodes.items()
+            for node_id in node_ids
+        ]
+
+    def __load_available_nodes(self) -> Dict[str, Dict[str, List[str]]]:
+        """Get available node ids by version, loaded from the file on first access."""
+        if self.__available_nodes is None:
+            self.__available_nodes = {}
+            if self.__path is not None and self.__path.is_file():
+                try:
+                    with open(self.__path, "r", encoding="utf-8") as file:
+                        content = json.load(file)
+                    if content["format"] == _AVAILABLE_NODES_FILE_FORMAT:
+                        self.__available_nodes = dict(content["versions"])
+                except (OSError, ValueError, KeyError, TypeError):
+                    pass
+        return self.__available_nodes
+
+    def __store_available_nodes(self) -> None:
+        """Write available node ids to the file, if given."""
+        if self.__path is None:
+            return
+        content = {
+            "format": _AVAILABLE_NODES_FILE_FORMAT,
+            "versions": self.__available_nodes,
+        }
+        # write to a temporary file first, so that other processes never read a partial file
+        temp_path = self.__path.with_name(f"{self.__path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            self.__path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(content, file)
+            os.replace(temp_path, self.__path)
+        except OSError:
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+
+
+_node_type_registry = NodeTypeRegistry()
+
+
+def get_node_type_registry() -> NodeTypeRegistry:
+    """Get the registry used to resolve node types and store available node types.
+
+    Returns
+    -------
+    NodeTypeRegistry
+        Node type registry.
+    """
+    return _node_type_registry
+
+
+def set_node_type_registry(registry: Optional[NodeTypeRegistry] = None) -> NodeTypeRegistry:
+    """Set the registry used to resolve node types and store available node types.
+
+    Parameters
+    ----------
+    registry : Optional[NodeTypeRegistry], optional
+        Node type registry. If ``None``, a new registry storing available node types in memory
+        is used. Defaults to ``None``.
+
+    Returns
+    -------
+    NodeTypeRegistry
+        Node type registry.
+
+    Examples
+    --------
+    Store node types available in optiSLang between sessions.
+
+    >>> from ansys.optislang.core.node_types import NodeTypeRegistry, set_node_type_registry
+    >>> set_node_type_registry(NodeTypeRegistry("available_nodes.json"))
+    """
+    global _node_type_registry
+    _node_type_registry = registry if registry is not None else NodeTypeRegistry()
+    return _node_type_registry
+
+
 def get_node_type_from_str(node_id: str) -> NodeType:
     """Create instance of ``NodeType`` from string.
 
@@ -1160,33 +1412,31 @@ def get_node_type_from_str(node_id: str) -> NodeType:
     NodeType
         Instance of ``NodeType`` class.
     """
-    customs = {
-        "AlgorithmSystem_": AddinType.PYTHON_BASED_ALGORITHM_PLUGIN,
-        "AlgorithmSystemPlugin_": AddinType.ALGORITHM_PLUGIN,
-        "Custom_": AddinType.PYTHON_BASED_NODE_PLUGIN,
-        "CustomETKIntegration_": "",  # TODO: append add-in type
-        "CustomIntegration_": AddinType.PYTHON_BASED_INTEGRATION_PLUGIN,
-        "CustomMop_": AddinType.PYTHON_BASED_MOP_NODE_PLUGIN,
-        "IntegrationPlugin_": AddinType.INTEGRATION_PLUGIN,
-    }
-    module_constants = {
-        key: value
-        for key, value in globals().items()
-        if not (callable(value) or isinstance(value, type) or key.startswith("__"))
-    }
-    module_constants.pop("annotations")
-
-    if module_constants.get(node_id, None) is not None:
-        return module_constants[node_id]
-    elif node_id in customs.keys():
+    return _node_type_registry.get_node_type(node_id)
+
+
+def _create_node_type(node_id: str) -> NodeType:
+    """Create instance of ``NodeType`` from string of a node type not predefined.
+
+    Parameters
+    ----------
+    node_id: str
+        Actor type in optiSLang server output format.
+
+    Returns
+    -------
+    NodeType
+        Instance of ``NodeType`` class.
+    """
+    if node_id in _CUSTOM_PREFIXES:
         id_ = node_id[:-1]
         subtype = AddinType.BUILT_IN
     else:
         was_found = False
-        for custom in customs.keys():
+        for custom, custom_subtype in _CUSTOM_PREFIXES.items():
             if node_id.startswith(custom):
                 id_ = node_id.replace(custom, "")
-                subtype = customs[custom]  # type: ignore[assignment]
+                subtype = custom_subtype  # type: ignore[assignment]
                 was_found = True
                 break
         if not was_found:
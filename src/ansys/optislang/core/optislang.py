@@ -32,8 +32,10 @@ from deprecated.sphinx import deprecated
 
 from ansys.optislang.core import LOG
 from ansys.optislang.core.communication_channels import CommunicationChannel
+from ansys.optislang.core.json_codec import JsonCodec
 from ansys.optislang.core.tcp.application import TcpApplicationProxy
 from ansys.optislang.core.tcp.osl_server import TcpOslServer
+from ansys.optislang.core.tcp.server_pool import PooledServer, TcpOslServerPool
 
 if TYPE_CHECKING:
     from ansys.optislang.core.application import Application
@@ -215,6 +217,28 @@ class Optislang:
     additional_args : Optional[Iterable[str]], optional
         Additional command line arguments used for execution of the optiSLang server process.
         Defaults to ``None``.
+    persistent_connections : bool, optional
+        Determines whether connections to the optiSLang server are kept open and reused by
+        subsequent commands and queries instead of connecting for each of them.
+        Defaults to ``False``.
+    max_persistent_connections : Optional[int], optional
+        Maximum number of persistent connections open at the same time. Concurrent commands
+        and queries wait for a free connection once the limit is reached. If ``None``,
+        the number of connections is not bounded. Defaults to ``4``.
+    persistent_connections_idle_timeout : Optional[float], optional
+        Time in seconds after which an idle persistent connection is closed. If ``None``,
+        idle connections are kept open until the instance is disposed. Defaults to ``60``.
+    json_codec : Union[str, JsonCodec, None], optional
+        Codec used to decode server responses, either codec instance or codec name:
+        ``"json"``, ``"orjson"``, ``"msgspec"`` or ``"auto"`` for the fastest installed one.
+        Defaults to ``None`` which results in using the default codec, see
+        :py:func:`set_default_json_codec <ansys.optislang.core.json_codec.set_default_json_codec>`.
+    server_pool : Optional[TcpOslServerPool], optional
+        Pool of pre-started optiSLang servers. If given and neither ``local_server_id`` nor
+        ``host`` and ``port`` are specified, the instance connects to an idle server of
+        the pool instead of starting a new one, opens the ``project_path`` if specified
+        and returns the server to the pool when disposed. Parameters related to the
+        execution of the server are given by the pool. Defaults to ``None``.
 
     Raises
     ------
@@ -275,6 +299,11 @@ class Optislang:
         dump_project_state: Optional[Union[str, Path]] = None,
         opx_project_definition_file: Optional[Union[str, Path]] = None,
         additional_args: Optional[Iterable[str]] = None,
+        persistent_connections: bool = False,
+        max_persistent_connections: Optional[int] = 4,
+        persistent_connections_idle_timeout: Optional[float] = 60,
+        json_codec: Union[str, JsonCodec, None] = None,
+        server_pool: Optional[TcpOslServerPool] = None,
     ) -> None:
         """Initialize a new instance of the ``Optislang`` class."""
         self.__local_server_id = local_server_id
@@ -309,13 +338,25 @@ class Optislang:
         self.__dump_project_state = dump_project_state
         self.__opx_project_definition_file = opx_project_definition_file
         self.__additional_args = additional_args
+        self.__persistent_connections = persistent_connections
+        self.__max_persistent_connections = max_persistent_connections
+        self.__persistent_connections_idle_timeout = persistent_connections_idle_timeout
+        self.__json_codec = json_codec
         self.__logger = LOG.add_instance_logger(self.name, self, loglevel)
         self.__log_process_stdout = log_process_stdout
         self.__log_process_stderr = log_process_stderr
+        self.__server_pool = server_pool
+        self.__pooled_server: Optional[PooledServer] = None
         self.__osl_server: OslServer = self.__init_osl_server()
         self.__application: Application = self.__init_application()
 
-        if self.__project_path and not self.__batch and not self.__service:  # pragma: no cover
+        if self.__project_path and self.__pooled_server is not None:
+            try:
+                self.open(file_path=self.__project_path, force=self.__force, reset=self.__reset)
+            except Exception:
+                self.dispose()
+                raise
+        elif self.__project_path and not self.__batch and not self.__service:  # pragma: no cover
             # trigger lazy project load in GUI mode
             self.open(file_path=self.__project_path, force=self.__force, reset=self.__reset)
 
@@ -336,6 +377,12 @@ class Optislang:
         OslServerLicensingError
             Raised when optiSLang server process failed to start due to licensing issues
         """
+        if (
+            self.__server_pool is not None
+            and self.__local_server_id is None
+            and (self.__host is None or self.__port is None)
+        ):
+            return self.__init_pooled_osl_server(self.__server_pool)
         if (
             self.__communication_channel == CommunicationChannel.LOCAL_DOMAIN
             or self.__communication_channel == CommunicationChannel.TCP
@@ -375,10 +422,49 @@ class Optislang:
                 listeners_refresh_interval=self.__listeners_refresh_interval,
                 listeners_default_timeout=self.__listeners_default_timeout,
                 additional_args=self.__additional_args,
+                persistent_connections=self.__persistent_connections,
+                max_persistent_connections=self.__max_persistent_connections,
+                persistent_connections_idle_timeout=self.__persistent_connections_idle_timeout,
+                json_codec=self.__json_codec,
             )
         else:
             raise NotImplementedError("Desired communication type is not yet supported.")
 
+    def __init_pooled_osl_server(self, server_pool: TcpOslServerPool) -> OslServer:
+        """Connect to an idle server of the pool.
+
+        Returns
+        -------
+        OslServer
+            OptiSlang server object.
+
+        Raises
+        ------
+        OslServerStartError
+            Raised when the pool has no idle server and a new server failed to start.
+        """
+        pooled_server = server_pool.acquire(executable=self.__executable)
+        try:
+            osl_server = TcpOslServer(
+                **pooled_server.connection_kwargs,
+                ini_timeout=self.__ini_timeout,
+                password=self.__password,
+                logger=self.log,
+                listener_id=self.__listener_id,
+                multi_listener=self.__multi_listener,
+                listeners_refresh_interval=self.__listeners_refresh_interval,
+                listeners_default_timeout=self.__listeners_default_timeout,
+                persistent_connections=self.__persistent_connections,
+                max_persistent_connections=self.__max_persistent_connections,
+                persistent_connections_idle_timeout=self.__persistent_connections_idle_timeout,
+                json_codec=self.__json_codec,
+            )
+        except Exception:
+            server_pool.release(pooled_server)
+            raise
+        self.__pooled_server = pooled_server
+        return osl_server
+
     def __init_application(self) -> Application:
         if isinstance(self.__osl_server, TcpOslServer):
             return TcpApplicationProxy(osl_server=self.__osl_server, logger=self.log)
@@ -560,7 +646,12 @@ class Optislang:
         TimeoutError
             Raised when the timeout float value expires.
         """
-        self.__osl_server.dispose()
+        try:
+            self.__osl_server.dispose()
+        finally:
+            pooled_server, self.__pooled_server = self.__pooled_server, None
+            if pooled_server is not None and self.__server_pool is not None:
+                self.__server_pool.release(pooled_server)
 
     @deprecated(version="0.6.0", reason="Use :py:attr:`Optislang.osl_server` instead.")
     def get_osl_server(self) -> Optional[OslServer]:
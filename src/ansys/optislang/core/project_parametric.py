@@ -26,8 +26,21 @@ from __future__ import annotations
 import ast
 import copy
 from enum import Enum
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+import importlib
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 import uuid
+import weakref
 
 from ansys.optislang.core.json_utils import _get_enum_value
 from ansys.optislang.core.utils import enum_from_str
@@ -1630,7 +1643,11 @@ class DesignVariable:
         bool
             ``True`` if all properties match; ``False`` otherwise.
         """
-        return type(self) == type(other) and self.name == other.name and self.value == other.value
+        return (
+            isinstance(other, DesignVariable)
+            and self.name == other.name
+            and self.value == other.value
+        )
 
     @property
     def name(self) -> str:
@@ -3271,6 +3288,237 @@ class Response:
 # endregion
 
 
+# region DesignSchema
+class DesignSchema:
+    """Stores names of design variables shared by designs with the same structure.
+
+    The schema is immutable, so that it can be shared by any number of designs, e.g. all
+    designs of a state. Designs created from a schema store only the values of the design
+    variables, see :py:meth:`Design.from_schema`.
+
+    Parameters
+    ----------
+    parameters : Iterable[str], optional
+        Names of parameters. By default ``()``.
+    constraints : Iterable[str], optional
+        Names of constraint criteria. By default ``()``.
+    limit_states : Iterable[str], optional
+        Names of limit state criteria. By default ``()``.
+    objectives : Iterable[str], optional
+        Names of objective criteria. By default ``()``.
+    variables : Iterable[str], optional
+        Names of variable criteria. By default ``()``.
+    responses : Iterable[str], optional
+        Names of responses. By default ``()``.
+    """
+
+    __slots__ = ("__names", "__indices")
+
+    _GROUPS = ("constraints", "limit_states", "objectives", "parameters", "responses", "variables")
+
+    def __init__(
+        self,
+        parameters: Iterable[str] = (),
+        constraints: Iterable[str] = (),
+        limit_states: Iterable[str] = (),
+        objectives: Iterable[str] = (),
+        variables: Iterable[str] = (),
+        responses: Iterable[str] = (),
+    ) -> None:
+        """Initialize a new instance of the ``DesignSchema`` class."""
+        self.__names: Dict[str, Tuple[str, ...]] = {
+            "constraints": tuple(constraints),
+            "limit_states": tuple(limit_states),
+            "objectives": tuple(objectives),
+            "parameters": tuple(parameters),
+            "responses": tuple(responses),
+            "variables": tuple(variables),
+        }
+        self.__indices: Dict[str, Dict[str, int]] = {
+            group: _create_name_indices(names) for group, names in self.__names.items()
+        }
+
+    def __eq__(self, other) -> bool:
+        """Compare names of two instances of the ``DesignSchema`` class."""
+        return isinstance(other, DesignSchema) and self.__names == other.__names
+
+    def __hash__(self) -> int:
+        """Return hash of the names."""
+        return hash(tuple(self.__names.values()))
+
+    @property
+    def constraints_names(self) -> Tuple[str, ...]:
+        """Tuple of all constraint names."""
+        return self.__names["constraints"]
+
+    @property
+    def limit_states_names(self) -> Tuple[str, ...]:
+        """Tuple of all limit state names."""
+        return self.__names["limit_states"]
+
+    @property
+    def objectives_names(self) -> Tuple[str, ...]:
+        """Tuple of all objective names."""
+        return self.__names["objectives"]
+
+    @property
+    def parameters_names(self) -> Tuple[str, ...]:
+        """Tuple of all parameter names."""
+        return self.__names["parameters"]
+
+    @property
+    def responses_names(self) -> Tuple[str, ...]:
+        """Tuple of all response names."""
+        return self.__names["responses"]
+
+    @property
+    def variables_names(self) -> Tuple[str, ...]:
+        """Tuple of all variable names."""
+        return self.__names["variables"]
+
+    def _create_variables(self, group: str, values: Sequence[Any]) -> _CompactDesignVariables:
+        """Create design variables of the given group sharing the names of the schema."""
+        names = self.__names[group]
+        if not isinstance(values, list):
+            values = list(values)
+        if len(values) != len(names):
+            raise ValueError(
+                f"Number of {group} values ``{len(values)}`` doesn't match "
+                f"number of names ``{len(names)}``."
+            )
+        return _CompactDesignVariables(names, self.__indices[group], values)
+
+
+def _create_name_indices(names: Sequence[str]) -> Dict[str, int]:
+    """Map names to their positions, ambiguous names are mapped to ``-1``."""
+    indices: Dict[str, int] = {}
+    for index, name in enumerate(names):
+        indices[name] = -1 if name in indices else index
+    return indices
+
+
+class _CompactDesignVariables:
+    """List of design variables storing only their values.
+
+    Names and the mapping of names to positions are shared with other designs until
+    a name is added, removed or renamed, values are owned by the list. Views of removed
+    variables are detached from the list, views of the following ones are moved, so that
+    they keep referring to the same variable.
+    """
+
+    __slots__ = ("names", "_indices", "_values", "_views")
+
+    def __init__(self, names: Tuple[str, ...], indices: Dict[str, int], values: List[Any]):
+        self.names = names
+        self._indices = indices
+        self._values = values
+        # created with the first view only, most designs are never accessed by views
+        self._views: Optional[weakref.WeakValueDictionary[int, _DesignVariableView]] = None
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> DesignVariable:
+        if index < 0:
+            index += len(self._values)
+        if not 0 <= index < len(self._values):
+            raise IndexError("Design variable index out of range.")
+        return self.__create_view(index)
+
+    def __iter__(self) -> Iterator[DesignVariable]:
+        return (self.__create_view(index) for index in range(len(self._values)))
+
+    def append(self, variable: DesignVariable) -> None:
+        self.names += (variable.name,)
+        self._values.append(variable.value)
+        self._indices = _create_name_indices(self.names)
+
+    def clear(self) -> None:
+        if self._views:
+            for view in list(self._views.values()):
+                view._detach()
+        self._views = None
+        self.names = ()
+        self._indices = {}
+        self._values = []
+
+    def find(self, name: str) -> Optional[int]:
+        """Find position of the name, ``-1`` is returned for ambiguous names."""
+        return self._indices.get(name)
+
+    def pop(self, index: int) -> DesignVariable:
+        if index < 0:
+            index += len(self._values)
+        if self._views:
+            for view in list(self._views.values()):
+                view._move(index)
+        variable = DesignVariable(self.names[index], self._values.pop(index))
+        self.names = self.names[:index] + self.names[index + 1 :]
+        self._indices = _create_name_indices(self.names)
+        return variable
+
+    def rename(self, index: int, name: str) -> None:
+        self.names = self.names[:index] + (name,) + self.names[index + 1 :]
+        self._indices = _create_name_indices(self.names)
+
+    def __create_view(self, index: int) -> _DesignVariableView:
+        if self._views is None:
+            self._views = weakref.WeakValueDictionary()
+        view = _DesignVariableView(self, index)
+        # design variables compare equal by value, hence aren't hashable
+        self._views[id(view)] = view
+        return view
+
+
+class _DesignVariableView(DesignVariable):
+    """Design variable reading and writing its name and value from a compact list."""
+
+    __slots__ = ("__variables", "__index")
+
+    def __init__(self, variables: _CompactDesignVariables, index: int) -> None:
+        self.__variables = variables
+        self.__index = index
+
+    @property
+    def name(self) -> str:
+        """Name of the design variable."""
+        return self.__variables.names[self.__index]
+
+    @name.setter
+    def name(self, name: str) -> None:
+        if not isinstance(name, str):
+            raise TypeError(f"String was expected but type: ``{type(name)}`` was given.")
+        self.__variables.rename(self.__index, name)
+
+    @property
+    def value(self) -> Union[bool, float, complex, list, dict, None]:
+        """Value of the design variable."""
+        return self.__variables._values[self.__index]
+
+    @value.setter
+    def value(self, value: Union[bool, float, complex, list, dict, None]) -> None:
+        self.__variables._values[self.__index] = value
+
+    def _detach(self) -> None:
+        """Keep the name and value in a list of its own, as a removed design variable does."""
+        name = self.name
+        self.__variables = _CompactDesignVariables((name,), {name: 0}, [self.value])
+        self.__index = 0
+
+    def _move(self, removed_index: int) -> None:
+        """Follow the design variable after the variable at ``removed_index`` was removed."""
+        if self.__index == removed_index:
+            self._detach()
+        elif self.__index > removed_index:
+            self.__index -= 1
+
+
+_DesignVariables = Union[List[DesignVariable], _CompactDesignVariables]
+
+
+# endregion
+
+
 # region Design
 class Design:
     """Stores information about the design point.
@@ -3367,16 +3615,16 @@ class Design:
         pareto_design: Optional[bool] = None,
     ) -> None:
         """Initialize a new instance of the ``Design`` class."""
-        self.__constraints: List[DesignVariable] = []
+        self.__constraints: _DesignVariables = []
         self.__feasibility: Optional[bool] = feasibility
         self.__id: Optional[int] = design_id
-        self.__limit_states: List[DesignVariable] = []
-        self.__objectives: List[DesignVariable] = []
-        self.__parameters: List[DesignVariable] = []
+        self.__limit_states: _DesignVariables = []
+        self.__objectives: _DesignVariables = []
+        self.__parameters: _DesignVariables = []
         self.__pareto_design: Optional[bool] = pareto_design
-        self.__responses: List[DesignVariable] = []
+        self.__responses: _DesignVariables = []
         self.__status: DesignStatus = status
-        self.__variables: List[DesignVariable] = []
+        self.__variables: _DesignVariables = []
 
         # parameters
         if parameters:
@@ -3430,7 +3678,7 @@ class Design:
     @property
     def constraints_names(self) -> Tuple[str, ...]:
         """Tuple of all constraint names."""
-        return tuple([constraint.name for constraint in self.__constraints])
+        return self.__get_names(self.__constraints)
 
     @property
     def feasibility(self) -> Optional[bool]:
@@ -3450,7 +3698,7 @@ class Design:
     @property
     def limit_states_names(self) -> Tuple[str, ...]:
         """Tuple of all limit state names."""
-        return tuple([limit_state.name for limit_state in self.__limit_states])
+        return self.__get_names(self.__limit_states)
 
     @property
     def objectives(self) -> Tuple[DesignVariable, ...]:
@@ -3460,7 +3708,7 @@ class Design:
     @property
     def objectives_names(self) -> Tuple[str, ...]:
         """Tuple of all objective names."""
-        return tuple([objective.name for objective in self.__objectives])
+        return self.__get_names(self.__objectives)
 
     @property
     def parameters(self) -> Tuple[DesignVariable, ...]:
@@ -3470,7 +3718,7 @@ class Design:
     @property
     def parameters_names(self) -> Tuple[str, ...]:
         """Tuple of all parameter names."""
-        return tuple([parameter.name for parameter in self.__parameters])
+        return self.__get_names(self.__parameters)
 
     @property
     def pareto_design(self) -> Optional[bool]:
@@ -3485,7 +3733,7 @@ class Design:
     @property
     def responses_names(self) -> Tuple[str, ...]:
         """Tuple of all response names."""
-        return tuple([response.name for response in self.__responses])
+        return self.__get_names(self.__responses)
 
     @property
     def status(self) -> DesignStatus:
@@ -3500,7 +3748,75 @@ class Design:
     @property
     def variables_names(self) -> Tuple[str, ...]:
         """Tuple of all variable names."""
-        return tuple([variable.name for variable in self.__variables])
+        return self.__get_names(self.__variables)
+
+    @classmethod
+    def from_schema(
+        cls,
+        schema: DesignSchema,
+        parameters: Sequence[Any] = (),
+        constraints: Sequence[Any] = (),
+        limit_states: Sequence[Any] = (),
+        objectives: Sequence[Any] = (),
+        variables: Sequence[Any] = (),
+        responses: Sequence[Any] = (),
+        feasibility: Optional[bool] = None,
+        design_id: Optional[int] = None,
+        status: DesignStatus = DesignStatus.IDLE,
+        pareto_design: Optional[bool] = None,
+    ) -> Design:
+        """Create a design storing only values, names are shared with the schema.
+
+        Designs created from the same schema share the names of their design variables
+        and the lookup of design variables by name, so that large numbers of designs
+        require considerably less memory. Design variables are provided as views
+        on the stored values, modifying them modifies the design.
+
+        Parameters
+        ----------
+        schema : DesignSchema
+            Names of the design variables.
+        parameters : Sequence[Any], optional
+            Values of the parameters in order of the schema. By default ``()``.
+        constraints : Sequence[Any], optional
+            Values of the constraint criteria in order of the schema. By default ``()``.
+        limit_states : Sequence[Any], optional
+            Values of the limit state criteria in order of the schema. By default ``()``.
+        objectives : Sequence[Any], optional
+            Values of the objective criteria in order of the schema. By default ``()``.
+        variables : Sequence[Any], optional
+            Values of the variable criteria in order of the schema. By default ``()``.
+        responses : Sequence[Any], optional
+            Values of the responses in order of the schema. By default ``()``.
+        feasibility: Optional[bool], optional
+            Determines whether design is feasible, by default ``None``.
+        design_id: Optional[int], optional
+            Design's id, by default ``None``.
+        status: DesignStatus, optional
+            Design's status, by default ``DesignStatus.IDLE``.
+        pareto_design: Optional[bool], optional
+            Pareto design flag, by default ``None``.
+
+        Returns
+        -------
+        Design
+            Design with the given values. Lists of values are not copied.
+
+        Raises
+        ------
+        ValueError
+            Raised when the number of values doesn't match the number of names.
+        """
+        design = cls(
+            feasibility=feasibility, design_id=design_id, status=status, pareto_design=pareto_design
+        )
+        design.__parameters = schema._create_variables("parameters", parameters)
+        design.__constraints = schema._create_variables("constraints", constraints)
+        design.__limit_states = schema._create_variables("limit_states", limit_states)
+        design.__objectives = schema._create_variables("objectives", objectives)
+        design.__variables = schema._create_variables("variables", variables)
+        design.__responses = schema._create_variables("responses", responses)
+        return design
 
     def clear_parameters(self) -> None:
         """Remove all defined parameters from the design."""
@@ -3673,6 +3989,7 @@ class Design:
             Raised when multiple instances of a a design variable with the same name are found.
         """
         indices = []
+        search_in: _DesignVariables
         if type_ == "constraint":
             search_in = self.__constraints
         elif type_ == "limit_state":
@@ -3688,6 +4005,12 @@ class Design:
         else:
             raise TypeError(f"Unknown type_: ``{type(type_)}``.")
 
+        if isinstance(search_in, _CompactDesignVariables):
+            index = search_in.find(name)
+            if index == -1:
+                raise RuntimeError(f"Name `{name}` of `{type_}` is not unique.")
+            return index
+
         for index, parameter in enumerate(search_in):
             if parameter.name == name:
                 indices.append(index)
@@ -3697,6 +4020,13 @@ class Design:
             return None
         return indices[0]
 
+    @staticmethod
+    def __get_names(variables: _DesignVariables) -> Tuple[str, ...]:
+        """Get names of design variables, shared names are returned without a copy."""
+        if isinstance(variables, _CompactDesignVariables):
+            return variables.names
+        return tuple([variable.name for variable in variables])
+
     def __parse_parameters_to_designvariables(
         self,
         parameters: Union[
@@ -3858,6 +4188,261 @@ class Design:
                 item.value = None
 
 
+# endregion
+
+
+# region DesignTable
+class DesignTable:
+    """Stores designs of a state column by column.
+
+    Designs are stored as one column per design variable instead of one object per design,
+    which makes large numbers of designs cheap to create and to convert into NumPy,
+    pandas, or Arrow data.
+
+    Parameters
+    ----------
+    ids : Sequence[str]
+        Designs' ids.
+    feasibility : Sequence[Optional[bool]]
+        Designs' feasibility.
+    status : Sequence[str]
+        Designs' status, given by names of the ``DesignStatus`` members.
+    pareto_design : Sequence[Optional[bool]]
+        Designs' pareto design flags.
+    constraints : Optional[Mapping[str, Sequence[Any]]], optional
+        Columns of constraint values by constraint name. By default ``None``.
+    limit_states : Optional[Mapping[str, Sequence[Any]]], optional
+        Columns of limit state values by limit state name. By default ``None``.
+    objectives : Optional[Mapping[str, Sequence[Any]]], optional
+        Columns of objective values by objective name. By default ``None``.
+    parameters : Optional[Mapping[str, Sequence[Any]]], optional
+        Columns of parameter values by parameter name. By default ``None``.
+    responses : Optional[Mapping[str, Sequence[Any]]], optional
+        Columns of response values by response name. By default ``None``.
+
+    Raises
+    ------
+    ValueError
+        Raised when the columns differ in length.
+
+    Examples
+    --------
+    Get the designs of a parametric system as pandas data frame:
+
+    >>> from ansys.optislang.core import Optislang
+    >>> osl = Optislang(project_path="path/to/project.opf")
+    >>> system = osl.project.root_system.find_nodes_by_name("Sensitivity")[0]
+    >>> table = system.design_manager.get_designs_table()
+    >>> data_frame = table.to_pandas()
+    >>> osl.dispose()
+    """
+
+    _GROUPS = ("constraints", "limit_states", "objectives", "parameters", "responses")
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        feasibility: Sequence[Optional[bool]],
+        status: Sequence[str],
+        pareto_design: Sequence[Optional[bool]],
+        constraints: Optional[Mapping[str, Sequence[Any]]] = None,
+        limit_states: Optional[Mapping[str, Sequence[Any]]] = None,
+        objectives: Optional[Mapping[str, Sequence[Any]]] = None,
+        parameters: Optional[Mapping[str, Sequence[Any]]] = None,
+        responses: Optional[Mapping[str, Sequence[Any]]] = None,
+    ) -> None:
+        """Initialize a new instance of the ``DesignTable`` class."""
+        self.__ids = ids
+        self.__feasibility = feasibility
+        self.__status = status
+        self.__pareto_design = pareto_design
+        self.__constraints = dict(constraints or {})
+        self.__limit_states = dict(limit_states or {})
+        self.__objectives = dict(objectives or {})
+        self.__parameters = dict(parameters or {})
+        self.__responses = dict(responses or {})
+        if any(len(column) != len(ids) for column in self.to_dict().values()):
+            raise ValueError("All columns of the design table must have the same length.")
+
+    def __len__(self) -> int:
+        """Return number of designs."""
+        return len(self.__ids)
+
+    def __str__(self) -> str:
+        """Return formatted string."""
+        return (
+            f"Designs: {len(self)}\n"
+            f"Parameters: {', '.join(self.__parameters)}\n"
+            f"Constraints: {', '.join(self.__constraints)}\n"
+            f"Limit states: {', '.join(self.__limit_states)}\n"
+            f"Objectives: {', '.join(self.__objectives)}\n"
+            f"Responses: {', '.join(self.__responses)}"
+        )
+
+    @property
+    def constraints(self) -> Dict[str, Sequence[Any]]:
+        """Columns of constraint values by constraint name."""
+        return self.__constraints
+
+    @property
+    def feasibility(self) -> Sequence[Optional[bool]]:
+        """Designs' feasibility."""
+        return self.__feasibility
+
+    @property
+    def ids(self) -> Sequence[str]:
+        """Designs' ids."""
+        return self.__ids
+
+    @property
+    def limit_states(self) -> Dict[str, Sequence[Any]]:
+        """Columns of limit state values by limit state name."""
+        return self.__limit_states
+
+    @property
+    def objectives(self) -> Dict[str, Sequence[Any]]:
+        """Columns of objective values by objective name."""
+        return self.__objectives
+
+    @property
+    def parameters(self) -> Dict[str, Sequence[Any]]:
+        """Columns of parameter values by parameter name."""
+        return self.__parameters
+
+    @property
+    def pareto_design(self) -> Sequence[Optional[bool]]:
+        """Designs' pareto design flags."""
+        return self.__pareto_design
+
+    @property
+    def responses(self) -> Dict[str, Sequence[Any]]:
+        """Columns of response values by response name."""
+        return self.__responses
+
+    @property
+    def status(self) -> Sequence[str]:
+        """Designs' status, given by names of the ``DesignStatus`` members."""
+        return self.__status
+
+    def to_dict(self) -> Dict[str, Sequence[Any]]:
+        """Get all columns in one dictionary.
+
+        The design properties are stored under the ``id``, ``feasible``, ``status`` and
+        ``pareto_design`` keys, followed by constraints, limit states, objectives,
+        parameters and responses, which are stored under their names. If a name is already
+        taken, it is prefixed by the group name, e.g. ``objectives.name``.
+
+        Returns
+        -------
+        Dict[str, Sequence[Any]]
+            Columns by name.
+        """
+        columns: Dict[str, Sequence[Any]] = {
+            "id": self.__ids,
+            "feasible": self.__feasibility,
+            "status": self.__status,
+            "pareto_design": self.__pareto_design,
+        }
+        for group in self._GROUPS:
+            for name, column in getattr(self, group).items():
+                columns[name if name not in columns else f"{group}.{name}"] = column
+        return columns
+
+    def to_numpy(self) -> Any:
+        """Get designs as NumPy structured array.
+
+        Column names are the same as the keys of the ``to_dict()`` method. Columns with
+        non-scalar values are stored as object arrays.
+
+        Returns
+        -------
+        numpy.ndarray
+            Structured array with one record per design.
+
+        Raises
+        ------
+        ImportError
+            Raised when the ``numpy`` package is not installed.
+        """
+        numpy = _import_optional_module("numpy", self.to_numpy.__name__)
+        arrays = {}
+        for name, column in self.to_dict().items():
+            array = numpy.asarray(column)
+            if array.ndim != 1:
+                array = numpy.empty(len(column), dtype=object)
+                for index, value in enumerate(column):
+                    array[index] = value
+            arrays[name] = array
+        table = numpy.empty(
+            len(self), dtype=[(name, array.dtype) for name, array in arrays.items()]
+        )
+        for name, array in arrays.items():
+            table[name] = array
+        return table
+
+    def to_pandas(self) -> Any:
+        """Get designs as pandas data frame.
+
+        Column names are the same as the keys of the ``to_dict()`` method.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Data frame with one row per design.
+
+        Raises
+        ------
+        ImportError
+            Raised when the ``pandas`` package is not installed.
+        """
+        pandas = _import_optional_module("pandas", self.to_pandas.__name__)
+        return pandas.DataFrame(self.to_dict())
+
+    def to_arrow(self) -> Any:
+        """Get designs as Arrow table.
+
+        Column names are the same as the keys of the ``to_dict()`` method.
+
+        Returns
+        -------
+        pyarrow.Table
+            Table with one row per design.
+
+        Raises
+        ------
+        ImportError
+            Raised when the ``pyarrow`` package is not installed.
+        """
+        pyarrow = _import_optional_module("pyarrow", self.to_arrow.__name__)
+        return pyarrow.table(self.to_dict())
+
+
+def _import_optional_module(name: str, feature: str) -> Any:
+    """Import module of an optional dependency.
+
+    Parameters
+    ----------
+    name : str
+        Name of the module.
+    feature : str
+        Name of the feature requiring the module, used in the error message.
+
+    Returns
+    -------
+    Any
+        Imported module.
+
+    Raises
+    ------
+    ImportError
+        Raised when the module is not installed.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError as ex:
+        raise ImportError(f"``{feature}`` requires the ``{name}`` package to be installed.") from ex
+
+
 # endregion
 
 # endregion
@@ -0,0 +1,995 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Contains classes for asynchronous plain TCP/IP communication with server."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import struct
+import sys
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from ansys.optislang.core.communication_channels import CommunicationChannel
+from ansys.optislang.core.encoding import force_bytes, force_text
+from ansys.optislang.core.errors import (
+    ConnectionEstablishedError,
+    ConnectionNotEstablishedError,
+    EmptyResponseError,
+    OslCommunicationError,
+    ResponseFormatError,
+)
+from ansys.optislang.core.json_codec import JsonCodec, get_json_codec
+from ansys.optislang.core.osl_server import OslVersion
+from ansys.optislang.core.tcp import server_commands as commands
+from ansys.optislang.core.tcp import server_queries as queries
+from ansys.optislang.core.tcp.osl_server import (
+    FunctionsAttributeRegister,
+    TcpOslServer,
+    _check_command_response,
+    _get_current_timeout,
+    _merge_server_commands,
+    _parse_osl_version,
+    _split_batch_responses,
+)
+
+
+class AsyncTcpClient:
+    r"""Asynchronous client for both TCP/IP and local domain communication.
+
+    It uses the same message framing as :py:class:`TcpClient
+    <ansys.optislang.core.tcp.osl_server.TcpClient>`: each message is preceded by its length
+    encoded twice as binary 64-bit unsigned integer.
+
+    Parameters
+    ----------
+    logger: Any, optional
+        Object for logging. If ``None``, standard logging object is used. Defaults to ``None``.
+
+    Examples
+    --------
+    Connect to the plain TCP/IP server with IP address of localhost and port 49690. Send
+    the following message:
+    '{ "What": "SYSTEMS_STATUS_INFO" }'
+
+    >>> import asyncio
+    >>> from ansys.optislang.core.tcp.async_osl_server import AsyncTcpClient
+    >>> async def main():
+    >>>     client = AsyncTcpClient()
+    >>>     await client.connect('127.0.0.1', 49690)
+    >>>     await client.send_msg('{ "What": "SYSTEMS_STATUS_INFO" }')
+    >>>     print(await client.receive_msg())
+    >>>     await client.disconnect()
+    >>> asyncio.run(main())
+    """
+
+    # Response size in bytes. Value is assumed to be binary 64Bit unsigned integer.
+    _RESPONSE_SIZE_BYTES = 8
+
+    def __init__(self, logger: Optional[Any] = None) -> None:
+        """Initialize a new instance of the ``AsyncTcpClient`` class."""
+        self.__reader: Optional[asyncio.StreamReader] = None
+        self.__writer: Optional[asyncio.StreamWriter] = None
+
+        if logger is None:
+            self._logger = logging.getLogger(__name__)
+        else:
+            self._logger = logger
+
+    @property
+    def is_connected(self) -> bool:
+        """Determine whether the connection has been established.
+
+        Returns
+        -------
+        bool
+            True if the connection has been established; False otherwise.
+        """
+        return self.__writer is not None
+
+    async def connect(self, host: str, port: int, timeout: Optional[float] = 2) -> None:
+        """Connect to the plain TCP/IP server.
+
+        Parameters
+        ----------
+        host : str
+            A string representation of an IPv4/v6 address or domain name.
+        port : int
+            A numeric port number.
+        timeout : Optional[float], optional
+            Timeout in seconds to establish a connection. If ``None`` is given, the function waits
+            until the connection is established. Defaults to 2 s.
+
+        Raises
+        ------
+        ConnectionEstablishedError
+            Raised when the connection is already established.
+        ConnectionRefusedError
+            Raised when the connection cannot be established.
+        TimeoutError
+            Raised when the timeout period value has elapsed before the operation has completed.
+        """
+        if self.is_connected:
+            raise ConnectionEstablishedError("Connection is already established.")
+        try:
+            self.__reader, self.__writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port), timeout
+            )
+        except (TimeoutError, asyncio.TimeoutError):
+            raise TimeoutError(f"Connection to host {host} and port {port} timed out.")
+        except OSError as ex:
+            raise ConnectionRefusedError(
+                f"Connection could not be established to host {host} and port {port}: {ex}"
+            )
+        self._logger.debug("Connection has been established to host %s and port %d.", host, port)
+
+    async def connect_local(self, local_server_id: str, timeout: Optional[float] = 2) -> None:
+        """Connect to a local domain server.
+
+        Parameters
+        ----------
+        local_server_id : str
+            The ID of a running optiSLang local domain server to connect.
+        timeout : Optional[float], optional
+            Timeout in seconds to establish a connection. If ``None`` is given, the function waits
+            until the connection is established. Defaults to 2 s.
+
+        Raises
+        ------
+        ConnectionEstablishedError
+            Raised when the connection is already established.
+        ConnectionRefusedError
+            Raised when the connection cannot be established.
+        TimeoutError
+            Raised when the timeout period value has elapsed before the operation has completed.
+        """
+        if self.is_connected:
+            raise ConnectionEstablishedError("Connection is already established.")
+        try:
+            self.__reader, self.__writer = await asyncio.wait_for(
+                self.__open_local_connection(local_server_id), timeout
+            )
+        except (TimeoutError, asyncio.TimeoutError):
+            raise TimeoutError(f"Connection to local server {local_server_id} timed out.")
+        except OSError as ex:
+            raise ConnectionRefusedError(
+                f"Connection could not be established to local server {local_server_id}: {ex}"
+            )
+        self._logger.debug("Connection has been established to local server %s.", local_server_id)
+
+    async def disconnect(self) -> None:
+        """Disconnect from the server."""
+        writer = self.__writer
+        self.__reader = None
+        self.__writer = None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def send_msg(self, msg: str, timeout: Optional[float] = 5) -> None:
+        """Send message to the server.
+
+        Parameters
+        ----------
+        msg : str
+            Message to send.
+        timeout : Optional[float], optional
+            Timeout in seconds to send a message. If ``None`` is given, the function waits
+            until the message is sent. Defaults to 5 s.
+
+        Raises
+        ------
+        ConnectionNotEstablishedError
+            Raised when the connection has not been established before function call.
+        TimeoutError
+            Raised when the timeout period value has elapsed before the operation has completed.
+        OSError
+            Raised when an error occurs while sending data.
+        """
+        if self.__writer is None:
+            raise ConnectionNotEstablishedError(
+                "Cannot send message. Connection is not established."
+            )
+        data = force_bytes(msg)
+        self._logger.debug("Sending message to %s. Message: %s", self.__peer_name(), msg)
+        self.__writer.write(struct.pack("!QQ", len(data), len(data)) + data)
+        try:
+            await asyncio.wait_for(self.__writer.drain(), timeout)
+        except (TimeoutError, asyncio.TimeoutError):
+            raise TimeoutError("Sending of the message timed out.")
+
+    async def receive_msg(self, timeout: Optional[float] = 5) -> str:
+        """Receive message from the server.
+
+        Parameters
+        ----------
+        timeout : Optional[float], optional
+            Timeout in seconds to receive a message. If ``None`` is given, the function waits
+            until the message is received. Defaults to 5 s.
+
+        Returns
+        -------
+        str
+            Received message from the server.
+
+        Raises
+        ------
+        ConnectionNotEstablishedError
+            Raised when the connection has not been established before function call.
+        EmptyResponseError
+            Raised when the empty message is received.
+        ResponseFormatError
+            Raised when the format of the received message is not valid.
+        TimeoutError
+            Raised when the timeout period value has elapsed before the operation has completed.
+        ConnectionError
+            Raised when the connection is closed before receiving all expected data.
+        """
+        if self.__reader is None:
+            raise ConnectionNotEstablishedError(
+                "Cannot receive message. Connection is not established."
+            )
+        try:
+            return await asyncio.wait_for(self.__receive_msg(self.__reader), timeout)
+        except (TimeoutError, asyncio.TimeoutError):
+            raise TimeoutError("Receiving of the message timed out.")
+
+    async def __receive_msg(self, reader: asyncio.StreamReader) -> str:
+        """Receive the message length header followed by the message."""
+        header = await self.__read_exactly(reader, 2 * self._RESPONSE_SIZE_BYTES)
+        response_len_1, response_len_2 = struct.unpack("!QQ", header)
+        if response_len_1 != response_len_2:
+            raise ResponseFormatError(
+                "Server response format unrecognized. Response sizes do not match."
+            )
+        if response_len_1 == 0:
+            raise EmptyResponseError("The empty message has been received.")
+        return force_text(await self.__read_exactly(reader, response_len_1))
+
+    @staticmethod
+    async def __read_exactly(reader: asyncio.StreamReader, count: int) -> bytes:
+        """Read exactly ``count`` bytes, raising ``ConnectionError`` on premature end of stream."""
+        try:
+            return await reader.readexactly(count)
+        except asyncio.IncompleteReadError as ex:
+            raise ConnectionError(
+                f"Connection closed after receiving {len(ex.partial)} of {count} bytes"
+            ) from ex
+
+    @staticmethod
+    async def __open_local_connection(
+        local_server_id: str,
+    ) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Open a stream to the local domain server."""
+        if sys.platform == "win32":
+            loop = asyncio.get_running_loop()
+            reader = asyncio.StreamReader()
+            protocol = asyncio.StreamReaderProtocol(reader)
+            transport, _ = await loop.create_pipe_connection(  # type: ignore[attr-defined]
+                lambda: protocol, local_server_id
+            )
+            return reader, asyncio.StreamWriter(transport, protocol, reader, loop)
+        else:
+            return await asyncio.open_unix_connection(local_server_id)
+
+    def __peer_name(self) -> Any:
+        """Get the remote address for logging purposes."""
+        if self.__writer is None:
+            return None
+        return self.__writer.get_extra_info("peername")
+
+
+class AsyncTcpOslServer:
+    """Asynchronous access to a running optiSLang server using plain TCP/IP communication.
+
+    Commands and queries are awaitable, so that a single event loop can communicate with many
+    optiSLang servers concurrently. The requests are generated by the functions from
+    the :ref:`server_queries <ref_osl_server_api_queries>` and
+    :ref:`server_commands <ref_osl_server_api_commands>` modules and can also be sent directly
+    using the generic :py:meth:`send_command` method.
+
+    Unlike :py:class:`TcpOslServer <ansys.optislang.core.tcp.osl_server.TcpOslServer>`, this class
+    does not start optiSLang server processes and does not register listeners. It connects to
+    an already running optiSLang server.
+
+    Parameters
+    ----------
+    local_server_id: Optional[str], optional
+        The ID of a running optiSLang local domain server to connect. Defaults to ``None``.
+    host : Optional[str], optional
+        A string representation of an IPv4/v6 address of a running optiSLang remote server.
+        Defaults to ``None``.
+    port : Optional[int], optional
+        A numeric port number of a running optiSLang remote server. Defaults to ``None``.
+    password : Optional[str], optional
+        The server password. Use when communication with the server requires the request
+        to contain a password entry. Defaults to ``None``.
+    logger : Optional[Any], optional
+        Object for logging. If ``None``, standard logging object is used. Defaults to ``None``.
+    json_codec : Union[str, JsonCodec, None], optional
+        Codec used to decode server responses, either codec instance or codec name, see
+        :py:func:`get_json_codec <ansys.optislang.core.json_codec.get_json_codec>`.
+        Defaults to ``None`` which results in using the default codec.
+
+    Raises
+    ------
+    ValueError
+        Raised when neither local server ID nor host and port are specified.
+
+    Examples
+    --------
+    Query the version of multiple running optiSLang servers concurrently.
+
+    >>> import asyncio
+    >>> from ansys.optislang.core.tcp.async_osl_server import AsyncTcpOslServer
+    >>> async def main(ports):
+    >>>     servers = [AsyncTcpOslServer(host="127.0.0.1", port=port) for port in ports]
+    >>>     return await asyncio.gather(*[server.get_osl_version() for server in servers])
+    >>> print(asyncio.run(main([49200, 49201])))
+    """
+
+    _PIPELINE_WINDOW_SIZE = TcpOslServer._PIPELINE_WINDOW_SIZE
+
+    def __init__(
+        self,
+        local_server_id: Optional[str] = None,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        password: Optional[str] = None,
+        logger: Optional[Any] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+    ) -> None:
+        """Initialize a new instance of the ``AsyncTcpOslServer`` class."""
+        if local_server_id is None and (host is None or port is None):
+            raise ValueError("Either local server ID or host and port must be specified.")
+        self.__local_server_id = local_server_id
+        self.__host = host
+        self.__port = port
+        self.__communication_channel = (
+            CommunicationChannel.LOCAL_DOMAIN
+            if local_server_id is not None
+            else CommunicationChannel.TCP
+        )
+        self.__password = password
+        self.__json_codec = get_json_codec(json_codec)
+        self.__timeouts_register = self.__get_default_timeouts_register()
+        self.__max_request_attempts_register = self.__get_default_max_request_attempts_register()
+
+        self._logger = logging.getLogger(__name__) if logger is None else logger
+
+    @property
+    def host(self) -> Optional[str]:
+        """IPv4/v6 address or domain name of the optiSLang server, if applicable."""
+        return self.__host
+
+    @property
+    def json_codec(self) -> JsonCodec:
+        """Codec used to decode server responses."""
+        return self.__json_codec
+
+    @property
+    def local_server_id(self) -> Optional[str]:
+        """Local server ID of the optiSLang server, if applicable."""
+        return self.__local_server_id
+
+    @property
+    def port(self) -> Optional[int]:
+        """Port the optiSLang server is listening on, if applicable."""
+        return self.__port
+
+    @property
+    def max_request_attempts_register(self) -> FunctionsAttributeRegister:
+        """Register with maximum number of attempts to be executed for individual functions.
+
+        If max_request_attempts for specific function is not specified, default value is used.
+        """
+        return self.__max_request_attempts_register
+
+    @property
+    def timeouts_register(self) -> FunctionsAttributeRegister:
+        """Register with timeout for a single attempt of execution for individual functions.
+
+        If timeout for specific function is not specified, default value is used.
+        """
+        return self.__timeouts_register
+
+    async def evaluate_design(self, evaluate_dict: Dict[str, float]) -> List[dict]:
+        """Evaluate requested design.
+
+        Parameters
+        ----------
+        evaluate_dict: Dict[str, float]
+            {'parName': value, ...}
+
+        Returns
+        -------
+        List[dict]
+            Output from optislang server.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        return await self.__send_function_command(
+            self.evaluate_design, commands.evaluate_design(evaluate_dict, self.__password)
+        )
+
+    async def get_actor_info(self, uid: str) -> Dict:
+        """Get info about actor defined by uid.
+
+        Parameters
+        ----------
+        uid : str
+            Actor uid.
+
+        Returns
+        -------
+        Dict
+            Info about actor defined by uid.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        return await self.__send_function_command(
+            self.get_actor_info, queries.actor_info(uid=uid, password=self.__password)
+        )
+
+    async def get_actor_properties(self, uid: str) -> Dict:
+        """Get properties of actor defined by uid.
+
+        Parameters
+        ----------
+        uid : str
+            Actor uid.
+
+        Returns
+        -------
+        Dict
+            Properties of actor defined by uid.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        return await self.__send_function_command(
+            self.get_actor_properties, queries.actor_properties(uid=uid, password=self.__password)
+        )
+
+    async def get_actor_status_info(
+        self,
+        uid: str,
+        hid: str,
+        include_designs: bool = True,
+        include_design_values: bool = True,
+        include_non_scalar_design_values: bool = False,
+        include_algorithm_info: bool = False,
+    ) -> Dict:
+        """Get status info about actor defined by actor uid and state Hid.
+
+        Parameters
+        ----------
+        uid : str
+            Actor uid.
+        hid: str
+            State/Design hierarchical id.
+        include_designs: bool
+            Include (result) designs in status info response.
+        include_design_values: bool
+            Include values in (result) designs.
+        include_non_scalar_design_values: bool
+            Include non scalar values in (result) designs.
+        include_algorithm_info: bool
+            Include algorithm result info in status info response.
+
+        Returns
+        -------
+        Dict
+            Info about actor defined by uid.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        return await self.__send_function_command(
+            self.get_actor_status_info,
+            queries.actor_status_info(
+                uid=uid,
+                hid=hid,
+                include_designs=include_designs,
+                include_design_values=include_design_values,
+                include_non_scalar_design_values=include_non_scalar_design_values,
+                include_algorithm_info=include_algorithm_info,
+                password=self.__password,
+            ),
+        )
+
+    async def get_basic_project_info(self) -> Dict:
+        """Get basic project info, like name, location, global settings and status.
+
+        Returns
+        -------
+        Dict
+            Basic project info, like name, location, global settings and status.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        return await self.__send_function_command(
+            self.get_basic_project_info, queries.basic_project_info(self.__password)
+        )
+
+    async def get_full_project_tree_with_properties(self) -> Dict:
+        """Get full project tree with properties.
+
+        Returns
+        -------
+        Dict
+            Full project tree with properties.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        return await self.__send_function_command(
+            self.get_full_project_tree_with_properties,
+            queries.full_project_tree_with_properties(self.__password),
+        )
+
+    async def get_osl_version(self) -> OslVersion:
+        """Get version of used optiSLang.
+
+        Returns
+        -------
+        OslVersion
+            optiSLang version as typing.NamedTuple containing
+            major, minor, maintenance and revision versions.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        RuntimeError
+            Raised when parsing version numbers from string fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        return _parse_osl_version(await self.get_osl_version_string())
+
+    async def get_osl_version_string(self) -> str:
+        """Get version of used optiSLang.
+
+        Returns
+        -------
+        str
+            optiSLang version.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        server_info = await self.get_server_info()
+        return server_info["application"]["version"]
+
+    async def get_project_status(self) -> Optional[str]:
+        """Get status of the optiSLang project.
+
+        Returns
+        -------
+        Optional[str]
+            optiSLang project status. If no project is loaded in the optiSLang,
+            returns ``None``.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        project_info = await self.get_basic_project_info()
+        if len(project_info.get("projects", [])) == 0:
+            return None
+        return project_info.get("projects", [{}])[0].get("state", None)
+
+    async def get_server_info(self) -> Dict:
+        """Get information about the application, the server configuration and the open projects.
+
+        Returns
+        -------
+        Dict
+            Information about the application, the server configuration and the open projects.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        return await self.__send_function_command(
+            self.get_server_info, queries.server_info(self.__password)
+        )
+
+    async def get_server_is_alive(self) -> bool:
+        """Get info whether the server is alive.
+
+        Returns
+        -------
+        bool
+            Whether the server is alive.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        response = await self.__send_function_command(
+            self.get_server_is_alive, queries.server_is_alive(password=self.__password)
+        )
+        return response.get("status") == "success"
+
+    async def reset(self) -> None:
+        """Reset complete project.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        await self.__send_function_command(self.reset, commands.reset(password=self.__password))
+
+    async def save(self) -> None:
+        """Save the changed data and settings of the current project.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        await self.__send_function_command(self.save, commands.save(password=self.__password))
+
+    async def start(self) -> None:
+        """Start project execution without waiting for it to be started or finished.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        await self.__send_function_command(self.start, commands.start(password=self.__password))
+
+    async def stop(self) -> None:
+        """Stop project execution without waiting for it to be finished.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        await self.__send_function_command(self.stop, commands.stop(password=self.__password))
+
+    async def send_command(self, command: str, **kwargs) -> Any:
+        """Send command or query to the optiSLang server.
+
+        Parameters
+        ----------
+        command: str
+            Command or query to be executed on optiSLang server.
+        timeout: Optional[float], optional
+            Timeout to execute command. If not provided,
+            `AsyncTcpOslServer.timeouts_register.default_value` is used.
+        max_request_attempts: int, optional
+            Maximum number of attempts to execute command. If not provided,
+            `AsyncTcpOslServer.max_request_attempts_register.default_value` is used.
+
+        Returns
+        -------
+        Any
+            Response from the server.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout expires.
+        """
+        timeout = (
+            kwargs.get("timeout")
+            if "timeout" in kwargs.keys()
+            else self.timeouts_register.default_value
+        )
+        max_request_attempts = kwargs.get(
+            "max_request_attempts", self.max_request_attempts_register.default_value
+        )
+        self._logger.debug("Sending command or query to the server: %s", command)
+        response_str = (await self.__send_requests([command], timeout, max_request_attempts))[0]
+        self._logger.debug("Response received: %s", response_str)
+        response = self.__json_codec.loads(response_str)
+        _check_command_response(response)
+        return response
+
+    async def send_commands(self, commands: Iterable[str], **kwargs) -> List[Any]:
+        """Send multiple commands or queries to the optiSLang server in one batch.
+
+        Consecutive server commands are merged into a single request and queries
+        are pipelined over one connection.
+
+        Parameters
+        ----------
+        commands: Iterable[str]
+            Commands or queries to be executed on optiSLang server.
+        timeout: Optional[float], optional
+            Timeout to execute the whole batch. If not provided,
+            `AsyncTcpOslServer.timeouts_register.default_value` is used.
+        max_request_attempts: int, optional
+            Maximum number of attempts to execute the batch. If not provided,
+            `AsyncTcpOslServer.max_request_attempts_register.default_value` is used.
+
+        Returns
+        -------
+        List[Any]
+            Responses from the server in the order of given commands and queries.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when any of the commands or queries fails.
+        ResponseFormatError
+            Raised when the response to merged commands does not match the number of commands.
+        TimeoutError
+            Raised when the timeout expires.
+        """
+        timeout = (
+            kwargs.get("timeout")
+            if "timeout" in kwargs.keys()
+            else self.timeouts_register.default_value
+        )
+        max_request_attempts = kwargs.get(
+            "max_request_attempts", self.max_request_attempts_register.default_value
+        )
+        requests, command_counts = _merge_server_commands(commands, self.__json_codec)
+        if not requests:
+            return []
+        self._logger.debug("Sending batch of %d requests to the server.", len(requests))
+        response_strs = await self.__send_requests(requests, timeout, max_request_attempts)
+        return _split_batch_responses(
+            [self.__json_codec.loads(resp) for resp in response_strs], command_counts
+        )
+
+    async def __connect_client(self, timeout: Optional[float]) -> AsyncTcpClient:
+        """Create a new client connected to the optiSLang server."""
+        client = AsyncTcpClient(logger=self._logger)
+        if self.__communication_channel == CommunicationChannel.LOCAL_DOMAIN:
+            await client.connect_local(str(self.__local_server_id), timeout=timeout)
+        else:
+            await client.connect(str(self.__host), int(str(self.__port)), timeout=timeout)
+        return client
+
+    async def __exchange_messages(
+        self,
+        client: AsyncTcpClient,
+        requests: List[str],
+        timeout: Optional[float],
+        start_time: float,
+    ) -> List[str]:
+        """Send requests over one connection and receive the responses in order.
+
+        Requests are pipelined, i.e. further requests are sent before the preceding responses
+        are received, as long as the size of the unanswered requests does not exceed
+        ``_PIPELINE_WINDOW_SIZE`` bytes.
+
+        Parameters
+        ----------
+        client : AsyncTcpClient
+            Connected client.
+        requests : List[str]
+            Requests to be sent.
+        timeout : Optional[float]
+            Timeout for the whole exchange.
+        start_time : float
+            The time when the timeout starts to count down.
+
+        Returns
+        -------
+        List[str]
+            Responses in the order of requests.
+        """
+        responses: List[str] = []
+        pending_sizes: List[int] = []
+        pending_size = 0
+        for request in requests:
+            while pending_sizes and pending_size + len(request) > self._PIPELINE_WINDOW_SIZE:
+                responses.append(
+                    await client.receive_msg(timeout=_get_current_timeout(timeout, start_time))
+                )
+                pending_size -= pending_sizes.pop(0)
+            await client.send_msg(request, timeout=_get_current_timeout(timeout, start_time))
+            pending_sizes.append(len(request))
+            pending_size += len(request)
+        for _ in pending_sizes:
+            responses.append(
+                await client.receive_msg(timeout=_get_current_timeout(timeout, start_time))
+            )
+        return responses
+
+    async def __send_function_command(self, function: Any, command: str) -> Any:
+        """Send command using timeout and maximum request attempts registered for function."""
+        return await self.send_command(
+            command,
+            timeout=self.timeouts_register.get_value(function),
+            max_request_attempts=self.max_request_attempts_register.get_value(function),
+        )
+
+    async def __send_requests(
+        self, requests: List[str], timeout: Optional[float], max_request_attempts: int
+    ) -> List[str]:
+        """Send requests over a new connection for each request attempt.
+
+        Parameters
+        ----------
+        requests : List[str]
+            Commands or queries to be executed on optiSLang server.
+        timeout : Optional[float]
+            Timeout to execute a single request attempt.
+        max_request_attempts : int
+            Maximum number of attempts to execute requests.
+
+        Returns
+        -------
+        List[str]
+            Responses from the server in the order of requests.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        TimeoutError
+            Raised when the timeout expires.
+        """
+        responses: List[str] = []
+
+        for request_attempt in range(1, max_request_attempts + 1):
+            start_time = time.time()
+            client: Optional[AsyncTcpClient] = None
+            try:
+                client = await self.__connect_client(_get_current_timeout(timeout, start_time))
+                responses = await self.__exchange_messages(client, requests, timeout, start_time)
+                break
+            except TimeoutError:
+                if request_attempt == max_request_attempts:
+                    raise
+                else:
+                    pass
+            except Exception as ex:
+                raise OslCommunicationError(
+                    "An error occurred while communicating with the optiSLang server."
+                ) from ex
+            finally:
+                if client is not None:
+                    await client.disconnect()
+
+        return responses
+
+    def __get_default_max_request_attempts_register(self) -> FunctionsAttributeRegister:
+        max_requests_register = FunctionsAttributeRegister(
+            default_value=2, validator=self.__class__.__validate_max_request_attempts_value
+        )
+        max_requests_register.register(self.__class__.evaluate_design, 1)
+        max_requests_register.register(self.__class__.reset, 1)
+        max_requests_register.register(self.__class__.save, 1)
+        max_requests_register.register(self.__class__.start, 1)
+        max_requests_register.register(self.__class__.stop, 1)
+        return max_requests_register
+
+    def __get_default_timeouts_register(self) -> FunctionsAttributeRegister:
+        timeout_register = FunctionsAttributeRegister(
+            default_value=30, validator=self.__class__.__validate_timeout_value
+        )
+        timeout_register.register(self.__class__.evaluate_design, None)
+        timeout_register.register(self.__class__.reset, None)
+        timeout_register.register(self.__class__.save, None)
+        timeout_register.register(self.__class__.start, None)
+        timeout_register.register(self.__class__.stop, None)
+        return timeout_register
+
+    @staticmethod
+    def __validate_timeout_value(value: Any) -> bool:
+        return value is None or (
+            isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0
+        )
+
+    @staticmethod
+    def __validate_max_request_attempts_value(value: Any) -> bool:
+        return isinstance(value, int) and not isinstance(value, bool) and value > 0
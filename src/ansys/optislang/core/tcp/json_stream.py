@@ -0,0 +1,197 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Contains functions for incremental decoding of large JSON documents."""
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any, Collection, Iterable, Iterator, Sequence, Set, Tuple, Union
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_NUMBER_START = "-0123456789"
+_NUMBER_CHARS = "+-.0123456789Ee"
+
+
+class _TextStream:
+    """Text buffer refilled on demand from an iterable of UTF-8 encoded chunks."""
+
+    def __init__(self, chunks: Iterable[Union[bytes, bytearray]]) -> None:
+        self.__chunks = iter(chunks)
+        self.__decoder = codecs.getincrementaldecoder("utf-8")()
+        self.__text = ""
+        self.__pos = 0
+        self.__eof = False
+
+    def decode_value(self) -> Any:
+        """Decode the whole JSON value starting at the current position."""
+        char = self.peek()
+        if char and char in _NUMBER_START:
+            # Number could continue in the next chunk, make sure its end is buffered.
+            while self.__number_end() == len(self.__text) and self.__read(1):
+                pass
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.__text, self.__pos)
+            except json.JSONDecodeError:
+                # Value is incomplete, at least double the buffered text to keep
+                # repeated decoding attempts of large values linear in time.
+                if not self.__read(2 * (len(self.__text) - self.__pos)):
+                    raise
+                continue
+            self.__pos = end
+            return value
+
+    def next_char(self) -> str:
+        """Consume the next non-whitespace character, empty string at the end of the stream."""
+        char = self.peek()
+        self.__pos += len(char)
+        return char
+
+    def peek(self) -> str:
+        """Get the next non-whitespace character, empty string at the end of the stream."""
+        while True:
+            while self.__pos < len(self.__text) and self.__text[self.__pos] in _WHITESPACE:
+                self.__pos += 1
+            if self.__pos < len(self.__text):
+                return self.__text[self.__pos]
+            if not self.__read(1):
+                return ""
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        """Create decoding error at the current position."""
+        return json.JSONDecodeError(message, self.__text, self.__pos)
+
+    def __number_end(self) -> int:
+        """Get the end position of the number characters starting at the current position."""
+        end = self.__pos
+        while end < len(self.__text) and self.__text[end] in _NUMBER_CHARS:
+            end += 1
+        return end
+
+    def __read(self, min_size: int) -> bool:
+        """Read chunks until at least ``min_size`` characters are available or stream ends."""
+        if self.__eof:
+            return False
+        parts = [self.__text[self.__pos :]]
+        size = 0
+        while size < max(min_size, 1):
+            try:
+                chunk = next(self.__chunks)
+            except StopIteration:
+                parts.append(self.__decoder.decode(b"", final=True))
+                self.__eof = True
+                break
+            part = self.__decoder.decode(chunk)
+            parts.append(part)
+            size += len(part)
+        self.__text = "".join(parts)
+        self.__pos = 0
+        return True
+
+
+def iter_json_events(
+    chunks: Iterable[Union[bytes, bytearray]], stream_paths: Collection[Sequence[str]]
+) -> Iterator[Tuple[Tuple[str, ...], Any]]:
+    """Decode JSON document incrementally and yield its values.
+
+    Items of arrays located at one of the ``stream_paths`` are yielded one by one,
+    as soon as they are decoded. Objects on the way to these arrays are traversed,
+    all other values are yielded whole. Only the currently decoded value and a small
+    amount of the undecoded text are held in memory.
+
+    Parameters
+    ----------
+    chunks : Iterable[Union[bytes, bytearray]]
+        UTF-8 encoded JSON document split into chunks of arbitrary size.
+    stream_paths : Collection[Sequence[str]]
+        Paths of the arrays, whose items are yielded one by one, specified as sequences of
+        object keys, e.g. ``[("designs", "values")]``.
+
+    Yields
+    ------
+    Tuple[Tuple[str, ...], Any]
+        Path of the value specified as tuple of object keys and the decoded value.
+        Items of streamed arrays share the path of the array.
+
+    Raises
+    ------
+    json.JSONDecodeError
+        Raised when the document is not a valid JSON document.
+
+    Examples
+    --------
+    Stream design values of the status info response.
+
+    >>> from ansys.optislang.core.tcp.json_stream import iter_json_events
+    >>> chunks = [b'{"designs": {"names": ["X"], "val', b'ues": [[1], [2]]}}']
+    >>> list(iter_json_events(chunks, [("designs", "values")]))
+    [(('designs', 'names'), ['X']), (('designs', 'values'), [1]), (('designs', 'values'), [2])]
+    """
+    streamed = {tuple(path) for path in stream_paths}
+    prefixes = {path[:i] for path in streamed for i in range(len(path))}
+    stream = _TextStream(chunks)
+    yield from _iter_value_events(stream, (), streamed, prefixes)
+    if stream.peek() != "":
+        raise stream.error("Extra data")
+
+
+def _iter_value_events(
+    stream: _TextStream,
+    path: Tuple[str, ...],
+    streamed: Set[Tuple[str, ...]],
+    prefixes: Set[Tuple[str, ...]],
+) -> Iterator[Tuple[Tuple[str, ...], Any]]:
+    """Yield events of the value starting at the current position of the stream."""
+    if path in streamed and stream.peek() == "[":
+        stream.next_char()
+        if stream.peek() == "]":
+            stream.next_char()
+            return
+        while True:
+            yield path, stream.decode_value()
+            char = stream.next_char()
+            if char == "]":
+                return
+            if char != ",":
+                raise stream.error("Expecting ',' delimiter")
+    elif path in prefixes and stream.peek() == "{":
+        stream.next_char()
+        if stream.peek() == "}":
+            stream.next_char()
+            return
+        while True:
+            if stream.peek() != '"':
+                raise stream.error("Expecting property name enclosed in double quotes")
+            key = stream.decode_value()
+            if stream.next_char() != ":":
+                raise stream.error("Expecting ':' delimiter")
+            yield from _iter_value_events(stream, path + (key,), streamed, prefixes)
+            char = stream.next_char()
+            if char == "}":
+                return
+            if char != ",":
+                raise stream.error("Expecting ',' delimiter")
+    else:
+        yield path, stream.decode_value()
@@ -25,10 +25,11 @@ from __future__ import annotations
 
 import logging
 import os
+import select
 import socket
 import sys
 import time
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 if sys.platform == "win32":
     import pywintypes
@@ -355,6 +356,88 @@ class LocalClientSocket(LocalSocket):
             else:
                 return self._socket.recv(bufsize)
 
+    def recv_into(self, buffer: Union[bytearray, memoryview], nbytes: int = 0) -> int:
+        """Receive data from the socket directly into a buffer.
+
+        Parameters
+        ----------
+        buffer : Union[bytearray, memoryview]
+            Writable buffer the received data is stored to.
+        nbytes : int, optional
+            Maximum number of bytes to receive. If ``0``, the size of the buffer is used.
+
+        Returns
+        -------
+        int
+            Number of received bytes.
+        """
+        return self.recv_into_with_timeout(buffer, nbytes, self._timeout)
+
+    def recv_into_with_timeout(
+        self, buffer: Union[bytearray, memoryview], nbytes: int, timeout: Optional[float]
+    ) -> int:
+        """Receive data from the socket directly into a buffer with timeout support.
+
+        Parameters
+        ----------
+        buffer : Union[bytearray, memoryview]
+            Writable buffer the received data is stored to.
+        nbytes : int
+            Maximum number of bytes to receive. If ``0``, the size of the buffer is used.
+        timeout : Optional[float]
+            Timeout in seconds, None for blocking
+
+        Returns
+        -------
+        int
+            Number of received bytes.
+        """
+        if nbytes <= 0:
+            nbytes = len(buffer)
+        if sys.platform == "win32":
+            data = self.recv_with_timeout(nbytes, timeout)
+            buffer[: len(data)] = data
+            return len(data)
+        else:
+            if self._socket is None:
+                raise ConnectionError("Not connected")
+            if timeout is not None:
+                original_timeout = self._socket.gettimeout()
+                self._socket.settimeout(timeout)
+                try:
+                    return self._socket.recv_into(buffer, nbytes)
+                finally:
+                    self._socket.settimeout(original_timeout)
+            else:
+                return self._socket.recv_into(buffer, nbytes)
+
+    def poll_readable(self) -> bool:
+        """Check without blocking whether data or the end of the stream can be read.
+
+        Returns
+        -------
+        bool
+            True if a read would not block or the connection is broken; False otherwise.
+        """
+        if sys.platform == "win32":
+            if self._handle is None:
+                return True
+            try:
+                _, bytes_available, _ = win32pipe.PeekNamedPipe(  # type: ignore[name-defined]
+                    self._handle, 0
+                )
+            except pywintypes.error:  # type: ignore[name-defined]
+                return True
+            return bytes_available > 0
+        else:
+            if self._socket is None:
+                return True
+            try:
+                readable, _, _ = select.select([self._socket], [], [], 0)
+            except (OSError, ValueError):
+                return True
+            return bool(readable)
+
     def settimeout(self, timeout: Optional[float]) -> None:
         """Set socket timeout.
 
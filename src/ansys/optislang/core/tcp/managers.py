@@ -23,11 +23,24 @@
 """Contains classes to obtain operate with project parametric."""
 from __future__ import annotations
 
+from collections import deque
 import csv
 from io import StringIO
 import json
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from ansys.optislang.core.io import File, FileOutputFormat
 from ansys.optislang.core.managers import (
@@ -40,7 +53,9 @@ from ansys.optislang.core.project_parametric import (
     ConstraintCriterion,
     Criterion,
     Design,
+    DesignSchema,
     DesignStatus,
+    DesignTable,
     LimitStateCriterion,
     Parameter,
     Response,
@@ -285,6 +300,14 @@ class TcpCriteriaManagerProxy(CriteriaManager):
 class TcpDesignManagerProxy(DesignManager):
     """Contains methods for obtaining designs."""
 
+    _DESIGN_NAMES_KEYS = (
+        "constraint_names",
+        "limit_state_names",
+        "objective_names",
+        "parameter_names",
+        "response_names",
+    )
+
     def __init__(self, uid: str, osl_server: TcpOslServer) -> None:
         """Initialize a new instance of the ``TcpDesignManagerProxy`` class.
 
@@ -373,6 +396,8 @@ class TcpDesignManagerProxy(DesignManager):
         hid: str = "0",
         include_design_values=True,
         include_non_scalar_design_values=False,
+        compact=False,
+        stream=False,
     ) -> Tuple[Design, ...]:
         """Get designs for a given state.
 
@@ -384,13 +409,37 @@ class TcpDesignManagerProxy(DesignManager):
             Include values. By default ``True``.
         include_non_scalar_design_values : Optional[bool], optional
             Include non scalar values. By default ``False``.
+        compact : bool, optional
+            Share names of design variables between designs, see
+            :py:meth:`Design.from_schema`. Recommended for large numbers of designs.
+            By default ``False``.
+        stream : bool, optional
+            Decode the status info while it is received from the server, see
+            :py:meth:`iter_designs`. Avoids holding the whole response in memory
+            for large numbers of designs. By default ``False``.
 
         Returns
         -------
         Tuple[Design, ...]
             Tuple of designs for a given state.
+
+        Raises
+        ------
+        KeyError
+            Raised when the status info doesn't contain designs.
+        ValueError
+            Raised when the design values don't match the design states.
         """
-        design_classes = []
+        if stream:
+            return tuple(
+                self.iter_designs(
+                    hid=hid,
+                    include_design_values=include_design_values,
+                    include_non_scalar_design_values=include_non_scalar_design_values,
+                    compact=compact,
+                )
+            )
+
         status_info = self._get_status_info(
             hid=hid,
             include_designs=True,
@@ -399,63 +448,143 @@ class TcpDesignManagerProxy(DesignManager):
             and include_non_scalar_design_values,
             include_algorithm_info=False,
         )
-        designs = status_info.get("designs", {})
         design_states = status_info["design_status"]
-
+        names: Dict[str, List[str]] = {}
+        design_values: List[Dict[str, Any]] = []
         if include_design_values:
-            design_values = designs.get("values")
-            for design_value, design_state in zip(design_values, design_states):
-                if design_value["hid"] != design_state["id"]:
-                    raise ValueError(f'{design_value["hid"]} != {design_state["id"]}')
-                design_classes.append(
-                    Design(
-                        parameters=dict(
-                            zip(
-                                designs.get("parameter_names", []),
-                                design_value.get("parameter_values", []),
-                            )
-                        ),
-                        constraints=dict(
-                            zip(
-                                designs.get("constraint_names", []),
-                                design_value.get("constraint_values", []),
-                            )
-                        ),
-                        limit_states=dict(
-                            zip(
-                                designs.get("limit_state_names", []),
-                                design_value.get("limit_state_values", []),
-                            )
-                        ),
-                        objectives=dict(
-                            zip(
-                                designs.get("objective_names", []),
-                                design_value.get("objective_values", []),
-                            )
-                        ),
-                        responses=dict(
-                            zip(
-                                designs.get("response_names", []),
-                                design_value.get("response_values", []),
-                            )
-                        ),
-                        feasibility=design_state["feasible"],
-                        design_id=design_state["id"],
-                        status=DesignStatus.from_str(design_state["status"]),
-                        pareto_design=design_state["pareto_design"],
-                    )
-                )
-        else:
-            for design_state in design_states:
-                design_classes.append(
-                    Design(
-                        feasibility=design_state["feasible"],
-                        design_id=design_state["id"],
-                        status=DesignStatus.from_str(design_state["status"]),
-                        pareto_design=design_state["pareto_design"],
-                    )
+            designs = status_info["designs"]
+            design_values = designs["values"]
+            names = {key: designs[key] for key in self._DESIGN_NAMES_KEYS if key in designs}
+        schema = self.__create_design_schema(names) if compact else None
+        return tuple(
+            self.__pop_designs(
+                names, deque(design_values), deque(design_states), include_design_values, schema
+            )
+        )
+
+    def get_designs_table(
+        self, hid: str = "0", include_non_scalar_design_values=False
+    ) -> DesignTable:
+        """Get designs for a given state as table of columns.
+
+        The table is built directly from the column names and value rows sent by the server,
+        without creating an object per design, which makes it suitable for large numbers
+        of designs.
+
+        Parameters
+        ----------
+        hid : str, optional
+            State/Design hierarchical id. Defaults to the "root" id ("0").
+        include_non_scalar_design_values : Optional[bool], optional
+            Include non scalar values. By default ``False``.
+
+        Returns
+        -------
+        DesignTable
+            Designs of a given state stored column by column.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with the server.
+        OslCommandError
+            Raised when a command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        ValueError
+            Raised when the design values don't match the design states.
+        """
+        status_info = self._get_status_info(
+            hid=hid,
+            include_designs=True,
+            include_design_values=True,
+            include_non_scalar_design_values=include_non_scalar_design_values,
+            include_algorithm_info=False,
+        )
+        return self.__create_designs_table(
+            status_info.get("designs", {}), status_info.get("design_status", [])
+        )
+
+    def iter_designs(
+        self,
+        hid: str = "0",
+        include_design_values=True,
+        include_non_scalar_design_values=False,
+        compact=False,
+    ) -> Iterator[Design]:
+        """Get designs for a given state one by one.
+
+        The status info of the state is decoded while it is received from the server,
+        so that designs can be processed before all of them are received.
+
+        Parameters
+        ----------
+        hid : str, optional
+            State/Design hierarchical id. Defaults to the "root" id ("0").
+        include_design_values : bool, optional
+            Include values. By default ``True``.
+        include_non_scalar_design_values : Optional[bool], optional
+            Include non scalar values. By default ``False``.
+        compact : bool, optional
+            Share names of design variables between designs, see
+            :py:meth:`Design.from_schema`. Recommended for large numbers of designs.
+            By default ``False``.
+
+        Yields
+        ------
+        Design
+            Designs of a given state.
+
+        Raises
+        ------
+        ValueError
+            Raised when the design values don't match the design states, e.g. when
+            the status info doesn't contain design states or design values.
+        """
+        names: Dict[str, List[str]] = {}
+        design_values: Deque[Dict[str, Any]] = deque()
+        design_states: Deque[Dict[str, Any]] = deque()
+        # Values can be converted to designs only once all names are known, which is
+        # either when all of them were received or the "designs" object is finished.
+        names_complete = not include_design_values
+        designs_started = False
+        schema: Optional[DesignSchema] = None
+
+        for path, value in self.__osl_server.iter_actor_status_info(
+            self.__uid,
+            hid=hid,
+            include_designs=True,
+            include_design_values=include_design_values,
+            include_non_scalar_design_values=include_design_values
+            and include_non_scalar_design_values,
+            include_algorithm_info=False,
+        ):
+            if path == ("design_status",):
+                design_states.append(value)
+            elif path == ("designs", "values"):
+                design_values.append(value)
+            elif len(path) == 2 and path[0] == "designs" and path[1] in self._DESIGN_NAMES_KEYS:
+                names[path[1]] = value
+                names_complete = names_complete or len(names) == len(self._DESIGN_NAMES_KEYS)
+            if path[0] == "designs":
+                designs_started = True
+            elif designs_started:
+                names_complete = True
+
+            if names_complete:
+                if compact and schema is None:
+                    schema = self.__create_design_schema(names)
+                yield from self.__pop_designs(
+                    names, design_values, design_states, include_design_values, schema
                 )
-        return tuple(design_classes)
+
+        if compact and schema is None:
+            schema = self.__create_design_schema(names)
+        yield from self.__pop_designs(
+            names, design_values, design_states, include_design_values, schema
+        )
+        if design_values or design_states:
+            raise ValueError("Design values don't match design states.")
 
     def save_designs_as_json(self, file_path: Union[Path, str], hid: str = "0") -> File:
         """Save designs for a given state to JSON file.
@@ -521,6 +650,124 @@ class TcpDesignManagerProxy(DesignManager):
         """
         return self.__save_designs_as(file_path=file_path, format=FileOutputFormat.CSV, hid=hid)
 
+    @classmethod
+    def __create_designs_table(
+        cls, designs: Dict[str, Any], design_states: List[Dict[str, Any]]
+    ) -> DesignTable:
+        """Transpose design values and design states received from the server to columns."""
+        design_values = designs.get("values", [])
+        ids = [design_state["id"] for design_state in design_states]
+        if [design_value["hid"] for design_value in design_values] != ids:
+            raise ValueError("Design values don't match design states.")
+        statuses = [design_state["status"] for design_state in design_states]
+        status_names = {status: DesignStatus.from_str(status).name for status in set(statuses)}
+
+        columns: Dict[str, Dict[str, Sequence[Any]]] = {}
+        for names_key in cls._DESIGN_NAMES_KEYS:
+            names = designs.get(names_key, [])
+            values_key = names_key.replace("_names", "_values")
+            rows = [design_value.get(values_key, ()) for design_value in design_values]
+            if rows and set(map(len, rows)) != {len(names)}:
+                raise ValueError(f"Number of ``{values_key}`` doesn't match ``{names_key}``.")
+            columns[names_key.replace("_names", "s")] = (
+                dict(zip(names, zip(*rows))) if rows else {name: () for name in names}
+            )
+
+        return DesignTable(
+            ids=ids,
+            feasibility=[design_state["feasible"] for design_state in design_states],
+            status=[status_names[status] for status in statuses],
+            pareto_design=[design_state["pareto_design"] for design_state in design_states],
+            **columns,
+        )
+
+    @staticmethod
+    def __create_design_schema(names: Dict[str, List[str]]) -> DesignSchema:
+        """Create schema shared by designs from names received from the server."""
+        return DesignSchema(
+            parameters=names.get("parameter_names", []),
+            constraints=names.get("constraint_names", []),
+            limit_states=names.get("limit_state_names", []),
+            objectives=names.get("objective_names", []),
+            responses=names.get("response_names", []),
+        )
+
+    @staticmethod
+    def __pop_designs(
+        names: Dict[str, List[str]],
+        design_values: Deque[Dict[str, Any]],
+        design_states: Deque[Dict[str, Any]],
+        include_design_values: bool,
+        schema: Optional[DesignSchema] = None,
+    ) -> Iterator[Design]:
+        """Convert received pairs of design values and design states to designs.
+
+        If schema is given, designs take over the received lists of values.
+        """
+        while design_states and (design_values or not include_design_values):
+            design_state = design_states.popleft()
+            if not include_design_values:
+                yield Design(
+                    feasibility=design_state["feasible"],
+                    design_id=design_state["id"],
+                    status=DesignStatus.from_str(design_state["status"]),
+                    pareto_design=design_state["pareto_design"],
+                )
+                continue
+            design_value = design_values.popleft()
+            if design_value["hid"] != design_state["id"]:
+                raise ValueError(f'{design_value["hid"]} != {design_state["id"]}')
+            if schema is not None:
+                yield Design.from_schema(
+                    schema,
+                    parameters=design_value.get("parameter_values", []),
+                    constraints=design_value.get("constraint_values", []),
+                    limit_states=design_value.get("limit_state_values", []),
+                    objectives=design_value.get("objective_values", []),
+                    responses=design_value.get("response_values", []),
+                    feasibility=design_state["feasible"],
+                    design_id=design_state["id"],
+                    status=DesignStatus.from_str(design_state["status"]),
+                    pareto_design=design_state["pareto_design"],
+                )
+                continue
+            yield Design(
+                parameters=dict(
+                    zip(
+                        names.get("parameter_names", []),
+                        design_value.get("parameter_values", []),
+                    )
+                ),
+                constraints=dict(
+                    zip(
+                        names.get("constraint_names", []),
+                        design_value.get("constraint_values", []),
+                    )
+                ),
+                limit_states=dict(
+                    zip(
+                        names.get("limit_state_names", []),
+                        design_value.get("limit_state_values", []),
+                    )
+                ),
+                objectives=dict(
+                    zip(
+                        names.get("objective_names", []),
+                        design_value.get("objective_values", []),
+                    )
+                ),
+                responses=dict(
+                    zip(
+                        names.get("response_names", []),
+                        design_value.get("response_values", []),
+                    )
+                ),
+                feasibility=design_state["feasible"],
+                design_id=design_state["id"],
+                status=DesignStatus.from_str(design_state["status"]),
+                pareto_design=design_state["pareto_design"],
+            )
+
     def __save_designs_as(
         self, file_path: Union[Path, str], format: FileOutputFormat, hid: str = "0"
     ) -> File:
@@ -0,0 +1,822 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Contains client-side instrumentation of requests sent to the optiSLang server."""
+from __future__ import annotations
+
+import bisect
+from enum import Enum
+import importlib.util
+import json
+import math
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+"""Default upper bounds in seconds of the latency histogram buckets."""
+
+
+class RequestPhase(Enum):
+    """Phases of a request sent to the optiSLang server."""
+
+    CONNECT = 0
+    SEND = 1
+    SERVER_WAIT = 2
+    RECEIVE = 3
+    DECODE = 4
+
+
+def get_request_name(request: Any) -> str:
+    """Get name of the decoded request, used to group the metrics.
+
+    Parameters
+    ----------
+    request : Any
+        Decoded query or command, e.g. generated by the functions from ``server_queries``
+        and ``server_commands`` modules.
+
+    Returns
+    -------
+    str
+        The ``What`` value of queries, the ``command`` value of commands. Names of merged
+        commands are joined by ``+``. ``UNKNOWN`` if the request format is not recognized.
+    """
+    if isinstance(request, dict):
+        if "What" in request:
+            return str(request["What"])
+        names: List[str] = []
+        projects = request.get("projects")
+        for project in projects if isinstance(projects, list) else []:
+            commands = project.get("commands") if isinstance(project, dict) else None
+            for command in commands if isinstance(commands, list) else []:
+                name = str(command.get("command")) if isinstance(command, dict) else None
+                if name is not None and name not in names:
+                    names.append(name)
+        if names:
+            return "+".join(names)
+    return "UNKNOWN"
+
+
+# Requests generated by the ``server_queries`` and ``server_commands`` modules encode the keys
+# sorted, so that the name of a query follows the optional password at the beginning and
+# the name of a single command follows its arguments at the end of the request.
+_PASSWORD_PREFIX = r'\s*\{\s*(?:"Password"\s*:\s*"(?:[^"\\]|\\.)*"\s*,\s*)?'
+_QUERY_NAME_PATTERN = re.compile(_PASSWORD_PREFIX + r'"What"\s*:\s*"([^"\\]*)"')
+_COMMAND_PREFIX_PATTERN = re.compile(_PASSWORD_PREFIX + r'"projects"\s*:\s*\[')
+_COMMAND_NAME_PATTERN = re.compile(
+    r'"command"\s*:\s*"([^"\\]*)"\s*,\s*(?:"hid"\s*:\s*"(?:[^"\\]|\\.)*"\s*,\s*)?'
+    r'"type"\s*:\s*"builtin"\s*\}\s*\]\s*\}\s*\]\s*\}\s*\Z'
+)
+
+
+def get_encoded_request_name(request: str) -> str:
+    """Get name of the JSON encoded request, used to group the metrics.
+
+    Names of queries and single commands generated by the ``server_queries`` and
+    ``server_commands`` modules are found without decoding the request, other requests,
+    e.g. merged commands, are decoded.
+
+    Parameters
+    ----------
+    request : str
+        JSON encoded query or command.
+
+    Returns
+    -------
+    str
+        Name of the request, see :py:func:`get_request_name`.
+    """
+    match = _QUERY_NAME_PATTERN.match(request)
+    if match is not None:
+        return match.group(1)
+    if _COMMAND_PREFIX_PATTERN.match(request) is not None:
+        match = _COMMAND_NAME_PATTERN.search(request)
+        # merged commands and arguments containing commands are decoded
+        if match is not None and request.find('"command"', 0, match.start()) == -1:
+            return match.group(1)
+    try:
+        return get_request_name(json.loads(request))
+    except ValueError:
+        return "UNKNOWN"
+
+
+class LatencyHistogram:
+    """Histogram of durations with fixed bucket bounds.
+
+    Parameters
+    ----------
+    buckets : Sequence[float], optional
+        Ascending upper bounds of the buckets in seconds. Durations greater than the last
+        bound are counted only by the implicit ``+Inf`` bucket.
+        Defaults to ``DEFAULT_LATENCY_BUCKETS``.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """Create a new instance of the ``LatencyHistogram`` class."""
+        self.__bounds = tuple(buckets)
+        self.__counts = [0] * (len(self.__bounds) + 1)
+        self.__count = 0
+        self.__sum = 0.0
+        self.__max = 0.0
+
+    @property
+    def count(self) -> int:
+        """Number of observed durations."""
+        return self.__count
+
+    @property
+    def max(self) -> float:
+        """Longest observed duration in seconds."""
+        return self.__max
+
+    @property
+    def sum(self) -> float:
+        """Sum of observed durations in seconds."""
+        return self.__sum
+
+    def copy(self) -> LatencyHistogram:
+        """Create an independent copy of the histogram.
+
+        Returns
+        -------
+        LatencyHistogram
+            Copy of the histogram.
+        """
+        histogram = LatencyHistogram(self.__bounds)
+        histogram.__counts = list(self.__counts)
+        histogram.__count = self.__count
+        histogram.__sum = self.__sum
+        histogram.__max = self.__max
+        return histogram
+
+    def get_buckets(self) -> List[Tuple[float, int]]:
+        """Get cumulative counts of the buckets.
+
+        Returns
+        -------
+        List[Tuple[float, int]]
+            Upper bound of each bucket and number of durations not greater than the bound,
+            the last bound is ``math.inf``.
+        """
+        buckets = []
+        cumulative = 0
+        for bound, count in zip((*self.__bounds, math.inf), self.__counts):
+            cumulative += count
+            buckets.append((bound, cumulative))
+        return buckets
+
+    def observe(self, duration: float) -> None:
+        """Add duration to the histogram.
+
+        Parameters
+        ----------
+        duration : float
+            Duration in seconds.
+        """
+        self.__counts[bisect.bisect_left(self.__bounds, duration)] += 1
+        self.__count += 1
+        self.__sum += duration
+        self.__max = max(self.__max, duration)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the histogram as a dictionary.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Count, sum and maximum of durations and the cumulative bucket counts.
+        """
+        return {
+            "count": self.__count,
+            "sum": self.__sum,
+            "max": self.__max,
+            "buckets": [[bound, count] for bound, count in self.get_buckets()],
+        }
+
+
+class RequestRecord(NamedTuple):
+    """Measurements of a single request sent to the optiSLang server.
+
+    Attributes
+    ----------
+    name : str
+        Name of the request, see :py:func:`get_request_name`.
+    start_time : float
+        Time when the request started in seconds since the epoch.
+    duration : float
+        Duration of the whole request in seconds.
+    phases : Dict[RequestPhase, float]
+        Summed durations of request phases in seconds over all attempts.
+    bytes_sent : int
+        Number of sent bytes, excluding the message headers.
+    bytes_received : int
+        Number of received bytes, excluding the message headers.
+    attempts : int
+        Number of request attempts.
+    timeouts : int
+        Number of attempts which timed out.
+    error : Optional[str]
+        Name of the exception class if the request failed, ``None`` otherwise.
+    """
+
+    name: str
+    start_time: float
+    duration: float
+    phases: Dict[RequestPhase, float]
+    bytes_sent: int
+    bytes_received: int
+    attempts: int
+    timeouts: int
+    error: Optional[str]
+
+
+class RequestTrace:
+    """Collects measurements of a request, until it is finished.
+
+    Instances are created by the :py:meth:`TcpCommandMetrics.start_request` method. A trace
+    without metrics is disabled and ignores all measurements, so it may be shared. The trace
+    can be used as a context manager, which finishes it, recording the raised exception
+    as the error.
+
+    Parameters
+    ----------
+    metrics : Optional[TcpCommandMetrics]
+        Metrics the finished request is recorded in.
+    name : str
+        Name of the request.
+    """
+
+    def __init__(self, metrics: Optional[TcpCommandMetrics], name: str) -> None:
+        """Create a new instance of the ``RequestTrace`` class."""
+        self.__metrics = metrics
+        self.__name = name
+        self.__start_time = time.time()
+        self.__start_counter = time.perf_counter()
+        self.__phases: Dict[RequestPhase, float] = {}
+        self.__bytes_sent = 0
+        self.__bytes_received = 0
+        self.__attempts = 0
+        self.__timeouts = 0
+        self.__finished = False
+
+    def __enter__(self) -> RequestTrace:
+        """Return the trace."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Finish the trace."""
+        self.finish(exc_value)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether measurements are recorded."""
+        return self.__metrics is not None
+
+    @property
+    def name(self) -> str:
+        """Name of the request."""
+        return self.__name
+
+    def add_bytes_received(self, count: int) -> None:
+        """Add number of received bytes.
+
+        Parameters
+        ----------
+        count : int
+            Number of bytes.
+        """
+        if self.__metrics is not None:
+            self.__bytes_received += count
+
+    def add_bytes_sent(self, count: int) -> None:
+        """Add number of sent bytes.
+
+        Parameters
+        ----------
+        count : int
+            Number of bytes.
+        """
+        if self.__metrics is not None:
+            self.__bytes_sent += count
+
+    def add_phase(self, phase: RequestPhase, duration: float) -> None:
+        """Add duration of a request phase.
+
+        Parameters
+        ----------
+        phase : RequestPhase
+            Phase of the request.
+        duration : float
+            Duration in seconds.
+        """
+        if self.__metrics is not None:
+            self.__phases[phase] = self.__phases.get(phase, 0.0) + duration
+
+    def add_timeout(self) -> None:
+        """Count an attempt which timed out."""
+        if self.__metrics is not None:
+            self.__timeouts += 1
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """Record the request in the metrics, further calls are ignored.
+
+        Parameters
+        ----------
+        error : Optional[BaseException], optional
+            Exception the request failed with. Defaults to ``None``.
+        """
+        if self.__finished or self.__metrics is None:
+            return
+        self.__finished = True
+        self.__metrics.record(
+            RequestRecord(
+                name=self.__name,
+                start_time=self.__start_time,
+                duration=time.perf_counter() - self.__start_counter,
+                phases=dict(self.__phases),
+                bytes_sent=self.__bytes_sent,
+                bytes_received=self.__bytes_received,
+                attempts=max(self.__attempts, 1),
+                timeouts=self.__timeouts,
+                error=type(error).__name__ if error is not None else None,
+            )
+        )
+
+    def start_attempt(self) -> None:
+        """Count a new attempt of the request."""
+        if self.__metrics is not None:
+            self.__attempts += 1
+
+
+DISABLED_TRACE = RequestTrace(None, "")
+"""Trace ignoring all measurements, used when metrics are not enabled."""
+
+
+class CommandMetrics:
+    """Aggregated measurements of requests with the same name.
+
+    Parameters
+    ----------
+    buckets : Sequence[float], optional
+        Upper bounds of the latency histogram buckets in seconds.
+        Defaults to ``DEFAULT_LATENCY_BUCKETS``.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """Create a new instance of the ``CommandMetrics`` class."""
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.timeouts = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency = LatencyHistogram(buckets)
+        self.phases = {phase: LatencyHistogram(buckets) for phase in RequestPhase}
+
+    def add(self, record: RequestRecord) -> None:
+        """Add measurements of a request.
+
+        Parameters
+        ----------
+        record : RequestRecord
+            Measurements of the request.
+        """
+        self.requests += 1
+        self.errors += record.error is not None
+        self.retries += record.attempts - 1
+        self.timeouts += record.timeouts
+        self.bytes_sent += record.bytes_sent
+        self.bytes_received += record.bytes_received
+        self.latency.observe(record.duration)
+        for phase, duration in record.phases.items():
+            self.phases[phase].observe(duration)
+
+    def copy(self) -> CommandMetrics:
+        """Create an independent copy of the measurements.
+
+        Returns
+        -------
+        CommandMetrics
+            Copy of the measurements.
+        """
+        command_metrics = CommandMetrics(())
+        command_metrics.requests = self.requests
+        command_metrics.errors = self.errors
+        command_metrics.retries = self.retries
+        command_metrics.timeouts = self.timeouts
+        command_metrics.bytes_sent = self.bytes_sent
+        command_metrics.bytes_received = self.bytes_received
+        command_metrics.latency = self.latency.copy()
+        command_metrics.phases = {
+            phase: histogram.copy() for phase, histogram in self.phases.items()
+        }
+        return command_metrics
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the measurements as a dictionary.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Counters, latency histogram and histograms of the phases keyed by lowercase names.
+        """
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency": self.latency.to_dict(),
+            "phases": {
+                phase.name.lower(): histogram.to_dict() for phase, histogram in self.phases.items()
+            },
+        }
+
+
+class MetricsExporter:
+    """Base class of exporters of the ``TcpCommandMetrics``.
+
+    Exporters passed to the ``TcpCommandMetrics`` are notified about each finished request
+    by the :py:meth:`on_request` method. The :py:meth:`export` method converts aggregated
+    metrics to the format of the exporter.
+    """
+
+    def export(self, metrics: TcpCommandMetrics) -> Any:
+        """Convert aggregated metrics.
+
+        Parameters
+        ----------
+        metrics : TcpCommandMetrics
+            Exported metrics.
+
+        Returns
+        -------
+        Any
+            Metrics in the format of the exporter, ``None`` if the exporter does not
+            export aggregated metrics.
+        """
+        return None
+
+    def on_request(self, record: RequestRecord) -> None:
+        """Handle a finished request.
+
+        Parameters
+        ----------
+        record : RequestRecord
+            Measurements of the request.
+        """
+
+
+class DictMetricsExporter(MetricsExporter):
+    """Exports metrics as a plain dictionary keyed by the request names."""
+
+    def export(self, metrics: TcpCommandMetrics) -> Dict[str, Dict[str, Any]]:
+        """Convert aggregated metrics to a dictionary.
+
+        Parameters
+        ----------
+        metrics : TcpCommandMetrics
+            Exported metrics.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            Dictionaries of the ``CommandMetrics.to_dict`` method keyed by the request names.
+        """
+        return metrics.snapshot()
+
+
+class PrometheusMetricsExporter(MetricsExporter):
+    """Exports metrics in the Prometheus text exposition format.
+
+    Parameters
+    ----------
+    namespace : str, optional
+        Prefix of the metric names. Defaults to ``"pyoptislang"``.
+    """
+
+    def __init__(self, namespace: str = "pyoptislang") -> None:
+        """Create a new instance of the ``PrometheusMetricsExporter`` class."""
+        self.__namespace = namespace
+
+    def export(self, metrics: TcpCommandMetrics) -> str:
+        """Convert aggregated metrics to the Prometheus text format.
+
+        Parameters
+        ----------
+        metrics : TcpCommandMetrics
+            Exported metrics.
+
+        Returns
+        -------
+        str
+            Metrics in the Prometheus text exposition format.
+        """
+        commands = metrics.get_all()
+        prefix = self.__namespace
+        lines: List[str] = []
+        counters = [
+            ("requests_total", "Number of requests.", "requests"),
+            ("request_errors_total", "Number of failed requests.", "errors"),
+            ("request_retries_total", "Number of repeated request attempts.", "retries"),
+            ("request_timeouts_total", "Number of request attempts timed out.", "timeouts"),
+            ("request_sent_bytes_total", "Number of sent bytes.", "bytes_sent"),
+            ("request_received_bytes_total", "Number of received bytes.", "bytes_received"),
+        ]
+        for name, description, attribute in counters:
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for command, command_metrics in commands.items():
+                labels = self.__format_labels(command=command)
+                lines.append(f"{prefix}_{name}{labels} {getattr(command_metrics, attribute)}")
+
+        name = f"{prefix}_request_duration_seconds"
+        lines.append(f"# HELP {name} Duration of requests.")
+        lines.append(f"# TYPE {name} histogram")
+        for command, command_metrics in commands.items():
+            lines.extend(self.__format_histogram(name, command_metrics.latency, command=command))
+
+        name = f"{prefix}_request_phase_duration_seconds"
+        lines.append(f"# HELP {name} Duration of request phases.")
+        lines.append(f"# TYPE {name} histogram")
+        for command, command_metrics in commands.items():
+            for phase, histogram in command_metrics.phases.items():
+                if histogram.count:
+                    lines.extend(
+                        self.__format_histogram(
+                            name, histogram, command=command, phase=phase.name.lower()
+                        )
+                    )
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def __format_labels(**labels: str) -> str:
+        """Format labels, escaping the values."""
+        escaped = []
+        for key, value in labels.items():
+            value = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            escaped.append(f'{key}="{value}"')
+        return "{" + ",".join(escaped) + "}"
+
+    @classmethod
+    def __format_histogram(cls, name: str, histogram: LatencyHistogram, **labels: str) -> List[str]:
+        """Format buckets, sum and count of the histogram."""
+        lines = []
+        for bound, count in histogram.get_buckets():
+            bound_str = "+Inf" if math.isinf(bound) else repr(float(bound))
+            bucket_labels = cls.__format_labels(**labels, le=bound_str)
+            lines.append(f"{name}_bucket{bucket_labels} {count}")
+        lines.append(f"{name}_sum{cls.__format_labels(**labels)} {histogram.sum!r}")
+        lines.append(f"{name}_count{cls.__format_labels(**labels)} {histogram.count}")
+        return lines
+
+
+class OpenTelemetrySpanExporter(MetricsExporter):
+    """Exports each finished request as an OpenTelemetry span.
+
+    The span is named after the request and its attributes contain the durations of
+    the phases, the numbers of transferred bytes, attempts and timeouts.
+
+    Parameters
+    ----------
+    tracer : Any, optional
+        OpenTelemetry tracer creating the spans. If ``None``, the tracer of the global
+        tracer provider is used, which requires the ``opentelemetry-api`` package.
+        Defaults to ``None``.
+
+    Raises
+    ------
+    ImportError
+        Raised when the ``tracer`` is not given and the ``opentelemetry-api`` package
+        is not installed.
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        """Create a new instance of the ``OpenTelemetrySpanExporter`` class."""
+        if tracer is None:
+            if importlib.util.find_spec("opentelemetry") is None:
+                raise ImportError("The ``opentelemetry-api`` package is required to export spans.")
+            from opentelemetry import trace
+
+            tracer = trace.get_tracer(__name__)
+        self.__tracer = tracer
+
+    def on_request(self, record: RequestRecord) -> None:
+        """Create a span of the finished request.
+
+        Parameters
+        ----------
+        record : RequestRecord
+            Measurements of the request.
+        """
+        start_time = int(record.start_time * 1e9)
+        attributes: Dict[str, Any] = {
+            "optislang.request.name": record.name,
+            "optislang.request.bytes_sent": record.bytes_sent,
+            "optislang.request.bytes_received": record.bytes_received,
+            "optislang.request.attempts": record.attempts,
+            "optislang.request.timeouts": record.timeouts,
+        }
+        for phase, duration in record.phases.items():
+            attributes[f"optislang.request.{phase.name.lower()}_seconds"] = duration
+        if record.error is not None:
+            attributes["error.type"] = record.error
+        span = self.__tracer.start_span(
+            f"optiSLang {record.name}", start_time=start_time, attributes=attributes
+        )
+        span.end(end_time=start_time + int(record.duration * 1e9))
+
+
+class TcpCommandMetrics:
+    """Collects client-side measurements of requests sent to the optiSLang server.
+
+    Measurements are aggregated by the request name, which is the ``What`` value of queries
+    and the ``command`` value of commands. For each name, the latency histograms of whole
+    requests and of their phases, numbers of transferred bytes, retries, timeouts and
+    errors are collected. Metrics are enabled by the ``enable_metrics`` method of the
+    :py:class:`TcpOslServer <ansys.optislang.core.tcp.osl_server.TcpOslServer>` class.
+
+    Parameters
+    ----------
+    buckets : Sequence[float], optional
+        Upper bounds of the latency histogram buckets in seconds.
+        Defaults to ``DEFAULT_LATENCY_BUCKETS``.
+    exporters : Optional[Iterable[MetricsExporter]], optional
+        Exporters notified about each finished request. Defaults to ``None``.
+
+    Examples
+    --------
+    Print the metrics of requests in the Prometheus text format.
+
+    >>> from ansys.optislang.core import Optislang
+    >>> from ansys.optislang.core.tcp.metrics import PrometheusMetricsExporter
+    >>> osl = Optislang()
+    >>> metrics = osl.osl_server.enable_metrics()
+    >>> osl.application.project.get_status()
+    >>> print(metrics.export(PrometheusMetricsExporter()))
+    >>> osl.dispose()
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        exporters: Optional[Iterable[MetricsExporter]] = None,
+    ) -> None:
+        """Create a new instance of the ``TcpCommandMetrics`` class."""
+        if list(buckets) != sorted(buckets):
+            raise ValueError("Bucket bounds must be sorted in ascending order.")
+        self.__buckets = tuple(buckets)
+        self.__exporters = list(exporters) if exporters is not None else []
+        self.__lock = threading.Lock()
+        self.__commands: Dict[str, CommandMetrics] = {}
+
+    @property
+    def exporters(self) -> List[MetricsExporter]:
+        """Exporters notified about each finished request."""
+        return list(self.__exporters)
+
+    def add_exporter(self, exporter: MetricsExporter) -> None:
+        """Add exporter notified about each finished request.
+
+        Parameters
+        ----------
+        exporter : MetricsExporter
+            Exporter to be added.
+        """
+        with self.__lock:
+            self.__exporters.append(exporter)
+
+    def export(self, exporter: Optional[MetricsExporter] = None) -> Any:
+        """Export aggregated metrics.
+
+        Parameters
+        ----------
+        exporter : Optional[MetricsExporter], optional
+            Exporter converting the metrics. If ``None``, the ``DictMetricsExporter``
+            is used. Defaults to ``None``.
+
+        Returns
+        -------
+        Any
+            Metrics in the format of the exporter.
+        """
+        return (exporter if exporter is not None else DictMetricsExporter()).export(self)
+
+    def get(self, name: str) -> Optional[CommandMetrics]:
+        """Get copy of the aggregated measurements of requests with the given name.
+
+        Parameters
+        ----------
+        name : str
+            Name of the requests.
+
+        Returns
+        -------
+        Optional[CommandMetrics]
+            Measurements, ``None`` if no request with the name was recorded.
+        """
+        return self.get_all().get(name)
+
+    def get_all(self) -> Dict[str, CommandMetrics]:
+        """Get copy of the aggregated measurements of all requests.
+
+        Returns
+        -------
+        Dict[str, CommandMetrics]
+            Measurements keyed by the request names, sorted by the names.
+        """
+        with self.__lock:
+            return {
+                name: command_metrics.copy()
+                for name, command_metrics in sorted(self.__commands.items())
+            }
+
+    def record(self, record: RequestRecord) -> None:
+        """Add measurements of a finished request and notify the exporters.
+
+        Parameters
+        ----------
+        record : RequestRecord
+            Measurements of the request.
+        """
+        with self.__lock:
+            command_metrics = self.__commands.get(record.name)
+            if command_metrics is None:
+                command_metrics = self.__commands[record.name] = CommandMetrics(self.__buckets)
+            command_metrics.add(record)
+            exporters = list(self.__exporters)
+        for exporter in exporters:
+            exporter.on_request(record)
+
+    def reset(self) -> None:
+        """Remove all measurements."""
+        with self.__lock:
+            self.__commands.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get aggregated measurements as a dictionary.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            Dictionaries of the ``CommandMetrics.to_dict`` method keyed by the request names.
+        """
+        with self.__lock:
+            return {
+                name: command_metrics.to_dict()
+                for name, command_metrics in sorted(self.__commands.items())
+            }
+
+    def start_request(self, name: str) -> RequestTrace:
+        """Start collecting measurements of a request.
+
+        Parameters
+        ----------
+        name : str
+            Name of the request, see :py:func:`get_request_name`.
+
+        Returns
+        -------
+        RequestTrace
+            Trace recording the request in these metrics when finished.
+        """
+        return RequestTrace(self, name)
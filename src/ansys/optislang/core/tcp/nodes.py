@@ -26,15 +26,29 @@ from __future__ import annotations
 from collections import OrderedDict
 import csv
 from io import StringIO
+import itertools
 import json
 import logging
 from pathlib import Path
 import time
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Type, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from deprecated.sphinx import deprecated
 
 from ansys.optislang.core.errors import OslCommandError
+from ansys.optislang.core.evaluation_cache import EvaluationCache
 from ansys.optislang.core.io import File, FileOutputFormat, RegisteredFile, RegisteredFileUsage
 from ansys.optislang.core.node_types import AddinType, NodeType, get_node_type_from_str
 from ansys.optislang.core.nodes import (
@@ -60,6 +74,7 @@ from ansys.optislang.core.project_parametric import (
     ConstraintCriterion,
     Design,
     DesignStatus,
+    DesignTable,
     DesignVariable,
     LimitStateCriterion,
     ObjectiveCriterion,
@@ -74,6 +89,7 @@ from ansys.optislang.core.tcp.managers import (
     TcpResponseManagerProxy,
 )
 from ansys.optislang.core.tcp.osl_server import TcpOslServer
+from ansys.optislang.core.tcp.project_tree_index import ProjectTreeIndex
 from ansys.optislang.core.tcp.slot_types import SlotTypeHintTCP
 
 if TYPE_CHECKING:
@@ -258,23 +274,20 @@ class TcpNodeProxy(Node):
                 "``TcpRootSystemProxy`` doesn't have any ancestors, empty tuple will be returned."
             )
             return ()
-        project_tree = self._osl_server.get_full_project_tree_with_properties()
-        parent_tree = project_tree["projects"][0]["system"]
+        project_tree_index = self._osl_server.get_project_tree_index()
+        root_tree = cast(dict, project_tree_index.get_node(project_tree_index.root_uid))
         ancestors_line_dicts = [
             {
-                "type": parent_tree["type"],
-                "name": parent_tree["name"],
-                "uid": parent_tree["uid"],
+                "type": root_tree["type"],
+                "name": root_tree["name"],
+                "uid": root_tree["uid"],
                 "kind": "root_system",
                 "is_parametric_system": True,
             },
         ]
-        ancestors_line_dicts = self._find_ancestor_line(
-            tree=parent_tree,
-            ancestor_line=ancestors_line_dicts,
-            node_uid=self.uid,
-            current_depth=1,
-            was_found=[],
+        ancestors_line_dicts.extend(
+            _get_node_properties_dict(project_tree_index=project_tree_index, uid=uid)
+            for uid in project_tree_index.get_ancestor_uids(self.uid)[1:]
         )
         return create_nodes_from_properties_dicts(
             osl_server=self._osl_server,
@@ -335,6 +348,9 @@ class TcpNodeProxy(Node):
             slot_type=slot_type,
             slot_name=slot_name,
         )
+        if not filtered_connections:
+            return ()
+        project_tree_index = self._osl_server.get_project_tree_index()
         edges = []
         for connection in filtered_connections:
             edges.append(
@@ -344,6 +360,7 @@ class TcpNodeProxy(Node):
                     connection=connection,
                     node=self,
                     logger=self._logger,
+                    project_tree_index=project_tree_index,
                 )
             )
         return tuple(edges)
@@ -940,6 +957,8 @@ class TcpNodeProxy(Node):
                         item["name"] == connection[slot_name_keys[0]]
                         for item in info[slot_type.name.lower() + "_slots"]
                     ]:
+                        # don't modify the project tree, which may be shared by the cache
+                        connection = dict(connection)
                         connection[slot_name_keys[0] + "_is_inner"] = slot_type_is_inner
                     else:
                         continue
@@ -981,15 +1000,14 @@ class TcpNodeProxy(Node):
             Raised when a command or query fails.
         TimeoutError
             Raised when the timeout float value expires.
+        RuntimeError
+            Raised when the node or its parent wasn't located in the project tree.
         """
-        project_tree = self._osl_server.get_full_project_tree_with_properties()
-        root_system_uid = project_tree["projects"][0]["system"]["uid"]
-        parent_tree = project_tree["projects"][0]["system"]
-        return self._find_parent_node_info(
-            tree=parent_tree,
-            parent_info=root_system_uid,
-            node_uid=self.uid,
-        )
+        project_tree_index = self._osl_server.get_project_tree_index()
+        parent_uid = project_tree_index.get_parent_uid(self.uid)
+        if parent_uid is None:
+            raise RuntimeError(f"Parent of node `{self.uid}` wasn't found.")
+        return _get_node_properties_dict(project_tree_index=project_tree_index, uid=parent_uid)
 
     def _get_slots(
         self, type_: Optional[SlotType] = None, name: Optional[str] = None
@@ -1059,7 +1077,7 @@ class TcpNodeProxy(Node):
             Raised when the timeout float value expires.
         """
         hids = self.get_states_ids()
-        return tuple([self._osl_server.get_actor_status_info(self.uid, hid) for hid in hids])
+        return tuple(self._osl_server.get_actor_states_status_info(self.uid, hids))
 
     @deprecated(version="0.6.0", reason="Not used anymore.")
     def _is_parametric_system(self, uid: str) -> bool:
@@ -1087,225 +1105,6 @@ class TcpNodeProxy(Node):
         props = self._osl_server.get_actor_properties(uid=uid)
         return "ParameterManager" in props
 
-    @staticmethod
-    def _find_ancestor_line(
-        tree: dict,
-        ancestor_line: List[dict],
-        node_uid: str,
-        current_depth: int,
-        was_found: list,
-    ) -> List[dict]:
-        """Get ancestor line starting from root system.
-
-        Parameters
-        ----------
-        tree: dict
-            Dictionary with children nodes.
-        ancestor_line: List[dict]
-            List of dictionaries with necessary information for node creation.
-        node_uid: str
-            Unique ID of the node for which to search for the parent.
-        current_depth: int
-            Current depth of the search.
-        was_found: list
-            Empty list, until node_uid is located.
-
-        Returns
-        -------
-        List[dict]
-            The ancestor line.
-
-        Raises
-        ------
-        RuntimeError
-            Raised when node was not located in structure tree.
-        """
-        for node in tree["nodes"]:
-            if len(was_found) == 1:
-                break
-            if node["uid"] == node_uid:
-                was_found.append("True")
-                break
-            if node["kind"] == "system":
-                ancestor_line.append(
-                    {
-                        "type": node["type"],
-                        "name": node["name"],
-                        "uid": node["uid"],
-                        "kind": node["kind"],
-                        "is_parametric_system": "ParameterManager" in node.get("properties", {}),
-                    }
-                )
-                TcpNodeProxy._find_ancestor_line(
-                    tree=node,
-                    ancestor_line=ancestor_line,
-                    node_uid=node_uid,
-                    current_depth=current_depth + 1,
-                    was_found=was_found,
-                )
-                if not was_found:
-                    ancestor_line.pop(-1)
-        return ancestor_line
-
-    @staticmethod
-    def _find_nodes_with_name(
-        name: str,
-        tree: dict,
-        properties_dicts_list: List[dict],
-        current_depth: int,
-        max_search_depth: int = 1,
-    ) -> List[dict]:
-        """Find nodes with the specified name.
-
-        Parameters
-        ----------
-        name : str
-            Node name.
-        tree : dict
-            Tree to search for nodes with the specified name.
-        properties_dicts_list : dict
-            Dictionary with properties.
-        current_depth: int
-            Current depth of the search.
-        max_search_depth: int, optional
-            Maximum depth of the search. The default is ``1``. Set to ``-1``
-            to search throughout the full depth.
-
-        Returns
-        -------
-        List[dict]
-            List of dictionaries with necessary information for creation of a node.
-        """
-        for node in tree["nodes"]:
-            if node["name"] == name:
-                properties_dicts_list.append(
-                    {
-                        "type": node["type"],
-                        "name": node["name"],
-                        "uid": node["uid"],
-                        "parent_uid": tree["uid"],
-                        "parent_name": tree["name"],
-                        "kind": node["kind"],
-                        "is_parametric_system": node.get("properties", {}).get(
-                            "ParameterManager", False
-                        ),
-                    }
-                )
-            if node["kind"] == "system" and (
-                current_depth < max_search_depth or max_search_depth == -1
-            ):
-                TcpNodeProxy._find_nodes_with_name(
-                    name=name,
-                    tree=node,
-                    properties_dicts_list=properties_dicts_list,
-                    current_depth=current_depth + 1,
-                    max_search_depth=max_search_depth,
-                )
-        return properties_dicts_list
-
-    @staticmethod
-    def _find_node_with_uid(
-        uid: str,
-        tree: dict,
-        properties_dicts_list: List[dict],
-        current_depth: int,
-        max_search_depth: int = 1,
-    ) -> List[dict]:
-        """Find a node with a specified unique ID.
-
-        Parameters
-        ----------
-        uid : str
-            Unique ID of the node.
-        tree : dict
-            Tree to search for nodes with the specified unique ID.
-        properties_dicts_list : List[dict]
-            Dictionary with properties.
-        current_depth: int
-            Current depth of the search.
-        max_search_depth: int, optional
-            Maximum depth of the search. The default is ``1``. Set to ``-1``
-            to search throughout the full depth.
-
-        Returns
-        -------
-        List[dict]
-            List of dictionaries with the necessary information for creation of a node.
-        """
-        for node in tree["nodes"]:
-            if len(properties_dicts_list) != 0:
-                break
-            if node["uid"] == uid:
-                properties_dicts_list.append(
-                    {
-                        "type": node["type"],
-                        "name": node["name"],
-                        "uid": node["uid"],
-                        "parent_uid": tree["uid"],
-                        "parent_name": tree["name"],
-                        "kind": node["kind"],
-                        "is_parametric_system": "ParameterManager" in node.get("properties", {}),
-                    }
-                )
-                break
-            if node["kind"] == "system" and (
-                current_depth < max_search_depth or max_search_depth == -1
-            ):
-                TcpNodeProxy._find_node_with_uid(
-                    uid=uid,
-                    tree=node,
-                    properties_dicts_list=properties_dicts_list,
-                    current_depth=current_depth + 1,
-                    max_search_depth=max_search_depth,
-                )
-        return properties_dicts_list
-
-    @staticmethod
-    def _find_parent_node_info(tree: dict, parent_info: dict, node_uid: str) -> dict:
-        """Get dictionary with necessary information for parent node creation.
-
-        Parameters
-        ----------
-        tree: dict
-            Dictionary with children nodes.
-        parent_info: str
-            Dictionary with necessary information for parent node creation.
-        node_uid: str
-            Unique ID of the node for which to search for the parent.
-
-        Returns
-        -------
-        dict
-            Dictionary with necessary information for parent node creation.
-
-        Raises
-        ------
-        RuntimeError
-            Raised when node was not located in structure tree.
-        """
-        for node in tree["nodes"]:
-            if parent_info.get("child_node_was_found"):
-                return parent_info
-            if node["uid"] == node_uid:
-                parent_info["child_node_was_found"] = True
-            if node["kind"] == "system":
-                new_parent_info = {
-                    "type": node["type"],
-                    "name": node["name"],
-                    "uid": node["uid"],
-                    "kind": node["kind"],
-                    "is_parametric_system": "ParameterManager" in node.get("properties", {}),
-                }
-                TcpNodeProxy._find_parent_node_info(
-                    tree=node,
-                    parent_info=new_parent_info,
-                    node_uid=node_uid,
-                )
-
-        # FIXME
-        # Raise to satisfy type checker
-        raise RuntimeError
-
 
 class TcpIntegrationNodeProxy(TcpNodeProxy, IntegrationNode):
     """Provides for creating and operating on integration nodes."""
@@ -2000,35 +1799,16 @@ class TcpSystemProxy(TcpNodeProxy, System):
         TypeError
             Raised when an unknown type of component is found.
         """
-        project_tree = self._osl_server.get_full_project_tree_with_properties()
-        if self.uid == project_tree["projects"][0]["system"]["uid"]:
-            system_tree = project_tree["projects"][0]["system"]
-        else:
-            located_tree = self._find_subtree(
-                tree=project_tree["projects"][0]["system"],
-                uid=self.uid,
-                nodes_tree=[],
-            )
-            if len(located_tree) == 1:
-                system_tree = located_tree[0]
-            else:
-                raise RuntimeError(f"Current system `{self.uid}` wasn't found.")
-
-        properties_dicts_list = self._find_node_with_uid(
-            uid=uid,
-            tree=system_tree,
-            properties_dicts_list=[],
-            current_depth=1,
-            max_search_depth=search_depth,
-        )
-
-        if len(properties_dicts_list) == 0:
+        project_tree_index = self._get_project_tree_index()
+        if not project_tree_index.is_descendant(uid, self.uid, max_depth=search_depth):
             self._logger.error(f"Node `{uid}` was not found in the current system.")
             return None
 
         return create_nodes_from_properties_dicts(
             osl_server=self._osl_server,
-            properties_dicts_list=properties_dicts_list,
+            properties_dicts_list=[
+                _get_node_properties_dict(project_tree_index=project_tree_index, uid=uid)
+            ],
             logger=self._logger,
         )[0]
 
@@ -2062,27 +1842,12 @@ class TcpSystemProxy(TcpNodeProxy, System):
         TypeError
             Raised when an unknown type of component is found.
         """
-        project_tree = self._osl_server.get_full_project_tree_with_properties()
-        if self.uid == project_tree["projects"][0]["system"]["uid"]:
-            system_tree = project_tree["projects"][0]["system"]
-        else:
-            located_tree = self._find_subtree(
-                tree=project_tree["projects"][0]["system"],
-                uid=self.uid,
-                nodes_tree=[],
-            )
-            if len(located_tree) == 1:
-                system_tree = located_tree[0]
-            else:
-                raise RuntimeError(f"Current system `{self.uid}` wasn't found.")
-
-        properties_dicts_list = self._find_nodes_with_name(
-            name=name,
-            tree=system_tree,
-            properties_dicts_list=[],
-            current_depth=1,
-            max_search_depth=search_depth,
-        )
+        project_tree_index = self._get_project_tree_index()
+        properties_dicts_list = [
+            _get_node_properties_dict(project_tree_index=project_tree_index, uid=uid)
+            for uid in project_tree_index.get_uids_by_name(name)
+            if project_tree_index.is_descendant(uid, self.uid, max_depth=search_depth)
+        ]
 
         if len(properties_dicts_list) == 0:
             self._logger.error(f"Node `{name}` not found in the current system.")
@@ -2136,19 +1901,7 @@ class TcpSystemProxy(TcpNodeProxy, System):
         RuntimeError
             Raised when the system wasn't located in the project tree.
         """
-        project_tree = self._osl_server.get_full_project_tree_with_properties()
-        if self.uid == project_tree["projects"][0]["system"]["uid"]:
-            system_tree = project_tree["projects"][0]["system"]
-        else:
-            located_tree = self._find_subtree(
-                tree=project_tree["projects"][0]["system"],
-                uid=self.uid,
-                nodes_tree=[],
-            )
-            if len(located_tree) == 1:
-                system_tree = located_tree[0]
-            else:
-                raise RuntimeError(f"Current system `{self.uid}` wasn't found.")
+        system_tree = cast(dict, self._get_project_tree_index().get_node(self.uid))
 
         children_dicts_list = []
         for node in system_tree["nodes"]:
@@ -2163,32 +1916,29 @@ class TcpSystemProxy(TcpNodeProxy, System):
             )
         return tuple(children_dicts_list)
 
-    @staticmethod
-    def _find_subtree(tree: dict, uid: str, nodes_tree: List[dict]) -> List[dict]:
-        """Find the subtree with a root node matching a specified unique ID.
-
-        Parameters
-        ----------
-        tree: dict
-            Dictionary with the parent structure.
-        uid: str
-            Unique ID of the subtree root node.
-        nodes_tree: List[dict]
-            List with tree of searched node.
+    def _get_project_tree_index(self) -> ProjectTreeIndex:
+        """Get index of the project tree containing the current system.
 
         Returns
         -------
-        dict
-            Dictionary representing the subtree found.
+        ProjectTreeIndex
+            Index of the project tree.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with the server.
+        OslCommandError
+            Raised when a command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        RuntimeError
+            Raised when the system wasn't located in the project tree.
         """
-        for node in tree["nodes"]:
-            if len(nodes_tree) != 0:
-                break
-            if node["uid"] == uid:
-                nodes_tree.append(node)
-            if node["kind"] == "system":
-                TcpSystemProxy._find_subtree(tree=node, uid=uid, nodes_tree=nodes_tree)
-        return nodes_tree
+        project_tree_index = self._osl_server.get_project_tree_index()
+        if self.uid not in project_tree_index:
+            raise RuntimeError(f"Current system `{self.uid}` wasn't found.")
+        return project_tree_index
 
     @staticmethod
     def _get_subtypes(
@@ -2739,6 +2489,18 @@ class TcpRootSystemProxy(TcpParametricSystemProxy, RootSystem):
             type_=NodeType(id="RunnableSystem", subtype=AddinType.BUILT_IN),
             logger=logger,
         )
+        self.__evaluation_cache: Optional[EvaluationCache] = None
+
+    @property
+    def evaluation_cache(self) -> Optional[EvaluationCache]:
+        """Cache of evaluated designs used by the ``evaluate_design`` method.
+
+        Returns
+        -------
+        Optional[EvaluationCache]
+            Enabled cache, ``None`` if the cache is disabled.
+        """
+        return self.__evaluation_cache
 
     def control(
         self,
@@ -2801,6 +2563,38 @@ class TcpRootSystemProxy(TcpParametricSystemProxy, RootSystem):
         """
         raise NotImplementedError("``RootSystem`` cannot be deleted.")
 
+    def disable_evaluation_cache(self) -> None:
+        """Disable the cache of evaluated designs.
+
+        The disabled cache is not closed, it can be enabled again.
+        """
+        self.__evaluation_cache = None
+
+    def enable_evaluation_cache(
+        self, evaluation_cache: Optional[EvaluationCache] = None
+    ) -> EvaluationCache:
+        """Enable the cache of evaluated designs.
+
+        While the cache is enabled, the ``evaluate_design`` method sends a design to the server
+        only if the result of a design with matching parameter values is not stored
+        in the cache. If the cache is already enabled, it is replaced.
+
+        Parameters
+        ----------
+        evaluation_cache : Optional[EvaluationCache], optional
+            Cache of evaluated designs. If ``None``, a cache stored in memory is created.
+            Defaults to ``None``.
+
+        Returns
+        -------
+        EvaluationCache
+            Enabled cache.
+        """
+        if evaluation_cache is None:
+            evaluation_cache = EvaluationCache()
+        self.__evaluation_cache = evaluation_cache
+        return evaluation_cache
+
     def evaluate_design(self, design: Design) -> Design:
         """Evaluate a design.
 
@@ -2827,11 +2621,129 @@ class TcpRootSystemProxy(TcpParametricSystemProxy, RootSystem):
         for parameter in design.parameters:
             evaluate_dict[parameter.name] = parameter.value
 
-        output_dict = self._osl_server.evaluate_design(
-            evaluate_dict=evaluate_dict  # type: ignore[arg-type]
-        )
+        evaluation_cache = self.__evaluation_cache
+        results = None
+        if evaluation_cache is not None:
+            results = evaluation_cache.get(evaluate_dict, namespace="evaluate_design")
+        if results is None:
+            output_dict = self._osl_server.evaluate_design(
+                evaluate_dict=evaluate_dict  # type: ignore[arg-type]
+            )
+            results = output_dict[0]
+            # failed designs are evaluated again next time
+            if evaluation_cache is not None and self.__is_succeeded(results):
+                evaluation_cache.put(evaluate_dict, results, namespace="evaluate_design")
         return self.__create_evaluated_design(
-            input_design=design, evaluate_dict=evaluate_dict, results=output_dict[0]
+            input_design=design, evaluate_dict=evaluate_dict, results=results
+        )
+
+    def evaluate_designs(
+        self, designs: Iterable[Design], chunk_size: int = 100
+    ) -> Iterator[Design]:
+        """Evaluate multiple designs.
+
+        Designs are sent to the server in chunks as the returned iterator is consumed. The
+        designs of a chunk are evaluated by a single request over one connection instead of
+        one round trip per design. If the evaluation cache is enabled, only designs not
+        found in the cache are sent to the server.
+
+        Parameters
+        ----------
+        designs: Iterable[Design]
+            Instances of the ``Design`` class with defined parameters.
+        chunk_size: int, optional
+            Maximum number of designs evaluated by a single request. By default ``100``.
+
+        Returns
+        -------
+        Iterator[Design]
+            Evaluated designs in the order of given designs.
+
+        Raises
+        ------
+        ValueError
+            Raised when the ``chunk_size`` is not greater than zero.
+        OslCommunicationError
+            Raised when an error occurs while communicating with the server.
+        OslCommandError
+            Raised when a command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"Chunk size must be positive, got {chunk_size}.")
+        return self.__create_evaluated_designs(designs, chunk_size)
+
+    def evaluate_designs_table(
+        self, designs: Iterable[Design], chunk_size: int = 100
+    ) -> DesignTable:
+        """Evaluate multiple designs and get the results column by column.
+
+        Designs are evaluated the same way as by the ``evaluate_designs`` method, but results
+        are collected directly into columns without creating an instance of the ``Design``
+        class for each evaluated design. Parameters of the table are the parameter values
+        used for evaluation by the server.
+
+        Parameters
+        ----------
+        designs: Iterable[Design]
+            Instances of the ``Design`` class with defined parameters.
+        chunk_size: int, optional
+            Maximum number of designs evaluated by a single request. By default ``100``.
+
+        Returns
+        -------
+        DesignTable
+            Evaluated designs in the order of given designs. Values of design variables
+            missing in some of the designs are ``None``.
+
+        Raises
+        ------
+        ValueError
+            Raised when the ``chunk_size`` is not greater than zero.
+        OslCommunicationError
+            Raised when an error occurs while communicating with the server.
+        OslCommandError
+            Raised when a command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"Chunk size must be positive, got {chunk_size}.")
+        ids: List[str] = []
+        feasibility: List[Optional[bool]] = []
+        status: List[str] = []
+        columns: Dict[str, Dict[str, List[Any]]] = {
+            kind: {} for kind in ("constraint", "limit_state", "objective", "parameter", "response")
+        }
+        for _, _, results in self.__evaluate_designs_in_chunks(designs, chunk_size):
+            result_design = results["result_design"]
+            for kind, kind_columns in columns.items():
+                for name, value in zip(
+                    result_design[f"{kind}_names"], result_design[f"{kind}_values"]
+                ):
+                    column = kind_columns.get(name)
+                    if column is None:
+                        column = kind_columns[name] = [None] * len(ids)
+                    column.append(value)
+            ids.append(result_design["hid"])
+            feasibility.append(result_design["feasible"])
+            status.append(DesignStatus.from_str(result_design["status"]).name)
+            # fill values of design variables missing in this design
+            for kind_columns in columns.values():
+                for column in kind_columns.values():
+                    if len(column) < len(ids):
+                        column.append(None)
+        return DesignTable(
+            ids=ids,
+            feasibility=feasibility,
+            status=status,
+            pareto_design=[None] * len(ids),
+            constraints=columns["constraint"],
+            limit_states=columns["limit_state"],
+            objectives=columns["objective"],
+            parameters=columns["parameter"],
+            responses=columns["response"],
         )
 
     def get_missing_parameters_names(self, design: Design) -> Tuple[str, ...]:
@@ -2922,8 +2834,82 @@ class TcpRootSystemProxy(TcpParametricSystemProxy, RootSystem):
             second=self.parameter_manager.get_parameters_names(),
         )
 
+    def __create_evaluated_designs(
+        self, designs: Iterable[Design], chunk_size: int
+    ) -> Iterator[Design]:
+        """Evaluate designs in chunks and create instances of ``Design`` with results."""
+        # parameter names are mostly the same for all designs, compare them only once
+        name_mappings: Dict[Tuple, Tuple] = {}
+        for design, evaluate_dict, results in self.__evaluate_designs_in_chunks(
+            designs, chunk_size
+        ):
+            yield self.__create_evaluated_design(
+                input_design=design,
+                evaluate_dict=evaluate_dict,
+                results=results,
+                name_mappings=name_mappings,
+            )
+
+    def __evaluate_designs_in_chunks(
+        self, designs: Iterable[Design], chunk_size: int
+    ) -> Iterator[Tuple[Design, Dict, Dict]]:
+        """Evaluate designs by one request per chunk, using the evaluation cache if enabled.
+
+        Parameters
+        ----------
+        designs: Iterable[Design]
+            Designs to be evaluated.
+        chunk_size: int
+            Maximum number of designs evaluated by a single request.
+
+        Returns
+        -------
+        Iterator[Tuple[Design, Dict, Dict]]
+            Input design, dictionary used for evaluation and output from the evaluation
+            for each design, in the order of given designs.
+        """
+        designs_iterator = iter(designs)
+        while True:
+            chunk = list(itertools.islice(designs_iterator, chunk_size))
+            if not chunk:
+                return
+            evaluate_dicts = [
+                {parameter.name: parameter.value for parameter in design.parameters}
+                for design in chunk
+            ]
+            evaluation_cache = self.__evaluation_cache
+            chunk_results: List[Optional[Dict]] = [None] * len(chunk)
+            if evaluation_cache is not None:
+                chunk_results = [
+                    evaluation_cache.get(evaluate_dict, namespace="evaluate_design")
+                    for evaluate_dict in evaluate_dicts
+                ]
+            unsolved = [index for index, results in enumerate(chunk_results) if results is None]
+            if unsolved:
+                output_dicts = self._osl_server.evaluate_designs(
+                    [evaluate_dicts[index] for index in unsolved]
+                )
+                for index, output_dict in zip(unsolved, output_dicts):
+                    results = output_dict[0]
+                    chunk_results[index] = results
+                    if evaluation_cache is not None and self.__is_succeeded(results):
+                        evaluation_cache.put(
+                            evaluate_dicts[index], results, namespace="evaluate_design"
+                        )
+            yield from zip(chunk, evaluate_dicts, chunk_results)  # type: ignore[misc]
+
+    @staticmethod
+    def __is_succeeded(results: Dict) -> bool:
+        """Determine whether the design was evaluated successfully."""
+        status = results.get("result_design", {}).get("status")
+        return isinstance(status, str) and DesignStatus.from_str(status) == DesignStatus.SUCCEEDED
+
     def __create_evaluated_design(
-        self, input_design: Design, evaluate_dict: Dict, results: Dict
+        self,
+        input_design: Design,
+        evaluate_dict: Dict,
+        results: Dict,
+        name_mappings: Optional[Dict[Tuple, Tuple]] = None,
     ) -> Design:
         """Create a new instance of ``Design`` with results.
 
@@ -2935,70 +2921,29 @@ class TcpRootSystemProxy(TcpParametricSystemProxy, RootSystem):
             Dictionary used for evaluation.
         results: Dict
             Output from the evaluation of the input design.
+        name_mappings: Optional[Dict[Tuple, Tuple]], optional
+            Missing and undefined parameters by names of input and output parameters, reused
+            for designs with the same parameters. Differences of parameters are logged only
+            when they are added. By default ``None``, differences are computed and logged.
 
         Returns
         -------
         Design
             Instance of the ``Design`` class with results.
         """
-        id = results["result_design"]["hid"]
-        feasibility = results["result_design"]["feasible"]
-        status = DesignStatus.from_str(results["result_design"]["status"])
-
-        # constraint
-        constraints = []
-        for position, constraint in enumerate(results["result_design"]["constraint_names"]):
-            constraints.append(
-                DesignVariable(
-                    name=constraint,
-                    value=results["result_design"]["constraint_values"][position],
-                )
-            )
-        # limit state
-        limit_states = []
-        for position, limit_state in enumerate(results["result_design"]["limit_state_names"]):
-            limit_states.append(
-                DesignVariable(
-                    name=limit_state,
-                    value=results["result_design"]["limit_state_values"][position],
-                )
-            )
-        # objective
-        objectives = []
-        for position, objective in enumerate(results["result_design"]["objective_names"]):
-            objectives.append(
-                DesignVariable(
-                    name=objective,
-                    value=results["result_design"]["objective_values"][position],
-                )
-            )
-        # responses
-        responses = []
-        for position, response in enumerate(results["result_design"]["response_names"]):
-            responses.append(
-                DesignVariable(
-                    name=response,
-                    value=results["result_design"]["response_values"][position],
-                )
-            )
-        # variables
-        variables = []
-        for position, variable in enumerate(results["result_design"]["variable_names"]):
-            variables.append(
-                DesignVariable(
-                    name=variable,
-                    value=results["result_design"]["variable_values"][position],
-                )
-            )
+        result_design = results["result_design"]
+        id = result_design["hid"]
+        feasibility = result_design["feasible"]
+        status = DesignStatus.from_str(result_design["status"])
 
         # create instance of design with new values
         output_design = Design(
             parameters=input_design.parameters,
-            constraints=constraints,
-            limit_states=limit_states,
-            objectives=objectives,
-            variables=variables,
-            responses=responses,
+            constraints=self.__create_design_variables(result_design, "constraint"),
+            limit_states=self.__create_design_variables(result_design, "limit_state"),
+            objectives=self.__create_design_variables(result_design, "objective"),
+            variables=self.__create_design_variables(result_design, "variable"),
+            responses=self.__create_design_variables(result_design, "response"),
             feasibility=feasibility,
             design_id=id,
             status=status,
@@ -3006,22 +2951,30 @@ class TcpRootSystemProxy(TcpParametricSystemProxy, RootSystem):
 
         # compare input and output values
         input_design_parameters = input_design.parameters_names
-        output_parameters = results["result_design"]["parameter_names"]
-        missing_parameters = self.__get_sorted_difference_of_sets(
-            output_parameters, input_design_parameters
-        )
-        undefined_parameters = self.__get_sorted_difference_of_sets(
-            input_design_parameters, output_parameters
-        )
-        unused = self.__compare_input_w_processed_parameters_values(evaluate_dict, results)
-
-        if undefined_parameters:
-            self._logger.debug(f"Parameters ``{undefined_parameters}`` weren't used.")
-        if missing_parameters:
-            self._logger.warning(
-                f"Parameters ``{missing_parameters}`` were missing, "
-                "reference values were used for evaluation and list of parameters will be updated."
+        output_parameters = result_design["parameter_names"]
+        mapping_key = (input_design_parameters, tuple(output_parameters))
+        name_mapping = name_mappings.get(mapping_key) if name_mappings is not None else None
+        if name_mapping is None:
+            missing_parameters = self.__get_sorted_difference_of_sets(
+                output_parameters, input_design_parameters
+            )
+            undefined_parameters = self.__get_sorted_difference_of_sets(
+                input_design_parameters, output_parameters
+            )
+            name_mapping = (
+                missing_parameters,
+                tuple(output_parameters.index(parameter) for parameter in missing_parameters),
             )
+            if name_mappings is not None:
+                name_mappings[mapping_key] = name_mapping
+            if undefined_parameters:
+                self._logger.debug(f"Parameters ``{undefined_parameters}`` weren't used.")
+            if missing_parameters:
+                self._logger.warning(
+                    f"Parameters ``{missing_parameters}`` were missing, reference values "
+                    "were used for evaluation and list of parameters will be updated."
+                )
+        unused = self.__compare_input_w_processed_parameters_values(evaluate_dict, results)
         if unused:
             self._logger.warning(
                 "Values of parameters were changed:"
@@ -3030,16 +2983,36 @@ class TcpRootSystemProxy(TcpParametricSystemProxy, RootSystem):
 
         # update design with missing parameters
         # (parameters not defined in input design, but used for evaluation)
-        for parameter in missing_parameters:
-            position = results["result_design"]["parameter_names"].index(parameter)
+        for parameter, position in zip(*name_mapping):
             output_design.set_parameter_by_name(
                 parameter,
-                results["result_design"]["parameter_values"][position],
+                result_design["parameter_values"][position],
                 False,
             )
 
         return output_design
 
+    @staticmethod
+    def __create_design_variables(result_design: Dict, kind: str) -> List[DesignVariable]:
+        """Create design variables of given kind from the evaluated design.
+
+        Parameters
+        ----------
+        result_design: Dict
+            Evaluated design from the server output.
+        kind: str
+            Kind of design variables, e.g. ``"response"``.
+
+        Returns
+        -------
+        List[DesignVariable]
+            Design variables with names and values of given kind.
+        """
+        return [
+            DesignVariable(name=name, value=value)
+            for name, value in zip(result_design[f"{kind}_names"], result_design[f"{kind}_values"])
+        ]
+
     @staticmethod
     def __categorize_criteria(criteria: Tuple[Criterion, ...]) -> Dict[str, List[Criterion]]:
         """Get criteria sorted by its kinds.
@@ -3900,6 +3873,7 @@ def create_edge_from_dict(
     connection: dict,
     node: Optional[TcpNodeProxy] = None,
     logger: Optional[Any] = None,
+    project_tree_index: Optional[ProjectTreeIndex] = None,
 ) -> Edge:
     """Create edge from project tree and connection dictionary.
 
@@ -3915,12 +3889,17 @@ def create_edge_from_dict(
         Node from which slot is created, by default ``None``.
     logger: Optional[Any], optional
         Object for logging. If ``None``, standard logging object is used. Defaults to ``None``.
+    project_tree_index: Optional[ProjectTreeIndex], optional
+        Index of the ``project_tree``. If ``None``, the index is built from the ``project_tree``.
+        Defaults to ``None``.
 
     Returns
     -------
     Edge
         Instance of the Edge class.
     """
+    if project_tree_index is None:
+        project_tree_index = ProjectTreeIndex(project_tree)
     rec_slot_name = connection["receiving_slot"]
     rec_slot_type = connection.get("receiving_slot_is_inner", None)
     rec_slot_type = (
@@ -3948,6 +3927,7 @@ def create_edge_from_dict(
         slot_type=rec_slot_type,
         node=node,
         logger=logger,
+        project_tree_index=project_tree_index,
     )
 
     sen_slot_name = connection["sending_slot"]
@@ -3977,6 +3957,7 @@ def create_edge_from_dict(
         slot_type=sen_slot_type,
         node=node,
         logger=logger,
+        project_tree_index=project_tree_index,
     )
 
     return Edge(from_slot=sen_slot, to_slot=rec_slot)
@@ -4035,6 +4016,7 @@ def create_slot_from_project_tree(
     slot_type: SlotType,
     node: Optional[TcpNodeProxy] = None,
     logger: Optional[Any] = None,
+    project_tree_index: Optional[ProjectTreeIndex] = None,
 ) -> TcpSlotProxy:
     """Create slot from project tree.
 
@@ -4054,6 +4036,9 @@ def create_slot_from_project_tree(
         Node from which slot is created, by default ``None``.
     logger: Optional[Any], optional
         Object for logging. If ``None``, standard logging object is used. Defaults to ``None``.
+    project_tree_index: Optional[ProjectTreeIndex], optional
+        Index of the ``project_tree``. If ``None``, the index is built from the ``project_tree``.
+        Defaults to ``None``.
 
     Returns
     -------
@@ -4064,16 +4049,13 @@ def create_slot_from_project_tree(
         if uid == project_tree["uid"]:
             node = TcpRootSystemProxy(uid=uid, osl_server=osl_server, logger=logger)
         else:
-            node_dict = TcpNodeProxy._find_node_with_uid(
-                uid=uid,
-                tree=project_tree,
-                properties_dicts_list=[],
-                current_depth=1,
-                max_search_depth=-1,
-            )
+            if project_tree_index is None:
+                project_tree_index = ProjectTreeIndex(project_tree)
             node = create_nodes_from_properties_dicts(
                 osl_server=osl_server,
-                properties_dicts_list=node_dict,
+                properties_dicts_list=[
+                    _get_node_properties_dict(project_tree_index=project_tree_index, uid=uid)
+                ],
                 logger=logger,
             )[0]
     return TcpSlotProxy.create_slot(
@@ -4081,6 +4063,42 @@ def create_slot_from_project_tree(
     )
 
 
+def _get_node_properties_dict(project_tree_index: ProjectTreeIndex, uid: str) -> dict:
+    """Get dictionary with necessary information for creation of a node.
+
+    Parameters
+    ----------
+    project_tree_index : ProjectTreeIndex
+        Index of the project tree.
+    uid : str
+        Unique ID of the node.
+
+    Returns
+    -------
+    dict
+        Dictionary with necessary information for creation of a node.
+
+    Raises
+    ------
+    RuntimeError
+        Raised when the node wasn't located in the project tree.
+    """
+    node = project_tree_index.get_node(uid)
+    if node is None:
+        raise RuntimeError(f"Node `{uid}` wasn't found.")
+    parent_uid = project_tree_index.get_parent_uid(uid)
+    parent = project_tree_index.get_node(parent_uid) if parent_uid is not None else None
+    return {
+        "type": node["type"],
+        "name": node["name"],
+        "uid": node["uid"],
+        "parent_uid": parent_uid,
+        "parent_name": parent["name"] if parent is not None else None,
+        "kind": node["kind"],
+        "is_parametric_system": "ParameterManager" in node.get("properties", {}),
+    }
+
+
 def _get_node_class_type(node_dict: dict, type_: NodeType) -> NodeClassType:
     """Get node class type from the given inputs.
 
@@ -0,0 +1,385 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Contains dispatcher executing callbacks of push notifications by a pool of threads."""
+from __future__ import annotations
+
+import collections
+import logging
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, Hashable, Iterable, List, NamedTuple, Optional
+
+from ansys.optislang.core.osl_process import ServerNotification
+
+DEFAULT_COALESCED_NOTIFICATIONS = (ServerNotification.ACTOR_DATA_CHANGED,)
+"""Notifications coalesced by default, received in bursts while designs are evaluated."""
+
+
+class NotificationDispatcherStats(NamedTuple):
+    """Statistics of the notifications dispatched by the ``NotificationDispatcher``.
+
+    Attributes
+    ----------
+    received : int
+        Number of received notifications.
+    coalesced : int
+        Number of notifications merged into a pending notification of the same type and actor.
+    executed : int
+        Number of notifications whose callbacks were executed.
+    errors : int
+        Number of notifications whose callbacks raised an exception.
+    queued : int
+        Number of notifications waiting for execution.
+    max_queued : int
+        Maximum number of notifications waiting for execution at once.
+    blocked : int
+        Number of notifications whose receiving was blocked, because the queue was full.
+    blocked_time : float
+        Summed time in seconds the receiving of notifications was blocked.
+    max_delay : float
+        Maximum time in seconds between receiving a notification and executing its callbacks.
+    """
+
+    received: int
+    coalesced: int
+    executed: int
+    errors: int
+    queued: int
+    max_queued: int
+    blocked: int
+    blocked_time: float
+    max_delay: float
+
+
+class _PendingNotification:
+    """Notification waiting for execution, updated in place when coalesced."""
+
+    __slots__ = ("notification", "execute", "coalescing_key", "received_time")
+
+    def __init__(
+        self,
+        notification: dict,
+        execute: Callable[[dict], None],
+        coalescing_key: Optional[Hashable],
+    ) -> None:
+        self.notification = notification
+        self.execute = execute
+        self.coalescing_key = coalescing_key
+        self.received_time = time.perf_counter()
+
+
+class NotificationDispatcher:
+    """Executes callbacks of push notifications by a pool of threads.
+
+    Listeners only receive and acknowledge notifications and put them into a bounded queue,
+    callbacks are executed by the worker threads. Slow callbacks thus do not delay receiving
+    of further notifications. Notifications of a single listener are executed one at a time
+    in the order of receiving, notifications of different listeners are executed concurrently.
+
+    Notifications of the ``coalesced_notifications`` types are coalesced. If a notification
+    of the same type and actor is still waiting for execution, it is replaced by the received
+    one instead of being queued. If the queue is full, receiving of further notifications is
+    blocked until a notification is executed.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Number of threads executing the callbacks. Defaults to ``4``.
+    max_queue_size : int, optional
+        Maximum number of notifications waiting for execution. Defaults to ``1000``.
+    coalesced_notifications : Iterable[ServerNotification], optional
+        Types of notifications to be coalesced.
+        Defaults to ``DEFAULT_COALESCED_NOTIFICATIONS``.
+    logger : Optional[Any], optional
+        Object for logging exceptions raised by callbacks. If ``None``, standard logging
+        object is used. Defaults to ``None``.
+
+    Raises
+    ------
+    ValueError
+        Raised when the ``max_workers`` or ``max_queue_size`` is not greater than zero.
+
+    Examples
+    --------
+    Execute callbacks of notifications by two threads.
+
+    >>> from ansys.optislang.core import Optislang
+    >>> from ansys.optislang.core.tcp.notification_dispatcher import NotificationDispatcher
+    >>> osl = Optislang(project_path="calculator.opf")
+    >>> dispatcher = osl.osl_server.enable_notification_dispatcher(
+    ...     NotificationDispatcher(max_workers=2)
+    ... )
+    >>> osl.application.project.start()
+    >>> stats = dispatcher.stats
+    >>> osl.dispose()
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_queue_size: int = 1000,
+        coalesced_notifications: Iterable[ServerNotification] = DEFAULT_COALESCED_NOTIFICATIONS,
+        logger: Optional[Any] = None,
+    ) -> None:
+        """Create a new instance of the ``NotificationDispatcher`` class and start workers."""
+        if max_workers <= 0:
+            raise ValueError(f"Number of workers must be positive, got {max_workers}.")
+        if max_queue_size <= 0:
+            raise ValueError(f"Size of the queue must be positive, got {max_queue_size}.")
+        if logger is None:
+            self._logger = logging.getLogger(__name__)
+        else:
+            self._logger = logger
+        self.__max_workers = max_workers
+        self.__max_queue_size = max_queue_size
+        self.__coalesced_notifications = frozenset(
+            notification.name for notification in coalesced_notifications
+        )
+        self.__condition = threading.Condition()
+        # pending notifications of each source, a source is executed by one worker at a time
+        self.__pending: Dict[Hashable, Deque[_PendingNotification]] = {}
+        self.__coalescing: Dict[Hashable, _PendingNotification] = {}
+        self.__ready: Deque[Hashable] = collections.deque()
+        self.__queued = 0
+        self.__running = 0
+        self.__shutdown = False
+        self.__received = 0
+        self.__coalesced = 0
+        self.__executed = 0
+        self.__errors = 0
+        self.__max_queued = 0
+        self.__blocked = 0
+        self.__blocked_time = 0.0
+        self.__max_delay = 0.0
+        self.__workers: List[threading.Thread] = [
+            threading.Thread(
+                target=self.__work, name=f"PyOptiSLang.NotificationDispatcher.{i}", daemon=True
+            )
+            for i in range(max_workers)
+        ]
+        for worker in self.__workers:
+            worker.start()
+
+    def __repr__(self) -> str:
+        """Return printable representation of the dispatcher."""
+        return (
+            f"{self.__class__.__name__}(max_workers={self.__max_workers}, "
+            f"max_queue_size={self.__max_queue_size})"
+        )
+
+    @property
+    def coalesced_notifications(self) -> frozenset:
+        """Names of coalesced types of notifications.
+
+        Returns
+        -------
+        frozenset
+            Names of the types, e.g. ``"ACTOR_DATA_CHANGED"``.
+        """
+        return self.__coalesced_notifications
+
+    @property
+    def is_shutdown(self) -> bool:
+        """Whether the dispatcher was shut down.
+
+        Returns
+        -------
+        bool
+            ``True`` if shut down, ``False`` otherwise.
+        """
+        return self.__shutdown
+
+    @property
+    def max_queue_size(self) -> int:
+        """Maximum number of notifications waiting for execution.
+
+        Returns
+        -------
+        int
+            Size of the queue.
+        """
+        return self.__max_queue_size
+
+    @property
+    def max_workers(self) -> int:
+        """Number of threads executing the callbacks.
+
+        Returns
+        -------
+        int
+            Number of threads.
+        """
+        return self.__max_workers
+
+    @property
+    def stats(self) -> NotificationDispatcherStats:
+        """Statistics of the dispatched notifications.
+
+        Returns
+        -------
+        NotificationDispatcherStats
+            Current statistics.
+        """
+        with self.__condition:
+            return NotificationDispatcherStats(
+                received=self.__received,
+                coalesced=self.__coalesced,
+                executed=self.__executed,
+                errors=self.__errors,
+                queued=self.__queued,
+                max_queued=self.__max_queued,
+                blocked=self.__blocked,
+                blocked_time=self.__blocked_time,
+                max_delay=self.__max_delay,
+            )
+
+    def dispatch(
+        self, source: Hashable, notification: dict, execute: Callable[[dict], None]
+    ) -> None:
+        """Queue notification for execution of its callbacks.
+
+        Blocks while the queue is full. Notifications dispatched after the dispatcher was shut
+        down are executed immediately by the calling thread.
+
+        Parameters
+        ----------
+        source : Hashable
+            Source of the notification, typically the listener. Notifications of the same
+            source are executed one at a time in the order of dispatching.
+        notification : dict
+            Decoded notification.
+        execute : Callable[[dict], None]
+            Function executing callbacks of the notification.
+        """
+        coalescing_key = None
+        if notification.get("type") in self.__coalesced_notifications:
+            coalescing_key = (source, notification.get("type"), notification.get("uid"))
+        with self.__condition:
+            self.__received += 1
+            if coalescing_key is not None:
+                pending_notification = self.__coalescing.get(coalescing_key)
+                if pending_notification is not None:
+                    pending_notification.notification = notification
+                    pending_notification.execute = execute
+                    self.__coalesced += 1
+                    return
+            if self.__queued >= self.__max_queue_size and not self.__shutdown:
+                self.__blocked += 1
+                start_time = time.perf_counter()
+                self.__condition.wait_for(
+                    lambda: self.__queued < self.__max_queue_size or self.__shutdown
+                )
+                self.__blocked_time += time.perf_counter() - start_time
+            if not self.__shutdown:
+                pending_notification = _PendingNotification(notification, execute, coalescing_key)
+                if coalescing_key is not None:
+                    self.__coalescing[coalescing_key] = pending_notification
+                pending = self.__pending.get(source)
+                if pending is None:
+                    pending = self.__pending[source] = collections.deque()
+                    self.__ready.append(source)
+                    self.__condition.notify()
+                pending.append(pending_notification)
+                self.__queued += 1
+                self.__max_queued = max(self.__max_queued, self.__queued)
+                return
+        self.__execute(_PendingNotification(notification, execute, None))
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued notifications were executed.
+
+        Parameters
+        ----------
+        timeout : Optional[float], optional
+            Maximum time to wait in seconds. If ``None``, waits without limit.
+            Defaults to ``None``.
+
+        Returns
+        -------
+        bool
+            ``True`` if all notifications were executed, ``False`` if the timeout expired.
+        """
+        with self.__condition:
+            return self.__condition.wait_for(
+                lambda: self.__queued == 0 and self.__running == 0, timeout=timeout
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers once the queued notifications were executed.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Determines whether to wait for the workers to finish. Defaults to ``True``.
+        """
+        with self.__condition:
+            self.__shutdown = True
+            self.__condition.notify_all()
+        if wait:
+            current_thread = threading.current_thread()
+            for worker in self.__workers:
+                if worker is not current_thread:
+                    worker.join()
+
+    def __work(self) -> None:
+        """Execute notifications of ready sources until the dispatcher is shut down."""
+        while True:
+            with self.__condition:
+                self.__condition.wait_for(lambda: self.__ready or self.__shutdown)
+                if not self.__ready:
+                    return
+                source = self.__ready.popleft()
+                pending = self.__pending[source]
+                pending_notification = pending.popleft()
+                if pending_notification.coalescing_key is not None:
+                    del self.__coalescing[pending_notification.coalescing_key]
+                self.__queued -= 1
+                self.__running += 1
+                self.__max_delay = max(
+                    self.__max_delay, time.perf_counter() - pending_notification.received_time
+                )
+                # a slot in the queue was released
+                self.__condition.notify_all()
+            try:
+                self.__execute(pending_notification)
+            finally:
+                with self.__condition:
+                    self.__running -= 1
+                    if pending:
+                        self.__ready.append(source)
+                    else:
+                        del self.__pending[source]
+                    self.__condition.notify_all()
+
+    def __execute(self, pending_notification: _PendingNotification) -> None:
+        """Execute callbacks of the notification and count the result."""
+        try:
+            pending_notification.execute(pending_notification.notification)
+        except Exception as ex:
+            self._logger.warning(f"Callback of notification failed: {ex!r}")
+            with self.__condition:
+                self.__errors += 1
+        finally:
+            with self.__condition:
+                self.__executed += 1
@@ -26,19 +26,32 @@ from __future__ import annotations
 import atexit
 from datetime import datetime
 from ipaddress import ip_address
-import json
 import logging
 import os
 from pathlib import Path
 from queue import Queue
 import re
+import select
 import signal
 import socket
 import struct
 import sys
 import threading
 import time
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 import uuid
 
 from deprecated.sphinx import deprecated
@@ -57,19 +70,33 @@ from ansys.optislang.core.errors import (
     OslServerStartError,
     ResponseFormatError,
 )
+from ansys.optislang.core.json_codec import JsonCodec, get_json_codec
 from ansys.optislang.core.json_utils import _get_enum_value
-from ansys.optislang.core.node_types import AddinType, NodeType
+from ansys.optislang.core.node_types import NodeType, get_node_type_registry
 from ansys.optislang.core.osl_process import OslServerProcess, ServerNotification
 from ansys.optislang.core.osl_server import OslServer, OslVersion
 from ansys.optislang.core.placeholder_types import PlaceholderInfo, PlaceholderType, UserLevel
 from ansys.optislang.core.slot_types import SlotTypeHint
+from ansys.optislang.core.tcp import json_stream
 from ansys.optislang.core.tcp import server_commands as commands
 from ansys.optislang.core.tcp import server_queries as queries
 from ansys.optislang.core.tcp.local_socket import (
     LocalClientSocket,
     LocalServerSocket,
 )
+from ansys.optislang.core.tcp.metrics import (
+    _COMMAND_PREFIX_PATTERN,
+    _QUERY_NAME_PATTERN,
+    DISABLED_TRACE,
+    RequestPhase,
+    RequestTrace,
+    TcpCommandMetrics,
+    get_encoded_request_name,
+)
+from ansys.optislang.core.tcp.notification_dispatcher import NotificationDispatcher
 from ansys.optislang.core.tcp.placeholder_types import PlaceholderTypeTCP, UserLevelTCP
+from ansys.optislang.core.tcp.project_tree_index import ProjectTreeIndex
+from ansys.optislang.core.tcp.session_recording import SessionRecorder
 
 
 def _get_current_timeout(initial_timeout: Optional[float], start_time: float) -> Optional[float]:
@@ -108,6 +135,174 @@ def _get_current_timeout(initial_timeout: Optional[float], start_time: float) ->
         return initial_timeout
 
 
+def _parse_osl_version(osl_version_str: str) -> OslVersion:
+    """Parse optiSLang version from the version string returned by the server.
+
+    Parameters
+    ----------
+    osl_version_str : str
+        optiSLang version string, e.g. ``"25.1.0 (123)"``.
+
+    Returns
+    -------
+    OslVersion
+        optiSLang version as typing.NamedTuple containing
+        major, minor, maintenance and revision versions.
+
+    Raises
+    ------
+    RuntimeError
+        Raised when parsing version numbers from string fails.
+    """
+    pattern = r"(\d+)\.(\d+)\.(\d+).*\((\d+)M?\)"
+    osl_version_entries = re.fullmatch(pattern, osl_version_str)
+
+    if osl_version_entries:
+        major, minor, maintenance, revision = osl_version_entries.groups()
+        return OslVersion(int(major), int(minor), int(maintenance), int(revision))
+    else:
+        raise RuntimeError(
+            'Invalid provided optiSLang version string: "{}".'.format(osl_version_str)
+        )
+
+
+def _check_command_response(response: Any) -> None:
+    """Check whether the server response for a sent command contains any failure information.
+
+    Parameters
+    ----------
+    response : Any
+        Server response as dictionary or list of dictionaries.
+
+    Raises
+    ------
+    OslCommandError
+        Raised when the server response for the sent command contains any failure information.
+    """
+    for resp_elem in response if isinstance(response, list) else [response]:
+        if "status" in resp_elem and resp_elem["status"].lower() == "failure":
+            message = None
+            if "message" in resp_elem:
+                message = resp_elem["message"]
+            if "std_err" in resp_elem:
+                message += "; " + resp_elem["std_err"]
+            if message is None:
+                message = "Command error: " + str(resp_elem)
+            raise OslCommandError(message)
+
+
+def _get_server_command_list(request: Any) -> Optional[List[Dict]]:
+    """Get list of commands if the request is a mergeable server command.
+
+    Parameters
+    ----------
+    request : Any
+        Decoded request.
+
+    Returns
+    -------
+    Optional[List[Dict]]
+        List of commands of a single project, ``None`` if the request is not a server command.
+    """
+    if (
+        isinstance(request, dict)
+        and set(request.keys()) <= {"projects", "Password"}
+        and isinstance(request.get("projects"), list)
+        and len(request["projects"]) == 1
+        and set(request["projects"][0].keys()) == {"commands"}
+        and isinstance(request["projects"][0]["commands"], list)
+    ):
+        return request["projects"][0]["commands"]
+    return None
+
+
+def _merge_server_commands(
+    commands: Iterable[str], json_codec: Optional[JsonCodec] = None
+) -> Tuple[List[str], List[Optional[List[int]]]]:
+    """Merge consecutive server commands into single requests.
+
+    Parameters
+    ----------
+    commands : Iterable[str]
+        Commands or queries to be merged.
+    json_codec : Optional[JsonCodec], optional
+        Codec used to decode and encode the requests. If ``None``, the default codec is used.
+
+    Returns
+    -------
+    Tuple[List[str], List[Optional[List[int]]]]
+        Requests to be sent and, for each request, either the number of commands of each merged
+        original command or ``None`` if the request is a query or other non-mergeable request.
+    """
+    codec = get_json_codec(json_codec)
+    requests: List[str] = []
+    merged_requests: List[Optional[Dict]] = []
+    command_counts: List[Optional[List[int]]] = []
+    for command in commands:
+        command_dict = codec.loads(command)
+        command_list = _get_server_command_list(command_dict)
+        previous = merged_requests[-1] if merged_requests else None
+        if (
+            command_list is not None
+            and previous is not None
+            and previous.get("Password") == command_dict.get("Password")
+        ):
+            previous["projects"][0]["commands"].extend(command_list)
+            command_counts[-1].append(len(command_list))  # type: ignore[union-attr]
+            continue
+        requests.append(command)
+        merged_requests.append(command_dict if command_list is not None else None)
+        command_counts.append([len(command_list)] if command_list is not None else None)
+
+    for idx, merged_request in enumerate(merged_requests):
+        counts = command_counts[idx]
+        if merged_request is not None and counts is not None and len(counts) > 1:
+            requests[idx] = codec.dumps(merged_request, sort_keys=True)
+    return requests, command_counts
+
+
+def _split_batch_responses(
+    responses: Sequence[Any], command_counts: Sequence[Optional[List[int]]]
+) -> List[Any]:
+    """Check responses to merged requests and split them back per original command.
+
+    Parameters
+    ----------
+    responses : Sequence[Any]
+        Decoded responses in the order of merged requests.
+    command_counts : Sequence[Optional[List[int]]]
+        Number of commands of each merged original command, as returned by
+        ``_merge_server_commands``.
+
+    Returns
+    -------
+    List[Any]
+        Responses in the order of original commands.
+
+    Raises
+    ------
+    OslCommandError
+        Raised when any of the commands or queries fails.
+    ResponseFormatError
+        Raised when the response to merged commands does not match the number of commands.
+    """
+    split_responses: List[Any] = []
+    for response, counts in zip(responses, command_counts):
+        _check_command_response(response)
+        if counts is None or len(counts) == 1:
+            split_responses.append(response)
+            continue
+        if not isinstance(response, list) or len(response) != sum(counts):
+            raise ResponseFormatError(
+                "Number of results does not match the number of merged commands."
+            )
+        position = 0
+        for count in counts:
+            split_responses.append(response[position : position + count])
+            position += count
+    return split_responses
+
+
 class FunctionsAttributeRegister:
     """Class which stores attributes specific to individual functions."""
 
@@ -272,6 +467,10 @@ class TcpClient:
     _BUFFER_SIZE = pow(2, 16)
     # Response size in bytes. Value is assumed to be binary 64Bit unsigned integer.
     _RESPONSE_SIZE_BYTES = 8
+    # Maximum size in bytes of the buffer allocated ahead of receiving the data. Larger messages
+    # are received into a buffer growing with the received data, as the declared size of
+    # a message is not trusted.
+    _MAX_PREALLOCATED_SIZE = pow(2, 24)
 
     def __init__(
         self,
@@ -335,6 +534,27 @@ class TcpClient:
             self.__local_socket is not None and self.__local_socket.is_connected
         )
 
+    def is_connection_dropped(self) -> bool:
+        """Determine whether an idle connection has been dropped by the server.
+
+        An idle connection is not expected to have any pending data. Both pending data
+        and the end of the stream mean that the connection cannot be reused.
+
+        Returns
+        -------
+        bool
+            True if the connection is not established or cannot be reused; False otherwise.
+        """
+        if self.__socket is not None:
+            try:
+                readable, _, _ = select.select([self.__socket], [], [], 0)
+            except (OSError, ValueError):
+                return True
+            return bool(readable)
+        elif self.__local_socket is not None and self.__local_socket.is_connected:
+            return self.__local_socket.poll_readable()
+        return True
+
     def connect_local(self, local_server_id: str, timeout: Optional[float] = 2) -> None:
         """Connect to a local domain server.
 
@@ -432,7 +652,9 @@ class TcpClient:
             self.__local_socket.close()
             self.__local_socket = None
 
-    def send_msg(self, msg: str, timeout: Optional[float] = 5) -> None:
+    def send_msg(
+        self, msg: str, timeout: Optional[float] = 5, trace: RequestTrace = DISABLED_TRACE
+    ) -> None:
         """Send message to the server.
 
         Parameters
@@ -444,6 +666,9 @@ class TcpClient:
             the function will raise a timeout exception if the timeout period value has elapsed
             before the operation has completed. If zero is given, the non-blocking mode is used.
             If ``None`` is given, the blocking mode is used. Defaults to 5 s.
+        trace : RequestTrace, optional
+            Trace recording the duration and the size of the sent message.
+            Defaults to ``DISABLED_TRACE``.
 
         Raises
         ------
@@ -459,6 +684,7 @@ class TcpClient:
                 "Cannot send message. Connection is not established."
             )
 
+        start_time = time.perf_counter()
         data = force_bytes(msg)
         data_len = len(data)
         header = struct.pack("!QQ", data_len, data_len)
@@ -482,6 +708,9 @@ class TcpClient:
                 if sent == 0:
                     raise ConnectionError("Socket connection broken")
                 bytes_sent += sent
+        if trace.enabled:
+            trace.add_phase(RequestPhase.SEND, time.perf_counter() - start_time)
+            trace.add_bytes_sent(data_len)
 
     def send_file(self, file_path: Union[str, Path], timeout: Optional[float] = 5) -> None:
         """Send content of the file to the server.
@@ -567,6 +796,44 @@ class TcpClient:
         str
             Received message from the server.
 
+        Raises
+        ------
+        ConnectionNotEstablishedError
+            Raised when the connection has not been established before function call.
+        EmptyResponseError
+            Raised when the empty message is received.
+        ResponseFormatError
+            Raised when the format of the received message is not valid.
+        TimeoutError
+            Raised when the timeout period value has elapsed before the operation has completed.
+        ValueError
+            Raised if the timeout value is a number not greater than zero.
+        """
+        return force_text(self.receive_raw_msg(timeout))
+
+    def receive_raw_msg(
+        self, timeout: Optional[float] = 5, trace: RequestTrace = DISABLED_TRACE
+    ) -> bytearray:
+        """Receive message from the server without decoding it.
+
+        The message is received directly into a single buffer, which can be passed to
+        a JSON decoder without further copying.
+
+        Parameters
+        ----------
+        timeout : Optional[float], optional
+            Timeout in seconds to receive a message. The function will raise a timeout exception
+            if the timeout period value has elapsed before the operation has completed. If ``None``
+            is given, the blocking mode is used. Defaults to 5 s.
+        trace : RequestTrace, optional
+            Trace recording the time waiting for the message header as the server wait,
+            the time receiving the message body and its size. Defaults to ``DISABLED_TRACE``.
+
+        Returns
+        -------
+        bytearray
+            Received UTF-8 encoded message from the server.
+
         Raises
         ------
         ConnectionNotEstablishedError
@@ -589,17 +856,76 @@ class TcpClient:
             raise ValueError("Timeout value must be greater than zero or None.")
 
         start_time = time.time()
+        wait_start_time = time.perf_counter()
 
         msg_len = self._recv_response_length(timeout)
         if msg_len == 0:
             raise EmptyResponseError("The empty message has been received.")
 
+        receive_start_time = time.perf_counter()
         remain_timeout = _get_current_timeout(timeout, start_time)
         data = self._receive_bytes(msg_len, remain_timeout)
         if len(data) != msg_len:
             raise ResponseFormatError("Received data does not match declared data size.")
 
-        return force_text(data)
+        if trace.enabled:
+            trace.add_phase(RequestPhase.SERVER_WAIT, receive_start_time - wait_start_time)
+            trace.add_phase(RequestPhase.RECEIVE, time.perf_counter() - receive_start_time)
+            trace.add_bytes_received(msg_len)
+        return data
+
+    def receive_msg_chunks(
+        self, timeout: Optional[float] = 5, chunk_size: int = pow(2, 20)
+    ) -> Iterator[bytearray]:
+        """Receive message from the server incrementally.
+
+        The message is received only as far as the returned iterator is consumed, so that
+        large messages can be processed without holding them in memory as a whole.
+
+        Parameters
+        ----------
+        timeout : Optional[float], optional
+            Timeout in seconds to receive a single chunk of the message. The function will raise
+            a timeout exception if the timeout period value has elapsed before the operation has
+            completed. If ``None`` is given, the blocking mode is used. Defaults to 5 s.
+        chunk_size : int, optional
+            Maximum size of the chunks in bytes. Defaults to 1 MiB.
+
+        Yields
+        ------
+        bytearray
+            Consecutive chunks of the UTF-8 encoded message from the server.
+
+        Raises
+        ------
+        ConnectionNotEstablishedError
+            Raised when the connection has not been established before function call.
+        EmptyResponseError
+            Raised when the empty message is received.
+        TimeoutError
+            Raised when the timeout period value has elapsed before the operation has completed.
+        ValueError
+            Raised if the timeout value is a number not greater than zero.
+        ConnectionError
+            Raised when the connection is closed before receiving all expected data.
+        """
+        if not self.is_connected:
+            raise ConnectionNotEstablishedError(
+                "Cannot receive message. Connection is not established."
+            )
+
+        if isinstance(timeout, float) and timeout <= 0:
+            raise ValueError("Timeout value must be greater than zero or None.")
+
+        msg_len = self._recv_response_length(timeout)
+        if msg_len == 0:
+            raise EmptyResponseError("The empty message has been received.")
+
+        remain = msg_len
+        while remain > 0:
+            chunk = self._receive_bytes(min(chunk_size, remain), timeout)
+            remain -= len(chunk)
+            yield chunk
 
     def receive_file(self, file_path: Union[str, Path], timeout: Optional[float] = 5) -> None:
         """Receive file from the server.
@@ -644,7 +970,7 @@ class TcpClient:
         if os.path.getsize(file_path) != file_len:
             raise ResponseFormatError("Received data does not match declared data size.")
 
-    def _recv_exact_bytes(self, count: int, timeout: Optional[float]) -> bytes:
+    def _recv_exact_bytes(self, count: int, timeout: Optional[float]) -> bytearray:
         """Receive exactly the specified number of bytes.
 
         Parameters
@@ -656,7 +982,7 @@ class TcpClient:
 
         Returns
         -------
-        bytes
+        bytearray
             Exactly `count` bytes received from the socket.
 
         Raises
@@ -670,26 +996,26 @@ class TcpClient:
             raise ConnectionNotEstablishedError("Socket not set.")
 
         start_time = time.time()
-        received = b""
+        # Receive directly into a single preallocated buffer to avoid repeated copying
+        # of the already received data.
+        received = bytearray(min(count, self._MAX_PREALLOCATED_SIZE))
         received_len = 0
 
         while received_len < count:
-            remain = count - received_len
-            if remain > self._BUFFER_SIZE:
-                buff = self._BUFFER_SIZE
-            else:
-                buff = remain
-
-            if self.__socket is not None:
-                self.__socket.settimeout(_get_current_timeout(timeout, start_time))
-                chunk = self.__socket.recv(buff)
-            elif self.__local_socket is not None:
-                self.__local_socket.settimeout(_get_current_timeout(timeout, start_time))
-                chunk = self.__local_socket.recv(buff)
-            else:
-                chunk = b""
+            if received_len == len(received):
+                # Double the buffer only once it is filled, up to the declared size.
+                received.extend(bytes(min(len(received), count - received_len)))
+            with memoryview(received) as view:
+                if self.__socket is not None:
+                    self.__socket.settimeout(_get_current_timeout(timeout, start_time))
+                    chunk_len = self.__socket.recv_into(view[received_len:])
+                elif self.__local_socket is not None:
+                    self.__local_socket.settimeout(_get_current_timeout(timeout, start_time))
+                    chunk_len = self.__local_socket.recv_into(view[received_len:])
+                else:
+                    chunk_len = 0
 
-            if not chunk:
+            if not chunk_len:
                 # Connection closed or error occurred
                 if received_len == 0:
                     raise ConnectionError("Connection closed before any data was received")
@@ -697,8 +1023,7 @@ class TcpClient:
                     raise ConnectionError(
                         f"Connection closed after receiving {received_len} of {count} bytes"
                     )
-            received += chunk
-            received_len += len(chunk)
+            received_len += chunk_len
         return received
 
     def _recv_response_length(self, timeout: Optional[float]) -> int:
@@ -750,7 +1075,7 @@ class TcpClient:
 
         return response_len_1
 
-    def _receive_bytes(self, count: int, timeout: Optional[float]) -> bytes:
+    def _receive_bytes(self, count: int, timeout: Optional[float]) -> bytearray:
         """Receive specified number of bytes from the server.
 
         Parameters
@@ -764,7 +1089,7 @@ class TcpClient:
 
         Returns
         -------
-        bytes
+        bytearray
             Received bytes.
 
         Raises
@@ -836,119 +1161,649 @@ class TcpClient:
                 data_len += len(chunk)
 
 
-class TcpOslListener:
-    """Listener of optiSLang server.
+class ConnectionPoolStatistics(NamedTuple):
+    """Snapshot of the ``TcpConnectionPool`` usage statistics.
 
-    Parameters
+    Attributes
     ----------
-        port_range: Optional[Tuple[int, int]], optional
-            Range of ports for listener.
-            Defaults to ``(49152, 65535)``.
-        timeout: float
-            Timeout in seconds to receive a message. Timeout exception will be raised
-            if the timeout period value has elapsed before the operation has completed. If ``None``
-            is given, the blocking mode is used.
-        name: str
-            Name of listener.
-        communication_channel: CommunicationChannel, optional
-            Communication channel. Defaults to ``CommunicationChannel.LOCAL_DOMAIN``.
+    max_connections : Optional[int]
+        Maximum number of connections open at the same time, ``None`` if unbounded.
+    open_connections : int
+        Number of currently open connections, both idle and in use.
+    idle_connections : int
+        Number of currently idle connections.
+    in_use_connections : int
+        Number of connections currently used by requests.
+    peak_in_use_connections : int
+        Maximum number of connections used by requests at the same time.
+    created_connections : int
+        Total number of established connections.
+    reused_connections : int
+        Total number of acquisitions served by an idle connection.
+    evicted_connections : int
+        Total number of idle connections closed after exceeding the idle timeout.
+    failed_health_checks : int
+        Total number of idle connections found dropped by the server.
+    acquisitions : int
+        Total number of successful acquisitions.
+    waits : int
+        Number of acquisitions which had to wait for a free connection.
+    wait_timeouts : int
+        Number of acquisitions which timed out waiting for a free connection.
+    total_wait_time : float
+        Total time in seconds spent waiting for a free connection.
+    max_wait_time : float
+        Longest time in seconds spent waiting for a free connection.
+    """
 
-            ..warning:: If set to ``CommunicationChannel.TCP``, insecure communication mode without
-            TLS is used. This mode allows remote communication but is not recommended.
-            For more details on the implications and usage of insecure mode,
-            refer to the optiSLang documentation.
+    max_connections: Optional[int]
+    open_connections: int
+    idle_connections: int
+    in_use_connections: int
+    peak_in_use_connections: int
+    created_connections: int
+    reused_connections: int
+    evicted_connections: int
+    failed_health_checks: int
+    acquisitions: int
+    waits: int
+    wait_timeouts: int
+    total_wait_time: float
+    max_wait_time: float
 
-        host: Optional[str], optional
-            Local IPv6 address, by default ``None``.
-        uid: Optional[str], optional
-            Unique ID of listener, should be used only if listener is used for optiSLangs port
-            when started locally, by default ``None``.
-        logger: Optional[Any], optional
-            Preferably OslLogger should be given. If not given, default logging.Logger is used.
-        notifications: Optional[List[ServerNotification]], optional
-            Notifications to subscribe to.
-            Either ["ALL"] or Sequence picked from below options:
-            Server: [ "SERVER_UP", "SERVER_DOWN" ] (always be sent by default).
-            Logging: [ "LOG_INFO", "LOG_WARNING", "LOG_ERROR", "LOG_DEBUG" ].
-            Project: [ "EXECUTION_STARTED", "PROCESSING_STARTED", "EXECUTION_FINISHED",
-                "NOTHING_PROCESSED", "CHECK_FAILED", "EXEC_FAILED" ].
-            Nodes: [ "ACTOR_STATE_CHANGED", "ACTOR_ACTIVE_CHANGED", "ACTOR_NAME_CHANGED",
-                "ACTOR_CONTENTS_CHANGED", "ACTOR_DATA_CHANGED" ].
-            Defaults to ``None``.
-        register_timeout : Optional[int], optional
-            Register timeout for TCP listeners in milliseconds. Defaults to ``None`` which
-            results in optiSLang using the default timeout value of 60000 milliseconds.
+    @property
+    def mean_wait_time(self) -> float:
+        """Mean time in seconds spent waiting for a free connection per acquisition."""
+        return self.total_wait_time / self.acquisitions if self.acquisitions else 0.0
 
-    Raises
-    ------
-    ValueError
-        Raised when port_range != 2 or first number is higher.
-    TypeError
-        Raised when port_range not type Tuple[int, int]
-    TimeoutError
-        Raised when the timeout float value expires.
+    @property
+    def utilization(self) -> Optional[float]:
+        """Ratio of connections in use to the maximum number of connections."""
+        if not self.max_connections:
+            return None
+        return self.in_use_connections / self.max_connections
 
-    Examples
-    --------
-    Create listener
 
-    >>> from ansys.optislang.core.tcp.osl_server import TcpOslListener
-    >>> general_listener = TcpOslListener(
-    >>>     port_range = (49152, 65535),
-    >>>     timeout = 30,
-    >>>     name = 'GeneralListener',
-    >>>     host = '127.0.0.1',
-    >>>     uid = str(uuid.uuid4()),
-    >>>     logger = logging.getLogger(__name__),
-    >>> )
-    """
+class TcpConnectionPool:
+    """Thread-safe, bounded pool of persistent connections to the optiSLang server.
 
-    _PRIVATE_PORTS_RANGE = (49152, 65535)
+    Connections are established on demand by the ``connect`` callable and kept open after
+    a request has been answered, so that subsequent requests can reuse them instead of paying
+    for a new handshake. When all connections are in use, further requests wait until one of
+    them is returned to the pool.
+
+    Parameters
+    ----------
+    connect : Callable[[Optional[float]], TcpClient]
+        Callable which creates a new client connected to the optiSLang server. It takes
+        the timeout in seconds to establish the connection as the only argument.
+    max_connections : Optional[int], optional
+        Maximum number of connections open at the same time. If ``None``, the number
+        of connections is not bounded. Defaults to ``1``.
+    idle_timeout : Optional[float], optional
+        Time in seconds after which an idle connection is closed. If ``None``, idle connections
+        are kept open until the pool is cleared. Defaults to ``None``.
+    health_check : bool, optional
+        Determines whether idle connections are checked for being dropped by the server
+        before they are reused. Defaults to ``True``.
+    logger : Any, optional
+        Object for logging. If ``None``, standard logging object is used. Defaults to ``None``.
+    """
 
     def __init__(
         self,
-        timeout: float,
-        name: str,
-        communication_channel: CommunicationChannel = CommunicationChannel.LOCAL_DOMAIN,
-        port_range: Optional[Tuple[int, int]] = None,
-        host: Optional[str] = None,
-        uid: Optional[str] = None,
+        connect: Callable[[Optional[float]], TcpClient],
+        max_connections: Optional[int] = 1,
+        idle_timeout: Optional[float] = None,
+        health_check: bool = True,
         logger: Optional[Any] = None,
-        notifications: Optional[List[ServerNotification]] = None,
-        register_timeout: Optional[int] = None,
-    ):
-        """Initialize a new instance of the ``TcpOslListener`` class."""
-        self.__uid = uid
-        self.__name = name
-        self.__timeout = timeout
-        self.__communication_channel = communication_channel
-        self.__listener_socket: Optional[socket.socket] = None
-        self.__local_server_socket: Optional[LocalServerSocket] = None
-        self.__thread: Optional[threading.Thread] = None
-        self.__callbacks: List[Tuple[Callable, Any]] = []
-        self.__run_listening_thread = False
-        self.__refresh_listener_registration = False
-        self.__notifications = notifications
-        self.__register_timeout = register_timeout
-        self._local_server_id: Optional[str] = None
+    ) -> None:
+        """Initialize a new instance of the ``TcpConnectionPool`` class."""
+        if max_connections is not None and (
+            not isinstance(max_connections, int)
+            or isinstance(max_connections, bool)
+            or max_connections < 1
+        ):
+            raise ValueError("Maximum number of connections must be a positive integer or None.")
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError("Idle timeout must be greater than zero or None.")
+        self.__connect = connect
+        self.__max_connections = max_connections
+        self.__idle_timeout = idle_timeout
+        self.__health_check = health_check
+        # Idle clients together with the time they were returned to the pool.
+        self.__idle_clients: List[Tuple[TcpClient, float]] = []
+        self.__condition = threading.Condition()
+        self.__open_connections = 0
+        self.__in_use_connections = 0
+        self.__peak_in_use_connections = 0
+        self.__created_connections = 0
+        self.__reused_connections = 0
+        self.__evicted_connections = 0
+        self.__failed_health_checks = 0
+        self.__acquisitions = 0
+        self.__waits = 0
+        self.__wait_timeouts = 0
+        self.__total_wait_time = 0.0
+        self.__max_wait_time = 0.0
 
         if logger is None:
             self._logger = logging.getLogger(__name__)
         else:
             self._logger = logger
 
-        if self.__communication_channel == CommunicationChannel.LOCAL_DOMAIN:
-            self.__init_local_listener_socket()
-        elif self.__communication_channel == CommunicationChannel.TCP:
-            actually_used_port_range: Tuple[int, int] = (
-                port_range if port_range is not None else self._PRIVATE_PORTS_RANGE
+    @property
+    def idle_connections(self) -> int:
+        """Number of idle connections currently kept open."""
+        with self.__condition:
+            return len(self.__idle_clients)
+
+    @property
+    def idle_timeout(self) -> Optional[float]:
+        """Time in seconds after which an idle connection is closed."""
+        return self.__idle_timeout
+
+    @property
+    def max_connections(self) -> Optional[int]:
+        """Maximum number of connections open at the same time."""
+        return self.__max_connections
+
+    @property
+    def statistics(self) -> ConnectionPoolStatistics:
+        """Snapshot of the pool usage statistics."""
+        with self.__condition:
+            return ConnectionPoolStatistics(
+                max_connections=self.__max_connections,
+                open_connections=self.__open_connections,
+                idle_connections=len(self.__idle_clients),
+                in_use_connections=self.__in_use_connections,
+                peak_in_use_connections=self.__peak_in_use_connections,
+                created_connections=self.__created_connections,
+                reused_connections=self.__reused_connections,
+                evicted_connections=self.__evicted_connections,
+                failed_health_checks=self.__failed_health_checks,
+                acquisitions=self.__acquisitions,
+                waits=self.__waits,
+                wait_timeouts=self.__wait_timeouts,
+                total_wait_time=self.__total_wait_time,
+                max_wait_time=self.__max_wait_time,
             )
-            if len(actually_used_port_range) != 2:
-                raise ValueError(
-                    f"Port ranges length must be 2 but: len = {len(actually_used_port_range)}"
-                )
-            if isinstance(actually_used_port_range, (int, int)):
-                raise TypeError(
+
+    def acquire(self, timeout: Optional[float] = None) -> Tuple[TcpClient, bool]:
+        """Get a connected client, reusing an idle connection if possible.
+
+        Parameters
+        ----------
+        timeout : Optional[float], optional
+            Timeout in seconds to wait for a free connection and to establish a new connection.
+            If ``None`` is given, the blocking mode is used. Defaults to ``None``.
+
+        Returns
+        -------
+        Tuple[TcpClient, bool]
+            Connected client and information whether the connection was reused.
+
+        Raises
+        ------
+        TimeoutError
+            Raised when no connection becomes free before the timeout expires.
+        ConnectionRefusedError
+            Raised when the new connection cannot be established.
+        """
+        start_time = time.time()
+        waited = False
+        stale_clients: List[TcpClient] = []
+        try:
+            with self.__condition:
+                while True:
+                    stale_clients.extend(self.__pop_expired_clients())
+                    while self.__idle_clients:
+                        client, _ = self.__idle_clients.pop()
+                        if self.__health_check and client.is_connection_dropped():
+                            self.__failed_health_checks += 1
+                            self.__open_connections -= 1
+                            stale_clients.append(client)
+                            continue
+                        self.__reused_connections += 1
+                        self.__register_acquisition(start_time, waited)
+                        return client, True
+                    if (
+                        self.__max_connections is None
+                        or self.__open_connections < self.__max_connections
+                    ):
+                        # Reserve the slot, the connection is established outside of the lock.
+                        self.__open_connections += 1
+                        self.__register_acquisition(start_time, waited)
+                        break
+                    try:
+                        remaining_timeout = _get_current_timeout(timeout, start_time)
+                        if remaining_timeout == 0:
+                            raise TimeoutError("No free connection is available.")
+                    except TimeoutError:
+                        self.__wait_timeouts += 1
+                        raise
+                    waited = True
+                    self.__condition.wait(remaining_timeout)
+        finally:
+            for stale_client in stale_clients:
+                stale_client.disconnect()
+
+        try:
+            client = self.__connect(_get_current_timeout(timeout, start_time))
+        except BaseException:
+            self.__release_slot()
+            raise
+        with self.__condition:
+            self.__created_connections += 1
+        return client, False
+
+    def release(self, client: TcpClient) -> None:
+        """Return a client, whose request was completed, back to the pool.
+
+        Parameters
+        ----------
+        client : TcpClient
+            Client to be returned to the pool.
+        """
+        with self.__condition:
+            if client.is_connected:
+                self.__in_use_connections -= 1
+                self.__idle_clients.append((client, time.time()))
+                self.__condition.notify()
+                return
+        self.__release_slot()
+
+    def discard(self, client: TcpClient) -> None:
+        """Close a client which must not be reused and free its slot in the pool.
+
+        Parameters
+        ----------
+        client : TcpClient
+            Client to be closed.
+        """
+        client.disconnect()
+        self.__release_slot()
+
+    def reconnect(self, client: TcpClient, timeout: Optional[float] = None) -> TcpClient:
+        """Replace a client, whose connection was dropped, by a newly connected one.
+
+        The slot of the original client in the pool is kept for the new one.
+
+        Parameters
+        ----------
+        client : TcpClient
+            Client to be replaced.
+        timeout : Optional[float], optional
+            Timeout in seconds to establish the new connection. Defaults to ``None``.
+
+        Returns
+        -------
+        TcpClient
+            Newly connected client.
+
+        Raises
+        ------
+        ConnectionRefusedError
+            Raised when the new connection cannot be established.
+        """
+        client.disconnect()
+        try:
+            new_client = self.__connect(timeout)
+        except BaseException:
+            self.__release_slot()
+            raise
+        with self.__condition:
+            self.__created_connections += 1
+        return new_client
+
+    def evict_idle_connections(self) -> int:
+        """Close idle connections which exceeded the idle timeout.
+
+        Returns
+        -------
+        int
+            Number of closed connections.
+        """
+        with self.__condition:
+            expired_clients = self.__pop_expired_clients()
+        for client in expired_clients:
+            client.disconnect()
+        return len(expired_clients)
+
+    def clear(self) -> None:
+        """Close all idle connections."""
+        with self.__condition:
+            idle_clients = [client for client, _ in self.__idle_clients]
+            self.__idle_clients = []
+            self.__open_connections -= len(idle_clients)
+            self.__condition.notify_all()
+        for client in idle_clients:
+            client.disconnect()
+        self._logger.debug("All idle persistent connections have been closed.")
+
+    def __pop_expired_clients(self) -> List[TcpClient]:
+        """Remove idle clients exceeding the idle timeout, must be called with lock held."""
+        if self.__idle_timeout is None or not self.__idle_clients:
+            return []
+        deadline = time.time() - self.__idle_timeout
+        expired = [client for client, released in self.__idle_clients if released < deadline]
+        if expired:
+            self.__idle_clients = [
+                (client, released)
+                for client, released in self.__idle_clients
+                if released >= deadline
+            ]
+            self.__open_connections -= len(expired)
+            self.__evicted_connections += len(expired)
+            self.__condition.notify(len(expired))
+        return expired
+
+    def __register_acquisition(self, start_time: float, waited: bool) -> None:
+        """Update usage statistics of an acquisition, must be called with lock held."""
+        self.__in_use_connections += 1
+        self.__peak_in_use_connections = max(
+            self.__peak_in_use_connections, self.__in_use_connections
+        )
+        self.__acquisitions += 1
+        if waited:
+            wait_time = time.time() - start_time
+            self.__waits += 1
+            self.__total_wait_time += wait_time
+            self.__max_wait_time = max(self.__max_wait_time, wait_time)
+
+    def __release_slot(self) -> None:
+        """Free the slot of an in use connection which is closed."""
+        with self.__condition:
+            self.__in_use_connections -= 1
+            self.__open_connections -= 1
+            self.__condition.notify()
+
+
+class ProjectTreeCache:
+    """Thread-safe cache of the project tree with properties.
+
+    The cached tree is replaced by a freshly fetched one once it has been invalidated or once
+    it is older than the time to live. Invalidation is expected to be triggered by push
+    notifications about changes of the project content and by commands sent to the server.
+
+    Parameters
+    ----------
+    ttl : Optional[float], optional
+        Time to live of the cached tree in seconds. If ``None``, the cached tree expires only
+        when it is invalidated. Defaults to ``30``.
+    """
+
+    def __init__(self, ttl: Optional[float] = 30) -> None:
+        """Initialize a new instance of the ``ProjectTreeCache`` class."""
+        if ttl is not None and ttl <= 0:
+            raise ValueError("Time to live must be greater than zero or None.")
+        self.__ttl = ttl
+        self.__lock = threading.Lock()
+        self.__tree: Optional[Dict] = None
+        self.__fetched = 0.0
+        self.__generation = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        """Number of invalidations and refetches, changes whenever the cached tree is replaced."""
+        with self.__lock:
+            return self.__generation
+
+    @property
+    def hits(self) -> int:
+        """Number of requests served by the cached tree."""
+        with self.__lock:
+            return self.__hits
+
+    @property
+    def invalidations(self) -> int:
+        """Number of invalidations of a valid cached tree."""
+        with self.__lock:
+            return self.__invalidations
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the cached tree can be used without fetching it again."""
+        with self.__lock:
+            return self.__is_valid()
+
+    @property
+    def misses(self) -> int:
+        """Number of requests which had to fetch the tree."""
+        with self.__lock:
+            return self.__misses
+
+    @property
+    def ttl(self) -> Optional[float]:
+        """Time to live of the cached tree in seconds."""
+        return self.__ttl
+
+    def get(self, fetch: Callable[[], Dict]) -> Dict:
+        """Get the cached tree, fetching it if the cached tree is not valid.
+
+        The returned tree is shared by all callers and must not be modified.
+
+        Parameters
+        ----------
+        fetch : Callable[[], Dict]
+            Callable which fetches the project tree with properties from the server.
+
+        Returns
+        -------
+        Dict
+            Dictionary of project tree with properties.
+        """
+        with self.__lock:
+            if self.__is_valid():
+                self.__hits += 1
+                return self.__tree  # type: ignore[return-value]
+            self.__misses += 1
+            generation = self.__generation
+        fetched = time.time()
+        tree = fetch()
+        with self.__lock:
+            # Tree fetched while being invalidated may be outdated already, don't store it.
+            if generation == self.__generation:
+                self.__tree = tree
+                self.__fetched = fetched
+                self.__generation += 1
+        return tree
+
+    def invalidate(self) -> None:
+        """Invalidate the cached tree, so that the next request fetches it again."""
+        with self.__lock:
+            if self.__tree is not None:
+                self.__invalidations += 1
+            self.__tree = None
+            self.__generation += 1
+
+    def __is_valid(self) -> bool:
+        """Check whether the cached tree is valid, must be called with lock held."""
+        if self.__tree is None:
+            return False
+        return self.__ttl is None or time.time() - self.__fetched < self.__ttl
+
+
+class NotificationWaiter:
+    """Blocks threads until push notifications of the optiSLang server are received.
+
+    Received notifications are counted. Callers read :py:attr:`count` before checking the
+    state of the server and pass it to :py:meth:`wait`, so that notifications received in
+    between are not missed.
+
+    Parameters
+    ----------
+    notifications : Iterable[ServerNotification]
+        Notifications the waiter is woken up by.
+    """
+
+    def __init__(self, notifications: Iterable[ServerNotification]) -> None:
+        """Initialize a new instance of the ``NotificationWaiter`` class."""
+        self.__notifications = tuple(notifications)
+        self.__condition = threading.Condition()
+        self.__count = 0
+
+    @property
+    def count(self) -> int:
+        """Number of notifications received so far."""
+        with self.__condition:
+            return self.__count
+
+    @property
+    def notifications(self) -> Tuple[ServerNotification, ...]:
+        """Notifications the waiter is woken up by."""
+        return self.__notifications
+
+    def notify(self) -> None:
+        """Count a received notification and wake up all waiting threads."""
+        with self.__condition:
+            self.__count += 1
+            self.__condition.notify_all()
+
+    def wait(self, count: int, timeout: Optional[float] = None) -> bool:
+        """Wait until more than the given number of notifications was received.
+
+        Parameters
+        ----------
+        count : int
+            Number of notifications already processed by the caller, see :py:attr:`count`.
+        timeout : Optional[float], optional
+            Maximum time to wait in seconds. If ``None``, wait without time limit.
+            Defaults to ``None``.
+
+        Returns
+        -------
+        bool
+            ``True`` if a new notification was received, ``False`` if the wait timed out.
+        """
+        with self.__condition:
+            return self.__condition.wait_for(lambda: self.__count > count, timeout)
+
+
+class TcpOslListener:
+    """Listener of optiSLang server.
+
+    Parameters
+    ----------
+        port_range: Optional[Tuple[int, int]], optional
+            Range of ports for listener.
+            Defaults to ``(49152, 65535)``.
+        timeout: float
+            Timeout in seconds to receive a message. Timeout exception will be raised
+            if the timeout period value has elapsed before the operation has completed. If ``None``
+            is given, the blocking mode is used.
+        name: str
+            Name of listener.
+        communication_channel: CommunicationChannel, optional
+            Communication channel. Defaults to ``CommunicationChannel.LOCAL_DOMAIN``.
+
+            ..warning:: If set to ``CommunicationChannel.TCP``, insecure communication mode without
+            TLS is used. This mode allows remote communication but is not recommended.
+            For more details on the implications and usage of insecure mode,
+            refer to the optiSLang documentation.
+
+        host: Optional[str], optional
+            Local IPv6 address, by default ``None``.
+        uid: Optional[str], optional
+            Unique ID of listener, should be used only if listener is used for optiSLangs port
+            when started locally, by default ``None``.
+        logger: Optional[Any], optional
+            Preferably OslLogger should be given. If not given, default logging.Logger is used.
+        notifications: Optional[List[ServerNotification]], optional
+            Notifications to subscribe to.
+            Either ["ALL"] or Sequence picked from below options:
+            Server: [ "SERVER_UP", "SERVER_DOWN" ] (always be sent by default).
+            Logging: [ "LOG_INFO", "LOG_WARNING", "LOG_ERROR", "LOG_DEBUG" ].
+            Project: [ "EXECUTION_STARTED", "PROCESSING_STARTED", "EXECUTION_FINISHED",
+                "NOTHING_PROCESSED", "CHECK_FAILED", "EXEC_FAILED" ].
+            Nodes: [ "ACTOR_STATE_CHANGED", "ACTOR_ACTIVE_CHANGED", "ACTOR_NAME_CHANGED",
+                "ACTOR_CONTENTS_CHANGED", "ACTOR_DATA_CHANGED" ].
+            Defaults to ``None``.
+        register_timeout : Optional[int], optional
+            Register timeout for TCP listeners in milliseconds. Defaults to ``None`` which
+            results in optiSLang using the default timeout value of 60000 milliseconds.
+        json_codec : Union[str, JsonCodec, None], optional
+            Codec used to decode received notifications, see
+            :py:func:`get_json_codec <ansys.optislang.core.json_codec.get_json_codec>`.
+            Defaults to ``None`` which results in using the default codec.
+
+    Raises
+    ------
+    ValueError
+        Raised when port_range != 2 or first number is higher.
+    TypeError
+        Raised when port_range not type Tuple[int, int]
+    TimeoutError
+        Raised when the timeout float value expires.
+
+    Examples
+    --------
+    Create listener
+
+    >>> from ansys.optislang.core.tcp.osl_server import TcpOslListener
+    >>> general_listener = TcpOslListener(
+    >>>     port_range = (49152, 65535),
+    >>>     timeout = 30,
+    >>>     name = 'GeneralListener',
+    >>>     host = '127.0.0.1',
+    >>>     uid = str(uuid.uuid4()),
+    >>>     logger = logging.getLogger(__name__),
+    >>> )
+    """
+
+    _PRIVATE_PORTS_RANGE = (49152, 65535)
+
+    def __init__(
+        self,
+        timeout: float,
+        name: str,
+        communication_channel: CommunicationChannel = CommunicationChannel.LOCAL_DOMAIN,
+        port_range: Optional[Tuple[int, int]] = None,
+        host: Optional[str] = None,
+        uid: Optional[str] = None,
+        logger: Optional[Any] = None,
+        notifications: Optional[List[ServerNotification]] = None,
+        register_timeout: Optional[int] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+    ):
+        """Initialize a new instance of the ``TcpOslListener`` class."""
+        self.__json_codec = get_json_codec(json_codec)
+        self.__uid = uid
+        self.__name = name
+        self.__timeout = timeout
+        self.__communication_channel = communication_channel
+        self.__listener_socket: Optional[socket.socket] = None
+        self.__local_server_socket: Optional[LocalServerSocket] = None
+        self.__thread: Optional[threading.Thread] = None
+        self.__callbacks: List[Tuple[Callable, Any]] = []
+        self.__run_listening_thread = False
+        self.__refresh_listener_registration = False
+        self.__notifications = notifications
+        self.__register_timeout = register_timeout
+        self.__recorder: Optional[SessionRecorder] = None
+        self.__dispatcher: Optional[NotificationDispatcher] = None
+        self._local_server_id: Optional[str] = None
+
+        if logger is None:
+            self._logger = logging.getLogger(__name__)
+        else:
+            self._logger = logger
+
+        if self.__communication_channel == CommunicationChannel.LOCAL_DOMAIN:
+            self.__init_local_listener_socket()
+        elif self.__communication_channel == CommunicationChannel.TCP:
+            actually_used_port_range: Tuple[int, int] = (
+                port_range if port_range is not None else self._PRIVATE_PORTS_RANGE
+            )
+            if len(actually_used_port_range) != 2:
+                raise ValueError(
+                    f"Port ranges length must be 2 but: len = {len(actually_used_port_range)}"
+                )
+            if isinstance(actually_used_port_range, (int, int)):
+                raise TypeError(
                     "Port range not type Tuple[int, int] but:"
                     f"[{type(actually_used_port_range[0])}, {actually_used_port_range[1]}]."
                 )
@@ -1046,6 +1901,24 @@ class TcpOslListener:
     def notifications(self, notifications: Optional[List[ServerNotification]]) -> None:
         self.__notifications = notifications
 
+    @property
+    def recorder(self) -> Optional[SessionRecorder]:
+        """Recorder of received notifications, ``None`` if notifications are not recorded."""
+        return self.__recorder
+
+    @recorder.setter
+    def recorder(self, recorder: Optional[SessionRecorder]) -> None:
+        self.__recorder = recorder
+
+    @property
+    def dispatcher(self) -> Optional[NotificationDispatcher]:
+        """Dispatcher executing the callbacks, ``None`` if executed by the listening thread."""
+        return self.__dispatcher
+
+    @dispatcher.setter
+    def dispatcher(self, dispatcher: Optional[NotificationDispatcher]) -> None:
+        self.__dispatcher = dispatcher
+
     def add_callback(self, callback: Callable, args) -> None:
         """Add callback (method) that will be called after push notification is received.
 
@@ -1161,15 +2034,18 @@ class TcpOslListener:
                 if client is not None:
                     message = client.receive_msg(timeout)
                     self._logger.debug("Received message from client: %s", message)
+                    recorder = self.__recorder
+                    if recorder is not None:
+                        recorder.record_notification(message)
 
-                    response = json.loads(message)
+                    response = self.__json_codec.loads(message)
                     client.send_msg("")
-                    self.__execute_callbacks(response)
+                    self.__dispatch_callbacks(response)
 
             except (TimeoutError, socket.timeout):
                 self._logger.warning(f"Listener {self.uid} listening timed out.")
                 response = {"type": "TimeoutError"}
-                self.__execute_callbacks(response)
+                self.__dispatch_callbacks(response)
                 break
             except Exception as ex:
                 self._logger.warning(ex)
@@ -1177,6 +2053,14 @@ class TcpOslListener:
                 if client is not None:
                     client.disconnect()
 
+    def __dispatch_callbacks(self, response) -> None:
+        """Execute all callbacks, by the dispatcher if set."""
+        dispatcher = self.__dispatcher
+        if dispatcher is None:
+            self.__execute_callbacks(response)
+        else:
+            dispatcher.dispatch(self, response, self.__execute_callbacks)
+
     def __execute_callbacks(self, response) -> None:
         """Execute all callback."""
         for callback, args in self.__callbacks:
@@ -1216,7 +2100,7 @@ class TcpOslListener:
 
                 if client is not None:
                     message = client.receive_msg(timeout)
-                    data_dict = json.loads(message)
+                    data_dict = self.__json_codec.loads(message)
                     self._logger.debug(f"CLEANUP: {data_dict}")
                     client.send_msg("")
             except socket.timeout:
@@ -1385,6 +2269,21 @@ class TcpOslServer(OslServer):
     additional_args : Optional[Iterable[str]], optional
         Additional command line arguments used for execution of the optiSLang server process.
         Defaults to ``None``.
+    persistent_connections : bool, optional
+        Determines whether connections to the optiSLang server are kept open and reused by
+        subsequent commands and queries instead of connecting for each of them. Connections
+        dropped by the server are re-established transparently. Defaults to ``False``.
+    max_persistent_connections : Optional[int], optional
+        Maximum number of persistent connections open at the same time. Concurrent commands
+        and queries wait for a free connection once the limit is reached. If ``None``,
+        the number of connections is not bounded. Defaults to ``4``.
+    persistent_connections_idle_timeout : Optional[float], optional
+        Time in seconds after which an idle persistent connection is closed. If ``None``,
+        idle connections are kept open until the instance is disposed. Defaults to ``60``.
+    json_codec : Union[str, JsonCodec, None], optional
+        Codec used to decode server responses and notifications, either codec instance or
+        codec name, see :py:func:`get_json_codec <ansys.optislang.core.json_codec.get_json_codec>`.
+        Defaults to ``None`` which results in using the default codec.
 
     Raises
     ------
@@ -1432,6 +2331,8 @@ class TcpOslServer(OslServer):
         "GENTLE_STOP_REQUESTED": 10,
     }
     _DEFAULT_PROJECT_FILE = "project.opf"
+    # Maximum size in bytes of pipelined requests waiting for their responses.
+    _PIPELINE_WINDOW_SIZE = pow(2, 15)
 
     def __init__(
         self,
@@ -1469,8 +2370,20 @@ class TcpOslServer(OslServer):
         dump_project_state: Optional[Union[str, Path]] = None,
         opx_project_definition_file: Optional[Union[str, Path]] = None,
         additional_args: Optional[Iterable[str]] = None,
+        persistent_connections: bool = False,
+        max_persistent_connections: Optional[int] = 4,
+        persistent_connections_idle_timeout: Optional[float] = 60,
+        json_codec: Union[str, JsonCodec, None] = None,
     ) -> None:
         """Initialize a new instance of the ``TcpOslServer`` class."""
+        self.__json_codec = get_json_codec(json_codec)
+        self.__metrics: Optional[TcpCommandMetrics] = None
+        self.__recorder: Optional[SessionRecorder] = None
+        self.__owns_recorder = False
+        self.__notification_dispatcher: Optional[NotificationDispatcher] = None
+        self.__owns_notification_dispatcher = False
+        self.__project_tree_cache: Optional[ProjectTreeCache] = None
+        self.__project_tree_index: Optional[Tuple[Dict, ProjectTreeIndex]] = None
         self.__host = host
         self.__port = port
         self.__max_request_attempts_register = self.__get_default_max_request_attempts_register()
@@ -1512,6 +2425,18 @@ class TcpOslServer(OslServer):
         self.__additional_args = additional_args
         self.__log_process_stdout = log_process_stdout
         self.__log_process_stderr = log_process_stderr
+        self.__connection_pool: Optional[TcpConnectionPool] = (
+            TcpConnectionPool(
+                connect=self.__connect_client,
+                max_connections=max_persistent_connections,
+                idle_timeout=persistent_connections_idle_timeout,
+                logger=self._logger,
+            )
+            if persistent_connections
+            else None
+        )
+        # Cleared once the server is found to close connections after each response.
+        self.__pipelining_supported = True
 
         executed_in_main_thread = True
 
@@ -1619,6 +2544,16 @@ class TcpOslServer(OslServer):
         """
         return self.__host
 
+    @property
+    def connection_pool(self) -> Optional[TcpConnectionPool]:
+        """Pool of persistent connections, ``None`` if persistent connections are not used."""
+        return self.__connection_pool
+
+    @property
+    def json_codec(self) -> JsonCodec:
+        """Codec used to decode server responses and notifications."""
+        return self.__json_codec
+
     @property
     def max_request_attempts_register(self) -> FunctionsAttributeRegister:
         """Register with maximum number of attempts to be executed for individual functions.
@@ -1627,6 +2562,21 @@ class TcpOslServer(OslServer):
         """
         return self.__max_request_attempts_register
 
+    @property
+    def metrics(self) -> Optional[TcpCommandMetrics]:
+        """Metrics of sent requests, ``None`` if metrics are not enabled."""
+        return self.__metrics
+
+    @property
+    def notification_dispatcher(self) -> Optional[NotificationDispatcher]:
+        """Dispatcher executing callbacks of listeners, ``None`` if not enabled."""
+        return self.__notification_dispatcher
+
+    @property
+    def recorder(self) -> Optional[SessionRecorder]:
+        """Recorder of the session, ``None`` if the session is not recorded."""
+        return self.__recorder
+
     @property
     def osl_version(self) -> OslVersion:
         """Version of used optiSLang.
@@ -1662,6 +2612,11 @@ class TcpOslServer(OslServer):
         """
         return self.__port
 
+    @property
+    def project_tree_cache(self) -> Optional[ProjectTreeCache]:
+        """Cache of the project tree with properties, ``None`` if the cache is disabled."""
+        return self.__project_tree_cache
+
     @property
     def timeout(self) -> Optional[float]:
         """Get default timeout value for execution of commands.
@@ -1957,19 +2912,58 @@ class TcpOslServer(OslServer):
             max_request_attempts=self.max_request_attempts_register.get_value(current_func_name),
         )
 
-    def disconnect_slot(self, uid: str, slot_name: str, direction: str) -> None:
-        """Remove all connections for a given slot.
+    def create_notification_waiter(
+        self, notifications: Iterable[ServerNotification]
+    ) -> NotificationWaiter:
+        """Create a waiter woken up by the given push notifications.
+
+        The waiter is backed by a listener registered to the optiSLang server until
+        the waiter is deleted by :py:meth:`delete_notification_waiter` or the server is
+        disposed.
 
         Parameters
         ----------
-        uid : str
-            Node uid.
-        slot_name : str
-            Slot name.
-        direction : str
-            String specifying direction, either 'sdInputs' <or> 'sdOuputs'.
+        notifications : Iterable[ServerNotification]
+            Notifications the waiter is woken up by.
 
-        Raises
+        Returns
+        -------
+        NotificationWaiter
+            Waiter counting the received notifications.
+
+        Raises
+        ------
+        RuntimeError
+            Raised when the listener cannot be started.
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        notification_waiter = NotificationWaiter(notifications)
+        listener = self.__create_notification_waiter_listener(notification_waiter)
+        listener.add_callback(
+            self.__class__.__notify_waiter,
+            (notification_waiter, self._logger),
+        )
+        listener.start_listening()
+        return notification_waiter
+
+    def disconnect_slot(self, uid: str, slot_name: str, direction: str) -> None:
+        """Remove all connections for a given slot.
+
+        Parameters
+        ----------
+        uid : str
+            Node uid.
+        slot_name : str
+            Slot name.
+        direction : str
+            String specifying direction, either 'sdInputs' <or> 'sdOuputs'.
+
+        Raises
         ------
         OslCommunicationError
             Raised when an error occurs while communicating with server.
@@ -1990,6 +2984,52 @@ class TcpOslServer(OslServer):
             max_request_attempts=self.max_request_attempts_register.get_value(current_func_name),
         )
 
+    def delete_notification_waiter(self, notification_waiter: NotificationWaiter) -> None:
+        """Unregister the listener of a waiter created by :py:meth:`create_notification_waiter`.
+
+        Parameters
+        ----------
+        notification_waiter : NotificationWaiter
+            Waiter to be deleted.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        key = self.__get_notification_waiter_listener_key(notification_waiter)
+        if key not in self.__listeners:
+            return
+        listener: TcpOslListener = self.__listeners.pop(key)
+        listener.refresh_listener_registration = False
+        listener.stop_listening()
+        listener.clear_callbacks()
+        try:
+            self._unregister_listener(listener)
+        finally:
+            listener.dispose()
+
+    def disable_project_tree_cache(self) -> None:
+        """Disable the cache of the project tree with properties.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        self.__project_tree_cache = None
+        self.__project_tree_index = None
+        if "project_tree_cache_listener" in self.__listeners:
+            self.__delete_project_tree_cache_listener()
+
     def dispose(self) -> None:
         """Terminate all local threads and unregister listeners.
 
@@ -2008,8 +3048,196 @@ class TcpOslServer(OslServer):
         self.__stop_listeners_registration_thread()
         self.__unregister_all_listeners()
         self.__dispose_all_listeners()
+        if self.__connection_pool is not None:
+            self.__connection_pool.clear()
+        self.disable_recording()
+        self.disable_notification_dispatcher()
         self.__disposed = True
 
+    def disable_metrics(self) -> None:
+        """Stop collecting metrics of sent requests."""
+        self.__metrics = None
+
+    def disable_notification_dispatcher(self) -> None:
+        """Execute callbacks of listeners by their listening threads again.
+
+        The dispatcher is shut down if it was created by the ``enable_notification_dispatcher``
+        method, notifications already queued are executed before.
+        """
+        dispatcher = self.__notification_dispatcher
+        if dispatcher is None:
+            return
+        self.__notification_dispatcher = None
+        for listener in self.__listeners.values():
+            listener.dispatcher = None
+        if self.__owns_notification_dispatcher:
+            dispatcher.shutdown()
+        self.__owns_notification_dispatcher = False
+
+    def disable_recording(self) -> None:
+        """Stop recording the session.
+
+        The recorder is closed if it was created by the ``enable_recording`` method.
+        """
+        recorder = self.__recorder
+        if recorder is None:
+            return
+        self.__recorder = None
+        for listener in self.__listeners.values():
+            listener.recorder = None
+        if self.__owns_recorder:
+            recorder.close()
+        self.__owns_recorder = False
+
+    def enable_metrics(self, metrics: Optional[TcpCommandMetrics] = None) -> TcpCommandMetrics:
+        """Collect client-side metrics of sent requests.
+
+        For each request name, the ``What`` value of queries and the ``command`` value
+        of commands, the durations of connecting, sending, waiting for the server, receiving
+        and decoding the response, numbers of transferred bytes, retries, timeouts and
+        errors are collected. Streamed responses of the ``send_command_stream`` method are
+        not measured.
+
+        Parameters
+        ----------
+        metrics : Optional[TcpCommandMetrics], optional
+            Metrics the requests are recorded in, which may be shared by several instances.
+            If ``None``, new metrics are created. Defaults to ``None``.
+
+        Returns
+        -------
+        TcpCommandMetrics
+            Enabled metrics.
+        """
+        self.__metrics = metrics if metrics is not None else TcpCommandMetrics()
+        return self.__metrics
+
+    def enable_recording(self, recorder: Union[str, Path, SessionRecorder]) -> SessionRecorder:
+        """Record the session, so that it can be replayed without optiSLang.
+
+        All requests sent by this instance with their responses and push notifications
+        received by its listeners are recorded. The recording can be replayed by the
+        ``ReplayOslServer`` class. If the session is already recorded, the previous recording
+        is stopped.
+
+        Parameters
+        ----------
+        recorder : Union[str, Path, SessionRecorder]
+            Path to the recording file or recorder the session is recorded by. A recorder
+            created from the path is closed by the ``disable_recording`` method.
+
+        Returns
+        -------
+        SessionRecorder
+            Enabled recorder.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        self.disable_recording()
+        if isinstance(recorder, SessionRecorder):
+            self.__owns_recorder = False
+        else:
+            recorder = SessionRecorder(
+                recorder,
+                metadata={"osl_version": self.osl_version_string},
+                json_codec=self.__json_codec,
+            )
+            self.__owns_recorder = True
+        self.__recorder = recorder
+        for listener in self.__listeners.values():
+            listener.recorder = recorder
+        return recorder
+
+    def enable_notification_dispatcher(
+        self, dispatcher: Optional[NotificationDispatcher] = None
+    ) -> NotificationDispatcher:
+        """Execute callbacks of listeners by a pool of threads.
+
+        By default, each listener executes the callbacks of a received notification before it
+        accepts the next one, so slow callbacks or bursts of notifications delay the delivery
+        of further notifications. While the dispatcher is enabled, listeners only receive and
+        acknowledge notifications and the callbacks are executed by the dispatcher, see
+        :py:class:`NotificationDispatcher
+        <ansys.optislang.core.tcp.notification_dispatcher.NotificationDispatcher>`.
+        If a dispatcher is already enabled, it is replaced.
+
+        Parameters
+        ----------
+        dispatcher : Optional[NotificationDispatcher], optional
+            Dispatcher executing the callbacks, which may be shared by several instances.
+            If ``None``, a new dispatcher with default settings is created, which is shut
+            down by the ``disable_notification_dispatcher`` method. Defaults to ``None``.
+
+        Returns
+        -------
+        NotificationDispatcher
+            Enabled dispatcher.
+        """
+        self.disable_notification_dispatcher()
+        self.__owns_notification_dispatcher = dispatcher is None
+        if dispatcher is None:
+            dispatcher = NotificationDispatcher(logger=self._logger)
+        self.__notification_dispatcher = dispatcher
+        for listener in self.__listeners.values():
+            listener.dispatcher = dispatcher
+        return dispatcher
+
+    def enable_project_tree_cache(
+        self, ttl: Optional[float] = 30, use_notifications: bool = True
+    ) -> ProjectTreeCache:
+        """Enable the cache of the project tree with properties.
+
+        While the cache is enabled, the project tree with properties is fetched from the server
+        only if the cached tree is not valid anymore. The cached tree is invalidated whenever
+        a command is sent by this instance, when the ``ACTOR_CONTENTS_CHANGED``,
+        ``ACTOR_NAME_CHANGED`` or ``ACTOR_STATE_CHANGED`` push notification is received
+        and when it is older than ``ttl``. If the cache is already enabled, it is replaced.
+
+        Parameters
+        ----------
+        ttl : Optional[float], optional
+            Time to live of the cached tree in seconds. If ``None``, the cached tree expires
+            only when it is invalidated. Defaults to ``30``.
+        use_notifications : bool, optional
+            Determines whether a listener is registered to invalidate the cached tree on push
+            notifications. If ``False``, changes made by other clients are reflected only
+            after the ``ttl`` expires. Defaults to ``True``.
+
+        Returns
+        -------
+        ProjectTreeCache
+            Enabled cache.
+
+        Raises
+        ------
+        ValueError
+            Raised when the ``ttl`` is not greater than zero.
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        project_tree_cache = ProjectTreeCache(ttl=ttl)
+        self.disable_project_tree_cache()
+        if use_notifications:
+            listener = self.__create_project_tree_cache_listener()
+            listener.add_callback(
+                self.__class__.__invalidate_project_tree_cache,
+                (project_tree_cache, self._logger),
+            )
+            listener.start_listening()
+        self.__project_tree_cache = project_tree_cache
+        return project_tree_cache
+
     def evaluate_design(self, evaluate_dict: Dict[str, float]) -> List[dict]:
         """Evaluate requested design.
 
@@ -2039,6 +3267,43 @@ class TcpOslServer(OslServer):
             max_request_attempts=self.max_request_attempts_register.get_value(current_func_name),
         )
 
+    def evaluate_designs(self, evaluate_dicts: Iterable[Dict[str, float]]) -> List[List[dict]]:
+        """Evaluate requested designs in a single request.
+
+        The ``evaluate_design`` commands of all designs are merged into one request, which is
+        sent over one connection, see ``send_commands``.
+
+        Parameters
+        ----------
+        evaluate_dicts: Iterable[Dict[str, float]]
+            Parameter values of each design, [{'parName': value, ...}, ...]
+
+        Returns
+        -------
+        List[List[dict]]
+            Output from optislang server for each design, in the order of given designs.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        ResponseFormatError
+            Raised when the number of results does not match the number of designs.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        current_func_name = self.evaluate_designs.__name__
+        return self.send_commands(
+            [
+                commands.evaluate_design(evaluate_dict, self.__password)
+                for evaluate_dict in evaluate_dicts
+            ],
+            timeout=self.timeouts_register.get_value(current_func_name),
+            max_request_attempts=self.max_request_attempts_register.get_value(current_func_name),
+        )
+
     def get_actor_info(
         self,
         uid: str,
@@ -2379,6 +3644,64 @@ class TcpOslServer(OslServer):
             max_request_attempts=self.max_request_attempts_register.get_value(current_func_name),
         )
 
+    def get_actor_states_status_info(
+        self,
+        uid: str,
+        hids: Iterable[str],
+        include_designs: bool = True,
+        include_design_values: bool = True,
+        include_non_scalar_design_values: bool = False,
+        include_algorithm_info: bool = False,
+    ) -> List[Dict]:
+        """Get status info about actor defined by actor uid for multiple states in one batch.
+
+        Parameters
+        ----------
+        uid : str
+            Actor uid.
+        hids: Iterable[str]
+            State/Design hierarchical ids.
+        include_designs: bool
+            Include (result) designs in status info response.
+        include_design_values: bool
+            Include values in (result) designs.
+        include_non_scalar_design_values: bool
+            Include non scalar values in (result) designs.
+        include_algorithm_info: bool
+            Include algorithm result info in status info response.
+
+        Returns
+        -------
+        List[Dict]
+            Info about actor defined by uid for each given state.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        current_func_name = self.get_actor_states_status_info.__name__
+        return self.send_commands(
+            commands=[
+                queries.actor_status_info(
+                    uid=uid,
+                    hid=hid,
+                    include_designs=include_designs,
+                    include_design_values=include_design_values,
+                    include_non_scalar_design_values=include_non_scalar_design_values,
+                    include_algorithm_info=include_algorithm_info,
+                    password=self.__password,
+                )
+                for hid in hids
+            ],
+            timeout=self.timeouts_register.get_value(current_func_name),
+            max_request_attempts=self.max_request_attempts_register.get_value(current_func_name),
+        )
+
     def get_actor_supports(self, uid: str, feature_name: str) -> bool:
         """Get supported features of actor defined by uid.
 
@@ -2471,9 +3794,19 @@ class TcpOslServer(OslServer):
         available_nodes.pop("status")
         return available_nodes
 
-    def get_available_node_types(self) -> List[NodeType]:
+    def get_available_node_types(self, use_cache: bool = True) -> List[NodeType]:
         """Get available node types for current oSL server.
 
+        Node types are stored per optiSLang version in the registry returned by the
+        :py:func:`get_node_type_registry() <ansys.optislang.core.node_types.get_node_type_registry>`
+        function and queried from the server only once per version.
+
+        Parameters
+        ----------
+        use_cache : bool, optional
+            Whether to use node types stored in the registry. If ``False``, node types are
+            queried from the server and the registry is updated. Defaults to ``True``.
+
         Returns
         -------
         List[NodeType]
@@ -2488,6 +3821,11 @@ class TcpOslServer(OslServer):
         TimeoutError
             Raised when the timeout float value expires.
         """
+        registry = get_node_type_registry()
+        if use_cache:
+            node_types = registry.get_available_node_types(self.__osl_version_string)
+            if node_types is not None:
+                return node_types
         current_func_name = self.get_available_node_types.__name__
         available_nodes = self.send_command(
             command=queries.available_nodes(self.__password),
@@ -2496,59 +3834,7 @@ class TcpOslServer(OslServer):
         )
         available_nodes.pop("message")
         available_nodes.pop("status")
-        node_types: List[NodeType] = []
-        for node_sub_type, node_type_list in available_nodes.items():
-            for node_type in node_type_list:
-                if node_sub_type == "algorithm_plugins":
-                    node_types.append(
-                        NodeType(
-                            id=node_type,
-                            subtype=AddinType.ALGORITHM_PLUGIN,
-                        )
-                    )
-                elif node_sub_type == "builtin_nodes":
-                    node_types.append(
-                        NodeType(
-                            id=node_type,
-                            subtype=AddinType.BUILT_IN,
-                        )
-                    )
-                elif node_sub_type == "integration_plugins":
-                    node_types.append(
-                        NodeType(
-                            id=node_type,
-                            subtype=AddinType.INTEGRATION_PLUGIN,
-                        )
-                    )
-                elif node_sub_type == "python_based_algorithm_plugins":
-                    node_types.append(
-                        NodeType(
-                            id=node_type,
-                            subtype=AddinType.PYTHON_BASED_ALGORITHM_PLUGIN,
-                        )
-                    )
-                elif node_sub_type == "python_based_integration_plugins":
-                    node_types.append(
-                        NodeType(
-                            id=node_type,
-                            subtype=AddinType.PYTHON_BASED_INTEGRATION_PLUGIN,
-                        )
-                    )
-                elif node_sub_type == "python_based_mop_node_plugins":
-                    node_types.append(
-                        NodeType(
-                            id=node_type,
-                            subtype=AddinType.PYTHON_BASED_MOP_NODE_PLUGIN,
-                        )
-                    )
-                elif node_sub_type == "python_based_node_plugins":
-                    node_types.append(
-                        NodeType(
-                            id=node_type,
-                            subtype=AddinType.PYTHON_BASED_NODE_PLUGIN,
-                        )
-                    )
-        return node_types
+        return registry.set_available_node_types(self.__osl_version_string, available_nodes)
 
     def get_available_output_locations(self, uid: str) -> List[dict]:
         """Get available output locations for a certain (integration) actor, if supported.
@@ -2827,12 +4113,10 @@ class TcpOslServer(OslServer):
         TimeoutError
             Raised when the timeout float value expires.
         """
-        current_func_name = self.get_full_project_tree_with_properties.__name__
-        return self.send_command(
-            command=queries.full_project_tree_with_properties(password=self.__password),
-            timeout=self.timeouts_register.get_value(current_func_name),
-            max_request_attempts=self.max_request_attempts_register.get_value(current_func_name),
-        )
+        project_tree_cache = self.__project_tree_cache
+        if project_tree_cache is not None:
+            return project_tree_cache.get(self.__get_full_project_tree_with_properties)
+        return self.__get_full_project_tree_with_properties()
 
     def get_full_subtree_status_info(
         self,
@@ -3592,6 +4876,37 @@ class TcpOslServer(OslServer):
         project_tree = self.get_full_project_tree_with_properties()
         return project_tree.get("projects", [{}])[0].get("system", {}).get("uid", None)
 
+    def get_project_tree_index(self) -> ProjectTreeIndex:
+        """Get index of the full project tree with properties.
+
+        While the project tree cache is enabled, the index is built only once
+        for each cached tree.
+
+        Returns
+        -------
+        ProjectTreeIndex
+            Index of the project tree for lookups of nodes by unique ID and name.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        project_tree = self.get_full_project_tree_with_properties()
+        if self.__project_tree_cache is None:
+            self.__project_tree_index = None
+            return ProjectTreeIndex.from_project_tree(project_tree)
+        indexed = self.__project_tree_index
+        if indexed is not None and indexed[0] is project_tree:
+            return indexed[1]
+        project_tree_index = ProjectTreeIndex.from_project_tree(project_tree)
+        self.__project_tree_index = (project_tree, project_tree_index)
+        return project_tree_index
+
     def get_project_tree_systems(self) -> Dict:
         """Get project tree systems without properties.
 
@@ -3837,15 +5152,42 @@ class TcpOslServer(OslServer):
             return None
         return Path(project_info.get("projects", [{}])[0].get("working_dir", None))
 
-    def load(self, uid: str, args: Optional[Dict[str, Any]] = None) -> None:
-        """Explicit load of node.
+    def iter_actor_status_info(
+        self,
+        uid: str,
+        hid: str,
+        include_designs: bool = True,
+        include_design_values: bool = True,
+        include_non_scalar_design_values: bool = False,
+        include_algorithm_info: bool = False,
+    ) -> Iterator[Tuple[Tuple[str, ...], Any]]:
+        """Get status info about actor defined by actor uid and state Hid incrementally.
+
+        Unlike :py:meth:`get_actor_status_info`, the response is decoded while it is received.
+        Design values and design statuses are yielded one by one, so that the status info
+        of states with many designs does not have to be held in memory as a whole.
 
         Parameters
         ----------
-        uid: str
+        uid : str
             Actor uid.
-        args: Optional[Dict[str, any]], optional
-            Additional arguments, by default ``None``.
+        hid: str
+            State/Design hierarchical id.
+        include_designs: bool
+            Include (result) designs in status info response.
+        include_design_values: bool
+            Include values in (result) designs.
+        include_non_scalar_design_values: bool
+            Include non scalar values in (result) designs.
+        include_algorithm_info: bool
+            Include algorithm result info in status info response.
+
+        Yields
+        ------
+        Tuple[Tuple[str, ...], Any]
+            Path of the value in the status info specified as tuple of keys and the value.
+            Items of the ``("designs", "values")`` and ``("design_status",)`` lists are yielded
+            one by one with the path of the list.
 
         Raises
         ------
@@ -3856,8 +5198,43 @@ class TcpOslServer(OslServer):
         TimeoutError
             Raised when the timeout float value expires.
         """
-        # TODO: create unit test
-        current_func_name = self.load.__name__
+        current_func_name = self.get_actor_status_info.__name__
+        return self.send_command_stream(
+            command=queries.actor_status_info(
+                uid=uid,
+                hid=hid,
+                include_designs=include_designs,
+                include_design_values=include_design_values,
+                include_non_scalar_design_values=include_non_scalar_design_values,
+                include_algorithm_info=include_algorithm_info,
+                password=self.__password,
+            ),
+            stream_paths=[("designs", "values"), ("design_status",)],
+            timeout=self.timeouts_register.get_value(current_func_name),
+            max_request_attempts=self.max_request_attempts_register.get_value(current_func_name),
+        )
+
+    def load(self, uid: str, args: Optional[Dict[str, Any]] = None) -> None:
+        """Explicit load of node.
+
+        Parameters
+        ----------
+        uid: str
+            Actor uid.
+        args: Optional[Dict[str, any]], optional
+            Additional arguments, by default ``None``.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        # TODO: create unit test
+        current_func_name = self.load.__name__
         self.send_command(
             command=commands.load(
                 actor_uid=uid,
@@ -4716,53 +6093,151 @@ class TcpOslServer(OslServer):
             raise RuntimeError("optiSLang server is not started.")
 
         self._logger.debug("Sending command or query to the server: %s", command)
-        client = TcpClient(logger=self._logger)
 
-        response_str = ""
+        with self.__start_request_trace([command]) as trace:
+            try:
+                raw_response = self.__send_requests([command], timeout, max_request_attempts, trace)
+                decode_start_time = time.perf_counter()
+                response = self.__json_codec.loads(raw_response[0])
+                trace.add_phase(RequestPhase.DECODE, time.perf_counter() - decode_start_time)
+            finally:
+                self.__invalidate_project_tree_cache_on_commands([command])
+            self._logger.debug("Response received: %s", response)
 
-        for request_attempt in range(1, max_request_attempts + 1):
-            start_time = time.time()
+            _check_command_response(response)
+
+        return response
+
+    def send_commands(self, commands: Iterable[str], **kwargs) -> List[Any]:
+        """Send multiple commands or queries to the optiSLang server in one batch.
+
+        Consecutive server commands are merged into a single request, as the optiSLang server
+        executes all commands of a request and answers with a list of their results. With
+        persistent connections, the requests are pipelined over one connection, so that the batch
+        costs a single connection setup and round trip instead of one per command or query.
+        Otherwise, each request is sent over its own connection.
+
+        Parameters
+        ----------
+        commands: Iterable[str]
+            Commands or queries to be executed on optiSLang server, e.g. generated by
+            the functions from ``server_commands`` and ``server_queries`` modules.
+        timeout: Optional[float], optional
+            Timeout to execute each request of the batch. If not provided, the value
+            registered for this method in `TcpOslServer.timeouts_register` is used.
+        max_request_attempts: int, optional
+            Maximum number of attempts to execute each request of the batch. If not provided,
+            the value registered for this method in
+            `TcpOslServer.max_request_attempts_register` is used.
+
+        Returns
+        -------
+        List[Any]
+            Responses from the server in the order of given commands and queries.
+
+        Raises
+        ------
+        RuntimeError
+            Raised when the optiSLang server is not started.
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when any of the commands or queries fails.
+        ResponseFormatError
+            Raised when the response to merged commands does not match the number of commands.
+        TimeoutError
+            Raised when the timeout expires.
+        """
+        current_func_name = self.send_commands.__name__
+        timeout = (
+            kwargs.get("timeout")
+            if "timeout" in kwargs.keys()
+            else self.timeouts_register.get_value(current_func_name)
+        )
+        max_request_attempts = kwargs.get(
+            "max_request_attempts", self.max_request_attempts_register.get_value(current_func_name)
+        )
+        if self.__disposed:
+            raise OslDisposedError("Cannot send commands, instance was already disposed.")
+        if self.__local_server_id is None and (self.__host is None or self.__port is None):
+            raise RuntimeError("optiSLang server is not started.")
+
+        original_commands = list(commands)
+        requests, command_counts = _merge_server_commands(original_commands, self.__json_codec)
+        if not requests:
+            return []
+
+        self._logger.debug("Sending batch of %d requests to the server.", len(requests))
+        # names are found faster in the original commands than in the merged requests
+        with self.__start_request_trace(original_commands) as trace:
             try:
-                if self.__communication_channel == CommunicationChannel.LOCAL_DOMAIN:
-                    if self.__local_server_id is None:
-                        raise RuntimeError("Local domain server ID is not set.")
-                    client.connect_local(
-                        local_server_id=self.__local_server_id,
-                        timeout=_get_current_timeout(timeout, start_time),
-                    )
-                elif self.__communication_channel == CommunicationChannel.TCP:
-                    if self.__host is None or self.__port is None:
-                        raise RuntimeError("TCP host or port is not set.")
-                    client.connect(
-                        self.__host,
-                        self.__port,
-                        timeout=_get_current_timeout(timeout, start_time),
-                    )
-                client.send_msg(command, timeout=_get_current_timeout(timeout, start_time))
-                response_str = client.receive_msg(timeout=_get_current_timeout(timeout, start_time))
-                break
-            except TimeoutError:
-                if request_attempt == max_request_attempts:
-                    raise
-                else:
-                    pass
-            except Exception as ex:
-                raise OslCommunicationError(
-                    "An error occurred while communicating with the optiSLang server."
-                ) from ex
+                raw_responses = self.__send_requests(requests, timeout, max_request_attempts, trace)
+                decode_start_time = time.perf_counter()
+                responses = [self.__json_codec.loads(response) for response in raw_responses]
+                trace.add_phase(RequestPhase.DECODE, time.perf_counter() - decode_start_time)
             finally:
-                client.disconnect()
+                self.__invalidate_project_tree_cache_on_commands(requests)
+            for response in responses:
+                self._logger.debug("Response received: %s", response)
+            return _split_batch_responses(responses, command_counts)
 
-        self._logger.debug("Response received: %s", response_str)
-        response = json.loads(response_str)
+    def send_command_stream(
+        self, command: str, stream_paths: Iterable[Sequence[str]], **kwargs
+    ) -> Iterator[Tuple[Tuple[str, ...], Any]]:
+        """Send command or query to the optiSLang server and decode the response incrementally.
 
-        if isinstance(response, list):
-            for resp_elem in response:
-                self.__check_command_response(resp_elem)
-        else:
-            self.__check_command_response(response)
+        The response is received and decoded only as far as the returned iterator is consumed.
+        Items of the lists located at ``stream_paths`` are yielded one by one, all other
+        values of the response are yielded whole. A dedicated connection is used for each
+        streamed response, which is closed once the iterator is exhausted or closed.
 
-        return response
+        Parameters
+        ----------
+        command: str
+            Command or query to be executed on optiSLang server.
+        stream_paths: Iterable[Sequence[str]]
+            Paths of the lists in the response, whose items are yielded one by one, specified
+            as sequences of keys, e.g. ``[("designs", "values")]``.
+        timeout: Optional[float], optional
+            Timeout to send the command and to receive each chunk of the response. If not
+            provided, `TcpOslServer.timeouts_register.default_value` is used.
+        max_request_attempts: int, optional
+            Maximum number of attempts to send the command. Once the response is being received,
+            the command is not repeated. If not provided,
+            `TcpOslServer.max_request_attempts_register.default_value` is used.
+
+        Yields
+        ------
+        Tuple[Tuple[str, ...], Any]
+            Path of the value in the response specified as tuple of keys and the value.
+
+        Raises
+        ------
+        RuntimeError
+            Raised when the optiSLang server is not started.
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout expires.
+        """
+        timeout = (
+            kwargs.get("timeout")
+            if "timeout" in kwargs.keys()
+            else self.timeouts_register.default_value
+        )
+        max_request_attempts = kwargs.get(
+            "max_request_attempts", self.max_request_attempts_register.default_value
+        )
+        if self.__disposed:
+            raise OslDisposedError("Cannot send command, instance was already disposed.")
+        if self.__local_server_id is None and (self.__host is None or self.__port is None):
+            raise RuntimeError("optiSLang server is not started.")
+
+        self._logger.debug("Sending command or query to the server: %s", command)
+        client = self.__send_stream_request(command, timeout, max_request_attempts)
+        return self.__iter_stream_response(client, command, stream_paths, timeout)
 
     def set_actor_property(self, actor_uid: str, name: str, value: Any) -> None:
         """Set an actor property.
@@ -4960,6 +6435,9 @@ class TcpOslServer(OslServer):
         except Exception:
             if not force or self.__osl_process is None:
                 raise
+        finally:
+            if self.__connection_pool is not None:
+                self.__connection_pool.clear()
 
         # If desired actively force osl process to terminate
         if force and self.__osl_process is not None:
@@ -5187,18 +6665,7 @@ class TcpOslServer(OslServer):
         TimeoutError
             Raised when the timeout float value expires.
         """
-        osl_version_str = self._get_osl_version_string()
-
-        pattern = r"(\d+)\.(\d+)\.(\d+).*\((\d+)M?\)"
-        osl_version_entries = re.fullmatch(pattern, osl_version_str)
-
-        if osl_version_entries:
-            major, minor, maintenance, revision = osl_version_entries.groups()
-            return OslVersion(int(major), int(minor), int(maintenance), int(revision))
-        else:
-            raise RuntimeError(
-                'Invalid provided optiSLang version string: "{}".'.format(osl_version_str)
-            )
+        return _parse_osl_version(self._get_osl_version_string())
 
     def _get_osl_version_string(self) -> str:
         """Get version of used optiSLang.
@@ -5415,6 +6882,37 @@ class TcpOslServer(OslServer):
         else:
             return Path(file_path)
 
+    def __connect_client(self, timeout: Optional[float]) -> TcpClient:
+        """Create a new client connected to the optiSLang server.
+
+        Parameters
+        ----------
+        timeout : Optional[float]
+            Timeout in seconds to establish the connection.
+
+        Returns
+        -------
+        TcpClient
+            Connected client.
+
+        Raises
+        ------
+        RuntimeError
+            Raised when the optiSLang server address is not set.
+        ConnectionRefusedError
+            Raised when the connection cannot be established.
+        """
+        client = TcpClient(logger=self._logger)
+        if self.__communication_channel == CommunicationChannel.LOCAL_DOMAIN:
+            if self.__local_server_id is None:
+                raise RuntimeError("Local domain server ID is not set.")
+            client.connect_local(local_server_id=self.__local_server_id, timeout=timeout)
+        elif self.__communication_channel == CommunicationChannel.TCP:
+            if self.__host is None or self.__port is None:
+                raise RuntimeError("TCP host or port is not set.")
+            client.connect(self.__host, self.__port, timeout=timeout)
+        return client
+
     def __create_listener(
         self,
         timeout: float,
@@ -5476,11 +6974,14 @@ class TcpOslServer(OslServer):
             logger=self._logger,
             notifications=notifications,
             register_timeout=register_timeout,
+            json_codec=self.__json_codec,
         )
 
         if not listener.is_initialized():
             raise RuntimeError("Cannot start listener of optiSLang server port.")
 
+        listener.recorder = self.__recorder
+        listener.dispatcher = self.__notification_dispatcher
         return listener
 
     def __create_exec_started_listener(self, timeout: Optional[float] = None) -> TcpOslListener:
@@ -5583,6 +7084,105 @@ class TcpOslServer(OslServer):
         self.__listeners["exec_finished_listener"] = exec_finished_listener
         return exec_finished_listener
 
+    def __create_project_tree_cache_listener(self) -> TcpOslListener:
+        """Create project_tree_cache listener and add to self.__listeners.
+
+        Returns
+        -------
+        project_tree_cache_listener: TcpOslListener
+            Listener registered to the optiSLang server and subscribed
+            for push notifications.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        project_tree_cache_listener = self.__create_listener(
+            timeout=None,  # type: ignore[arg-type]
+            register_timeout=self.__listeners_default_timeout,
+            name="ProjectTreeCache",
+            communication_channel=self.__communication_channel,
+            notifications=[
+                ServerNotification.ACTOR_CONTENTS_CHANGED,
+                ServerNotification.ACTOR_NAME_CHANGED,
+                ServerNotification.ACTOR_STATE_CHANGED,
+            ],
+        )
+        if self.__communication_channel == CommunicationChannel.LOCAL_DOMAIN:
+            if project_tree_cache_listener.local_server_id is not None:
+                project_tree_cache_listener.uid = self.__register_local_listener(
+                    local_server_id=project_tree_cache_listener.local_server_id,
+                    timeout=self.__listeners_default_timeout,
+                    notifications=project_tree_cache_listener.notifications,
+                )
+        else:
+            project_tree_cache_listener.uid = self.__register_listener(
+                host_addresses=project_tree_cache_listener.host_addresses,
+                port=project_tree_cache_listener.port,
+                timeout=self.__listeners_default_timeout,
+                notifications=project_tree_cache_listener.notifications,
+            )
+        project_tree_cache_listener.refresh_listener_registration = True
+        self.__listeners["project_tree_cache_listener"] = project_tree_cache_listener
+        return project_tree_cache_listener
+
+    def __create_notification_waiter_listener(
+        self, notification_waiter: NotificationWaiter
+    ) -> TcpOslListener:
+        """Create listener of the notification waiter and add to self.__listeners.
+
+        Parameters
+        ----------
+        notification_waiter: NotificationWaiter
+            Waiter to be woken up by the listener.
+
+        Returns
+        -------
+        notification_waiter_listener: TcpOslListener
+            Listener registered to the optiSLang server and subscribed
+            for push notifications.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        notification_waiter_listener = self.__create_listener(
+            timeout=None,  # type: ignore[arg-type]
+            register_timeout=self.__listeners_default_timeout,
+            name="NotificationWaiter",
+            communication_channel=self.__communication_channel,
+            notifications=list(notification_waiter.notifications),
+        )
+        if self.__communication_channel == CommunicationChannel.LOCAL_DOMAIN:
+            if notification_waiter_listener.local_server_id is not None:
+                notification_waiter_listener.uid = self.__register_local_listener(
+                    local_server_id=notification_waiter_listener.local_server_id,
+                    timeout=self.__listeners_default_timeout,
+                    notifications=notification_waiter_listener.notifications,
+                )
+        else:
+            notification_waiter_listener.uid = self.__register_listener(
+                host_addresses=notification_waiter_listener.host_addresses,
+                port=notification_waiter_listener.port,
+                timeout=self.__listeners_default_timeout,
+                notifications=notification_waiter_listener.notifications,
+            )
+        notification_waiter_listener.refresh_listener_registration = True
+        self.__listeners[self.__get_notification_waiter_listener_key(notification_waiter)] = (
+            notification_waiter_listener
+        )
+        return notification_waiter_listener
+
     def __delete_exec_started_listener(self) -> None:
         """Terminate ExecStarted listener and remove from active listeners dict."""
         exec_started_listener: TcpOslListener = self.__listeners["exec_started_listener"]
@@ -5599,12 +7199,117 @@ class TcpOslServer(OslServer):
         self.__listeners.pop("exec_finished_listener")
         del exec_finished_listener
 
+    def __delete_project_tree_cache_listener(self) -> None:
+        """Terminate ProjectTreeCache listener and remove from active listeners dict."""
+        project_tree_cache_listener: TcpOslListener = self.__listeners.pop(
+            "project_tree_cache_listener"
+        )
+        project_tree_cache_listener.refresh_listener_registration = False
+        project_tree_cache_listener.stop_listening()
+        project_tree_cache_listener.clear_callbacks()
+        try:
+            self._unregister_listener(project_tree_cache_listener)
+        finally:
+            project_tree_cache_listener.dispose()
+
     def __dispose_all_listeners(self) -> None:
         """Dispose all listeners."""
         for listener in self.__listeners.values():
             listener.dispose()
         self.__listeners = {}
 
+    def __exchange_messages(
+        self,
+        client: TcpClient,
+        requests: Sequence[str],
+        responses: List[bytearray],
+        timeout: Optional[float],
+        start_time: float,
+        trace: RequestTrace = DISABLED_TRACE,
+    ) -> None:
+        """Send requests over one connection and receive the responses in order.
+
+        Requests are pipelined, i.e. further requests are sent before the preceding responses
+        are received, as long as the size of the unanswered requests does not exceed
+        ``_PIPELINE_WINDOW_SIZE`` bytes. Received responses are appended to ``responses``
+        immediately, so that they are kept if the exchange fails.
+
+        Parameters
+        ----------
+        client : TcpClient
+            Connected client.
+        requests : Sequence[str]
+            Requests to be sent.
+        responses : List[bytearray]
+            List the responses are appended to in the order of requests.
+        timeout : Optional[float]
+            Timeout to receive each response.
+        start_time : float
+            The time when the timeout starts to count down for the first response.
+        trace : RequestTrace, optional
+            Trace recording the exchange. Defaults to ``DISABLED_TRACE``.
+        """
+        pending_sizes: List[int] = []
+        pending_size = 0
+        for request in requests:
+            while pending_sizes and pending_size + len(request) > self._PIPELINE_WINDOW_SIZE:
+                responses.append(
+                    client.receive_raw_msg(
+                        timeout=_get_current_timeout(timeout, start_time), trace=trace
+                    )
+                )
+                start_time = time.time()
+                pending_size -= pending_sizes.pop(0)
+            client.send_msg(request, timeout=_get_current_timeout(timeout, start_time), trace=trace)
+            pending_sizes.append(len(request))
+            pending_size += len(request)
+        for _ in pending_sizes:
+            responses.append(
+                client.receive_raw_msg(
+                    timeout=_get_current_timeout(timeout, start_time), trace=trace
+                )
+            )
+            start_time = time.time()
+
+    def __get_full_project_tree_with_properties(self) -> Dict:
+        """Get full project tree with properties from the server, bypassing the cache."""
+        current_func_name = self.get_full_project_tree_with_properties.__name__
+        return self.send_command(
+            command=queries.full_project_tree_with_properties(password=self.__password),
+            timeout=self.timeouts_register.get_value(current_func_name),
+            max_request_attempts=self.max_request_attempts_register.get_value(current_func_name),
+        )
+
+    def __invalidate_project_tree_cache_on_commands(self, requests: Sequence[str]) -> None:
+        """Invalidate the project tree cache if any of the sent requests is a server command.
+
+        Parameters
+        ----------
+        requests : Sequence[str]
+            Sent requests.
+        """
+        project_tree_cache = self.__project_tree_cache
+        if project_tree_cache is None or not project_tree_cache.is_valid:
+            return
+        for request in requests:
+            # Requests generated by the ``server_queries`` and ``server_commands`` modules are
+            # recognized by their beginning, other requests are decoded.
+            if _COMMAND_PREFIX_PATTERN.match(request) is not None:
+                is_command = True
+            elif _QUERY_NAME_PATTERN.match(request) is not None:
+                is_command = False
+            else:
+                try:
+                    is_command = (
+                        _get_server_command_list(self.__json_codec.loads(request)) is not None
+                    )
+                except ValueError:
+                    # Invalidate on unknown requests to be on the safe side.
+                    is_command = True
+            if is_command:
+                project_tree_cache.invalidate()
+                return
+
     def __get_project_status(self) -> Optional[str]:
         """Get status of the optiSLang project.
 
@@ -5847,11 +7552,436 @@ class TcpOslServer(OslServer):
                             str(e),
                         )
                         pass
+                if self.__connection_pool is not None:
+                    self.__connection_pool.evict_idle_connections()
                 counter = 0
             counter += check_for_refresh
             self.__refresh_listeners_stopped.wait(check_for_refresh)
         self._logger.debug("Stop refreshing listener registration, self.__refresh = False")
 
+    def __start_request_trace(self, requests: Sequence[str]) -> RequestTrace:
+        """Start trace of the requests, disabled if metrics are not enabled.
+
+        The trace is named by the names of the requests, which are found without decoding
+        the requests where possible.
+
+        Parameters
+        ----------
+        requests : Sequence[str]
+            Commands or queries to be sent.
+
+        Returns
+        -------
+        RequestTrace
+            Trace of the requests.
+        """
+        metrics = self.__metrics
+        if metrics is None:
+            return DISABLED_TRACE
+        names: List[str] = []
+        for request in requests:
+            name = get_encoded_request_name(request)
+            if name not in names:
+                names.append(name)
+        return metrics.start_request("+".join(names))
+
+    def __send_requests(
+        self,
+        requests: Sequence[str],
+        timeout: Optional[float],
+        max_request_attempts: int,
+        trace: RequestTrace = DISABLED_TRACE,
+    ) -> List[bytearray]:
+        """Send requests using either persistent or single use connections.
+
+        Parameters
+        ----------
+        requests : Sequence[str]
+            Commands or queries to be executed on optiSLang server.
+        timeout : Optional[float]
+            Timeout to execute a single request attempt.
+        max_request_attempts : int
+            Maximum number of attempts to execute requests.
+        trace : RequestTrace, optional
+            Trace recording the requests. Defaults to ``DISABLED_TRACE``.
+
+        Returns
+        -------
+        List[bytearray]
+            Responses from the server in the order of requests.
+        """
+        recorder = self.__recorder
+        start_time = time.perf_counter()
+        if self.__connection_pool is not None:
+            responses = self.__send_requests_persistent(
+                requests, timeout, max_request_attempts, self.__connection_pool, trace
+            )
+        else:
+            responses = self.__send_requests_single_use(
+                requests, timeout, max_request_attempts, trace
+            )
+        if recorder is not None:
+            # pipelined requests share the time of the whole batch
+            duration = (time.perf_counter() - start_time) / max(len(requests), 1)
+            for request, response in zip(requests, responses):
+                recorder.record_request(request, response, duration)
+        return responses
+
+    def __send_requests_persistent(
+        self,
+        requests: Sequence[str],
+        timeout: Optional[float],
+        max_request_attempts: int,
+        connection_pool: TcpConnectionPool,
+        trace: RequestTrace = DISABLED_TRACE,
+    ) -> List[bytearray]:
+        """Send requests using a persistent connection from the connection pool.
+
+        A reused connection which turns out to be dropped by the server is replaced
+        by a new one without consuming a request attempt. A new connection answers a single
+        request before the remaining requests are pipelined over it. If the server closes
+        the connection after answering, pipelining is disabled and the remaining requests
+        are sent one per connection.
+
+        Parameters
+        ----------
+        requests : Sequence[str]
+            Commands or queries to be executed on optiSLang server.
+        timeout : Optional[float]
+            Timeout to execute a single request attempt.
+        max_request_attempts : int
+            Maximum number of attempts to execute requests.
+        connection_pool : TcpConnectionPool
+            Pool providing the connections.
+        trace : RequestTrace, optional
+            Trace recording the requests. Defaults to ``DISABLED_TRACE``.
+
+        Returns
+        -------
+        List[bytearray]
+            Responses from the server in the order of requests.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        TimeoutError
+            Raised when the timeout expires.
+        """
+        responses: List[bytearray] = []
+
+        for request_attempt in range(1, max_request_attempts + 1):
+            start_time = time.time()
+            client: Optional[TcpClient] = None
+            trace.start_attempt()
+            try:
+                connect_start_time = time.perf_counter()
+                client, reused = connection_pool.acquire(
+                    timeout=_get_current_timeout(timeout, start_time)
+                )
+                trace.add_phase(RequestPhase.CONNECT, time.perf_counter() - connect_start_time)
+                # Whether the connection answered a request within this attempt.
+                answering = False
+                while len(responses) < len(requests):
+                    answered = len(responses)
+                    if answering and not self.__pipelining_supported:
+                        dropped_client, client = client, None
+                        client = self.__reconnect_client(
+                            connection_pool, dropped_client, timeout, start_time, trace
+                        )
+                        reused = answering = False
+                    if (reused or answering) and self.__pipelining_supported:
+                        pending = requests[answered:]
+                    else:
+                        pending = requests[answered : answered + 1]
+                    try:
+                        self.__exchange_messages(
+                            client, pending, responses, timeout, start_time, trace
+                        )
+                    except TimeoutError:
+                        raise
+                    except OSError:
+                        if answering or len(responses) > answered:
+                            self._logger.debug(
+                                "Connection was closed by the server after the response, "
+                                "pipelining is disabled."
+                            )
+                            self.__pipelining_supported = False
+                        elif reused:
+                            self._logger.debug("Persistent connection was dropped, reconnecting.")
+                        else:
+                            raise
+                        dropped_client, client = client, None
+                        client = self.__reconnect_client(
+                            connection_pool, dropped_client, timeout, start_time, trace
+                        )
+                        reused = answering = False
+                        continue
+                    answering = True
+                    start_time = time.time()
+                connection_pool.release(client)
+                client = None
+                break
+            except TimeoutError:
+                trace.add_timeout()
+                if request_attempt == max_request_attempts:
+                    raise
+                else:
+                    pass
+            except Exception as ex:
+                raise OslCommunicationError(
+                    "An error occurred while communicating with the optiSLang server."
+                ) from ex
+            finally:
+                # Connection state is undefined after a failed request, it must not be reused.
+                if client is not None:
+                    connection_pool.discard(client)
+
+        return responses
+
+    def __reconnect_client(
+        self,
+        connection_pool: TcpConnectionPool,
+        client: TcpClient,
+        timeout: Optional[float],
+        start_time: float,
+        trace: RequestTrace = DISABLED_TRACE,
+    ) -> TcpClient:
+        """Replace the client of the connection pool by a newly connected one."""
+        connect_start_time = time.perf_counter()
+        client = connection_pool.reconnect(
+            client, timeout=_get_current_timeout(timeout, start_time)
+        )
+        trace.add_phase(RequestPhase.CONNECT, time.perf_counter() - connect_start_time)
+        return client
+
+    def __send_requests_single_use(
+        self,
+        requests: Sequence[str],
+        timeout: Optional[float],
+        max_request_attempts: int,
+        trace: RequestTrace = DISABLED_TRACE,
+    ) -> List[bytearray]:
+        """Send requests using a new connection for each request.
+
+        Parameters
+        ----------
+        requests : Sequence[str]
+            Commands or queries to be executed on optiSLang server.
+        timeout : Optional[float]
+            Timeout to execute a single request attempt.
+        max_request_attempts : int
+            Maximum number of attempts to execute each request.
+        trace : RequestTrace, optional
+            Trace recording the requests. Defaults to ``DISABLED_TRACE``.
+
+        Returns
+        -------
+        List[bytearray]
+            Responses from the server in the order of requests.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        TimeoutError
+            Raised when the timeout expires.
+        """
+        return [
+            self.__send_request_single_use(request, timeout, max_request_attempts, trace)
+            for request in requests
+        ]
+
+    def __send_request_single_use(
+        self,
+        request: str,
+        timeout: Optional[float],
+        max_request_attempts: int,
+        trace: RequestTrace = DISABLED_TRACE,
+    ) -> bytearray:
+        """Send request using a new connection for each request attempt.
+
+        Parameters
+        ----------
+        request : str
+            Command or query to be executed on optiSLang server.
+        timeout : Optional[float]
+            Timeout to execute a single request attempt.
+        max_request_attempts : int
+            Maximum number of attempts to execute the request.
+        trace : RequestTrace, optional
+            Trace recording the request. Defaults to ``DISABLED_TRACE``.
+
+        Returns
+        -------
+        bytearray
+            Response from the server.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        TimeoutError
+            Raised when the timeout expires.
+        """
+        response = bytearray()
+
+        for request_attempt in range(1, max_request_attempts + 1):
+            start_time = time.time()
+            client: Optional[TcpClient] = None
+            trace.start_attempt()
+            try:
+                connect_start_time = time.perf_counter()
+                client = self.__connect_client(timeout=_get_current_timeout(timeout, start_time))
+                trace.add_phase(RequestPhase.CONNECT, time.perf_counter() - connect_start_time)
+                client.send_msg(
+                    request, timeout=_get_current_timeout(timeout, start_time), trace=trace
+                )
+                response = client.receive_raw_msg(
+                    timeout=_get_current_timeout(timeout, start_time), trace=trace
+                )
+                break
+            except TimeoutError:
+                trace.add_timeout()
+                if request_attempt == max_request_attempts:
+                    raise
+                else:
+                    pass
+            except Exception as ex:
+                raise OslCommunicationError(
+                    "An error occurred while communicating with the optiSLang server."
+                ) from ex
+            finally:
+                if client is not None:
+                    client.disconnect()
+
+        return response
+
+    def __iter_stream_response(
+        self,
+        client: TcpClient,
+        command: str,
+        stream_paths: Iterable[Sequence[str]],
+        timeout: Optional[float],
+    ) -> Iterator[Tuple[Tuple[str, ...], Any]]:
+        """Decode the response incrementally and close the connection afterwards.
+
+        Parameters
+        ----------
+        client : TcpClient
+            Client the request was sent with.
+        command : str
+            Command or query sent, recorded with the whole response if the session is recorded.
+        stream_paths : Iterable[Sequence[str]]
+            Paths of the lists in the response, whose items are yielded one by one.
+        timeout : Optional[float]
+            Timeout to receive each chunk of the response.
+
+        Yields
+        ------
+        Tuple[Tuple[str, ...], Any]
+            Path of the value in the response specified as tuple of keys and the value.
+        """
+        status_info: Dict[str, Any] = {}
+        recorder = self.__recorder
+        start_time = time.perf_counter()
+        chunks = client.receive_msg_chunks(timeout=timeout)
+        if recorder is not None:
+            chunks = self.__record_stream_chunks(recorder, command, chunks, start_time)
+        try:
+            events = json_stream.iter_json_events(chunks, list(stream_paths))
+            while True:
+                try:
+                    path, value = next(events)
+                except StopIteration:
+                    break
+                except TimeoutError:
+                    raise
+                except Exception as ex:
+                    raise OslCommunicationError(
+                        "An error occurred while communicating with the optiSLang server."
+                    ) from ex
+                if len(path) == 1 and path[0] in ("status", "message", "std_err"):
+                    status_info[path[0]] = value
+                yield path, value
+        finally:
+            client.disconnect()
+        _check_command_response(status_info)
+
+    @staticmethod
+    def __record_stream_chunks(
+        recorder: SessionRecorder, command: str, chunks: Iterator[bytearray], start_time: float
+    ) -> Iterator[bytearray]:
+        """Pass the chunks of the response through and record the whole response at the end.
+
+        Parameters
+        ----------
+        recorder : SessionRecorder
+            Recorder of the session.
+        command : str
+            Command or query sent.
+        chunks : Iterator[bytearray]
+            Chunks of the response.
+        start_time : float
+            Time the response started to be received at.
+
+        Yields
+        ------
+        bytearray
+            Chunk of the response.
+        """
+        response = bytearray()
+        for chunk in chunks:
+            response += chunk
+            yield chunk
+        recorder.record_request(command, response, time.perf_counter() - start_time)
+
+    def __send_stream_request(
+        self, command: str, timeout: Optional[float], max_request_attempts: int
+    ) -> TcpClient:
+        """Send request over a new connection, whose response is to be received incrementally.
+
+        Parameters
+        ----------
+        command : str
+            Command or query to be executed on optiSLang server.
+        timeout : Optional[float]
+            Timeout to send the request in a single attempt.
+        max_request_attempts : int
+            Maximum number of attempts to send the request.
+
+        Returns
+        -------
+        TcpClient
+            Connected client the request was sent with.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        TimeoutError
+            Raised when the timeout expires.
+        """
+        for request_attempt in range(1, max_request_attempts + 1):
+            start_time = time.time()
+            client: Optional[TcpClient] = None
+            try:
+                client = self.__connect_client(timeout=_get_current_timeout(timeout, start_time))
+                client.send_msg(command, timeout=_get_current_timeout(timeout, start_time))
+                return client
+            except TimeoutError:
+                if client is not None:
+                    client.disconnect()
+                if request_attempt == max_request_attempts:
+                    raise
+            except Exception as ex:
+                if client is not None:
+                    client.disconnect()
+                raise OslCommunicationError(
+                    "An error occurred while communicating with the optiSLang server."
+                ) from ex
+        raise ValueError("Maximum number of request attempts must be greater than zero.")
+
     def __signal_handler(self, signum, frame):
         self._logger.error("Interrupt from keyboard (CTRL + C), terminating execution.")
         self.dispose()
@@ -5980,35 +8110,12 @@ class TcpOslServer(OslServer):
     #             raise TimeoutError("Waiting for finished timed out.")
     #         self._logger.info(f"Successfully_finished: {successfully_finished}.")
 
-    @staticmethod
-    def __check_command_response(response: Dict) -> None:
-        """Check whether the server response for a sent command contains any failure information.
-
-        Parameters
-        ----------
-        response : Dict
-            Server response as dictionary.
-
-        Raises
-        ------
-        OslCommandError
-            Raised when the server response for the sent command contains any failure information.
-        """
-        if "status" in response and response["status"].lower() == "failure":
-            message = None
-            if "message" in response:
-                message = response["message"]
-            if "std_err" in response:
-                message += "; " + response["std_err"]
-            if message is None:
-                message = "Command error: " + str(response)
-            raise OslCommandError(message)
-
     def __get_default_max_request_attempts_register(self) -> FunctionsAttributeRegister:
         max_requests_register = FunctionsAttributeRegister(
             default_value=2, validator=self.__class__.__validate_max_request_attempts_value
         )
         max_requests_register.register(self.__class__.evaluate_design, 1)
+        max_requests_register.register(self.__class__.evaluate_designs, 1)
         max_requests_register.register(self.__class__.get_full_project_status_info, 1)
         max_requests_register.register(self.__class__.load, 1)
         max_requests_register.register(self.__class__.open, 1)
@@ -6017,6 +8124,7 @@ class TcpOslServer(OslServer):
         max_requests_register.register(self.__class__.save, 1)
         max_requests_register.register(self.__class__.save_as, 1)
         max_requests_register.register(self.__class__.save_copy, 1)
+        max_requests_register.register(self.__class__.send_commands, 1)
         max_requests_register.register(self.__class__.start, 1)
         max_requests_register.register(self.__class__.stop, 1)
         return max_requests_register
@@ -6026,6 +8134,7 @@ class TcpOslServer(OslServer):
             default_value=30, validator=self.__class__.__validate_timeout_value
         )
         timeout_register.register(self.__class__.evaluate_design, None)
+        timeout_register.register(self.__class__.evaluate_designs, None)
         timeout_register.register(self.__class__.get_full_project_status_info, None)
         timeout_register.register(self.__class__.load, None)
         timeout_register.register(self.__class__.open, None)
@@ -6034,10 +8143,53 @@ class TcpOslServer(OslServer):
         timeout_register.register(self.__class__.save, None)
         timeout_register.register(self.__class__.save_as, None)
         timeout_register.register(self.__class__.save_copy, None)
+        timeout_register.register(self.__class__.send_commands, 30)
         timeout_register.register(self.__class__.start, None)
         timeout_register.register(self.__class__.stop, None)
         return timeout_register
 
+    @staticmethod
+    def __get_notification_waiter_listener_key(notification_waiter: NotificationWaiter) -> str:
+        """Get key of the listener of the notification waiter in self.__listeners."""
+        return f"notification_waiter_listener_{id(notification_waiter)}"
+
+    @staticmethod
+    def __invalidate_project_tree_cache(
+        sender: TcpOslListener,
+        response: dict,
+        project_tree_cache: ProjectTreeCache,
+        logger: logging.Logger,
+    ) -> None:
+        """Invalidate the project tree cache if the project content changed."""
+        type = response.get("type", None)
+        if type == "TimeoutError":
+            project_tree_cache.invalidate()
+            logger.warning(
+                f"Listener {sender.name} timed out, project tree cache relies on its time to live."
+            )
+        elif type is not None:
+            project_tree_cache.invalidate()
+            logger.debug(f"Project tree cache invalidated by {type} notification.")
+        else:
+            logger.error("Invalid response from server, push notification not evaluated.")
+
+    @staticmethod
+    def __notify_waiter(
+        sender: TcpOslListener,
+        response: dict,
+        notification_waiter: NotificationWaiter,
+        logger: logging.Logger,
+    ) -> None:
+        """Wake up threads waiting for push notifications."""
+        type = response.get("type", None)
+        if type == "TimeoutError":
+            logger.warning(f"Listener {sender.name} timed out.")
+        elif type is None:
+            logger.error("Invalid response from server, push notification not evaluated.")
+        else:
+            logger.debug(f"Notification waiter woken up by {type} notification.")
+        notification_waiter.notify()
+
     @staticmethod
     def __local_listener_notification_received(
         sender: TcpOslListener, response: dict, results_queue: Queue, logger
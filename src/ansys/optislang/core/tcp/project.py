@@ -105,6 +105,17 @@ class TcpProjectProxy(Project):
         """
         return self.__root_system.parameter_manager
 
+    @property
+    def project_tree_cache_enabled(self) -> bool:
+        """Whether the project tree is cached on the client side.
+
+        Returns
+        -------
+        bool
+            ``True`` if the project tree cache is enabled, ``False`` otherwise.
+        """
+        return self.__osl_server.project_tree_cache is not None
+
     @property
     def response_manager(self) -> TcpResponseManagerProxy:
         """Instance of the ``TcpResponseManagerProxy`` class at the root system.
@@ -147,6 +158,55 @@ class TcpProjectProxy(Project):
         """
         return self.__uid
 
+    def disable_project_tree_cache(self) -> None:
+        """Disable the client-side cache of the project tree.
+
+        Raises
+        ------
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        self.__osl_server.disable_project_tree_cache()
+
+    def enable_project_tree_cache(
+        self, ttl: Optional[float] = 30, use_notifications: bool = True
+    ) -> None:
+        """Enable the client-side cache of the project tree.
+
+        Navigation in the project tree, e.g. finding nodes, getting ancestors, parents
+        or child nodes, requires the whole project tree. With the cache enabled, the tree
+        is transferred from the server only once and reused until it is invalidated,
+        either by a command sent by this client, by a push notification about a change
+        of the project content, or after the ``ttl`` expires.
+
+        Parameters
+        ----------
+        ttl : Optional[float], optional
+            Time to live of the cached tree in seconds. If ``None``, the cached tree expires
+            only when it is invalidated. Defaults to ``30``.
+        use_notifications : bool, optional
+            Determines whether the cached tree is invalidated by the ``ACTOR_CONTENTS_CHANGED``,
+            ``ACTOR_NAME_CHANGED`` and ``ACTOR_STATE_CHANGED`` push notifications. If ``False``,
+            changes made by other clients are reflected only after the ``ttl`` expires.
+            Defaults to ``True``.
+
+        Raises
+        ------
+        ValueError
+            Raised when the ``ttl`` is not greater than zero.
+        OslCommunicationError
+            Raised when an error occurs while communicating with server.
+        OslCommandError
+            Raised when the command or query fails.
+        TimeoutError
+            Raised when the timeout float value expires.
+        """
+        self.__osl_server.enable_project_tree_cache(ttl=ttl, use_notifications=use_notifications)
+
     def evaluate_design(self, design: Design) -> Design:
         """Evaluate a design.
 
@@ -0,0 +1,202 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Contains class ProjectTreeIndex."""
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+
+class ProjectTreeIndex:
+    """Flattened index over the project tree for lookups by unique ID and name.
+
+    The index is built by a single pass through the tree and references the node
+    dictionaries of the tree, so it stays valid only as long as the tree is not modified.
+
+    Parameters
+    ----------
+    system_tree : dict
+        Dictionary of the root system as contained in the project tree,
+        i.e. ``project_tree["projects"][0]["system"]``.
+    """
+
+    def __init__(self, system_tree: dict) -> None:
+        """Initialize a new instance of the ``ProjectTreeIndex`` class."""
+        self.__root_uid: str = system_tree["uid"]
+        self.__nodes: Dict[str, dict] = {}
+        self.__parents: Dict[str, Optional[str]] = {}
+        self.__depths: Dict[str, int] = {}
+        self.__names: Dict[str, List[str]] = {}
+        # Pre-order traversal, so that the nodes of the same name are ordered
+        # as if found by a recursive search.
+        stack: List[Tuple[dict, Optional[str], int]] = [(system_tree, None, 0)]
+        while stack:
+            node, parent_uid, depth = stack.pop()
+            uid = node["uid"]
+            self.__nodes[uid] = node
+            self.__parents[uid] = parent_uid
+            self.__depths[uid] = depth
+            if parent_uid is not None:
+                self.__names.setdefault(node["name"], []).append(uid)
+            stack.extend((child, uid, depth + 1) for child in reversed(node.get("nodes", [])))
+
+    @classmethod
+    def from_project_tree(cls, project_tree: dict) -> ProjectTreeIndex:
+        """Create index of the first project of the full project tree.
+
+        Parameters
+        ----------
+        project_tree : dict
+            Dictionary of the full project tree, e.g. as returned by
+            ``TcpOslServer.get_full_project_tree_with_properties()``.
+
+        Returns
+        -------
+        ProjectTreeIndex
+            Index of the project tree.
+        """
+        return cls(project_tree["projects"][0]["system"])
+
+    def __contains__(self, uid: object) -> bool:
+        """Check whether the node with the given unique ID is located in the tree."""
+        return uid in self.__nodes
+
+    def __len__(self) -> int:
+        """Return number of nodes in the tree including the root system."""
+        return len(self.__nodes)
+
+    @property
+    def root_uid(self) -> str:
+        """Unique ID of the root system."""
+        return self.__root_uid
+
+    def get_node(self, uid: str) -> Optional[dict]:
+        """Get dictionary of the node, i.e. the subtree with the node at its root.
+
+        Parameters
+        ----------
+        uid : str
+            Unique ID of the node.
+
+        Returns
+        -------
+        Optional[dict]
+            Dictionary of the node as contained in the tree, ``None`` if the node is not found.
+        """
+        return self.__nodes.get(uid)
+
+    def get_parent_uid(self, uid: str) -> Optional[str]:
+        """Get unique ID of the parent system.
+
+        Parameters
+        ----------
+        uid : str
+            Unique ID of the node.
+
+        Returns
+        -------
+        Optional[str]
+            Unique ID of the parent system, ``None`` for the root system or if the node
+            is not found.
+        """
+        return self.__parents.get(uid)
+
+    def get_depth(self, uid: str) -> Optional[int]:
+        """Get depth of the node, the root system is at depth ``0``.
+
+        Parameters
+        ----------
+        uid : str
+            Unique ID of the node.
+
+        Returns
+        -------
+        Optional[int]
+            Depth of the node, ``None`` if the node is not found.
+        """
+        return self.__depths.get(uid)
+
+    def get_uids_by_name(self, name: str) -> Tuple[str, ...]:
+        """Get unique IDs of all nodes with the given name except for the root system.
+
+        Parameters
+        ----------
+        name : str
+            Name of the nodes.
+
+        Returns
+        -------
+        Tuple[str, ...]
+            Unique IDs of the nodes in the pre-order of the tree.
+        """
+        return tuple(self.__names.get(name, ()))
+
+    def get_ancestor_uids(self, uid: str) -> Tuple[str, ...]:
+        """Get unique IDs of the ancestors starting from the root system.
+
+        Parameters
+        ----------
+        uid : str
+            Unique ID of the node.
+
+        Returns
+        -------
+        Tuple[str, ...]
+            Unique IDs of the ancestors, empty tuple for the root system or if the node
+            is not found.
+        """
+        ancestors = []
+        parent_uid = self.__parents.get(uid)
+        while parent_uid is not None:
+            ancestors.append(parent_uid)
+            parent_uid = self.__parents[parent_uid]
+        return tuple(reversed(ancestors))
+
+    def is_descendant(self, uid: str, ancestor_uid: str, max_depth: int = -1) -> bool:
+        """Check whether the node is a descendant of the given ancestor.
+
+        Parameters
+        ----------
+        uid : str
+            Unique ID of the node.
+        ancestor_uid : str
+            Unique ID of the ancestor.
+        max_depth : int, optional
+            Maximum depth of the node relative to the ancestor, direct children are at
+            depth ``1``. Defaults to ``-1``, which means unlimited depth.
+
+        Returns
+        -------
+        bool
+            ``True`` if the node is a descendant within the maximum depth, ``False`` otherwise.
+        """
+        depth = self.__depths.get(uid)
+        ancestor_depth = self.__depths.get(ancestor_uid)
+        if depth is None or ancestor_depth is None:
+            return False
+        relative_depth = depth - ancestor_depth
+        if relative_depth < 1 or (max_depth != -1 and relative_depth > max_depth):
+            return False
+        for _ in range(relative_depth):
+            uid = self.__parents[uid]  # type: ignore[assignment]
+        return uid == ancestor_uid
@@ -21,9 +21,9 @@
 # SOFTWARE.
 
 """Module for generation of all server commands."""
-import json
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
 
+from ansys.optislang.core.json_codec import get_json_codec
 from ansys.optislang.core.placeholder_types import PlaceholderType, UserLevel
 from ansys.optislang.core.slot_types import SlotTypeHint
 from ansys.optislang.core.tcp.placeholder_types import PlaceholderTypeTCP, UserLevelTCP
@@ -2526,4 +2526,4 @@ def _to_json(dict: Dict) -> str:
     str
         JSON string.
     """
-    return json.dumps(dict, sort_keys=True, ensure_ascii=False)
+    return get_json_codec().dumps(dict, sort_keys=True)
@@ -0,0 +1,441 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Contains pool of pre-started optiSLang servers."""
+from __future__ import annotations
+
+import atexit
+from enum import Enum
+import logging
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from ansys.optislang.core import utils
+from ansys.optislang.core.communication_channels import CommunicationChannel
+from ansys.optislang.core.errors import OslDisposedError
+from ansys.optislang.core.tcp.osl_server import TcpOslServer
+
+
+class ServerResetMode(Enum):
+    """Ways of resetting a released server before it is handed out again."""
+
+    NEW = 0
+    RESET = 1
+    NONE = 2
+
+
+class PooledServer:
+    """Started optiSLang server owned by a ``TcpOslServerPool``.
+
+    Parameters
+    ----------
+    owner : TcpOslServer
+        Instance which started the server and keeps it running.
+    executable : Optional[Path]
+        Executable of the server, ``None`` for the latest installed version.
+    """
+
+    def __init__(self, owner: TcpOslServer, executable: Optional[Path]) -> None:
+        """Create a new instance of the ``PooledServer`` class."""
+        self.__owner = owner
+        self.__executable = executable
+        self.__created = time.monotonic()
+        self.__last_used = self.__created
+        self.__uses = 0
+
+    @property
+    def age(self) -> float:
+        """Time in seconds since the server was started."""
+        return time.monotonic() - self.__created
+
+    @property
+    def connection_kwargs(self) -> Dict[str, Any]:
+        """Arguments of ``TcpOslServer`` or ``Optislang`` connecting to the server."""
+        if self.__owner.local_server_id is not None:
+            return {
+                "local_server_id": self.__owner.local_server_id,
+                "communication_channel": CommunicationChannel.LOCAL_DOMAIN,
+            }
+        return {
+            "host": self.__owner.host,
+            "port": self.__owner.port,
+            "communication_channel": CommunicationChannel.TCP,
+        }
+
+    @property
+    def executable(self) -> Optional[Path]:
+        """Executable of the server, ``None`` for the latest installed version."""
+        return self.__executable
+
+    @property
+    def idle_time(self) -> float:
+        """Time in seconds since the server was started or last released."""
+        return time.monotonic() - self.__last_used
+
+    @property
+    def owner(self) -> TcpOslServer:
+        """Instance which started the server and keeps it running."""
+        return self.__owner
+
+    @property
+    def uses(self) -> int:
+        """Number of times the server was handed out."""
+        return self.__uses
+
+    def _mark_acquired(self) -> None:
+        self.__uses += 1
+
+    def _mark_released(self) -> None:
+        self.__last_used = time.monotonic()
+
+
+class TcpOslServerPool:
+    """Keeps pre-started optiSLang servers ready to be used by new ``Optislang`` instances.
+
+    Starting an optiSLang server takes seconds. The pool starts servers in advance and keeps
+    ``size`` idle servers for each executable. An ``Optislang`` instance created with
+    the ``server_pool`` argument connects to an idle server and returns it to the pool
+    when disposed. Returned servers are reset and used again, until they are older than
+    ``max_lifetime``. Idle servers are checked periodically, servers which are not alive
+    or too old are shut down and replaced.
+
+    Parameters
+    ----------
+    size : int, optional
+        Number of idle servers kept for each executable. Defaults to ``2``.
+    max_lifetime : Optional[float], optional
+        Time in seconds after which a server is shut down instead of being reused.
+        If ``None``, servers are reused until they fail. Defaults to ``3600``.
+    health_check_interval : Optional[float], optional
+        Interval in seconds of checking and refilling the idle servers. If ``None``,
+        idle servers are checked only when they are handed out. Defaults to ``30``.
+    reset_mode : ServerResetMode, optional
+        Way of resetting a returned server. ``ServerResetMode.NEW`` creates a new project,
+        ``ServerResetMode.RESET`` resets the current project. Defaults to
+        ``ServerResetMode.NEW``.
+    server_factory : Optional[Callable[..., TcpOslServer]], optional
+        Function starting a server, called with the same arguments as ``TcpOslServer``.
+        If ``None``, the ``TcpOslServer`` class is used. Defaults to ``None``.
+    **kwargs
+        Additional keyword arguments used to start the servers, e.g. ``ini_timeout``,
+        ``port_range`` or ``communication_channel``.
+
+    Raises
+    ------
+    ValueError
+        Raised when an argument is invalid.
+
+    Examples
+    --------
+    Create short-lived ``Optislang`` instances using pre-started servers.
+
+    >>> from ansys.optislang.core import Optislang
+    >>> from ansys.optislang.core.tcp.server_pool import TcpOslServerPool
+    >>> pool = TcpOslServerPool(size=2)
+    >>> pool.fill()
+    >>> with Optislang(server_pool=pool) as osl:
+    ...     print(osl.application.project.get_status())
+    >>> pool.dispose()
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_lifetime: Optional[float] = 3600,
+        health_check_interval: Optional[float] = 30,
+        reset_mode: ServerResetMode = ServerResetMode.NEW,
+        server_factory: Optional[Callable[..., TcpOslServer]] = None,
+        **kwargs,
+    ) -> None:
+        """Create a new instance of the ``TcpOslServerPool`` class."""
+        if size < 0:
+            raise ValueError(f"Size of the pool must not be negative, got {size}.")
+        if max_lifetime is not None and max_lifetime <= 0:
+            raise ValueError(f"Maximum lifetime must be positive, got {max_lifetime}.")
+        if health_check_interval is not None and health_check_interval <= 0:
+            raise ValueError(
+                f"Health check interval must be positive, got {health_check_interval}."
+            )
+        self.__size = size
+        self.__max_lifetime = max_lifetime
+        self.__health_check_interval = health_check_interval
+        self.__reset_mode = reset_mode
+        self.__server_factory = server_factory if server_factory is not None else TcpOslServer
+        self.__kwargs = kwargs
+        self.__logger = logging.getLogger(__name__)
+        self.__lock = threading.Lock()
+        self.__idle: Dict[Optional[Path], List[PooledServer]] = {}
+        self.__leased: List[PooledServer] = []
+        self.__disposed = False
+        self.__wake_maintenance = threading.Event()
+        self.__maintenance_thread: Optional[threading.Thread] = None
+        if health_check_interval is not None:
+            self.__maintenance_thread = threading.Thread(
+                target=self.__run_maintenance,
+                name="PyOptiSLang.ServerPoolMaintenance",
+                daemon=True,
+            )
+            self.__maintenance_thread.start()
+        atexit.register(self.dispose)
+
+    @property
+    def leased_count(self) -> int:
+        """Number of servers handed out and not yet released."""
+        return len(self.__leased)
+
+    @property
+    def size(self) -> int:
+        """Number of idle servers kept for each executable."""
+        return self.__size
+
+    def get_idle_count(
+        self,
+        executable: Optional[Union[str, Path]] = None,
+        osl_version: Optional[Union[int, str]] = None,
+    ) -> int:
+        """Get number of idle servers of the executable.
+
+        Parameters
+        ----------
+        executable : Optional[Union[str, Path]], optional
+            Path to the executable. Defaults to ``None``.
+        osl_version : Optional[Union[int, str]], optional
+            Version used to find the executable, if the executable is not given.
+            Defaults to ``None``, the latest installed version.
+
+        Returns
+        -------
+        int
+            Number of idle servers.
+        """
+        key = self.__get_key(executable, osl_version)
+        with self.__lock:
+            return len(self.__idle.get(key, []))
+
+    def acquire(
+        self,
+        executable: Optional[Union[str, Path]] = None,
+        osl_version: Optional[Union[int, str]] = None,
+    ) -> PooledServer:
+        """Hand out an idle server, a new server is started if none is idle.
+
+        Parameters
+        ----------
+        executable : Optional[Union[str, Path]], optional
+            Path to the executable. Defaults to ``None``.
+        osl_version : Optional[Union[int, str]], optional
+            Version used to find the executable, if the executable is not given.
+            Defaults to ``None``, the latest installed version.
+
+        Returns
+        -------
+        PooledServer
+            Server to connect to, which must be returned by the ``release`` method.
+
+        Raises
+        ------
+        OslDisposedError
+            Raised when the pool was already disposed.
+        OslServerStartError
+            Raised when a new server failed to start.
+        """
+        key = self.__get_key(executable, osl_version)
+        while True:
+            with self.__lock:
+                if self.__disposed:
+                    raise OslDisposedError("Cannot acquire server, pool was already disposed.")
+                idle = self.__idle.setdefault(key, [])
+                server = idle.pop(0) if idle else None
+            if server is None:
+                server = self.__start_server(key)
+                break
+            if self.__is_usable(server):
+                break
+            self.__shutdown_server(server)
+        server._mark_acquired()
+        with self.__lock:
+            self.__leased.append(server)
+        # replace the handed out server in background
+        self.__wake_maintenance.set()
+        return server
+
+    def dispose(self) -> None:
+        """Shut down all idle servers and stop the maintenance.
+
+        Servers handed out are shut down when they are released.
+        """
+        with self.__lock:
+            if self.__disposed:
+                return
+            self.__disposed = True
+            servers = [server for idle in self.__idle.values() for server in idle]
+            self.__idle.clear()
+        self.__wake_maintenance.set()
+        if self.__maintenance_thread is not None:
+            self.__maintenance_thread.join()
+        for server in servers:
+            self.__shutdown_server(server)
+        atexit.unregister(self.dispose)
+
+    def fill(
+        self,
+        executable: Optional[Union[str, Path]] = None,
+        osl_version: Optional[Union[int, str]] = None,
+    ) -> None:
+        """Start servers until ``size`` servers of the executable are idle.
+
+        Parameters
+        ----------
+        executable : Optional[Union[str, Path]], optional
+            Path to the executable. Defaults to ``None``.
+        osl_version : Optional[Union[int, str]], optional
+            Version used to find the executable, if the executable is not given.
+            Defaults to ``None``, the latest installed version.
+
+        Raises
+        ------
+        OslServerStartError
+            Raised when a server failed to start.
+        """
+        self.__fill(self.__get_key(executable, osl_version))
+
+    def release(self, server: PooledServer) -> None:
+        """Return a server handed out by the ``acquire`` method.
+
+        The server is reset and kept idle, unless it is not alive anymore, is older than
+        ``max_lifetime`` or ``size`` servers are already idle.
+
+        Parameters
+        ----------
+        server : PooledServer
+            Server to be returned.
+        """
+        with self.__lock:
+            if server in self.__leased:
+                self.__leased.remove(server)
+        if self.__disposed or self.__is_expired(server) or not self.__reset_server(server):
+            self.__shutdown_server(server)
+            return
+        server._mark_released()
+        with self.__lock:
+            idle = self.__idle.setdefault(server.executable, [])
+            if not self.__disposed and len(idle) < self.__size:
+                idle.append(server)
+                return
+        self.__shutdown_server(server)
+
+    def __fill(self, key: Optional[Path]) -> None:
+        """Start servers of the executable until ``size`` servers are idle."""
+        while True:
+            with self.__lock:
+                if self.__disposed or len(self.__idle.setdefault(key, [])) >= self.__size:
+                    return
+            server = self.__start_server(key)
+            with self.__lock:
+                idle = self.__idle.setdefault(key, [])
+                if not self.__disposed and len(idle) < self.__size:
+                    idle.append(server)
+                    continue
+            self.__shutdown_server(server)
+            return
+
+    def __get_key(
+        self, executable: Optional[Union[str, Path]], osl_version: Optional[Union[int, str]]
+    ) -> Optional[Path]:
+        """Get executable identifying the idle servers."""
+        if executable is not None:
+            return Path(executable)
+        if osl_version is not None:
+            osl_exec = utils.get_osl_exec(osl_version)
+            if osl_exec is None:
+                raise ValueError(f"optiSLang executable of version {osl_version} not found.")
+            return osl_exec[1]
+        return None
+
+    def __is_expired(self, server: PooledServer) -> bool:
+        """Determine whether the server is older than the maximum lifetime."""
+        return self.__max_lifetime is not None and server.age > self.__max_lifetime
+
+    def __is_usable(self, server: PooledServer) -> bool:
+        """Determine whether the idle server may be handed out."""
+        if self.__is_expired(server):
+            return False
+        try:
+            return server.owner.get_server_is_alive()
+        except Exception as ex:
+            self.__logger.debug(f"Pooled server is not alive: {ex}")
+            return False
+
+    def __reset_server(self, server: PooledServer) -> bool:
+        """Reset the released server, return ``False`` if it failed."""
+        try:
+            if self.__reset_mode == ServerResetMode.NEW:
+                server.owner.new()
+            elif self.__reset_mode == ServerResetMode.RESET:
+                server.owner.reset()
+            return server.owner.get_server_is_alive()
+        except Exception as ex:
+            self.__logger.warning(f"Released server could not be reset: {ex}")
+            return False
+
+    def __run_maintenance(self) -> None:
+        """Periodically replace idle servers which are not usable and refill the pool."""
+        while True:
+            self.__wake_maintenance.wait(self.__health_check_interval)
+            self.__wake_maintenance.clear()
+            with self.__lock:
+                if self.__disposed:
+                    return
+                keys = list(self.__idle)
+            for key in keys:
+                with self.__lock:
+                    servers = list(self.__idle.get(key, []))
+                for server in servers:
+                    if self.__disposed or self.__is_usable(server):
+                        continue
+                    with self.__lock:
+                        if server not in self.__idle.get(key, []):
+                            continue
+                        self.__idle[key].remove(server)
+                    self.__shutdown_server(server)
+                try:
+                    self.__fill(key)
+                except Exception as ex:
+                    self.__logger.warning(f"Pool of servers could not be refilled: {ex}")
+
+    def __shutdown_server(self, server: PooledServer) -> None:
+        """Shut down the server, errors are only logged."""
+        try:
+            server.owner.shutdown(force=True)
+        except Exception as ex:
+            self.__logger.warning(f"Pooled server could not be shut down: {ex}")
+        finally:
+            server.owner.dispose()
+
+    def __start_server(self, key: Optional[Path]) -> PooledServer:
+        """Start a new server of the executable."""
+        self.__logger.debug(f"Starting pooled server of executable: {key}")
+        # the owner keeps the server running while clients connect and disconnect
+        owner = self.__server_factory(executable=key, shutdown_on_finished=False, **self.__kwargs)
+        return PooledServer(owner, key)
@@ -21,9 +21,10 @@
 # SOFTWARE.
 
 """Module for generation of all server queries."""
-import json
 from typing import Any, Dict, Optional
 
+from ansys.optislang.core.json_codec import get_json_codec
+
 QueryArgs = Dict[str, Any]
 
 _ACTOR_INFO = "ACTOR_INFO"
@@ -984,4 +985,4 @@ def _to_json(dict: Dict) -> str:
     str
         JSON string.
     """
-    return json.dumps(dict, sort_keys=True, ensure_ascii=False)
+    return get_json_codec().dumps(dict, sort_keys=True)
@@ -0,0 +1,344 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Contains recording of sessions with the optiSLang server."""
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+import threading
+import time
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+from ansys.optislang.core.encoding import force_text
+from ansys.optislang.core.json_codec import JsonCodec, get_json_codec
+
+SESSION_RECORDING_FORMAT = "pyoptislang-session"
+SESSION_RECORDING_VERSION = 1
+
+_REQUEST = "r"
+_NOTIFICATION = "n"
+
+
+class RecordedRequest(NamedTuple):
+    """Request sent to the optiSLang server and its response.
+
+    Attributes
+    ----------
+    time : float
+        Time of sending the request in seconds since the start of the recording.
+    duration : float
+        Time in seconds until the response was received.
+    request : str
+        Request as sent.
+    response : str
+        Response as received.
+    """
+
+    time: float
+    duration: float
+    request: str
+    response: str
+
+
+class RecordedNotification(NamedTuple):
+    """Push notification received from the optiSLang server.
+
+    Attributes
+    ----------
+    time : float
+        Time of receiving the notification in seconds since the start of the recording.
+    notification : str
+        Notification as received.
+    """
+
+    time: float
+    notification: str
+
+
+class SessionRecorder:
+    """Records requests, responses and push notifications of a session to a file.
+
+    The file is a gzip compressed sequence of JSON lines. The first line contains the header
+    with the format version and ``metadata``, each following line one request with its
+    response or one push notification. Identical notifications received by several listeners
+    between two requests are recorded only once, as the optiSLang server sends each of them
+    to all subscribed listeners. The file is complete only after the recorder is closed.
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        Path to the recording file, an existing file is overwritten.
+    metadata : Optional[Mapping[str, Any]], optional
+        Metadata of the session stored in the header, e.g. version of optiSLang.
+        Defaults to ``None``.
+    json_codec : Union[str, JsonCodec, None], optional
+        Codec used to encode the records. If ``None``, the default codec is used.
+        Defaults to ``None``.
+
+    Examples
+    --------
+    Record a session and replay it.
+
+    >>> from ansys.optislang.core import Optislang
+    >>> from ansys.optislang.core.tcp.stand_in_server import ReplayOslServer
+    >>> osl = Optislang(project_path="calculator.opf")
+    >>> recorder = osl.osl_server.enable_recording("session.jsonl.gz")
+    >>> osl.osl_server.start()
+    >>> osl.dispose()
+    >>> with ReplayOslServer("session.jsonl.gz") as server:
+    ...     osl_server = server.create_osl_server()
+    ...     osl_server.start()
+    ...     osl_server.dispose()
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        metadata: Optional[Mapping[str, Any]] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+    ) -> None:
+        """Create a new instance of the ``SessionRecorder`` class and open the file."""
+        self.__path = Path(path)
+        self.__json_codec = get_json_codec(json_codec)
+        self.__lock = threading.Lock()
+        self.__start_time = time.perf_counter()
+        self.__recent_notifications: set = set()
+        self.__requests = 0
+        self.__notifications = 0
+        self.__file = gzip.open(self.__path, "wt", encoding="utf-8")
+        self.__write(
+            {
+                "format": SESSION_RECORDING_FORMAT,
+                "metadata": dict(metadata) if metadata is not None else {},
+                "start": time.time(),
+                "version": SESSION_RECORDING_VERSION,
+            }
+        )
+
+    def __enter__(self) -> SessionRecorder:
+        """Enter the context."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the recorder when leaving the context."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Return printable representation of the recorder."""
+        return f"{self.__class__.__name__}(path={self.__path})"
+
+    @property
+    def closed(self) -> bool:
+        """Whether the recorder is closed.
+
+        Returns
+        -------
+        bool
+            ``True`` if closed, ``False`` otherwise.
+        """
+        return self.__file.closed
+
+    @property
+    def notifications(self) -> int:
+        """Number of recorded push notifications.
+
+        Returns
+        -------
+        int
+            Number of notifications.
+        """
+        return self.__notifications
+
+    @property
+    def path(self) -> Path:
+        """Path to the recording file.
+
+        Returns
+        -------
+        Path
+            Path to the file.
+        """
+        return self.__path
+
+    @property
+    def requests(self) -> int:
+        """Number of recorded requests.
+
+        Returns
+        -------
+        int
+            Number of requests.
+        """
+        return self.__requests
+
+    def close(self) -> None:
+        """Close the recording file, further records are ignored."""
+        with self.__lock:
+            self.__file.close()
+
+    def record_notification(self, notification: Union[str, bytes, bytearray]) -> None:
+        """Record push notification received just now.
+
+        Parameters
+        ----------
+        notification : Union[str, bytes, bytearray]
+            Notification as received.
+        """
+        notification = _to_text(notification)
+        with self.__lock:
+            if self.__file.closed or notification in self.__recent_notifications:
+                return
+            self.__recent_notifications.add(notification)
+            self.__notifications += 1
+            self.__write([_NOTIFICATION, self.__get_time(), notification])
+
+    def record_request(
+        self,
+        request: Union[str, bytes, bytearray],
+        response: Union[str, bytes, bytearray],
+        duration: float,
+    ) -> None:
+        """Record request whose response was received just now.
+
+        Parameters
+        ----------
+        request : Union[str, bytes, bytearray]
+            Request as sent.
+        response : Union[str, bytes, bytearray]
+            Response as received.
+        duration : float
+            Time in seconds between sending the request and receiving the response.
+        """
+        request = _to_text(request)
+        response = _to_text(response)
+        with self.__lock:
+            if self.__file.closed:
+                return
+            self.__recent_notifications.clear()
+            self.__requests += 1
+            self.__write(
+                [_REQUEST, max(0.0, self.__get_time() - duration), duration, request, response]
+            )
+
+    def __get_time(self) -> float:
+        """Get time since the start of the recording."""
+        return round(time.perf_counter() - self.__start_time, 6)
+
+    def __write(self, record: Any) -> None:
+        """Write record as a single line."""
+        self.__file.write(self.__json_codec.dumps(record))
+        self.__file.write("\n")
+
+
+class SessionRecording:
+    """Session recorded by the ``SessionRecorder`` class.
+
+    Parameters
+    ----------
+    records : List[Union[RecordedRequest, RecordedNotification]]
+        Requests and push notifications in the order of recording.
+    metadata : Optional[Dict[str, Any]], optional
+        Metadata of the session. Defaults to ``None``.
+    """
+
+    def __init__(
+        self,
+        records: List[Union[RecordedRequest, RecordedNotification]],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Create a new instance of the ``SessionRecording`` class."""
+        self.__records = tuple(records)
+        self.__metadata = metadata if metadata is not None else {}
+
+    def __len__(self) -> int:
+        """Get number of records."""
+        return len(self.__records)
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Metadata of the session, e.g. version of optiSLang.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Metadata of the session.
+        """
+        return self.__metadata
+
+    @property
+    def records(self) -> Tuple[Union[RecordedRequest, RecordedNotification], ...]:
+        """Requests and push notifications in the order of recording.
+
+        Returns
+        -------
+        Tuple[Union[RecordedRequest, RecordedNotification], ...]
+            Records of the session.
+        """
+        return self.__records
+
+    @classmethod
+    def from_file(
+        cls, path: Union[str, Path], json_codec: Union[str, JsonCodec, None] = None
+    ) -> SessionRecording:
+        """Read session recorded by the ``SessionRecorder`` class.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            Path to the recording file.
+        json_codec : Union[str, JsonCodec, None], optional
+            Codec used to decode the records. If ``None``, the default codec is used.
+            Defaults to ``None``.
+
+        Returns
+        -------
+        SessionRecording
+            Recorded session.
+
+        Raises
+        ------
+        ValueError
+            Raised when the file is not a session recording or its version is not supported.
+        """
+        codec = get_json_codec(json_codec)
+        records: List[Union[RecordedRequest, RecordedNotification]] = []
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            header = codec.loads(file.readline() or "null")
+            if not isinstance(header, dict) or header.get("format") != SESSION_RECORDING_FORMAT:
+                raise ValueError(f"File `{path}` is not a session recording.")
+            if header.get("version") != SESSION_RECORDING_VERSION:
+                raise ValueError(
+                    f"Version {header.get('version')} of session recording is not supported."
+                )
+            for line in file:
+                record = codec.loads(line)
+                if record[0] == _REQUEST:
+                    records.append(RecordedRequest(*record[1:]))
+                elif record[0] == _NOTIFICATION:
+                    records.append(RecordedNotification(*record[1:]))
+        return cls(records, header.get("metadata"))
+
+
+def _to_text(data: Union[str, bytes, bytearray]) -> str:
+    return data if isinstance(data, str) else force_text(data)
@@ -0,0 +1,1013 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Contains local stand-in of the optiSLang server for testing and benchmarking."""
+from __future__ import annotations
+
+import collections
+import copy
+from enum import Enum
+import json
+from pathlib import Path
+import socket
+import struct
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from ansys.optislang.core import utils
+from ansys.optislang.core.communication_channels import CommunicationChannel
+from ansys.optislang.core.json_codec import JsonCodec, get_json_codec
+from ansys.optislang.core.tcp.local_socket import LocalClientSocket, LocalServerSocket
+from ansys.optislang.core.tcp.osl_server import TcpOslServer
+from ansys.optislang.core.tcp.project_tree_index import ProjectTreeIndex
+from ansys.optislang.core.tcp.session_recording import (
+    RecordedNotification,
+    RecordedRequest,
+    SessionRecording,
+)
+
+QueryHandler = Callable[[dict], Any]
+CommandHandler = Callable[[dict], dict]
+
+_Connection = Union[socket.socket, LocalClientSocket]
+
+_HEADER = struct.Struct("!QQ")
+_LISTENER_COMMANDS = ("REFRESH_LISTENER_REGISTRATION", "REGISTER_LISTENER", "UNREGISTER_LISTENER")
+
+
+class RegisteredListener(NamedTuple):
+    """Listener registered to the stand-in server."""
+
+    host: Optional[str]
+    port: Optional[int]
+    local_server_id: Optional[str]
+    notifications: Optional[List[str]]
+
+
+def create_project_tree(systems: int = 1, nodes_per_system: int = 1) -> dict:
+    """Create full project tree of a synthetic project.
+
+    The root system of the project contains ``systems`` parametric systems, each of them
+    containing ``nodes_per_system`` calculator nodes. Unique IDs of the nodes are
+    ``"root"``, ``"system-<i>"`` and ``"node-<i>-<j>"``.
+
+    Parameters
+    ----------
+    systems : int, optional
+        Number of parametric systems. Defaults to ``1``.
+    nodes_per_system : int, optional
+        Number of nodes in each parametric system. Defaults to ``1``.
+
+    Returns
+    -------
+    dict
+        Full project tree with properties, as returned by the
+        ``FULL_PROJECT_TREE_WITH_PROPERTIES`` query.
+    """
+    return {
+        "projects": [
+            {
+                "connections": [],
+                "system": {
+                    "kind": "system",
+                    "name": "Root",
+                    "nodes": [
+                        {
+                            "kind": "system",
+                            "name": f"Sensitivity {i}",
+                            "nodes": [
+                                {
+                                    "kind": "actor",
+                                    "name": f"Calculator {i}.{j}",
+                                    "properties": {
+                                        "ExecutionOptions": {"value": 1},
+                                        "MaxParallel": {"value": 1},
+                                    },
+                                    "type": "CalculatorSet",
+                                    "uid": f"node-{i}-{j}",
+                                }
+                                for j in range(1, nodes_per_system + 1)
+                            ],
+                            "properties": {
+                                "ExecutionOptions": {"value": 1},
+                                "ParameterManager": {},
+                            },
+                            "type": "Sensitivity",
+                            "uid": f"system-{i}",
+                        }
+                        for i in range(1, systems + 1)
+                    ],
+                    "properties": {},
+                    "type": "RunnableSystem",
+                    "uid": "root",
+                },
+            }
+        ]
+    }
+
+
+def create_status_info(
+    designs: int, parameters: int = 2, responses: int = 1, hid: str = "0"
+) -> dict:
+    """Create status info of a parametric system state with synthetic designs.
+
+    Parameters
+    ----------
+    designs : int
+        Number of designs.
+    parameters : int, optional
+        Number of parameters ``X1``, ``X2``, ... of each design. Defaults to ``2``.
+    responses : int, optional
+        Number of responses ``Y1``, ``Y2``, ... of each design. Defaults to ``1``.
+    hid : str, optional
+        Hierarchical ID of the state, used as prefix of the design IDs. Defaults to ``"0"``.
+
+    Returns
+    -------
+    dict
+        Status info, as returned by the ``ACTOR_STATUS_INFO`` query.
+    """
+    ids = [f"{hid}.{i}" for i in range(1, designs + 1)]
+    return {
+        "design_status": [
+            {
+                "directory": f"Design{i:04d}",
+                "feasible": True,
+                "id": id_,
+                "pareto_design": False,
+                "status": "succeeded",
+            }
+            for i, id_ in enumerate(ids, start=1)
+        ],
+        "designs": {
+            "constraint_names": [],
+            "limit_state_names": [],
+            "objective_names": ["obj"],
+            "parameter_names": [f"X{k}" for k in range(1, parameters + 1)],
+            "response_names": [f"Y{k}" for k in range(1, responses + 1)],
+            "values": [
+                {
+                    "constraint_values": [],
+                    "hid": id_,
+                    "limit_state_values": [],
+                    "objective_values": [float(i)],
+                    "parameter_values": [i + k * 1e-3 for k in range(1, parameters + 1)],
+                    "response_values": [i * float(k) for k in range(1, responses + 1)],
+                }
+                for i, id_ in enumerate(ids, start=1)
+            ],
+        },
+        "hid": hid,
+        "status": "success",
+    }
+
+
+class StandInOslServer:
+    """Local stand-in of the optiSLang server speaking the optiSLang server protocol.
+
+    The stand-in server listens on a local TCP port or local domain socket, receives requests
+    framed the same way as by the optiSLang server and answers a subset of queries and commands
+    from a synthetic project. It allows to exercise and benchmark the ``TcpOslServer`` class and
+    the node proxies without an optiSLang installation. Supported queries are ``SERVER_INFO``,
+    ``SERVER_IS_ALIVE``, ``BASIC_PROJECT_INFO``, ``FULL_PROJECT_TREE``,
+    ``FULL_PROJECT_TREE_WITH_PROPERTIES``, ``ACTOR_INFO``, ``ACTOR_PROPERTIES``,
+    ``ACTOR_STATES`` and ``ACTOR_STATUS_INFO``. Supported commands are ``REGISTER_LISTENER``,
+    ``REFRESH_LISTENER_REGISTRATION``, ``UNREGISTER_LISTENER``, ``SET_DESIGNS``, ``START``,
+    ``STOP`` and ``RESET``. Handlers of other queries and commands can be added and the
+    default ones replaced or removed by the :py:meth:`set_query_handler` and
+    :py:meth:`set_command_handler` methods. Unsupported queries and commands fail.
+
+    Push notifications are sent to the registered listeners, either by the
+    :py:meth:`send_notification` method or when executing the project. Responses to requests
+    can also be created by overriding the :py:meth:`_create_response` method.
+
+    Parameters
+    ----------
+    project_tree : Optional[dict], optional
+        Full project tree with properties. If ``None``, the project tree created by
+        :py:func:`create_project_tree` with default arguments is used. Defaults to ``None``.
+    designs : int, optional
+        Number of synthetic designs of each parametric system. Defaults to ``10``.
+    parameters : int, optional
+        Number of parameters of each synthetic design. Defaults to ``2``.
+    responses : int, optional
+        Number of responses of each synthetic design. Defaults to ``1``.
+    latency : Union[float, Callable[[dict], float]], optional
+        Delay in seconds before answering each request, or function returning the delay for
+        the decoded request. Defaults to ``0``.
+    version : str, optional
+        Version of optiSLang reported by the ``SERVER_INFO`` query.
+        Defaults to ``"25.1.0 (123)"``.
+    communication_channel : CommunicationChannel, optional
+        Communication channel to listen on. Defaults to ``CommunicationChannel.TCP``.
+    host : str, optional
+        Address to listen on, used by the TCP channel only. Defaults to ``"127.0.0.1"``.
+    port : int, optional
+        Port to listen on, used by the TCP channel only. Defaults to ``0``, which selects
+        a free port.
+    local_server_id : Optional[str], optional
+        ID of the local domain server, used by the local domain channel only. If ``None``,
+        a new ID is generated. Defaults to ``None``.
+    json_codec : Union[str, JsonCodec, None], optional
+        Codec used to decode requests and encode responses. If ``None``, the default codec
+        is used. Defaults to ``None``.
+
+    Examples
+    --------
+    Benchmark the client against a project with 100 systems.
+
+    >>> from ansys.optislang.core.tcp.stand_in_server import (
+    ...     StandInOslServer, create_project_tree
+    ... )
+    >>> with StandInOslServer(project_tree=create_project_tree(systems=100)) as server:
+    ...     osl_server = server.create_osl_server()
+    ...     project_tree = osl_server.get_full_project_tree_with_properties()
+    ...     osl_server.dispose()
+    >>> print(server.queries["FULL_PROJECT_TREE_WITH_PROPERTIES"])
+    1
+    """
+
+    def __init__(
+        self,
+        project_tree: Optional[dict] = None,
+        designs: int = 10,
+        parameters: int = 2,
+        responses: int = 1,
+        latency: Union[float, Callable[[dict], float]] = 0,
+        version: str = "25.1.0 (123)",
+        communication_channel: CommunicationChannel = CommunicationChannel.TCP,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        local_server_id: Optional[str] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+    ) -> None:
+        """Create a new instance of the ``StandInOslServer`` class and start listening."""
+        self.__project_tree = project_tree if project_tree is not None else create_project_tree()
+        self.__project_tree_index = ProjectTreeIndex.from_project_tree(self.__project_tree)
+        self.__designs = designs
+        self.__parameters = parameters
+        self.__responses = responses
+        self.__latency = latency
+        self.__version = version
+        self.__json_codec = get_json_codec(json_codec)
+        self.__state = "IDLE"
+        self.__lock = threading.Lock()
+        self.__listeners: Dict[str, RegisteredListener] = {}
+        self.__received_designs: Dict[str, List[dict]] = collections.defaultdict(list)
+        # encoded responses of queries, cleared by any command
+        self.__responses_cache: Dict[bytes, bytes] = {}
+        self.__query_handlers: Dict[str, QueryHandler] = {
+            "ACTOR_INFO": self.__get_actor_info,
+            "ACTOR_PROPERTIES": self.__get_actor_properties,
+            "ACTOR_STATES": self.__get_actor_states,
+            "ACTOR_STATUS_INFO": self.__get_actor_status_info,
+            "BASIC_PROJECT_INFO": self.__get_basic_project_info,
+            "FULL_PROJECT_TREE": self.__get_full_project_tree,
+            "FULL_PROJECT_TREE_WITH_PROPERTIES": lambda query: self.__project_tree,
+            "SERVER_INFO": lambda query: {"application": {"version": self.__version}},
+            "SERVER_IS_ALIVE": lambda query: {"status": "success"},
+        }
+        self.__command_handlers: Dict[str, CommandHandler] = {
+            "REFRESH_LISTENER_REGISTRATION": self.__refresh_listener_registration,
+            "REGISTER_LISTENER": self.__register_listener,
+            "RESET": self.__reset,
+            "SET_DESIGNS": self.__set_designs,
+            "START": self.__start,
+            "STOP": self.__stop,
+            "UNREGISTER_LISTENER": self.__unregister_listener,
+        }
+        self.queries: collections.Counter = collections.Counter()
+        self.commands: collections.Counter = collections.Counter()
+        self.requests = 0
+        self.connections = 0
+
+        self.__communication_channel = communication_channel
+        self.__socket: Optional[socket.socket] = None
+        self.__local_server_socket: Optional[LocalServerSocket] = None
+        if communication_channel == CommunicationChannel.LOCAL_DOMAIN:
+            self.__local_server_socket = LocalServerSocket()
+            self.__local_server_socket.bind_and_listen(
+                local_server_id or utils.generate_local_server_id(), backlog=64
+            )
+        else:
+            self.__socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.__socket.bind((host, port))
+            self.__socket.listen(64)
+            self.__socket.settimeout(0.2)
+        self.__running = True
+        self.__thread = threading.Thread(target=self.__serve, name="StandInOslServer", daemon=True)
+        self.__thread.start()
+
+    def __enter__(self) -> StandInOslServer:
+        """Enter the context."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Stop the server when leaving the context."""
+        self.close()
+
+    @property
+    def communication_channel(self) -> CommunicationChannel:
+        """Communication channel the server listens on.
+
+        Returns
+        -------
+        CommunicationChannel
+            Communication channel of the server.
+        """
+        return self.__communication_channel
+
+    @property
+    def host(self) -> Optional[str]:
+        """Address the server listens on.
+
+        Returns
+        -------
+        Optional[str]
+            Address of the server, ``None`` for the local domain channel.
+        """
+        return self.__socket.getsockname()[0] if self.__socket is not None else None
+
+    @property
+    def port(self) -> Optional[int]:
+        """Port the server listens on.
+
+        Returns
+        -------
+        Optional[int]
+            Port of the server, ``None`` for the local domain channel.
+        """
+        return self.__socket.getsockname()[1] if self.__socket is not None else None
+
+    @property
+    def local_server_id(self) -> Optional[str]:
+        """ID of the local domain server.
+
+        Returns
+        -------
+        Optional[str]
+            ID of the local domain server, ``None`` for the TCP channel.
+        """
+        if self.__local_server_socket is None:
+            return None
+        return self.__local_server_socket.address
+
+    @property
+    def latency(self) -> Union[float, Callable[[dict], float]]:
+        """Delay in seconds before answering each request.
+
+        Returns
+        -------
+        Union[float, Callable[[dict], float]]
+            Delay or function returning the delay for the decoded request.
+        """
+        return self.__latency
+
+    @latency.setter
+    def latency(self, value: Union[float, Callable[[dict], float]]) -> None:
+        self.__latency = value
+
+    @property
+    def project_state(self) -> str:
+        """State of the project reported by the ``BASIC_PROJECT_INFO`` query.
+
+        Returns
+        -------
+        str
+            State of the project, e.g. ``"IDLE"`` or ``"FINISHED"``.
+        """
+        return self.__state
+
+    @property
+    def project_tree(self) -> dict:
+        """Full project tree with properties of the synthetic project.
+
+        Returns
+        -------
+        dict
+            Full project tree.
+        """
+        return self.__project_tree
+
+    @property
+    def listeners(self) -> Dict[str, RegisteredListener]:
+        """Registered listeners.
+
+        Returns
+        -------
+        Dict[str, RegisteredListener]
+            Address and subscribed notifications of each listener, keyed by the unique ID
+            of the listener.
+        """
+        with self.__lock:
+            return dict(self.__listeners)
+
+    def close(self) -> None:
+        """Stop listening and wait for the server thread to finish."""
+        self.__running = False
+        self.__thread.join()
+        if self.__socket is not None:
+            self.__socket.close()
+        if self.__local_server_socket is not None:
+            self.__local_server_socket.close()
+
+    def create_osl_server(self, **kwargs) -> TcpOslServer:
+        """Create instance of the ``TcpOslServer`` class connected to the stand-in server.
+
+        Parameters
+        ----------
+        **kwargs
+            Arguments of the ``TcpOslServer`` class, overriding the default ones. Automatic
+            refreshing of the listeners registration is disabled by default.
+
+        Returns
+        -------
+        TcpOslServer
+            Instance connected to the stand-in server.
+        """
+        kwargs.setdefault("listeners_refresh_interval", 3600)
+        if self.__communication_channel == CommunicationChannel.LOCAL_DOMAIN:
+            return TcpOslServer(
+                local_server_id=self.local_server_id,
+                communication_channel=CommunicationChannel.LOCAL_DOMAIN,
+                **kwargs,
+            )
+        return TcpOslServer(
+            host=self.host,
+            port=self.port,
+            communication_channel=CommunicationChannel.TCP,
+            **kwargs,
+        )
+
+    def get_received_designs(self, uid: str) -> List[dict]:
+        """Get designs received by the ``SET_DESIGNS`` command.
+
+        Parameters
+        ----------
+        uid : str
+            Unique ID of the actor.
+
+        Returns
+        -------
+        List[dict]
+            Received designs in the order of receiving.
+        """
+        with self.__lock:
+            return list(self.__received_designs.get(uid, []))
+
+    def send_notification(self, type_: str, **data: Any) -> int:
+        """Send push notification to the registered listeners subscribed to it.
+
+        Parameters
+        ----------
+        type_ : str
+            Type of the notification, e.g. ``"ACTOR_DATA_CHANGED"``.
+        **data
+            Additional data of the notification, e.g. ``uid`` of the actor.
+
+        Returns
+        -------
+        int
+            Number of listeners which acknowledged the notification.
+        """
+        message = self.__json_codec.dumps({"type": type_, **data}).encode()
+        delivered = 0
+        for listener in self.listeners.values():
+            notifications = listener.notifications
+            if notifications is not None and not {type_, "ALL"} & set(notifications):
+                continue
+            connection: Optional[_Connection] = None
+            try:
+                if listener.local_server_id is not None:
+                    connection = LocalClientSocket()
+                    connection.connect(listener.local_server_id, timeout=5)
+                else:
+                    connection = socket.create_connection((listener.host, listener.port), timeout=5)
+                _send_all(connection, _HEADER.pack(len(message), len(message)) + message)
+                # wait for the acknowledgement, i.e. until the notification was received
+                _recv_exact(connection, _HEADER.size)
+                delivered += 1
+            except OSError:
+                pass
+            finally:
+                if connection is not None:
+                    connection.close()
+        return delivered
+
+    def set_command_handler(self, command: str, handler: Optional[CommandHandler]) -> None:
+        """Set handler of the command.
+
+        Parameters
+        ----------
+        command : str
+            Name of the command, e.g. ``"SET_DESIGNS"``.
+        handler : Optional[Callable[[dict], dict]]
+            Function taking the decoded command and returning its result. If ``None``,
+            the command is not supported anymore.
+        """
+        with self.__lock:
+            if handler is None:
+                self.__command_handlers.pop(command, None)
+            else:
+                self.__command_handlers[command] = handler
+
+    def set_query_handler(self, query: str, handler: Optional[QueryHandler]) -> None:
+        """Set handler of the query.
+
+        Parameters
+        ----------
+        query : str
+            Name of the query, e.g. ``"ACTOR_INFO"``.
+        handler : Optional[Callable[[dict], Any]]
+            Function taking the decoded query and returning the response. Responses of queries
+            are cached until the next command is received. If ``None``, the query is not
+            supported anymore.
+        """
+        with self.__lock:
+            if handler is None:
+                self.__query_handlers.pop(query, None)
+            else:
+                self.__query_handlers[query] = handler
+            self.__responses_cache.clear()
+
+    def __serve(self) -> None:
+        """Accept connections and handle each of them by a separate thread."""
+        while self.__running:
+            connection: _Connection
+            try:
+                if self.__local_server_socket is not None:
+                    connection, _ = self.__local_server_socket.accept(timeout=0.2)
+                elif self.__socket is not None:
+                    connection, _ = self.__socket.accept()
+                    # answers to pipelined requests must not wait for acknowledgements
+                    connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except TimeoutError:
+                continue
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self.__handle, args=(connection,), daemon=True).start()
+
+    def _create_response(self, request: dict, raw_request: bytes) -> bytes:
+        """Create encoded response to the request.
+
+        Parameters
+        ----------
+        request : dict
+            Decoded request.
+        raw_request : bytes
+            Request as received.
+
+        Returns
+        -------
+        bytes
+            UTF-8 encoded response.
+        """
+        with self.__lock:
+            if "What" in request:
+                response = self.__responses_cache.get(raw_request)
+                if response is None:
+                    handler = self.__query_handlers.get(request["What"])
+                    if handler is None:
+                        return self._encode(_failure(f"Unknown query: {request['What']}."))
+                    response = self.__responses_cache[raw_request] = self._encode(handler(request))
+                return response
+            self.__responses_cache.clear()
+            results = []
+            for command in request["projects"][0]["commands"]:
+                command_handler = self.__command_handlers.get(command["command"])
+                if command_handler is None:
+                    results.append(_failure(f"Unknown command: {command['command']}."))
+                else:
+                    results.append(command_handler(command))
+            return self._encode(results)
+
+    def _encode(self, response: Any) -> bytes:
+        """Encode response to JSON."""
+        return self.__json_codec.dumps(response).encode()
+
+    def __handle(self, connection: _Connection) -> None:
+        """Answer requests received by the connection until it is closed."""
+        try:
+            while self.__running:
+                try:
+                    length, _ = _HEADER.unpack(_recv_exact(connection, _HEADER.size))
+                    raw_request = bytes(_recv_exact(connection, length))
+                except OSError:
+                    return
+                request = self.__json_codec.loads(raw_request)
+                with self.__lock:
+                    self.requests += 1
+                    if "What" in request:
+                        self.queries[request["What"]] += 1
+                    else:
+                        self.commands.update(
+                            command["command"] for command in request["projects"][0]["commands"]
+                        )
+                response = self._create_response(request, raw_request)
+                latency = self.__latency(request) if callable(self.__latency) else self.__latency
+                if latency > 0:
+                    time.sleep(latency)
+                try:
+                    _send_all(connection, _HEADER.pack(len(response), len(response)) + response)
+                except OSError:
+                    return
+        finally:
+            connection.close()
+
+    def __get_node(self, query: dict) -> Optional[dict]:
+        """Get node of the synthetic project addressed by the query or command."""
+        return self.__project_tree_index.get_node(query.get("uid", query.get("actor_uid", "")))
+
+    def __get_actor_info(self, query: dict) -> dict:
+        node = self.__get_node(query)
+        if node is None:
+            return _failure("No such actor.")
+        info = {
+            "input_slots": [],
+            "kind": node["kind"],
+            "name": node["name"],
+            "output_slots": [],
+            "status": "Succeeded" if self.__state == "FINISHED" else "Idle",
+            "type": node["type"],
+            "uid": node["uid"],
+        }
+        if node["kind"] == "system":
+            info.update(inner_input_slots=[], inner_output_slots=[])
+        if "ParameterManager" in node.get("properties", {}):
+            info["estimated_designs"] = self.__designs
+        return info
+
+    def __get_actor_properties(self, query: dict) -> dict:
+        node = self.__get_node(query)
+        if node is None:
+            return _failure("No such actor.")
+        return {"properties": node.get("properties", {})}
+
+    def __get_actor_states(self, query: dict) -> dict:
+        node = self.__get_node(query)
+        if node is None:
+            return _failure("No such actor.")
+        if "ParameterManager" not in node.get("properties", {}):
+            return {"states": []}
+        return {"states": [{"hid": "0"}]}
+
+    def __get_actor_status_info(self, query: dict) -> dict:
+        node = self.__get_node(query)
+        if node is None:
+            return _failure("No such actor.")
+        if query.get("hid") != "0" or "ParameterManager" not in node.get("properties", {}):
+            return _failure("No such state.")
+        return create_status_info(
+            self.__designs, self.__parameters, self.__responses, hid=query["hid"]
+        )
+
+    def __get_basic_project_info(self, query: dict) -> dict:
+        return {
+            "projects": [
+                {
+                    "location": "stand_in.opf",
+                    "name": "stand_in",
+                    "registered_files": [],
+                    "settings": {"short_description": ""},
+                    "state": self.__state,
+                    "working_dir": "stand_in.opd",
+                }
+            ]
+        }
+
+    def __get_full_project_tree(self, query: dict) -> dict:
+        project_tree = copy.deepcopy(self.__project_tree)
+        stack = [project_tree["projects"][0]["system"]]
+        while stack:
+            node = stack.pop()
+            node.pop("properties", None)
+            stack.extend(node.get("nodes", []))
+        return project_tree
+
+    def __register_listener(self, command: dict) -> dict:
+        args = command.get("args", {})
+        self.__listeners[args.get("uid", "")] = RegisteredListener(
+            host=args.get("host"),
+            port=args.get("port"),
+            local_server_id=args.get("id"),
+            notifications=args.get("notifications"),
+        )
+        return _success(command)
+
+    def __refresh_listener_registration(self, command: dict) -> dict:
+        if command.get("args", {}).get("uid") not in self.__listeners:
+            return _failure("No such listener.")
+        return _success(command)
+
+    def __unregister_listener(self, command: dict) -> dict:
+        self.__listeners.pop(command.get("args", {}).get("uid"), None)
+        return _success(command)
+
+    def __reset(self, command: dict) -> dict:
+        self.__state = "IDLE"
+        self.__received_designs.clear()
+        return _success(command)
+
+    def __set_designs(self, command: dict) -> dict:
+        if self.__get_node(command) is None:
+            return _failure("No such actor.")
+        self.__received_designs[command["actor_uid"]].extend(command["args"]["designs"])
+        return _success(command)
+
+    def __start(self, command: dict) -> dict:
+        self.__state = "PROCESSING"
+        # the project is executed asynchronously, as by the optiSLang server
+        threading.Thread(target=self.__execute_project, daemon=True).start()
+        return _success(command)
+
+    def __stop(self, command: dict) -> dict:
+        self.__state = "STOPPED"
+        return _success(command)
+
+    def __execute_project(self) -> None:
+        """Send notifications of the project execution."""
+        self.send_notification("PROCESSING_STARTED")
+        with self.__lock:
+            if self.__state != "PROCESSING":
+                return
+            self.__state = "FINISHED"
+            self.__responses_cache.clear()
+        self.send_notification("EXECUTION_FINISHED")
+
+
+class ReplayTiming(Enum):
+    """Timing of the replayed session."""
+
+    IMMEDIATE = 0
+    RECORDED = 1
+
+
+class ReplayOslServer(StandInOslServer):
+    """Stand-in server replaying a session recorded by the ``SessionRecorder`` class.
+
+    Each received request is answered by the response recorded for an equal request,
+    passwords are not compared. Equal requests are answered in the order of recording, once
+    all of them were answered, the last response is repeated. Requests registering, refreshing
+    and unregistering listeners are handled by the stand-in server, as well as the
+    ``SERVER_INFO`` and ``SERVER_IS_ALIVE`` queries if they were not recorded. Other requests,
+    which were not recorded, fail and are collected by the :py:attr:`unmatched_requests`
+    attribute.
+
+    Recorded push notifications are sent to the registered listeners once the requests sent
+    before the notification was received in the recorded session were answered. If the replayed
+    client does not send these requests, the notification is not sent.
+
+    Parameters
+    ----------
+    recording : Union[str, Path, SessionRecording]
+        Path to the recording file or the recorded session.
+    timing : ReplayTiming, optional
+        Timing of the replay. If ``ReplayTiming.IMMEDIATE``, requests are answered and
+        notifications are sent as soon as possible. If ``ReplayTiming.RECORDED``, responses
+        are delayed by the recorded durations of the requests and notifications by their
+        recorded delays. Defaults to ``ReplayTiming.IMMEDIATE``.
+    communication_channel : CommunicationChannel, optional
+        Communication channel to listen on. Defaults to ``CommunicationChannel.TCP``.
+    host : str, optional
+        Address to listen on, used by the TCP channel only. Defaults to ``"127.0.0.1"``.
+    port : int, optional
+        Port to listen on, used by the TCP channel only. Defaults to ``0``, which selects
+        a free port.
+    local_server_id : Optional[str], optional
+        ID of the local domain server, used by the local domain channel only. If ``None``,
+        a new ID is generated. Defaults to ``None``.
+    json_codec : Union[str, JsonCodec, None], optional
+        Codec used to decode the recording and requests and to encode responses. If ``None``,
+        the default codec is used. Defaults to ``None``.
+
+    Examples
+    --------
+    Replay a recorded session.
+
+    >>> from ansys.optislang.core.tcp.stand_in_server import ReplayOslServer
+    >>> with ReplayOslServer("session.jsonl.gz") as server:
+    ...     osl_server = server.create_osl_server()
+    ...     project_tree = osl_server.get_full_project_tree_with_properties()
+    ...     osl_server.dispose()
+    >>> print(server.unmatched_requests)
+    []
+    """
+
+    def __init__(
+        self,
+        recording: Union[str, Path, SessionRecording],
+        timing: ReplayTiming = ReplayTiming.IMMEDIATE,
+        communication_channel: CommunicationChannel = CommunicationChannel.TCP,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        local_server_id: Optional[str] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+    ) -> None:
+        """Create a new instance of the ``ReplayOslServer`` class and start listening."""
+        codec = get_json_codec(json_codec)
+        if not isinstance(recording, SessionRecording):
+            recording = SessionRecording.from_file(recording, json_codec=codec)
+        self.__recording = recording
+        self.__json_codec = codec
+        self.__timing = timing
+        self.__condition = threading.Condition()
+        self.__closed = False
+        self.__answered = 0
+        self.__replay_start: Optional[float] = None
+        self.__start_offset = 0.0
+        self.__responses: Dict[str, Deque[RecordedRequest]] = collections.defaultdict(
+            collections.deque
+        )
+        self.__last_responses: Dict[str, RecordedRequest] = {}
+        # notifications with the number of requests to be answered before sending them
+        self.__notifications: List[Tuple[int, RecordedNotification]] = []
+        self.unmatched_requests: List[dict] = []
+
+        request_times: List[float] = []
+        for record in recording.records:
+            if isinstance(record, RecordedRequest):
+                request = codec.loads(record.request)
+                if _is_listener_request(request):
+                    continue
+                self.__responses[_create_request_key(request)].append(record)
+                request_times.append(record.time)
+        # requests are recorded once answered, i.e. possibly after notifications sent meanwhile
+        for record in recording.records:
+            if isinstance(record, RecordedNotification):
+                answered = sum(1 for time_ in request_times if time_ <= record.time)
+                self.__notifications.append((answered, record))
+        if request_times:
+            self.__start_offset = min(request_times)
+
+        super().__init__(
+            version=recording.metadata.get("osl_version", "25.1.0 (123)"),
+            communication_channel=communication_channel,
+            host=host,
+            port=port,
+            local_server_id=local_server_id,
+            json_codec=codec,
+        )
+        self.__notifier = threading.Thread(
+            target=self.__send_notifications, name="ReplayOslServerNotifier", daemon=True
+        )
+        self.__notifier.start()
+
+    @property
+    def recording(self) -> SessionRecording:
+        """Replayed session.
+
+        Returns
+        -------
+        SessionRecording
+            Replayed session.
+        """
+        return self.__recording
+
+    @property
+    def timing(self) -> ReplayTiming:
+        """Timing of the replay.
+
+        Returns
+        -------
+        ReplayTiming
+            Timing of the replay.
+        """
+        return self.__timing
+
+    def close(self) -> None:
+        """Stop sending notifications and listening and wait for the threads to finish."""
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+        self.__notifier.join()
+        super().close()
+
+    def _create_response(self, request: dict, raw_request: bytes) -> bytes:
+        """Create encoded response to the request from the recorded session.
+
+        Parameters
+        ----------
+        request : dict
+            Decoded request.
+        raw_request : bytes
+            Request as received.
+
+        Returns
+        -------
+        bytes
+            UTF-8 encoded response.
+        """
+        if _is_listener_request(request):
+            return super()._create_response(request, raw_request)
+        key = _create_request_key(request)
+        with self.__condition:
+            queue = self.__responses.get(key)
+            replayed = bool(queue)
+            if queue:
+                record: Optional[RecordedRequest] = queue.popleft()
+                self.__last_responses[key] = record
+                if self.__replay_start is None:
+                    self.__replay_start = time.perf_counter()
+            else:
+                record = self.__last_responses.get(key)
+        if record is None:
+            if request.get("What") in ("SERVER_INFO", "SERVER_IS_ALIVE"):
+                return super()._create_response(request, raw_request)
+            with self.__condition:
+                self.unmatched_requests.append(request)
+            return self._encode(_failure("Request was not recorded."))
+        if self.__timing == ReplayTiming.RECORDED:
+            time.sleep(record.duration)
+        if replayed:
+            with self.__condition:
+                self.__answered += 1
+                self.__condition.notify_all()
+        return record.response.encode()
+
+    def __send_notifications(self) -> None:
+        """Send recorded notifications once the preceding requests were answered."""
+        for answered, record in self.__notifications:
+            with self.__condition:
+                self.__condition.wait_for(lambda: self.__closed or self.__answered >= answered)
+                if self.__closed:
+                    return
+                if self.__timing == ReplayTiming.RECORDED and self.__replay_start is not None:
+                    delay = record.time - self.__start_offset
+                    self.__condition.wait_for(
+                        lambda: self.__closed,
+                        timeout=max(0.0, self.__replay_start + delay - time.perf_counter()),
+                    )
+                    if self.__closed:
+                        return
+            notification = self.__json_codec.loads(record.notification)
+            self.send_notification(notification.pop("type"), **notification)
+
+
+def _failure(message: str) -> dict:
+    return {"message": message, "status": "failure"}
+
+
+def _success(command: dict) -> dict:
+    return {"command": command["command"], "status": "success"}
+
+
+def _send_all(connection: _Connection, data: bytes) -> None:
+    """Send all data, local domain sockets may send only a part of the data at once."""
+    if isinstance(connection, socket.socket):
+        connection.sendall(data)
+        return
+    view = memoryview(data)
+    while view:
+        view = view[connection.send(view) :]
+
+
+def _recv_exact(connection: _Connection, count: int) -> bytearray:
+    """Receive exactly ``count`` bytes."""
+    data = bytearray(count)
+    view = memoryview(data)
+    received = 0
+    while received < count:
+        chunk_len = connection.recv_into(view[received:])
+        if not chunk_len:
+            raise ConnectionError("Connection closed.")
+        received += chunk_len
+    return data
+
+
+def _create_request_key(request: dict) -> str:
+    """Create key of the request independent of the password and order of keys."""
+    return json.dumps(
+        {key: value for key, value in request.items() if key != "Password"}, sort_keys=True
+    )
+
+
+def _is_listener_request(request: dict) -> bool:
+    """Determine whether the request only registers, refreshes or unregisters listeners."""
+    if "What" in request:
+        return False
+    return all(
+        command.get("command") in _LISTENER_COMMANDS
+        for command in request["projects"][0]["commands"]
+    )
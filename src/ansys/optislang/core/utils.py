@@ -26,13 +26,16 @@ from __future__ import annotations
 import collections
 from enum import Enum
 import ipaddress
+import json
 import os
 from pathlib import Path
 import re
 import socket
 import sys
 import tempfile
+import threading
 from typing import (
+    Any,
     DefaultDict,
     Dict,
     Iterable,
@@ -51,6 +54,12 @@ from ansys.optislang.core import FIRST_SUPPORTED_VERSION
 
 VersionMapping = Dict[int, Path]
 
+_OSL_EXEC_CACHE_FORMAT = 1
+_osl_exec_cache_lock = threading.Lock()
+# found executables keyed by the environment variables affecting the search
+_osl_exec_memo: Dict[Tuple[str, ...], OrderedDict[int, Tuple[Path, ...]]] = {}
+_osl_exec_cache_file: Optional[Path] = None
+
 
 T = TypeVar("T", bound=Enum)
 
@@ -102,7 +111,9 @@ def enum_from_str(
         raise ValueError(f"{string} is not a member of {enum_class.__name__}.")
 
 
-def get_osl_exec(osl_version: Optional[Union[int, str]] = None) -> Optional[Tuple[int, Path]]:
+def get_osl_exec(
+    osl_version: Optional[Union[int, str]] = None, use_cache: bool = True
+) -> Optional[Tuple[int, Path]]:
     """Get the path to the optiSLang executable file.
 
     Parameters
@@ -110,6 +121,9 @@ def get_osl_exec(osl_version: Optional[Union[int, str]] = None) -> Optional[Tupl
     osl_version : Optional[Union[int, str]], optional
         optiSLang version in a three-digit format like this ``221``. The default
         is ``None``, in which case the latest installed version is used.
+    use_cache : bool, optional
+        Whether to use executables found by previous calls. For more information,
+        see the :py:func:`find_all_osl_exec` function. Defaults to ``True``.
 
     Returns
     -------
@@ -124,7 +138,7 @@ def get_osl_exec(osl_version: Optional[Union[int, str]] = None) -> Optional[Tupl
     NotImplementedError
         Raised when the operating system is not supported.
     """
-    osl_execs = find_all_osl_exec()
+    osl_execs = find_all_osl_exec(use_cache=use_cache)
     if len(osl_execs) == 0:
         return None
 
@@ -142,9 +156,22 @@ def get_osl_exec(osl_version: Optional[Union[int, str]] = None) -> Optional[Tupl
         return (osl_version, osl_execs[osl_version][0])
 
 
-def find_all_osl_exec() -> OrderedDict[int, Tuple[Path, ...]]:
+def find_all_osl_exec(use_cache: bool = True) -> OrderedDict[int, Tuple[Path, ...]]:
     """Find all optiSLang executable files.
 
+    Searching installation directories may be slow, e.g. on network file systems. Found
+    executables are therefore kept in memory and reused, until the ``AWP_ROOT`` environment
+    variables change or the :py:func:`invalidate_osl_exec_cache` function is called.
+    If enabled by the :py:func:`enable_osl_exec_file_cache` function, they are also stored
+    in a file shared by all processes, which is used as long as the modification times
+    of the searched directories do not change.
+
+    Parameters
+    ----------
+    use_cache : bool, optional
+        Whether to use executables found by previous calls. If ``False``, installation
+        directories are searched again and the cache is updated. Defaults to ``True``.
+
     Returns
     -------
     OrderedDict[int, Tuple[Path, ...]]
@@ -158,15 +185,76 @@ def find_all_osl_exec() -> OrderedDict[int, Tuple[Path, ...]]:
     NotImplementedError
         Raised when the operating system is not supported.
     """
-    # windows
-    if os.name == "nt":
-        return _find_all_osl_exec_in_windows()
-    # linux
-    elif os.name == "posix":
-        return _find_all_osl_exec_in_posix()
-    # another os
-    else:
-        raise NotImplementedError(f"Unsupported OS {os.name}.")
+    environment = _get_osl_exec_environment()
+    osl_execs = None
+    if use_cache:
+        with _osl_exec_cache_lock:
+            osl_execs = _osl_exec_memo.get(environment)
+        if osl_execs is None:
+            osl_execs = _load_osl_exec_cache_file(environment)
+    if osl_execs is None:
+        osl_execs = _find_all_osl_exec()
+        _store_osl_exec_cache_file(environment, osl_execs)
+    with _osl_exec_cache_lock:
+        _osl_exec_memo[environment] = osl_execs
+    return collections.OrderedDict(osl_execs)
+
+
+def invalidate_osl_exec_cache() -> None:
+    """Remove optiSLang executables found by previous calls of :py:func:`find_all_osl_exec`.
+
+    The cache file is removed as well, if enabled.
+    """
+    with _osl_exec_cache_lock:
+        _osl_exec_memo.clear()
+        cache_file = _osl_exec_cache_file
+    if cache_file is not None:
+        try:
+            cache_file.unlink()
+        except OSError:
+            pass
+
+
+def enable_osl_exec_file_cache(path: Optional[Union[str, Path]] = None) -> Path:
+    """Store optiSLang executables found by :py:func:`find_all_osl_exec` in a file.
+
+    The file is shared by all processes using it, so that only the first process searches
+    installation directories. Stored executables are used as long as the ``AWP_ROOT``
+    environment variables and the modification times of the searched directories and
+    the directories of the found executables do not change.
+
+    Parameters
+    ----------
+    path : Optional[Union[str, Path]], optional
+        Path to the cache file. Defaults to ``None``, in which case the file
+        ``pyoptislang/osl_executables.json`` in the cache directory of the user is used,
+        which is ``%LOCALAPPDATA%`` on Windows and ``$XDG_CACHE_HOME`` or ``~/.cache``
+        otherwise. The file should not be writable by other users, since the stored
+        executables are started.
+
+    Returns
+    -------
+    Path
+        Path to the cache file.
+    """
+    global _osl_exec_cache_file
+    if path is None:
+        cache_dir = os.environ.get("LOCALAPPDATA" if os.name == "nt" else "XDG_CACHE_HOME")
+        path = (
+            (Path(cache_dir) if cache_dir else Path.home() / ".cache")
+            / "pyoptislang"
+            / "osl_executables.json"
+        )
+    with _osl_exec_cache_lock:
+        _osl_exec_cache_file = Path(path)
+        return _osl_exec_cache_file
+
+
+def disable_osl_exec_file_cache() -> None:
+    """Stop storing optiSLang executables in a file, the file is kept."""
+    global _osl_exec_cache_file
+    with _osl_exec_cache_lock:
+        _osl_exec_cache_file = None
 
 
 def get_osl_opx_import_script(osl_executable: Optional[Union[str, Path]] = None) -> Optional[Path]:
@@ -204,6 +292,167 @@ def get_osl_opx_import_script(osl_executable: Optional[Union[str, Path]] = None)
     return None
 
 
+def _find_all_osl_exec() -> OrderedDict[int, Tuple[Path, ...]]:
+    """Find all optiSLang executable files by searching installation directories.
+
+    Returns
+    -------
+    OrderedDict[int, Tuple[Path, ...]]
+        Ordered dictionary of found optiSLang executables.
+
+    Raises
+    ------
+    NotImplementedError
+        Raised when the operating system is not supported.
+    """
+    # windows
+    if os.name == "nt":
+        return _find_all_osl_exec_in_windows()
+    # linux
+    elif os.name == "posix":
+        return _find_all_osl_exec_in_posix()
+    # another os
+    else:
+        raise NotImplementedError(f"Unsupported OS {os.name}.")
+
+
+def _get_osl_exec_environment() -> Tuple[str, ...]:
+    """Get environment variables affecting the search of optiSLang executable files.
+
+    Returns
+    -------
+    Tuple[str, ...]
+        Operating system name followed by the environment variables and their values.
+    """
+    variables = [f"AWP_ROOT{version}={path}" for version, path in iter_awp_roots()]
+    if os.name == "nt":
+        variables.append(f"ProgramFiles={_get_program_files_path()}")
+    return (os.name, *sorted(variables))
+
+
+def _get_osl_exec_search_dirs() -> List[Path]:
+    """Get directories whose content determines the found optiSLang executable files.
+
+    Returns
+    -------
+    List[Path]
+        Searched directories.
+    """
+    search_dirs = [path / "optiSLang" for _, path in iter_awp_roots()]
+    if os.name == "nt":
+        program_files_path = _get_program_files_path()
+        search_dirs.extend(
+            [
+                program_files_path / "ANSYS Inc",
+                program_files_path / "Dynardo" / "Ansys optiSLang",
+                program_files_path / "Ansys optiSLang",
+            ]
+        )
+    else:
+        search_dirs.extend([Path("/usr/ansys_inc"), Path("/ansys_inc"), Path("/opt/dynardo")])
+    return search_dirs
+
+
+def _get_osl_exec_dir_mtimes(osl_execs: OrderedDict[int, Tuple[Path, ...]]) -> Dict[str, Any]:
+    """Get modification times of the searched directories and directories of the executables.
+
+    Parameters
+    ----------
+    osl_execs : OrderedDict[int, Tuple[Path, ...]]
+        Found optiSLang executables.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Modification times in nanoseconds, ``None`` for directories which do not exist.
+    """
+    dirs = _get_osl_exec_search_dirs()
+    dirs.extend(path.parent for paths in osl_execs.values() for path in paths)
+    mtimes: Dict[str, Any] = {}
+    for directory in dirs:
+        try:
+            mtimes[str(directory)] = directory.stat().st_mtime_ns
+        except OSError:
+            mtimes[str(directory)] = None
+    return mtimes
+
+
+def _load_osl_exec_cache_file(
+    environment: Tuple[str, ...],
+) -> Optional[OrderedDict[int, Tuple[Path, ...]]]:
+    """Load optiSLang executable files from the cache file, if it is valid.
+
+    Parameters
+    ----------
+    environment : Tuple[str, ...]
+        Environment variables affecting the search.
+
+    Returns
+    -------
+    Optional[OrderedDict[int, Tuple[Path, ...]]]
+        Stored optiSLang executables, ``None`` if the cache file is not enabled or not valid.
+    """
+    cache_file = _osl_exec_cache_file
+    if cache_file is None:
+        return None
+    try:
+        with open(cache_file, "r", encoding="utf-8") as file:
+            content = json.load(file)
+        if (
+            content["format"] != _OSL_EXEC_CACHE_FORMAT
+            or content["environment"] != list(environment)
+            or content["first_supported_version"] != FIRST_SUPPORTED_VERSION
+        ):
+            return None
+        osl_execs = collections.OrderedDict(
+            (int(version), tuple(Path(path) for path in paths))
+            for version, paths in content["executables"]
+        )
+        if content["mtimes"] != _get_osl_exec_dir_mtimes(osl_execs):
+            return None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return osl_execs
+
+
+def _store_osl_exec_cache_file(
+    environment: Tuple[str, ...], osl_execs: OrderedDict[int, Tuple[Path, ...]]
+) -> None:
+    """Store optiSLang executable files in the cache file, if it is enabled.
+
+    Parameters
+    ----------
+    environment : Tuple[str, ...]
+        Environment variables affecting the search.
+    osl_execs : OrderedDict[int, Tuple[Path, ...]]
+        Found optiSLang executables.
+    """
+    cache_file = _osl_exec_cache_file
+    if cache_file is None:
+        return
+    content = {
+        "format": _OSL_EXEC_CACHE_FORMAT,
+        "environment": list(environment),
+        "first_supported_version": FIRST_SUPPORTED_VERSION,
+        "mtimes": _get_osl_exec_dir_mtimes(osl_execs),
+        "executables": [
+            [version, [str(path) for path in paths]] for version, paths in osl_execs.items()
+        ],
+    }
+    # write to a temporary file first, so that other processes never read a partial file
+    temp_file = cache_file.with_name(f"{cache_file.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_file, "w", encoding="utf-8") as file:
+            json.dump(content, file)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        try:
+            temp_file.unlink()
+        except OSError:
+            pass
+
+
 def _find_all_osl_exec_in_windows() -> OrderedDict[int, Tuple[Path, ...]]:
     """Find all optiSLang executable files on Windows.
 
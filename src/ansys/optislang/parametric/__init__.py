@@ -26,10 +26,10 @@ optiSLang.
 parametric
 """
 
-import importlib.util
-import os
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-from ansys.optislang import __version__
+from ansys.optislang.core import _set_examples_path
 from ansys.optislang.core.logging import OslLogger
 
 LOG = OslLogger(loglevel="ERROR", log_to_file=False, log_to_stdout=True)
@@ -38,19 +38,31 @@ LOG.logger.debug("Loaded logging module as LOG")
 # First supported version of optiSLang: 2023R1
 FIRST_SUPPORTED_VERSION = 231
 
-from ansys.optislang.core.optislang import Optislang
-from ansys.optislang.parametric.design_study import ParametricDesignStudyManager
-
-# Provide examples directory path
-EXAMPLES_MODULE = "ansys.optislang.core.examples"
-if spec := importlib.util.find_spec(EXAMPLES_MODULE):
-    if spec.origin:
-        os.environ["OSL_EXAMPLES"] = os.path.dirname(spec.origin)
-    else:
-        LOG.logger.warning(
-            f"Could not set path to examples. Missing spec for module {EXAMPLES_MODULE}."
-        )
-else:
-    LOG.logger.warning(
-        f"Could not set path to examples. Missing origin for module {EXAMPLES_MODULE}."
-    )
+if TYPE_CHECKING:
+    from ansys.optislang.core.optislang import Optislang
+    from ansys.optislang.parametric.design_study import ParametricDesignStudyManager
+
+# Public classes are imported on first access, see ``ansys.optislang.core``.
+_LAZY_ATTRIBUTES = {
+    "__version__": "ansys.optislang",
+    "Optislang": "ansys.optislang.core.optislang",
+    "ParametricDesignStudyManager": "ansys.optislang.parametric.design_study",
+}
+
+__all__ = ["FIRST_SUPPORTED_VERSION", "LOG", *_LAZY_ATTRIBUTES]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public classes on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    _set_examples_path()
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List attributes including the classes not imported yet."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -24,13 +24,14 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from enum import Enum
 from pathlib import Path
 import threading
-import time
 from typing import (
     TYPE_CHECKING,
     Callable,
+    Dict,
     Iterable,
     List,
     Optional,
@@ -40,6 +41,8 @@ from typing import (
 )
 
 from ansys.optislang.core import Optislang
+from ansys.optislang.core.errors import OslCommandError, OslCommunicationError
+from ansys.optislang.core.evaluation_cache import EvaluationCache
 from ansys.optislang.core.nodes import (
     ExecutionOption,
     IntegrationNode,
@@ -47,7 +50,9 @@ from ansys.optislang.core.nodes import (
     ParametricSystem,
     ProxySolverNode,
 )
+from ansys.optislang.core.osl_process import ServerNotification
 from ansys.optislang.core.project_parametric import Design, DesignVariable
+from ansys.optislang.core.tcp.osl_server import NotificationWaiter, TcpOslServer
 
 if TYPE_CHECKING:
     from ansys.optislang.core.project_parametric import (
@@ -310,7 +315,9 @@ class ProxySolverManagedParametricSystem(ManagedParametricSystem):
         solver_node : ProxySolverNode
             Instance of the proxy solver node inside the managed parametric system.
         callback: Callable
-            Callback to be executed by the proxy solver.
+            Callback to be executed by the proxy solver. Takes a list of ``Design`` instances
+            and returns the resulting ones, or a single design if the design study runs
+            callbacks by an executor.
         """
         super().__init__(algorithm, solver_node)
         self.__callback = callback
@@ -406,9 +413,28 @@ class ExecutableBlock:
 # endregion
 
 
+class ProxySolverExecutorType(Enum):
+    """Built-in executors running proxy solver callbacks in parallel."""
+
+    THREAD_POOL = 0
+    PROCESS_POOL = 1
+
+
 class ParametricDesignStudy:
     """A class to store data and perform operations on design study."""
 
+    # proxy solver waits for these notifications, polling is only a fallback
+    _PROXY_SOLVER_NOTIFICATIONS = (
+        ServerNotification.ACTOR_DATA_CHANGED,
+        ServerNotification.ACTOR_STATE_CHANGED,
+        ServerNotification.EXECUTION_FINISHED,
+        ServerNotification.NOTHING_PROCESSED,
+        ServerNotification.EXEC_FAILED,
+        ServerNotification.CHECK_FAILED,
+    )
+    _POLLING_INTERVAL_MIN = 0.01
+    _POLLING_INTERVAL_MAX = 0.5
+
     @property
     def managed_instances(self) -> Tuple[ManagedInstance, ...]:
         """Elementary components of this ParametricStudy.
@@ -447,6 +473,9 @@ class ParametricDesignStudy:
         osl_instance: Optislang,
         managed_instances: Iterable[ManagedInstance],
         execution_blocks: Optional[Iterable[ExecutableBlock]] = None,
+        executor: Optional[Union[ProxySolverExecutorType, Executor]] = None,
+        max_workers: Optional[int] = None,
+        evaluation_cache: Optional[EvaluationCache] = None,
     ):
         """Initialize the ParametricDesignStudy.
 
@@ -465,8 +494,25 @@ class ParametricDesignStudy:
             parametric design study. All execution block must create a complete set
             without overlap. Created automatically from managed instances ordered,
             if not provided.
+        executor: Optional[Union[ProxySolverExecutorType, Executor]], optional
+            Executor running proxy solver callbacks in parallel, either type of a built-in
+            executor or an executor instance, which is not shut down by the design study.
+            If specified, callbacks are called for each design, taking a ``Design`` instance
+            and returning the resulting ``Design`` instance, and results are sent to the
+            proxy solver as soon as they are available. By default ``None``, callbacks are
+            called for a batch of designs in the thread executing the design study.
+        max_workers: Optional[int], optional
+            Maximum number of workers of a built-in executor. By default ``None``, the
+            default of the executor is used.
+        evaluation_cache: Optional[EvaluationCache], optional
+            Cache of designs solved by proxy solver callbacks. Designs with parameter values
+            matching a stored design are answered from the cache without calling the callback.
+            By default ``None``, callbacks are called for all designs.
         """
         self.__osl_instance: Optislang = osl_instance
+        self.__executor = executor
+        self.__max_workers = max_workers
+        self.__evaluation_cache = evaluation_cache
         self.__managed_instances: List[ManagedInstance] = list(managed_instances)
         if execution_blocks is not None:
             self.__execution_blocks = execution_blocks
@@ -705,30 +751,216 @@ class ParametricDesignStudy:
         proxy_solver : ProxySolverNode
             Proxy solver to be executed.
         callback : Callable
-            Callback obtaining input designs and returning results.
+            Callback obtaining input designs and returning results, called for each design
+            if an executor is used.
+
+        Raises
+        ------
+        RuntimeError
+            Raised when the callback called by the executor fails. Results of the other
+            finished callbacks are sent to the proxy solver before.
         """
         if not self.__osl_instance.application.project:
             raise RuntimeError("No project loaded.")
-        self.__osl_instance.application.project.start(wait_for_finished=False)
-        while True:
-            status = self.__osl_instance.application.project.get_status()
-            if status == "FINISHED":
-                self.__osl_instance.log.info(f"Project status: {status}")
-                break
-            elif status == "STOPPED":
-                self.__osl_instance.log.info(f"Project status: {status}")
-                break
-            design_list: List[dict] = proxy_solver.get_designs()
-            if len(design_list):
-                design_objects: List[Design] = self.__class__.__convert_design_dicts_to_objects(
-                    design_list
+        notification_waiter = self.__create_notification_waiter()
+        # without notifications, the waiter is woken up only by finished callbacks
+        waiter = notification_waiter if notification_waiter is not None else NotificationWaiter(())
+        executor = self.__create_executor()
+        # ids of the designs passed to callbacks, which are not finished yet
+        pending: Dict[Future, str] = {}
+        # parameters of designs passed to callbacks, stored in the cache with their results
+        unsolved_parameters: Dict[str, List[Tuple[str, object]]] = {}
+        cache_namespace = (
+            f"proxy_solver:{proxy_solver.uid}" if self.__evaluation_cache is not None else ""
+        )
+        try:
+            self.__osl_instance.application.project.start(wait_for_finished=False)
+            polling_interval = self._POLLING_INTERVAL_MIN
+            while True:
+                # read before querying the server, notifications received meanwhile wake up
+                notifications_count = waiter.count
+                status = self.__osl_instance.application.project.get_status()
+                if status == "FINISHED":
+                    self.__osl_instance.log.info(f"Project status: {status}")
+                    break
+                elif status == "STOPPED":
+                    self.__osl_instance.log.info(f"Project status: {status}")
+                    break
+                responses_objects: List[Design] = []
+                design_list: List[dict] = proxy_solver.get_designs()
+                if len(design_list):
+                    design_objects: List[Design] = self.__class__.__convert_design_dicts_to_objects(
+                        design_list
+                    )
+                    if self.__evaluation_cache is not None:
+                        design_objects = self.__solve_from_cache(
+                            design_objects, cache_namespace, responses_objects, unsolved_parameters
+                        )
+                    if executor is None:
+                        if design_objects:
+                            responses_objects.extend(callback(design_objects))
+                    else:
+                        for design in design_objects:
+                            future = executor.submit(callback, design)
+                            future.add_done_callback(lambda _: waiter.notify())
+                            pending[future] = design.id
+                failure: Optional[Tuple[str, BaseException]] = None
+                for future in [future for future in pending if future.done()]:
+                    design_id = pending.pop(future)
+                    try:
+                        responses_objects.append(future.result())
+                    except Exception as ex:
+                        if failure is None:
+                            failure = (design_id, ex)
+                if self.__evaluation_cache is not None:
+                    self.__store_in_cache(responses_objects, cache_namespace, unsolved_parameters)
+                if len(responses_objects):
+                    responses_list = self.__class__.__convert_design_object_to_response(
+                        responses_objects
+                    )
+                    proxy_solver.set_designs(responses_list)
+                if failure is not None:
+                    raise RuntimeError(
+                        f"Proxy solver callback failed for design {failure[0]}."
+                    ) from failure[1]
+                if len(design_list) or len(responses_objects):
+                    polling_interval = self._POLLING_INTERVAL_MIN
+                elif notification_waiter is not None:
+                    waiter.wait(notifications_count, self._POLLING_INTERVAL_MAX)
+                else:
+                    waiter.wait(notifications_count, polling_interval)
+                    polling_interval = min(2 * polling_interval, self._POLLING_INTERVAL_MAX)
+        finally:
+            for future in pending:
+                future.cancel()
+            # callbacks already running must not outlive the execution of the proxy solver
+            wait(pending)
+            if executor is not None and executor is not self.__executor:
+                executor.shutdown(wait=True, cancel_futures=True)
+            if notification_waiter is not None:
+                self.__delete_notification_waiter(notification_waiter)
+
+    def __solve_from_cache(
+        self,
+        design_objects: List[Design],
+        cache_namespace: str,
+        responses_objects: List[Design],
+        unsolved_parameters: Dict[str, List[Tuple[str, object]]],
+    ) -> List[Design]:
+        """Answer designs stored in the evaluation cache.
+
+        Parameters
+        ----------
+        design_objects : List[Design]
+            Designs obtained from the proxy solver.
+        cache_namespace : str
+            Namespace of the proxy solver results in the cache.
+        responses_objects : List[Design]
+            List extended by designs solved from the cache.
+        unsolved_parameters : Dict[str, List[Tuple[str, object]]]
+            Parameters of designs not found in the cache by design id, updated in place.
+
+        Returns
+        -------
+        List[Design]
+            Designs not found in the cache, which have to be solved by the callback.
+        """
+        unsolved = []
+        for design in design_objects:
+            parameters = [(parameter.name, parameter.value) for parameter in design.parameters]
+            responses = self.__evaluation_cache.get(  # type: ignore[union-attr]
+                parameters, namespace=cache_namespace
+            )
+            if responses is None:
+                unsolved_parameters[str(design.id)] = parameters
+                unsolved.append(design)
+            else:
+                responses_objects.append(
+                    Design(
+                        parameters=design.parameters,
+                        responses=[
+                            DesignVariable(name=response["name"], value=response["value"])
+                            for response in responses
+                        ],
+                        design_id=design.id,
+                    )
                 )
-                responses_objects: List[Design] = callback(design_objects)
-                responses_list = self.__class__.__convert_design_object_to_response(
-                    responses_objects
+        return unsolved
+
+    def __store_in_cache(
+        self,
+        responses_objects: List[Design],
+        cache_namespace: str,
+        unsolved_parameters: Dict[str, List[Tuple[str, object]]],
+    ) -> None:
+        """Store designs solved by the callback in the evaluation cache.
+
+        Parameters
+        ----------
+        responses_objects : List[Design]
+            Designs to be sent to the proxy solver.
+        cache_namespace : str
+            Namespace of the proxy solver results in the cache.
+        unsolved_parameters : Dict[str, List[Tuple[str, object]]]
+            Parameters of designs passed to the callback by design id, updated in place.
+        """
+        for design in responses_objects:
+            parameters = unsolved_parameters.pop(str(design.id), None)
+            if parameters is None:
+                continue
+            responses = [
+                {"name": response.name, "value": response.value} for response in design.responses
+            ]
+            try:
+                self.__evaluation_cache.put(  # type: ignore[union-attr]
+                    parameters, responses, namespace=cache_namespace
                 )
-                proxy_solver.set_designs(responses_list)
-            time.sleep(0.5)
+            except (TypeError, ValueError) as ex:
+                self.__osl_instance.log.warning(f"Design {design.id} was not cached: {ex}")
+
+    def __create_executor(self) -> Optional[Executor]:
+        """Create built-in executor of proxy solver callbacks or return the given one.
+
+        Returns
+        -------
+        Optional[Executor]
+            Executor, ``None`` if callbacks are called for batches of designs.
+        """
+        if self.__executor == ProxySolverExecutorType.THREAD_POOL:
+            return ThreadPoolExecutor(
+                max_workers=self.__max_workers, thread_name_prefix="PyOptiSLang.ProxySolver"
+            )
+        elif self.__executor == ProxySolverExecutorType.PROCESS_POOL:
+            return ProcessPoolExecutor(max_workers=self.__max_workers)
+        return self.__executor  # type: ignore[return-value]
+
+    def __create_notification_waiter(self) -> Optional[NotificationWaiter]:
+        """Create waiter woken up by notifications relevant for the proxy solver.
+
+        Returns
+        -------
+        Optional[NotificationWaiter]
+            Notification waiter, ``None`` if notifications are not available and the proxy
+            solver has to be polled.
+        """
+        osl_server = self.__osl_instance.osl_server
+        if not isinstance(osl_server, TcpOslServer):
+            return None
+        try:
+            return osl_server.create_notification_waiter(self._PROXY_SOLVER_NOTIFICATIONS)
+        except (OslCommunicationError, OslCommandError, RuntimeError, TimeoutError) as ex:
+            self.__osl_instance.log.warning(
+                f"Push notifications not available, proxy solver is polled: {ex}"
+            )
+            return None
+
+    def __delete_notification_waiter(self, notification_waiter: NotificationWaiter) -> None:
+        """Delete waiter created by ``__create_notification_waiter``."""
+        osl_server = self.__osl_instance.osl_server
+        try:
+            osl_server.delete_notification_waiter(notification_waiter)  # type: ignore[attr-defined]
+        except (OslCommunicationError, OslCommandError, TimeoutError) as ex:
+            self.__osl_instance.log.warning(f"Notification waiter was not deleted: {ex}")
 
     @staticmethod
     def __convert_design_dicts_to_objects(design_list: List[dict]) -> List[Design]:
@@ -834,13 +1066,26 @@ class ParametricDesignStudyManager:
                 design_study.delete()
         self.__design_studies.clear()
 
-    def create_design_study(self, template: DesignStudyTemplate) -> ParametricDesignStudy:
+    def create_design_study(
+        self,
+        template: DesignStudyTemplate,
+        executor: Optional[Union[ProxySolverExecutorType, Executor]] = None,
+        max_workers: Optional[int] = None,
+        evaluation_cache: Optional[EvaluationCache] = None,
+    ) -> ParametricDesignStudy:
         """Create a design study based on the provided template.
 
         Parameters
         ----------
         template : DesignStudyTemplate
             The template defining the design study.
+        executor: Optional[Union[ProxySolverExecutorType, Executor]], optional
+            Executor running proxy solver callbacks for each design in parallel,
+            see :py:class:`ParametricDesignStudy`. By default ``None``.
+        max_workers: Optional[int], optional
+            Maximum number of workers of a built-in executor. By default ``None``.
+        evaluation_cache: Optional[EvaluationCache], optional
+            Cache of designs solved by proxy solver callbacks. By default ``None``.
 
         Returns
         -------
@@ -852,7 +1097,12 @@ class ParametricDesignStudyManager:
                 self.optislang.application.project.root_system
             )
             design_study = ParametricDesignStudy(
-                self.optislang, managed_instances, executable_blocks
+                self.optislang,
+                managed_instances,
+                executable_blocks,
+                executor=executor,
+                max_workers=max_workers,
+                evaluation_cache=evaluation_cache,
             )
             self.__design_studies.append(design_study)
             return design_study
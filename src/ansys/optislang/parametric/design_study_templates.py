@@ -1077,7 +1077,9 @@ class OptimizationOnMOPTemplate(DesignStudyTemplate):
             MUST be specified to allow automatic execution. If not specified,
             execution of the proxy solver must be performed by the user.
             Input into callback function is a list of `Design` instances, iterable
-            of resulting `Design` instances is expected as output.
+            of resulting `Design` instances is expected as output. If the design study
+            runs callbacks by an executor, a single `Design` instance is passed and
+            returned instead.
         """
         self.parameters = parameters
         self.criteria = criteria
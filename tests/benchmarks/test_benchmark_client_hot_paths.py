@@ -0,0 +1,263 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark client-side hot paths on synthetic payloads without a server.
+
+Covered are the creation of designs, conversion and sorting of designs received from the
+server, export of designs to CSV, searches in the project tree, conversion of parameters
+and generation of commands.
+
+Run with ``pytest tests/benchmarks --perf -s`` to print the timings, add
+``--perf_results=<file>.json`` to store them for comparison with other releases.
+"""
+
+import copy
+import time
+
+import pytest
+
+from ansys.optislang.core.project_parametric import Design, Parameter
+from ansys.optislang.core.tcp import server_commands as commands
+from ansys.optislang.core.tcp.managers import TcpDesignManagerProxy
+from ansys.optislang.core.tcp.nodes import TcpRootSystemProxy
+from ansys.optislang.core.tcp.project_tree_index import ProjectTreeIndex
+from ansys.optislang.core.tcp.stand_in_server import create_project_tree, create_status_info
+
+pytestmark = pytest.mark.perf
+
+PARAMETER_DICT = {
+    "active": True,
+    "const": False,
+    "deterministic_property": {
+        "domain_type": "real",
+        "kind": "continuous",
+        "lower_bound": -1.0,
+        "upper_bound": 1.0,
+    },
+    "id": "ddc173ae-9784-4387-ae66-21fff6e199e5",
+    "modifiable": False,
+    "name": "mixed",
+    "reference_value": 0.0,
+    "removable": True,
+    "stochastic_property": {
+        "kind": "marginaldistribution",
+        "statistical_moments": [0.0, 1.0],
+        "type": "normal",
+    },
+    "type": "mixed",
+    "unit": "",
+}
+
+
+def _best_of(function, repeats: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _result_design(index: int, parameters: int, responses: int) -> dict:
+    result_design = {
+        "feasible": True,
+        "hid": f"0.{index}",
+        "parameter_names": [f"X{j}" for j in range(parameters)],
+        "parameter_values": [index * 0.1 + j for j in range(parameters)],
+        "status": "succeeded",
+    }
+    for kind in ("constraint", "limit_state", "objective", "variable"):
+        result_design[f"{kind}_names"] = []
+        result_design[f"{kind}_values"] = []
+    result_design["response_names"] = [f"Y{j}" for j in range(responses)]
+    result_design["response_values"] = [index * 0.01 - j for j in range(responses)]
+    return result_design
+
+
+def _statuses_info(states: int, designs: int) -> list:
+    """Create status info of nested states with designs ``0.<state>.<design>``."""
+    statuses_info = []
+    # states and designs are received in the order of their string IDs
+    for state in sorted(range(1, states + 1), key=str):
+        status_info = create_status_info(designs, parameters=20, responses=10, hid=f"0.{state}")
+        status_info["hid"] = f"0.{state}"
+        for design, design_status in zip(
+            status_info["designs"]["values"], status_info["design_status"]
+        ):
+            design_status["directory"] = ""
+            for kind in ("constraint", "limit_state", "objective"):
+                design[f"{kind}_values"] = []
+        for kind in ("constraint", "limit_state", "objective"):
+            status_info["designs"][f"{kind}_names"] = []
+        status_info["designs"]["values"].sort(key=lambda design: design["hid"])
+        status_info["design_status"].sort(key=lambda design_status: design_status["id"])
+        statuses_info.append(status_info)
+    return statuses_info
+
+
+class _ProjectTreeServer:
+    def __init__(self, project_tree: dict) -> None:
+        self.__project_tree_index = ProjectTreeIndex.from_project_tree(project_tree)
+
+    def get_project_tree_index(self) -> ProjectTreeIndex:
+        return self.__project_tree_index
+
+
+class _StatusInfoServer:
+    def __init__(self, status_info: dict) -> None:
+        self.__status_info = status_info
+
+    def iter_actor_status_info(self, uid, hid, **kwargs):
+        for design_state in self.__status_info["design_status"]:
+            yield ("design_status",), design_state
+        for key, value in self.__status_info["designs"].items():
+            if key == "values":
+                for design_value in value:
+                    yield ("designs", "values"), design_value
+            else:
+                yield ("designs", key), value
+        yield ("status",), self.__status_info["status"]
+
+
+@pytest.mark.parametrize("count", [1000, 10000])
+def test_design_construction(count, record_timing):
+    parameters = [{f"X{j}": i * 0.1 + j for j in range(20)} for i in range(count)]
+    responses = [{f"Y{j}": i * 0.01 - j for j in range(10)} for i in range(count)]
+    duration = _best_of(
+        lambda: [
+            Design(parameters=design_parameters, responses=design_responses)
+            for design_parameters, design_responses in zip(parameters, responses)
+        ],
+        repeats=3,
+    )
+    record_timing("design", duration)
+    print(f"\n{count:>6} designs: construction {duration * 1e3:9.3f} ms")
+
+
+@pytest.mark.parametrize("count", [1000, 10000])
+def test_create_evaluated_design(count, record_timing):
+    root_system = TcpRootSystemProxy(uid="root", osl_server=None)  # type: ignore[arg-type]
+    create_evaluated_design = root_system._TcpRootSystemProxy__create_evaluated_design
+    results = [{"result_design": _result_design(i, 20, 10)} for i in range(count)]
+    designs = [
+        Design(parameters=dict(zip(result["parameter_names"], result["parameter_values"])))
+        for result in (results["result_design"] for results in results)
+    ]
+    evaluate_dicts = [
+        {parameter.name: parameter.value for parameter in design.parameters} for design in designs
+    ]
+
+    def create_evaluated_designs():
+        name_mappings: dict = {}
+        for design, evaluate_dict, design_results in zip(designs, evaluate_dicts, results):
+            create_evaluated_design(design, evaluate_dict, design_results, name_mappings)
+
+    duration = _best_of(create_evaluated_designs, repeats=3)
+    record_timing("create_evaluated_design", duration)
+    print(f"\n{count:>6} designs: evaluated designs {duration * 1e3:9.3f} ms")
+
+
+@pytest.mark.parametrize("count", [1000, 10000])
+def test_get_designs(count, record_timing):
+    status_info = create_status_info(count, parameters=20, responses=10)
+    design_manager = TcpDesignManagerProxy(uid="uid", osl_server=None)  # type: ignore[arg-type]
+    design_manager._TcpDesignManagerProxy__osl_server = _StatusInfoServer(status_info)
+    duration = _best_of(design_manager.get_designs, repeats=3)
+    record_timing("get_designs", duration)
+    print(f"\n{count:>6} designs: get_designs {duration * 1e3:9.3f} ms")
+
+
+@pytest.mark.parametrize("states, designs", [(10, 100), (100, 100)])
+def test_get_designs_dicts(states, designs, record_timing):
+    statuses_info = _statuses_info(states, designs)
+    system = TcpRootSystemProxy(uid="uid", osl_server=None)  # type: ignore[arg-type]
+    best = float("inf")
+    for _ in range(3):
+        # status info is updated in place, each run needs a fresh copy
+        payload = copy.deepcopy(statuses_info)
+        system._get_status_info = lambda: payload  # type: ignore[method-assign]
+        start = time.perf_counter()
+        designs_dicts = system._get_designs_dicts()
+        best = min(best, time.perf_counter() - start)
+    assert list(designs_dicts)[:2] == ["0.1", "0.2"]
+    assert designs_dicts["0.1"]["values"][1]["hid"] == "0.1.2"
+
+    convert_to_csv = system._TcpParametricSystemProxy__convert_design_dict_to_csv
+    csv = _best_of(lambda: [convert_to_csv(design) for design in designs_dicts.values()], repeats=3)
+    record_timing("get_designs_dicts", best)
+    record_timing("convert_design_dict_to_csv", csv)
+    print(
+        f"\n{states * designs:>6} designs in {states:>3} states: sorting {best * 1e3:9.3f} ms, "
+        f"CSV export {csv * 1e3:9.3f} ms"
+    )
+
+
+@pytest.mark.parametrize("systems", [100, 1000])
+def test_find_nodes(systems, record_timing):
+    project_tree = create_project_tree(systems=systems, nodes_per_system=10)
+    root_system = TcpRootSystemProxy(
+        uid="root", osl_server=_ProjectTreeServer(project_tree)  # type: ignore[arg-type]
+    )
+    by_uid = _best_of(
+        lambda: [root_system.find_node_by_uid(f"node-{i}-1", search_depth=2) for i in range(1, 11)]
+    )
+    by_name = _best_of(
+        lambda: root_system.find_nodes_by_name(f"Calculator {systems}.10", search_depth=2)
+    )
+    assert root_system.find_node_by_uid(f"node-{systems}-10", search_depth=2) is not None
+    assert len(root_system.find_nodes_by_name(f"Calculator {systems}.10", search_depth=2)) == 1
+    record_timing("find_node_by_uid", by_uid)
+    record_timing("find_nodes_by_name", by_name)
+    print(
+        f"\n{systems * 11:>6} nodes: 10 searches by uid {by_uid * 1e3:9.3f} ms, "
+        f"search by name {by_name * 1e3:9.3f} ms"
+    )
+
+
+def test_parameter_conversion(record_timing):
+    parameters_dicts = [dict(PARAMETER_DICT, name=f"X{i}") for i in range(1000)]
+    from_dict = _best_of(lambda: [Parameter.from_dict(par_dict) for par_dict in parameters_dicts])
+    parameters = [Parameter.from_dict(par_dict) for par_dict in parameters_dicts]
+    to_dict = _best_of(lambda: [parameter.to_dict() for parameter in parameters])
+    record_timing("from_dict", from_dict)
+    record_timing("to_dict", to_dict)
+    print(
+        f"\n  1000 parameters: from_dict {from_dict * 1e3:9.3f} ms, to_dict {to_dict * 1e3:9.3f} ms"
+    )
+
+
+@pytest.mark.parametrize("count", [100, 10000])
+def test_command_generation(count, record_timing):
+    designs = [
+        {"hid": f"0.{i}", "parameter_values": [i * 0.1 + j for j in range(20)]}
+        for i in range(count)
+    ]
+    parameters = {f"X{j}": j * 0.1 for j in range(20)}
+    set_designs = _best_of(lambda: commands.set_designs("uid", designs, password="secret"))
+    evaluate_design = _best_of(lambda: [commands.evaluate_design(parameters) for _ in range(count)])
+    record_timing("set_designs", set_designs)
+    record_timing("evaluate_design", evaluate_design)
+    print(
+        f"\n{count:>6} designs: set_designs {set_designs * 1e3:9.3f} ms, "
+        f"{count} evaluate_design {evaluate_design * 1e3:9.3f} ms"
+    )
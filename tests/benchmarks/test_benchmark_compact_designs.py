@@ -0,0 +1,103 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark of compact designs sharing a schema compared to regular designs.
+
+Run with ``pytest tests/benchmarks --perf -s`` to print the timings.
+"""
+
+import time
+import tracemalloc
+
+import pytest
+
+from ansys.optislang.core.tcp.managers import TcpDesignManagerProxy
+
+pytestmark = pytest.mark.perf
+
+
+def _status_info(count: int) -> dict:
+    return {
+        "design_status": [
+            {"feasible": True, "id": f"0.{i}", "pareto_design": False, "status": "succeeded"}
+            for i in range(1, count + 1)
+        ],
+        "designs": {
+            "parameter_names": [f"X{j}" for j in range(20)],
+            "response_names": [f"Y{j}" for j in range(10)],
+            "values": [
+                {
+                    "hid": f"0.{i}",
+                    "parameter_values": [i * 0.1 + j for j in range(20)],
+                    "response_values": [i * 0.01 - j for j in range(10)],
+                }
+                for i in range(1, count + 1)
+            ],
+        },
+        "status": "success",
+    }
+
+
+def _get_designs(count: int, compact: bool):
+    status_info = _status_info(count)
+    design_manager = TcpDesignManagerProxy(uid="uid", osl_server=None)  # type: ignore[arg-type]
+    design_manager._TcpDesignManagerProxy__osl_server = _StatusInfoServer(status_info)
+    tracemalloc.start()
+    start = time.perf_counter()
+    designs = design_manager.get_designs(compact=compact)
+    duration = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return designs, duration, memory
+
+
+class _StatusInfoServer:
+    def __init__(self, status_info: dict) -> None:
+        self.__status_info = status_info
+
+    def iter_actor_status_info(self, uid, hid, **kwargs):
+        for design_state in self.__status_info["design_status"]:
+            yield ("design_status",), design_state
+        for key, value in self.__status_info["designs"].items():
+            if key == "values":
+                for design_value in value:
+                    yield ("designs", "values"), design_value
+            else:
+                yield ("designs", key), value
+        yield ("status",), self.__status_info["status"]
+
+
+@pytest.mark.parametrize("count", [10000, 100000])
+def test_compact_designs(count):
+    designs, designs_time, designs_memory = _get_designs(count, compact=False)
+    del designs
+    compact_designs, compact_time, compact_memory = _get_designs(count, compact=True)
+
+    print(
+        f"\n{count} designs: "
+        f"regular {designs_time * 1e3:9.1f} ms {designs_memory / 2**20:7.1f} MiB, "
+        f"compact {compact_time * 1e3:9.1f} ms {compact_memory / 2**20:7.1f} MiB"
+    )
+    assert len(compact_designs) == count
+    assert compact_memory < designs_memory
+    assert compact_time < designs_time
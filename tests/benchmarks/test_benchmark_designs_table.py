@@ -0,0 +1,94 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark of building the designs table compared to building design objects.
+
+Run with ``pytest tests/benchmarks --perf -s`` to print the timings.
+"""
+
+import time
+
+import pytest
+
+from ansys.optislang.core.project_parametric import Design, DesignStatus
+from ansys.optislang.core.tcp.managers import TcpDesignManagerProxy
+
+pytestmark = pytest.mark.perf
+
+
+def _status_info(count: int) -> dict:
+    return {
+        "design_status": [
+            {"feasible": True, "id": f"0.{i}", "pareto_design": False, "status": "succeeded"}
+            for i in range(1, count + 1)
+        ],
+        "designs": {
+            "parameter_names": [f"X{j}" for j in range(20)],
+            "response_names": [f"Y{j}" for j in range(10)],
+            "values": [
+                {
+                    "hid": f"0.{i}",
+                    "parameter_values": [i * 0.1 + j for j in range(20)],
+                    "response_values": [i * 0.01 - j for j in range(10)],
+                }
+                for i in range(1, count + 1)
+            ],
+        },
+        "status": "success",
+    }
+
+
+def _create_designs(status_info: dict) -> list:
+    designs = status_info["designs"]
+    return [
+        Design(
+            parameters=dict(zip(designs["parameter_names"], value["parameter_values"])),
+            responses=dict(zip(designs["response_names"], value["response_values"])),
+            feasibility=state["feasible"],
+            design_id=state["id"],
+            status=DesignStatus.from_str(state["status"]),
+            pareto_design=state["pareto_design"],
+        )
+        for value, state in zip(designs["values"], status_info["design_status"])
+    ]
+
+
+@pytest.mark.parametrize("count", [10000, 100000])
+def test_designs_table(count):
+    status_info = _status_info(count)
+    design_manager = TcpDesignManagerProxy(uid="uid", osl_server=None)  # type: ignore[arg-type]
+    design_manager._get_status_info = lambda **kwargs: status_info  # type: ignore[method-assign]
+
+    start = time.perf_counter()
+    designs = _create_designs(status_info)
+    objects_time = time.perf_counter() - start
+    start = time.perf_counter()
+    table = design_manager.get_designs_table()
+    table_time = time.perf_counter() - start
+
+    print(
+        f"\n{count} designs: objects {objects_time * 1e3:9.1f} ms, "
+        f"table {table_time * 1e3:9.1f} ms"
+    )
+    assert len(table) == len(designs)
+    assert table_time < objects_time
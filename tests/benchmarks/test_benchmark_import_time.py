@@ -0,0 +1,63 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark of the time needed to import the package.
+
+Run with ``pytest tests/benchmarks --perf -s`` to print the timings.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.perf
+
+# generous limit guarding against eager imports of the whole TCP stack
+_MAX_IMPORT_TIME = 0.15
+
+
+def _get_import_time(module: str) -> float:
+    """Get cumulative import time of the module in seconds reported by ``-X importtime``."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        env=os.environ.copy(),
+    ).stderr.decode()
+    for line in stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative) * 1e-6
+    raise RuntimeError(f"Import time of {module} not reported.")
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["ansys.optislang.core", "ansys.optislang.core.utils", "ansys.optislang.core.optislang"],
+)
+def test_import_time(module):
+    import_time = min(_get_import_time(module) for _ in range(5))
+    print(f"\n  {module}: {import_time * 1e3:9.3f} ms")
+    if module != "ansys.optislang.core.optislang":
+        assert import_time < _MAX_IMPORT_TIME
@@ -0,0 +1,125 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Micro-benchmark of the available JSON codecs over representative payloads.
+
+Run with ``pytest tests/benchmarks --perf -s`` to print the timings.
+"""
+
+import time
+
+import pytest
+
+from ansys.optislang.core.json_codec import (
+    get_available_json_codecs,
+    get_json_codec,
+    set_default_json_codec,
+)
+from ansys.optislang.core.tcp import server_commands, server_queries
+
+pytestmark = pytest.mark.perf
+
+
+def _status_info(count: int) -> dict:
+    return {
+        "design_status": [
+            {"feasible": True, "id": f"0.{i}", "pareto_design": False, "status": "succeeded"}
+            for i in range(1, count + 1)
+        ],
+        "designs": {
+            "parameter_names": [f"X{j}" for j in range(20)],
+            "response_names": [f"Y{j}" for j in range(10)],
+            "values": [
+                {
+                    "hid": f"0.{i}",
+                    "parameter_values": [i * 0.1 + j for j in range(20)],
+                    "response_values": [i * 0.01 - j for j in range(10)],
+                }
+                for i in range(1, count + 1)
+            ],
+        },
+        "status": "success",
+    }
+
+
+def _project_tree(depth: int, width: int) -> dict:
+    def node(level: int, index: int) -> dict:
+        return {
+            "kind": "system" if level < depth else "actor",
+            "name": f"Node {level}.{index}",
+            "uid": f"{level:04d}{index:04d}-0000-0000-0000-000000000000",
+            "properties": {"MaxParallel": {"type": "uint", "value": 4}},
+            "nodes": [node(level + 1, i) for i in range(width)] if level < depth else [],
+        }
+
+    return {"projects": [{"system": node(0, 0)}]}
+
+
+_PAYLOADS = {
+    "server_info": {"application": {"version": "25.1.0 (123)"}, "projects": []},
+    "project_tree": _project_tree(4, 6),
+    "status_info_1k": _status_info(1000),
+    "status_info_50k": _status_info(50000),
+}
+
+
+def _best_of(function, repeats: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.parametrize("payload", list(_PAYLOADS))
+def test_decode_encode(payload):
+    data = _PAYLOADS[payload]
+    encoded = get_json_codec("json").dumps(data).encode("utf-8")
+    print(f"\n{payload} ({len(encoded) / 1e6:.2f} MB)")
+    for name in get_available_json_codecs():
+        codec = get_json_codec(name)
+        assert codec.loads(encoded) == data
+        decode = _best_of(lambda: codec.loads(encoded))
+        encode = _best_of(lambda: codec.dumps(data, sort_keys=True))
+        print(f"  {name:>8}: loads {decode * 1e3:9.3f} ms, dumps {encode * 1e3:9.3f} ms")
+
+
+def test_command_generation():
+    designs = [
+        {"hid": f"0.{i}", "parameters": {f"X{j}": float(j) for j in range(20)}} for i in range(100)
+    ]
+    print()
+    for name in get_available_json_codecs():
+        set_default_json_codec(name)
+        try:
+            query = _best_of(lambda: [server_queries.server_info() for _ in range(1000)])
+            command = _best_of(
+                lambda: server_commands.set_designs(actor_uid="uid", designs=designs)
+            )
+        finally:
+            set_default_json_codec(None)
+        print(
+            f"  {name:>8}: 1000 queries {query * 1e3:9.3f} ms, "
+            f"set_designs command {command * 1e3:9.3f} ms"
+        )
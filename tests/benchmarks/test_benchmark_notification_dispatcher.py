@@ -0,0 +1,94 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark delivery of push notifications with slow callbacks.
+
+A burst of ``ACTOR_DATA_CHANGED`` notifications is sent by the ``StandInOslServer`` to
+a listener, whose callback takes a millisecond, with callbacks executed either by the listening
+thread or by the ``NotificationDispatcher``.
+
+Run with ``pytest tests/benchmarks --perf -s`` to print the timings.
+"""
+
+import time
+
+import pytest
+
+from ansys.optislang.core.communication_channels import CommunicationChannel
+from ansys.optislang.core.tcp import server_commands as commands
+from ansys.optislang.core.tcp.notification_dispatcher import NotificationDispatcher
+from ansys.optislang.core.tcp.osl_server import TcpOslListener
+from ansys.optislang.core.tcp.stand_in_server import StandInOslServer
+
+pytestmark = pytest.mark.perf
+
+
+def _deliver(count: int, dispatcher=None) -> float:
+    listener = TcpOslListener(
+        timeout=30,
+        name="Benchmark",
+        communication_channel=CommunicationChannel.TCP,
+        host="127.0.0.1",
+    )
+    listener.dispatcher = dispatcher
+    listener.add_callback(lambda sender, response: time.sleep(0.001), ())
+    with StandInOslServer() as server:
+        osl_server = server.create_osl_server()
+        try:
+            osl_server.send_command(
+                commands.register_listener(
+                    host="127.0.0.1",
+                    port=listener.port,
+                    notifications=["ACTOR_DATA_CHANGED"],
+                    listener_uid="uid",
+                )
+            )
+            listener.start_listening()
+            start = time.perf_counter()
+            for i in range(count):
+                server.send_notification("ACTOR_DATA_CHANGED", uid=f"node-{i % 10}")
+            return time.perf_counter() - start
+        finally:
+            listener.stop_listening()
+            listener.dispose()
+            osl_server.dispose()
+
+
+@pytest.mark.parametrize("count", [100, 1000])
+def test_notification_delivery(count, record_timing):
+    inline = _deliver(count)
+    dispatcher = NotificationDispatcher()
+    try:
+        dispatched = _deliver(count, dispatcher)
+        dispatcher.join()
+    finally:
+        dispatcher.shutdown()
+    stats = dispatcher.stats
+    record_timing("inline", inline)
+    record_timing("dispatcher", dispatched)
+    print(
+        f"\n{count:>5} notifications: inline callbacks {inline * 1e3:9.3f} ms, "
+        f"dispatcher {dispatched * 1e3:9.3f} ms, coalesced {stats.coalesced}, "
+        f"max queued {stats.max_queued}"
+    )
+    assert stats.executed + stats.coalesced == count
@@ -0,0 +1,279 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark latency of the proxy solver loop on a local stand-in server.
+
+Each batch of designs is handed out by the stand-in server shortly after the previous batch
+was solved. The latency is the time between a design becoming available on the server and
+its result being received by the server.
+
+Run with ``pytest tests/benchmarks --perf -s`` to print the latencies.
+"""
+
+import json
+import logging
+import socket
+import statistics
+import struct
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ansys.optislang.core.communication_channels import CommunicationChannel
+import ansys.optislang.core.node_types as nt
+from ansys.optislang.core.tcp.nodes import TcpProxySolverNodeProxy
+from ansys.optislang.core.tcp.osl_server import TcpOslServer
+from ansys.optislang.core.tcp.project import TcpProjectProxy
+from ansys.optislang.parametric.design_study import (
+    ParametricDesignStudy,
+    ProxySolverExecutorType,
+)
+
+pytestmark = pytest.mark.perf
+
+BATCHES = 10
+BATCH_SIZE = 5
+# time needed by the stand-in server to create the next batch of designs
+BATCH_DELAY = 0.005
+
+
+def _recv_exact(conn: socket.socket, count: int) -> bytes:
+    data = b""
+    while len(data) < count:
+        chunk = conn.recv(count - len(data))
+        if not chunk:
+            raise ConnectionError("Connection closed.")
+        data += chunk
+    return data
+
+
+def _send_framed(conn: socket.socket, message) -> None:
+    data = json.dumps(message).encode()
+    conn.sendall(struct.pack("!QQ", len(data), len(data)) + data)
+
+
+class _ProxySolverServer:
+    """Stand-in optiSLang server running a project with a proxy solver."""
+
+    def __init__(self):
+        self.state = "IDLE"
+        self.latencies = []
+        self.__batch = 0
+        self.__pending = []
+        self.__pending_since = 0.0
+        self.__unsolved = set()
+        self.__listeners = {}
+        self.__lock = threading.Lock()
+        self.__socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.__socket.bind(("127.0.0.1", 0))
+        self.__socket.listen(16)
+        self.__socket.settimeout(0.2)
+        self.__running = True
+        self.__thread = threading.Thread(target=self.__serve, daemon=True)
+        self.__thread.start()
+
+    @property
+    def port(self) -> int:
+        return self.__socket.getsockname()[1]
+
+    def close(self):
+        self.__running = False
+        self.__thread.join()
+        self.__socket.close()
+
+    def __serve(self):
+        while self.__running:
+            try:
+                conn, _ = self.__socket.accept()
+            except socket.timeout:
+                continue
+            threading.Thread(target=self.__handle, args=(conn,), daemon=True).start()
+
+    def __handle(self, conn: socket.socket):
+        with conn:
+            while True:
+                try:
+                    length, _ = struct.unpack("!QQ", _recv_exact(conn, 16))
+                    request = json.loads(_recv_exact(conn, length))
+                except (ConnectionError, OSError):
+                    return
+                if "What" in request:
+                    response = self.__answer_query(request)
+                else:
+                    commands = request["projects"][0]["commands"]
+                    for command in commands:
+                        self.__execute_command(command)
+                    response = [
+                        {"status": "success", "command": command["command"]} for command in commands
+                    ]
+                _send_framed(conn, response)
+
+    def __answer_query(self, request: dict):
+        if request["What"] == "BASIC_PROJECT_INFO":
+            return {"projects": [{"state": self.state}]}
+        elif request["What"] == "GET_DESIGNS":
+            with self.__lock:
+                designs, self.__pending = self.__pending, []
+            return {"designs": designs}
+        elif request["What"] == "SERVER_INFO":
+            return {"application": {"version": "25.1.0 (123)"}}
+        return {"status": "success"}
+
+    def __execute_command(self, command: dict):
+        args = command.get("args", {})
+        if command["command"] == "REGISTER_LISTENER":
+            self.__listeners[args["uid"]] = (args["port"], args.get("notifications"))
+        elif command["command"] == "UNREGISTER_LISTENER":
+            self.__listeners.pop(args["uid"], None)
+        elif command["command"] == "START":
+            self.state = "PROCESSING"
+            self.__notify("PROCESSING_STARTED")
+            threading.Timer(BATCH_DELAY, self.__create_batch).start()
+        elif command["command"] == "SET_DESIGNS":
+            for design in args["designs"]:
+                self.latencies.append(time.perf_counter() - self.__pending_since)
+                self.__unsolved.remove(design["hid"])
+            if self.__unsolved:
+                return
+            if self.__batch < BATCHES:
+                threading.Timer(BATCH_DELAY, self.__create_batch).start()
+            else:
+                self.state = "FINISHED"
+                self.__notify("EXECUTION_FINISHED")
+
+    def __create_batch(self):
+        self.__batch += 1
+        with self.__lock:
+            self.__pending = [
+                {
+                    "hid": f"0.{(self.__batch - 1) * BATCH_SIZE + i}",
+                    "parameters": [{"name": "X1", "value": float(i)}],
+                }
+                for i in range(1, BATCH_SIZE + 1)
+            ]
+            self.__unsolved = {design["hid"] for design in self.__pending}
+            self.__pending_since = time.perf_counter()
+        self.__notify("ACTOR_DATA_CHANGED")
+
+    def __notify(self, type_: str):
+        for port, notifications in list(self.__listeners.values()):
+            if notifications is not None and type_ not in notifications:
+                continue
+            try:
+                with socket.create_connection(("127.0.0.1", port), timeout=5) as conn:
+                    _send_framed(conn, {"type": type_})
+                    conn.recv(16)
+            except OSError:
+                pass
+
+
+def _solve(designs):
+    for design in designs:
+        design.set_parameter_by_name("X1", design.parameters[0].value, reset_output=False)
+    return designs
+
+
+def _legacy_execute_proxy_solver(project, proxy_solver, callback):
+    """Execute the proxy solver by polling every 0.5 s, as done before notifications were used."""
+    study = ParametricDesignStudy(SimpleNamespace(), [])
+    convert_to_objects = study._ParametricDesignStudy__convert_design_dicts_to_objects
+    convert_to_responses = study._ParametricDesignStudy__convert_design_object_to_response
+    project.start(wait_for_finished=False)
+    while project.get_status() not in ("FINISHED", "STOPPED"):
+        design_list = proxy_solver.get_designs()
+        if len(design_list):
+            proxy_solver.set_designs(
+                convert_to_responses(callback(convert_to_objects(design_list)))
+            )
+        time.sleep(0.5)
+
+
+def _execute(loop, callback, **kwargs):
+    """Execute the proxy solver on the stand-in server, return latencies of the designs."""
+    server = _ProxySolverServer()
+    osl_server = TcpOslServer(
+        host="127.0.0.1",
+        port=server.port,
+        communication_channel=CommunicationChannel.TCP,
+        listeners_refresh_interval=3600,
+    )
+    try:
+        project = TcpProjectProxy(osl_server=osl_server, uid="root-uid")
+        proxy_solver = TcpProxySolverNodeProxy(
+            uid="proxy-uid", osl_server=osl_server, type_=nt.ProxySolver
+        )
+        if loop == "legacy":
+            _legacy_execute_proxy_solver(project, proxy_solver, callback)
+        else:
+            osl_instance = SimpleNamespace(
+                application=SimpleNamespace(project=project),
+                osl_server=osl_server if loop == "notifications" else None,
+                log=logging.getLogger(__name__),
+            )
+            study = ParametricDesignStudy(osl_instance, [], **kwargs)
+            study._ParametricDesignStudy__execute_proxy_solver(proxy_solver, callback)
+    finally:
+        osl_server.dispose()
+        server.close()
+    assert len(server.latencies) == BATCHES * BATCH_SIZE
+    return server.latencies
+
+
+@pytest.mark.parametrize("loop", ["legacy", "polling", "notifications"])
+def test_proxy_solver_latency(loop):
+    latencies = _execute(loop, _solve)
+    print(
+        f"\n{loop:>13}: design latency mean {statistics.mean(latencies) * 1e3:7.1f} ms, "
+        f"max {max(latencies) * 1e3:7.1f} ms"
+    )
+    if loop != "legacy":
+        assert statistics.mean(latencies) < 0.25
+
+
+def _solve_slowly(design):
+    time.sleep(0.02 * float(design.parameters[0].value))
+    return design
+
+
+def _solve_batch_slowly(designs):
+    return [_solve_slowly(design) for design in designs]
+
+
+@pytest.mark.parametrize("executor", [None, ProxySolverExecutorType.THREAD_POOL])
+def test_proxy_solver_executor(executor):
+    """Callback takes 20 ms to 100 ms per design, depending on the design."""
+    start = time.perf_counter()
+    latencies = _execute(
+        "notifications",
+        _solve_batch_slowly if executor is None else _solve_slowly,
+        executor=executor,
+        max_workers=BATCH_SIZE,
+    )
+    duration = time.perf_counter() - start
+    name = "batch" if executor is None else executor.name.lower()
+    print(
+        f"\n{name:>11}: design latency mean {statistics.mean(latencies) * 1e3:7.1f} ms, "
+        f"total {duration * 1e3:7.1f} ms"
+    )
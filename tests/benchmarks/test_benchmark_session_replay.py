@@ -0,0 +1,95 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark client workloads replayed from a recorded session.
+
+A session is recorded against the ``StandInOslServer`` with injected latency and replayed
+by the ``ReplayOslServer`` without delays, so the wall time, CPU time and peak memory of the
+client can be measured repeatably, independent of the server.
+
+Run with ``pytest tests/benchmarks --perf -s`` to print the timings.
+"""
+
+import time
+import tracemalloc
+
+import pytest
+
+from ansys.optislang.core.tcp.managers import TcpDesignManagerProxy
+from ansys.optislang.core.tcp.project import TcpProjectProxy
+from ansys.optislang.core.tcp.stand_in_server import (
+    ReplayOslServer,
+    StandInOslServer,
+    create_project_tree,
+)
+
+pytestmark = pytest.mark.perf
+
+
+def _run_workload(osl_server, systems: int) -> None:
+    root_system = TcpProjectProxy(osl_server=osl_server, uid="root").root_system
+    for i in range(1, systems + 1):
+        root_system.find_node_by_uid(f"system-{i}", search_depth=1)
+        TcpDesignManagerProxy(uid=f"system-{i}", osl_server=osl_server).get_designs()
+
+
+@pytest.mark.parametrize("designs", [100, 1000])
+def test_replay_workload(tmp_path, designs):
+    path = tmp_path / "session.jsonl.gz"
+    systems = 5
+    with StandInOslServer(
+        project_tree=create_project_tree(systems=systems),
+        designs=designs,
+        parameters=20,
+        responses=10,
+        latency=0.005,
+    ) as server:
+        osl_server = server.create_osl_server()
+        try:
+            recorder = osl_server.enable_recording(path)
+            start = time.perf_counter()
+            _run_workload(osl_server, systems)
+            recorded = time.perf_counter() - start
+        finally:
+            osl_server.dispose()
+
+    with ReplayOslServer(path) as server:
+        osl_server = server.create_osl_server()
+        try:
+            start, start_cpu = time.perf_counter(), time.process_time()
+            _run_workload(osl_server, systems)
+            replayed = time.perf_counter() - start
+            cpu = time.process_time() - start_cpu
+            # responses of the exhausted requests are repeated, so the workload can run again
+            tracemalloc.start()
+            _run_workload(osl_server, systems)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        finally:
+            osl_server.dispose()
+    print(
+        f"\n{designs:>5} designs, {recorder.requests} requests: recorded {recorded * 1e3:9.3f} ms, "
+        f"replayed {replayed * 1e3:9.3f} ms, CPU {cpu * 1e3:9.3f} ms, "
+        f"peak memory {peak / 2**20:7.2f} MiB"
+    )
+    assert server.unmatched_requests == []
@@ -0,0 +1,110 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark ``TcpOslServer`` and the node proxies on a local stand-in server.
+
+Projects of realistic sizes are served by the ``StandInOslServer``, optionally with injected
+latency of each request, so the client-side costs can be measured without optiSLang.
+
+Run with ``pytest tests/benchmarks --perf -s`` to print the timings.
+"""
+
+import time
+
+import pytest
+
+from ansys.optislang.core.tcp import server_queries as queries
+from ansys.optislang.core.tcp.managers import TcpDesignManagerProxy
+from ansys.optislang.core.tcp.project import TcpProjectProxy
+from ansys.optislang.core.tcp.stand_in_server import StandInOslServer, create_project_tree
+
+pytestmark = pytest.mark.perf
+
+
+def _best_of(function, repeats: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.parametrize("systems", [10, 100, 1000])
+def test_find_nodes(systems):
+    project_tree = create_project_tree(systems=systems, nodes_per_system=10)
+    with StandInOslServer(project_tree=project_tree) as server:
+        osl_server = server.create_osl_server()
+        try:
+            root_system = TcpProjectProxy(osl_server=osl_server, uid="root").root_system
+
+            def find_nodes():
+                for i in range(1, 11):
+                    root_system.find_node_by_uid(f"node-{i}-1", search_depth=2)
+
+            uncached = _best_of(find_nodes, repeats=3)
+            osl_server.enable_project_tree_cache(use_notifications=False)
+            cached = _best_of(find_nodes, repeats=3)
+        finally:
+            osl_server.dispose()
+    print(
+        f"\n{systems * 11:>6} nodes, 10 lookups: uncached {uncached * 1e3:9.3f} ms, "
+        f"cached project tree {cached * 1e3:9.3f} ms"
+    )
+    assert cached < uncached
+
+
+@pytest.mark.parametrize("designs", [1000, 10000])
+def test_get_designs(designs):
+    with StandInOslServer(designs=designs, parameters=20, responses=10) as server:
+        osl_server = server.create_osl_server()
+        try:
+            design_manager = TcpDesignManagerProxy(uid="system-1", osl_server=osl_server)
+            objects = _best_of(design_manager.get_designs, repeats=3)
+            table = _best_of(design_manager.get_designs_table, repeats=3)
+        finally:
+            osl_server.dispose()
+    print(
+        f"\n{designs:>6} designs: design objects {objects * 1e3:9.3f} ms, "
+        f"designs table {table * 1e3:9.3f} ms"
+    )
+
+
+@pytest.mark.parametrize("latency", [0, 0.001, 0.01])
+def test_request_latency(latency):
+    requests = [queries.actor_info(uid=f"system-{i}") for i in range(1, 21)]
+    with StandInOslServer(project_tree=create_project_tree(systems=20), latency=latency) as server:
+        single_use = server.create_osl_server()
+        persistent = server.create_osl_server(persistent_connections=True)
+        try:
+            sequential = _best_of(lambda: [single_use.send_command(r) for r in requests])
+            reused = _best_of(lambda: [persistent.send_command(r) for r in requests])
+            batch = _best_of(lambda: persistent.send_commands(requests))
+        finally:
+            single_use.dispose()
+            persistent.dispose()
+    print(
+        f"\n{latency * 1e3:4.0f} ms latency, 20 queries: single-use connections "
+        f"{sequential * 1e3:8.3f} ms, persistent {reused * 1e3:8.3f} ms, "
+        f"batch {batch * 1e3:8.3f} ms"
+    )
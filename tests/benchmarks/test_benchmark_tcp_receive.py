@@ -0,0 +1,105 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark receiving of large responses by ``TcpClient``.
+
+Run with ``pytest tests/benchmarks --perf -s`` to print the timings.
+"""
+
+import json
+import socket
+import struct
+import threading
+import time
+
+import pytest
+
+from ansys.optislang.core.encoding import force_text
+from ansys.optislang.core.tcp.osl_server import TcpClient
+
+pytestmark = pytest.mark.perf
+
+_BUFFER_SIZE = pow(2, 16)
+
+
+def _create_payload(size: int) -> bytes:
+    """Create JSON list of design values with approximately the given size in bytes."""
+    item = '{"hid": "0.1", "values": [1.0, 2.0, 3.0]}, '
+    count = max(1, size // len(item))
+    return ("[" + item * (count - 1) + item[:-2] + "]").encode()
+
+
+def _legacy_receive(sock: socket.socket, count: int) -> bytes:
+    """Receive data by concatenating chunks, as done before the ``recv_into`` receive path."""
+    received = b""
+    received_len = 0
+    while received_len < count:
+        chunk = sock.recv(min(_BUFFER_SIZE, count - received_len))
+        if not chunk:
+            raise ConnectionError("Connection closed.")
+        received += chunk
+        received_len += len(chunk)
+    return received
+
+
+def _measure(payload: bytes, receive) -> float:
+    """Send framed payload over a socket pair and measure receiving and decoding of it."""
+    sender, receiver = socket.socketpair()
+    thread = threading.Thread(
+        target=sender.sendall, args=(struct.pack("!QQ", len(payload), len(payload)) + payload,)
+    )
+    try:
+        thread.start()
+        start = time.perf_counter()
+        receive(receiver)
+        elapsed = time.perf_counter() - start
+        thread.join()
+    finally:
+        sender.close()
+        receiver.close()
+    return elapsed
+
+
+def _receive_legacy(sock: socket.socket):
+    length, _ = struct.unpack("!QQ", _legacy_receive(sock, 16))
+    return json.loads(force_text(_legacy_receive(sock, length)))
+
+
+def _receive_zero_copy(sock: socket.socket):
+    return json.loads(TcpClient(sock).receive_raw_msg(timeout=None))
+
+
+@pytest.mark.parametrize("size_mb", [1, 10, 100])
+def test_receive_large_response(size_mb):
+    payload = _create_payload(size_mb * pow(2, 20))
+
+    repeats = 5 if size_mb < 10 else 1
+    legacy = min(_measure(payload, _receive_legacy) for _ in range(repeats))
+    zero_copy = min(_measure(payload, _receive_zero_copy) for _ in range(repeats))
+
+    print(
+        f"\n{size_mb:>4} MB response: chunk concatenation {legacy:.3f} s, "
+        f"recv_into {zero_copy:.3f} s, speedup {legacy / zero_copy:.1f}x"
+    )
+    if size_mb >= 10:
+        assert zero_copy < legacy
@@ -20,8 +20,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import json
 import os
 import pathlib
+import platform
 import shutil
 
 import pytest
@@ -36,6 +38,17 @@ def pytest_addoption(parser):
         default=False,
         help="run tests with local optiSLang process",
     )
+    parser.addoption(
+        "--perf",
+        action="store_true",
+        default=False,
+        help="run performance benchmarks",
+    )
+    parser.addoption(
+        "--perf_results",
+        default=None,
+        help="store timings of performance benchmarks to the JSON file",
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -45,6 +58,67 @@ def pytest_collection_modifyitems(config, items):
         for item in items:
             if "local_osl" in item.keywords:
                 item.add_marker(skip_local_osl)
+    if not config.getoption("--perf"):
+        skip_perf = pytest.mark.skip(reason="need --perf option to run")
+        for item in items:
+            if "perf" in item.keywords:
+                item.add_marker(skip_perf)
+
+
+@pytest.fixture(scope="session")
+def perf_results(request):
+    """Get timings of performance benchmarks, stored to the ``--perf_results`` file at the end.
+
+    The file contains the version of the package, Python and the platform, so timings of
+    different releases can be compared.
+
+    Parameters
+    ----------
+    request : pytest.FixtureRequest
+        Builtin fixture providing the command line options.
+
+    Returns
+    -------
+    dict
+        Timings in seconds keyed by names of benchmarks.
+    """
+    results: dict = {}
+    yield results
+    path = request.config.getoption("--perf_results")
+    if path is None or not results:
+        return
+    from ansys.optislang.core import __version__
+
+    content = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": dict(sorted(results.items())),
+    }
+    pathlib.Path(path).write_text(json.dumps(content, indent=2), encoding="utf-8")
+
+
+@pytest.fixture
+def record_timing(request, perf_results):
+    """Record timing of the current performance benchmark.
+
+    Parameters
+    ----------
+    request : pytest.FixtureRequest
+        Builtin fixture providing the current test.
+    perf_results : dict
+        Timings of performance benchmarks.
+
+    Returns
+    -------
+    Callable[[str, float], None]
+        Function taking the name of the measured operation and its duration in seconds.
+    """
+
+    def _record(name: str, seconds: float) -> None:
+        perf_results[f"{request.node.nodeid}::{name}"] = seconds
+
+    return _record
 
 
 @pytest.fixture
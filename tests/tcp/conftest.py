@@ -0,0 +1,139 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Fixtures shared by the TCP tests."""
+
+import collections
+import json
+import socket
+import struct
+import threading
+
+import pytest
+
+
+def _recv_exact(conn: socket.socket, count: int) -> bytes:
+    data = b""
+    while len(data) < count:
+        chunk = conn.recv(count - len(data))
+        if not chunk:
+            raise ConnectionError("Connection closed.")
+        data += chunk
+    return data
+
+
+class _FramedServer:
+    """Answer framed requests, optionally closing the connection after each response.
+
+    Responses to queries listed in ``query_responses`` are sent as given. Results of commands
+    are created by ``command_handler``, if given. Received queries are counted in ``queries``
+    and received commands are recorded in ``commands``.
+    """
+
+    def __init__(
+        self, close_after_response: bool = False, query_responses=None, command_handler=None
+    ):
+        self.close_after_response = close_after_response
+        self.query_responses = query_responses or {}
+        self.command_handler = command_handler
+        self.connections = 0
+        self.requests = 0
+        self.queries = collections.Counter()
+        self.commands = []
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.bind(("127.0.0.1", 0))
+        self._socket.listen(16)
+        self._socket.settimeout(0.2)
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    @property
+    def port(self) -> int:
+        return self._socket.getsockname()[1]
+
+    def close(self):
+        self._running = False
+        self._thread.join()
+        self._socket.close()
+
+    def _serve(self):
+        while self._running:
+            try:
+                conn, _ = self._socket.accept()
+            except socket.timeout:
+                continue
+            self.connections += 1
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn: socket.socket):
+        with conn:
+            while True:
+                try:
+                    length, _ = struct.unpack("!QQ", _recv_exact(conn, 16))
+                    request = json.loads(_recv_exact(conn, length))
+                except (ConnectionError, OSError):
+                    return
+                self.requests += 1
+                if "What" in request:
+                    self.queries[request["What"]] += 1
+                else:
+                    self.commands.extend(request["projects"][0]["commands"])
+                if request.get("What") in self.query_responses:
+                    response = self.query_responses[request["What"]]
+                elif request.get("What") == "SERVER_INFO":
+                    response = {"application": {"version": "25.1.0 (123)"}}
+                elif "What" in request:
+                    response = {
+                        "status": "success",
+                        "what": request["What"],
+                        "hid": request.get("hid"),
+                    }
+                elif self.command_handler is not None:
+                    response = [
+                        self.command_handler(command)
+                        for command in request["projects"][0]["commands"]
+                    ]
+                else:
+                    response = [
+                        {"status": "success", "command": command["command"]}
+                        for command in request["projects"][0]["commands"]
+                    ]
+                data = json.dumps(response).encode()
+                conn.sendall(struct.pack("!QQ", len(data), len(data)) + data)
+                if self.close_after_response:
+                    return
+
+
+@pytest.fixture
+def framed_server():
+    servers = []
+
+    def _create(**kwargs):
+        server = _FramedServer(**kwargs)
+        servers.append(server)
+        return server
+
+    yield _create
+    for server in servers:
+        server.close()
@@ -0,0 +1,136 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Test ``AsyncTcpOslServer`` against a minimal in-process server."""
+
+import asyncio
+import json
+import socket
+import struct
+
+import pytest
+
+from ansys.optislang.core.errors import EmptyResponseError, OslCommunicationError
+from ansys.optislang.core.osl_server import OslVersion
+from ansys.optislang.core.tcp import server_commands as commands
+from ansys.optislang.core.tcp import server_queries as queries
+from ansys.optislang.core.tcp.async_osl_server import AsyncTcpClient, AsyncTcpOslServer
+
+
+def test_requires_address():
+    with pytest.raises(ValueError):
+        AsyncTcpOslServer(host="127.0.0.1")
+
+
+def test_client_send_receive(framed_server):
+    server = framed_server()
+
+    async def run():
+        client = AsyncTcpClient()
+        await client.connect("127.0.0.1", server.port)
+        assert client.is_connected
+        await client.send_msg(queries.server_info())
+        response = json.loads(await client.receive_msg())
+        await client.disconnect()
+        assert not client.is_connected
+        return response
+
+    assert asyncio.run(run()) == {"application": {"version": "25.1.0 (123)"}}
+
+
+def test_client_empty_response():
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+
+    async def run():
+        client = AsyncTcpClient()
+        await client.connect("127.0.0.1", listener.getsockname()[1])
+        conn, _ = listener.accept()
+        with conn:
+            conn.sendall(struct.pack("!QQ", 0, 0))
+            with pytest.raises(EmptyResponseError):
+                await client.receive_msg(timeout=2)
+        await client.disconnect()
+
+    try:
+        asyncio.run(run())
+    finally:
+        listener.close()
+
+
+def test_queries(framed_server):
+    server = framed_server()
+    osl_server = AsyncTcpOslServer(host="127.0.0.1", port=server.port)
+
+    async def run():
+        return await asyncio.gather(
+            osl_server.get_osl_version(),
+            osl_server.get_server_is_alive(),
+            osl_server.get_actor_status_info("uid", "0"),
+        )
+
+    version, is_alive, status_info = asyncio.run(run())
+    assert version == OslVersion(25, 1, 0, 123)
+    assert is_alive
+    assert status_info["what"] == "ACTOR_STATUS_INFO"
+    assert server.connections == 3
+
+
+def test_send_commands(framed_server):
+    server = framed_server()
+    osl_server = AsyncTcpOslServer(host="127.0.0.1", port=server.port)
+    requests = [commands.save(), queries.server_is_alive(), commands.start(), commands.stop()]
+
+    responses = asyncio.run(osl_server.send_commands(requests))
+
+    assert responses[0][0]["command"] == "SAVE"
+    assert responses[1]["what"] == "SERVER_IS_ALIVE"
+    assert [response[0]["command"] for response in responses[2:]] == ["START", "STOP"]
+    assert server.connections == 1
+    assert server.requests == 3
+    assert server.connections == 1
+
+
+def test_send_commands_pipeline_window(framed_server):
+    server = framed_server()
+    osl_server = AsyncTcpOslServer(host="127.0.0.1", port=server.port)
+    hids = [f"0.{idx}" for idx in range(1, 1001)]
+    requests = [queries.actor_status_info(uid="uid", hid=hid) for hid in hids]
+    assert sum(len(request) for request in requests) > AsyncTcpOslServer._PIPELINE_WINDOW_SIZE
+
+    responses = asyncio.run(osl_server.send_commands(requests))
+
+    assert [response["hid"] for response in responses] == hids
+    assert server.connections == 1
+
+
+def test_communication_error():
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    port = listener.getsockname()[1]
+    listener.close()
+    osl_server = AsyncTcpOslServer(host="127.0.0.1", port=port)
+
+    with pytest.raises(OslCommunicationError):
+        asyncio.run(osl_server.get_server_info())
@@ -0,0 +1,73 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test receiving of messages by ``TcpClient`` over a socket pair."""
+
+import socket
+import struct
+import threading
+
+import pytest
+
+import ansys.optislang.core.tcp.osl_server as tos
+
+
+def _send(sender: socket.socket, data: bytes) -> None:
+    sender.sendall(data)
+    sender.shutdown(socket.SHUT_WR)
+
+
+def _receive(data: bytes, monkeypatch, max_preallocated_size: int) -> bytearray:
+    monkeypatch.setattr(tos.TcpClient, "_MAX_PREALLOCATED_SIZE", max_preallocated_size)
+    sender, receiver = socket.socketpair()
+    thread = threading.Thread(target=_send, args=(sender, data))
+    try:
+        thread.start()
+        return tos.TcpClient(receiver).receive_raw_msg(timeout=5)
+    finally:
+        thread.join()
+        sender.close()
+        receiver.close()
+
+
+@pytest.mark.parametrize("max_preallocated_size", [pow(2, 24), 7, 1])
+def test_receive_raw_msg(monkeypatch, max_preallocated_size):
+    payload = b'{"values": [' + b", ".join(b"1.0" for _ in range(100_000)) + b"]}"
+
+    received = _receive(
+        struct.pack("!QQ", len(payload), len(payload)) + payload,
+        monkeypatch,
+        max_preallocated_size,
+    )
+
+    assert received == payload
+
+
+def test_receive_raw_msg_untrusted_size(monkeypatch):
+    declared_size = pow(2, 40)
+
+    with pytest.raises(ConnectionError):
+        _receive(
+            struct.pack("!QQ", declared_size, declared_size) + b'{"status": "success"}',
+            monkeypatch,
+            pow(2, 10),
+        )
@@ -0,0 +1,117 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Test the column-oriented designs table."""
+
+import pytest
+
+from ansys.optislang.core.communication_channels import CommunicationChannel
+from ansys.optislang.core.tcp.managers import TcpDesignManagerProxy
+from ansys.optislang.core.tcp.osl_server import TcpOslServer
+
+
+def _create_status_info(count: int) -> dict:
+    return {
+        "design_status": [
+            {
+                "feasible": i % 2 == 0,
+                "id": f"0.{i}",
+                "pareto_design": False,
+                "status": "succeeded" if i < count else "failed",
+            }
+            for i in range(1, count + 1)
+        ],
+        "designs": {
+            "constraint_names": [],
+            "limit_state_names": [],
+            "objective_names": ["obj"],
+            "parameter_names": ["X1", "X2"],
+            "response_names": ["Y"],
+            "values": [
+                {
+                    "constraint_values": [],
+                    "hid": f"0.{i}",
+                    "limit_state_values": [],
+                    "objective_values": [-i * 0.5],
+                    "parameter_values": [i, 1e-3 * i],
+                    "response_values": [i * 0.5],
+                }
+                for i in range(1, count + 1)
+            ],
+        },
+        "status": "success",
+    }
+
+
+def _create_osl_server(port: int) -> TcpOslServer:
+    return TcpOslServer(
+        host="127.0.0.1",
+        port=port,
+        communication_channel=CommunicationChannel.TCP,
+        listeners_refresh_interval=3600,
+    )
+
+
+def test_get_designs_table(framed_server):
+    server = framed_server(query_responses={"ACTOR_STATUS_INFO": _create_status_info(1000)})
+    osl_server = _create_osl_server(server.port)
+    try:
+        design_manager = TcpDesignManagerProxy(uid="uid", osl_server=osl_server)
+        table = design_manager.get_designs_table()
+        designs = design_manager.get_designs()
+
+        assert len(table) == len(designs) == 1000
+        assert list(table.ids) == [design.id for design in designs]
+        assert list(table.feasibility) == [design.feasibility for design in designs]
+        assert list(table.status) == [design.status.name for design in designs]
+        assert table.status[-1] == "FAILED"
+        assert list(table.parameters) == ["X1", "X2"]
+        assert list(table.parameters["X2"]) == [design.parameters[1].value for design in designs]
+        assert list(table.objectives["obj"]) == [design.objectives[0].value for design in designs]
+        assert list(table.responses["Y"]) == [design.responses[0].value for design in designs]
+        assert table.constraints == {}
+    finally:
+        osl_server.dispose()
+
+
+def test_get_designs_table_empty(framed_server):
+    server = framed_server(query_responses={"ACTOR_STATUS_INFO": _create_status_info(0)})
+    osl_server = _create_osl_server(server.port)
+    try:
+        table = TcpDesignManagerProxy(uid="uid", osl_server=osl_server).get_designs_table()
+        assert len(table) == 0
+        assert table.parameters == {"X1": (), "X2": ()}
+    finally:
+        osl_server.dispose()
+
+
+def test_get_designs_table_mismatch(framed_server):
+    status_info = _create_status_info(3)
+    status_info["designs"]["values"].pop()
+    server = framed_server(query_responses={"ACTOR_STATUS_INFO": status_info})
+    osl_server = _create_osl_server(server.port)
+    try:
+        with pytest.raises(ValueError):
+            TcpDesignManagerProxy(uid="uid", osl_server=osl_server).get_designs_table()
+    finally:
+        osl_server.dispose()
@@ -0,0 +1,137 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Test evaluation of multiple designs by the root system."""
+
+import logging
+
+import pytest
+
+from ansys.optislang.core.communication_channels import CommunicationChannel
+from ansys.optislang.core.evaluation_cache import EvaluationCache
+from ansys.optislang.core.project_parametric import Design, DesignStatus
+from ansys.optislang.core.tcp.nodes import TcpRootSystemProxy
+from ansys.optislang.core.tcp.osl_server import TcpOslServer
+
+
+def _evaluate_design(command: dict) -> dict:
+    """Evaluate ``Y = X1 + X2``, the server uses reference value ``0`` for missing ``X2``."""
+    if command["command"] != "EVALUATE_DESIGN":
+        return {"status": "success", "command": command["command"]}
+    parameters = {"X2": 0, **command["args"]["parameters"]}
+    result_design = {
+        "hid": f"0.{int(parameters['X1'])}",
+        "feasible": True,
+        "status": "succeeded" if parameters["X1"] >= 0 else "failed",
+        "parameter_names": ["X1", "X2"],
+        "parameter_values": [parameters["X1"], parameters["X2"]],
+        "response_names": ["Y"],
+        "response_values": [parameters["X1"] + parameters["X2"]],
+        "objective_names": ["obj"],
+        "objective_values": [-parameters["X1"]],
+    }
+    for kind in ("constraint", "limit_state", "variable"):
+        result_design[f"{kind}_names"] = []
+        result_design[f"{kind}_values"] = []
+    return {"status": "success", "result_design": result_design}
+
+
+@pytest.fixture
+def root_system(framed_server):
+    server = framed_server(command_handler=_evaluate_design)
+    osl_server = TcpOslServer(
+        host="127.0.0.1",
+        port=server.port,
+        communication_channel=CommunicationChannel.TCP,
+        listeners_refresh_interval=3600,
+    )
+    yield server, TcpRootSystemProxy(uid="root", osl_server=osl_server)
+    osl_server.dispose()
+
+
+def _count_evaluated(server) -> int:
+    return len([command for command in server.commands if command["command"] == "EVALUATE_DESIGN"])
+
+
+def _create_designs(count: int):
+    return (Design(parameters={"X1": i, "X2": 0.5}) for i in range(1, count + 1))
+
+
+def test_evaluate_designs(root_system):
+    server, root_system = root_system
+    requests = server.requests
+    results = root_system.evaluate_designs(_create_designs(250), chunk_size=100)
+    # designs are sent as the results are consumed
+    assert server.requests == requests
+    results = list(results)
+    assert server.requests == requests + 3
+    assert _count_evaluated(server) == 250
+    assert [design.id for design in results] == [f"0.{i}" for i in range(1, 251)]
+    assert results[9].responses[0].value == 10.5
+    assert results[9].objectives[0].value == -10
+    assert results[9].status == DesignStatus.SUCCEEDED
+    single = root_system.evaluate_design(Design(parameters={"X1": 10, "X2": 0.5}))
+    assert single.responses == results[9].responses
+    assert single.parameters == results[9].parameters
+
+
+def test_evaluate_designs_missing_parameter(root_system, caplog):
+    _, root_system = root_system
+    with caplog.at_level(logging.WARNING):
+        results = list(
+            root_system.evaluate_designs(Design(parameters={"X1": i}) for i in range(1, 4))
+        )
+    assert [design.parameters_names for design in results] == [("X1", "X2")] * 3
+    # names of parameters are compared only once
+    assert len([record for record in caplog.records if "were missing" in record.message]) == 1
+
+
+def test_evaluate_designs_table(root_system):
+    server, root_system = root_system
+    designs = [Design(parameters={"X1": i, "X2": 0.5}) for i in (1, 2, -3)]
+    requests = server.requests
+    table = root_system.evaluate_designs_table(designs, chunk_size=2)
+    assert server.requests == requests + 2
+    assert list(table.ids) == ["0.1", "0.2", "0.-3"]
+    assert list(table.status) == ["SUCCEEDED", "SUCCEEDED", "FAILED"]
+    assert table.parameters == {"X1": [1, 2, -3], "X2": [0.5, 0.5, 0.5]}
+    assert table.responses == {"Y": [1.5, 2.5, -2.5]}
+    assert table.objectives == {"obj": [-1, -2, 3]}
+    assert table.constraints == {}
+
+
+def test_evaluate_designs_evaluation_cache(root_system):
+    server, root_system = root_system
+    cache = root_system.enable_evaluation_cache(EvaluationCache())
+    designs = [Design(parameters={"X1": i, "X2": 0.5}) for i in (1, 2, -3, 1, 2, -3)]
+    results = list(root_system.evaluate_designs(designs, chunk_size=3))
+    # failed designs are not cached
+    assert _count_evaluated(server) == 4
+    assert (cache.hits, cache.misses) == (2, 4)
+    assert [design.responses[0].value for design in results] == [1.5, 2.5, -2.5] * 2
+
+
+def test_evaluate_designs_invalid_chunk_size(root_system):
+    _, root_system = root_system
+    with pytest.raises(ValueError):
+        root_system.evaluate_designs([], chunk_size=0)
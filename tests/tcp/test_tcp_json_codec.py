@@ -0,0 +1,82 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Test selection of the JSON codec of ``TcpOslServer``."""
+
+import pytest
+
+from ansys.optislang.core.communication_channels import CommunicationChannel
+from ansys.optislang.core.json_codec import StdlibJsonCodec, get_available_json_codecs
+from ansys.optislang.core.tcp import server_commands as commands
+from ansys.optislang.core.tcp import server_queries as queries
+from ansys.optislang.core.tcp.osl_server import TcpOslServer
+
+
+class _CountingCodec(StdlibJsonCodec):
+    def __init__(self):
+        self.decoded = 0
+
+    def loads(self, data):
+        self.decoded += 1
+        return super().loads(data)
+
+
+@pytest.mark.parametrize("json_codec", get_available_json_codecs())
+def test_json_codec_name(framed_server, json_codec):
+    server = framed_server()
+    osl_server = TcpOslServer(
+        host="127.0.0.1",
+        port=server.port,
+        communication_channel=CommunicationChannel.TCP,
+        listeners_refresh_interval=3600,
+        json_codec=json_codec,
+    )
+    try:
+        assert osl_server.json_codec.name == json_codec
+        assert osl_server.osl_version_string == "25.1.0 (123)"
+    finally:
+        osl_server.dispose()
+
+
+def test_json_codec_instance(framed_server):
+    server = framed_server()
+    codec = _CountingCodec()
+    osl_server = TcpOslServer(
+        host="127.0.0.1",
+        port=server.port,
+        communication_channel=CommunicationChannel.TCP,
+        listeners_refresh_interval=3600,
+        json_codec=codec,
+    )
+    try:
+        assert osl_server.json_codec is codec
+        decoded = codec.decoded
+        responses = osl_server.send_commands(
+            [queries.server_is_alive(), commands.save(), commands.stop()]
+        )
+        assert responses[1][0]["command"] == "SAVE"
+        assert responses[2][0]["command"] == "STOP"
+        # Merging decodes each of the commands, each response is decoded once.
+        assert codec.decoded - decoded == 5
+    finally:
+        osl_server.dispose()
@@ -0,0 +1,183 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Test incremental decoding of large server responses."""
+
+import json
+
+import pytest
+
+from ansys.optislang.core.communication_channels import CommunicationChannel
+from ansys.optislang.core.errors import OslCommandError
+from ansys.optislang.core.project_parametric import DesignStatus
+from ansys.optislang.core.tcp.json_stream import iter_json_events
+from ansys.optislang.core.tcp.managers import TcpDesignManagerProxy
+from ansys.optislang.core.tcp.osl_server import TcpOslServer
+
+STREAM_PATHS = [("designs", "values"), ("design_status",)]
+
+
+def _create_status_info(count: int) -> dict:
+    return {
+        "design_status": [
+            {"feasible": True, "id": f"0.{i}", "pareto_design": False, "status": "succeeded"}
+            for i in range(1, count + 1)
+        ],
+        "designs": {
+            "constraint_names": [],
+            "limit_state_names": [],
+            "objective_names": ["obj"],
+            "parameter_names": ["X1", "X2"],
+            "response_names": ["Y"],
+            "values": [
+                {
+                    "hid": f"0.{i}",
+                    "objective_values": [-i * 0.5],
+                    "parameter_values": [i, 1e-3 * i],
+                    "response_values": [i * 0.5],
+                }
+                for i in range(1, count + 1)
+            ],
+        },
+        "status": "success",
+    }
+
+
+def _split(data: bytes, chunk_size: int):
+    return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024, pow(2, 20)])
+def test_iter_json_events(chunk_size):
+    status_info = _create_status_info(50)
+    chunks = _split(json.dumps(status_info).encode(), chunk_size)
+
+    events = list(iter_json_events(chunks, STREAM_PATHS))
+
+    assert [value for path, value in events if path == ("designs", "values")] == status_info[
+        "designs"
+    ]["values"]
+    assert [value for path, value in events if path == ("design_status",)] == status_info[
+        "design_status"
+    ]
+    assert (("designs", "parameter_names"), ["X1", "X2"]) in events
+    assert (("status",), "success") in events
+    assert list(iter_json_events(chunks, [])) == [((), status_info)]
+
+
+def test_iter_json_events_non_ascii():
+    document = {"values": ["äöü", 12345678901234567890, -1.5e-7, None, True], "name": "€"}
+    events = list(iter_json_events(_split(json.dumps(document).encode(), 1), [("values",)]))
+    events_utf8 = list(
+        iter_json_events(
+            _split(json.dumps(document, ensure_ascii=False).encode(), 1), [("values",)]
+        )
+    )
+    expected = [(("values",), value) for value in document["values"]] + [(("name",), "€")]
+    assert events == expected
+    assert events_utf8 == expected
+
+
+@pytest.mark.parametrize(
+    "document", [b'{"values": [1, 2', b'{"values": [1 2]}', b'{"a" 1}', b'{"a": 1} 2', b""]
+)
+def test_iter_json_events_invalid(document):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_events([document], [("values",)]))
+
+
+def _create_osl_server(port: int) -> TcpOslServer:
+    return TcpOslServer(
+        host="127.0.0.1",
+        port=port,
+        communication_channel=CommunicationChannel.TCP,
+        listeners_refresh_interval=3600,
+    )
+
+
+def test_iter_designs(framed_server):
+    status_info = _create_status_info(1000)
+    server = framed_server(query_responses={"ACTOR_STATUS_INFO": status_info})
+    osl_server = _create_osl_server(server.port)
+    try:
+        design_manager = TcpDesignManagerProxy(uid="uid", osl_server=osl_server)
+        designs = design_manager.get_designs()
+        assert len(designs) == 1000
+        assert designs[9].id == "0.10"
+        assert designs[9].parameters_names == ("X1", "X2")
+        assert [parameter.value for parameter in designs[9].parameters] == [10, 0.01]
+        assert designs[9].responses[0].value == 5.0
+        assert designs[9].status == DesignStatus.SUCCEEDED
+        assert design_manager.get_designs(stream=True) == designs
+
+        iterator = design_manager.iter_designs()
+        assert next(iterator).id == "0.1"
+        iterator.close()
+
+        states = design_manager.get_designs(include_design_values=False)
+        assert [design.id for design in states] == [design.id for design in designs]
+    finally:
+        osl_server.dispose()
+
+
+@pytest.mark.parametrize("stream, error", [(False, KeyError), (True, ValueError)])
+def test_get_designs_missing_design_status(framed_server, stream, error):
+    status_info = _create_status_info(10)
+    del status_info["design_status"]
+    server = framed_server(query_responses={"ACTOR_STATUS_INFO": status_info})
+    osl_server = _create_osl_server(server.port)
+    try:
+        design_manager = TcpDesignManagerProxy(uid="uid", osl_server=osl_server)
+        with pytest.raises(error):
+            design_manager.get_designs(stream=stream)
+    finally:
+        osl_server.dispose()
+
+
+def test_send_command_stream_failure(framed_server):
+    server = framed_server(
+        query_responses={"ACTOR_STATUS_INFO": {"message": "Unknown actor", "status": "failure"}}
+    )
+    osl_server = _create_osl_server(server.port)
+    try:
+        with pytest.raises(OslCommandError, match="Unknown actor"):
+            list(osl_server.iter_actor_status_info(uid="uid", hid="0"))
+    finally:
+        osl_server.dispose()
+
+
+def test_iter_designs_compact(framed_server):
+    status_info = _create_status_info(100)
+    server = framed_server(query_responses={"ACTOR_STATUS_INFO": status_info})
+    osl_server = _create_osl_server(server.port)
+    try:
+        design_manager = TcpDesignManagerProxy(uid="uid", osl_server=osl_server)
+        designs = design_manager.get_designs()
+        compact_designs = design_manager.get_designs(compact=True)
+        assert compact_designs == designs
+        assert compact_designs[0].parameters_names is compact_designs[99].parameters_names
+        assert [design.id for design in design_manager.iter_designs(compact=True)] == [
+            design.id for design in designs
+        ]
+    finally:
+        osl_server.dispose()
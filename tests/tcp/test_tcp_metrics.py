@@ -0,0 +1,251 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test client-side metrics of requests sent to the optiSLang server."""
+
+import json
+import math
+import time
+
+import pytest
+
+from ansys.optislang.core.communication_channels import CommunicationChannel
+from ansys.optislang.core.tcp import server_commands as commands
+from ansys.optislang.core.tcp import server_queries as queries
+from ansys.optislang.core.tcp.metrics import (
+    DictMetricsExporter,
+    LatencyHistogram,
+    MetricsExporter,
+    OpenTelemetrySpanExporter,
+    PrometheusMetricsExporter,
+    RequestPhase,
+    TcpCommandMetrics,
+    get_encoded_request_name,
+    get_request_name,
+)
+from ansys.optislang.core.tcp.osl_server import TcpOslServer, _merge_server_commands
+
+
+class _RecordingExporter(MetricsExporter):
+    def __init__(self):
+        self.records = []
+
+    def on_request(self, record):
+        self.records.append(record)
+
+
+class _Span:
+    def __init__(self, name, start_time, attributes):
+        self.name = name
+        self.start_time = start_time
+        self.attributes = attributes
+        self.end_time = None
+
+    def end(self, end_time=None):
+        self.end_time = end_time
+
+
+class _Tracer:
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, start_time=None, attributes=None):
+        span = _Span(name, start_time, attributes)
+        self.spans.append(span)
+        return span
+
+
+def _slow_command(command: dict) -> dict:
+    if command["command"] == "SAVE":
+        time.sleep(0.5)
+    return {"status": "success", "command": command["command"]}
+
+
+@pytest.fixture(params=[False, True], ids=["single_use", "persistent"])
+def osl_server(framed_server, request):
+    server = framed_server(command_handler=_slow_command)
+    osl_server = TcpOslServer(
+        host="127.0.0.1",
+        port=server.port,
+        communication_channel=CommunicationChannel.TCP,
+        listeners_refresh_interval=3600,
+        persistent_connections=request.param,
+    )
+    yield osl_server
+    osl_server.dispose()
+
+
+def test_get_request_name():
+    assert get_request_name({"What": "SERVER_INFO"}) == "SERVER_INFO"
+    command = {"projects": [{"commands": [{"command": "SAVE"}, {"command": "SAVE"}]}]}
+    assert get_request_name(command) == "SAVE"
+    command["projects"][0]["commands"].append({"command": "RESET"})
+    assert get_request_name(command) == "SAVE+RESET"
+    assert get_request_name([]) == "UNKNOWN"
+    assert get_request_name({"projects": "invalid"}) == "UNKNOWN"
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        queries.server_info(),
+        queries.server_info(password='pass "word"'),
+        queries.actor_status_info(uid="uid", hid="0.1"),
+        commands.save(password="password"),
+        commands.reset(actor_uid="uid", hid="0.1"),
+        commands.evaluate_design({"What": "X", "command": "Y"}),
+        commands.set_designs("uid", [{"hid": "0.1", "command": "STOP", "type": "builtin"}]),
+        json.dumps({"projects": [{"commands": [{"command": "SAVE"}, {"command": "RESET"}]}]}),
+        _merge_server_commands([commands.start(), commands.stop()])[0][0],
+        json.dumps({"uid": "uid", "What": "ACTOR_INFO"}),
+        "invalid",
+    ],
+)
+def test_get_encoded_request_name(request_):
+    try:
+        expected = get_request_name(json.loads(request_))
+    except ValueError:
+        expected = "UNKNOWN"
+    assert get_encoded_request_name(request_) == expected
+
+
+def test_get_encoded_request_name_merged_commands():
+    requests, _ = _merge_server_commands([commands.start(), commands.stop()])
+    assert get_encoded_request_name(requests[0]) == "START+STOP"
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram([0.1, 1.0])
+    for duration in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(duration)
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(2.65)
+    assert histogram.max == 2.0
+    assert histogram.get_buckets() == [(0.1, 2), (1.0, 3), (math.inf, 4)]
+    copy = histogram.copy()
+    histogram.observe(0.01)
+    assert copy.count == 4
+    assert copy.get_buckets() == [(0.1, 2), (1.0, 3), (math.inf, 4)]
+
+
+def test_metrics_are_disabled_by_default(osl_server):
+    assert osl_server.metrics is None
+    osl_server.send_command(queries.server_info())
+    metrics = osl_server.enable_metrics()
+    assert osl_server.metrics is metrics
+    osl_server.disable_metrics()
+    osl_server.send_command(queries.server_info())
+    assert metrics.snapshot() == {}
+
+
+def test_send_command_metrics(osl_server):
+    exporter = _RecordingExporter()
+    metrics = osl_server.enable_metrics(TcpCommandMetrics(exporters=[exporter]))
+    for _ in range(3):
+        osl_server.send_command(queries.server_info())
+    osl_server.send_command(commands.reset())
+
+    info = metrics.get("SERVER_INFO")
+    assert info.requests == 3
+    assert info.errors == info.retries == info.timeouts == 0
+    assert info.bytes_sent == 3 * len(queries.server_info().encode())
+    assert info.bytes_received > 0
+    assert info.latency.count == 3
+    for phase in RequestPhase:
+        assert info.phases[phase].count == 3
+    assert metrics.get("RESET").requests == 1
+
+    assert [record.name for record in exporter.records] == ["SERVER_INFO"] * 3 + ["RESET"]
+    record = exporter.records[0]
+    assert record.attempts == 1
+    assert record.error is None
+    assert record.duration >= sum(record.phases.values())
+
+    snapshot = metrics.export()
+    assert snapshot == DictMetricsExporter().export(metrics)
+    assert snapshot["SERVER_INFO"]["requests"] == 3
+    assert snapshot["SERVER_INFO"]["phases"]["server_wait"]["count"] == 3
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_send_commands_metrics(osl_server):
+    metrics = osl_server.enable_metrics()
+    osl_server.send_commands([commands.reset(), commands.stop(), queries.server_info()])
+    assert list(metrics.get_all()) == ["RESET+STOP+SERVER_INFO"]
+    command_metrics = metrics.get("RESET+STOP+SERVER_INFO")
+    assert command_metrics.requests == 1
+    # merged commands and the query are received separately
+    assert command_metrics.phases[RequestPhase.RECEIVE].count == 1
+
+
+def test_timeout_metrics(osl_server):
+    metrics = osl_server.enable_metrics()
+    with pytest.raises(TimeoutError):
+        osl_server.send_command(commands.save(), timeout=0.1, max_request_attempts=2)
+    save = metrics.get("SAVE")
+    assert save.requests == 1
+    assert save.errors == 1
+    assert save.retries == 1
+    assert save.timeouts == 2
+
+
+def test_prometheus_exporter():
+    metrics = TcpCommandMetrics(buckets=[0.1, 1.0])
+    with metrics.start_request('SERVER_"INFO"') as trace:
+        trace.start_attempt()
+        trace.add_phase(RequestPhase.SEND, 0.05)
+        trace.add_bytes_sent(10)
+    text = metrics.export(PrometheusMetricsExporter(namespace="osl"))
+    assert (
+        '# TYPE osl_requests_total counter\nosl_requests_total{command="SERVER_\\"INFO\\""} 1'
+        in text
+    )
+    assert 'osl_request_sent_bytes_total{command="SERVER_\\"INFO\\""} 10' in text
+    assert (
+        'osl_request_phase_duration_seconds_bucket{command="SERVER_\\"INFO\\"",'
+        'phase="send",le="0.1"} 1'
+    ) in text
+    assert 'osl_request_duration_seconds_bucket{command="SERVER_\\"INFO\\"",le="+Inf"} 1' in text
+    assert 'phase="decode"' not in text
+    assert text.endswith("\n")
+
+
+def test_open_telemetry_span_exporter():
+    tracer = _Tracer()
+    metrics = TcpCommandMetrics(exporters=[OpenTelemetrySpanExporter(tracer)])
+    with pytest.raises(ValueError):
+        with metrics.start_request("SAVE") as trace:
+            trace.start_attempt()
+            trace.add_phase(RequestPhase.CONNECT, 0.01)
+            raise ValueError("Failed.")
+    span = tracer.spans[0]
+    assert span.name == "optiSLang SAVE"
+    assert span.attributes["optislang.request.connect_seconds"] == 0.01
+    assert span.attributes["error.type"] == "ValueError"
+    assert span.end_time >= span.start_time
+    assert metrics.get("SAVE").errors == 1
+
+
+def test_invalid_buckets():
+    with pytest.raises(ValueError):
+        TcpCommandMetrics(buckets=[1.0, 0.1])
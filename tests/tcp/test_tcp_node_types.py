@@ -0,0 +1,87 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test caching of node types available in the optiSLang server."""
+
+import pytest
+
+from ansys.optislang.core import node_types
+from ansys.optislang.core.communication_channels import CommunicationChannel
+from ansys.optislang.core.node_types import AddinType, NodeType, NodeTypeRegistry
+from ansys.optislang.core.tcp.osl_server import TcpOslServer
+
+_AVAILABLE_NODES = {
+    "algorithm_plugins": ["AlgorithmPlugin"],
+    "builtin_nodes": ["Sensitivity", "Python2"],
+    "python_based_node_plugins": ["NodePlugin"],
+    "message": "",
+    "status": "success",
+}
+
+
+@pytest.fixture
+def registry(tmp_path):
+    default = node_types.get_node_type_registry()
+    registry = node_types.set_node_type_registry(NodeTypeRegistry(tmp_path / "nodes.json"))
+    yield registry
+    node_types.set_node_type_registry(default)
+
+
+@pytest.fixture
+def server(framed_server):
+    return framed_server(query_responses={"AVAILABLE_NODES": _AVAILABLE_NODES})
+
+
+def _create_osl_server(server) -> TcpOslServer:
+    return TcpOslServer(
+        host="127.0.0.1",
+        port=server.port,
+        communication_channel=CommunicationChannel.TCP,
+        listeners_refresh_interval=3600,
+    )
+
+
+def test_available_node_types_queried_once_per_version(server, registry):
+    osl_server = _create_osl_server(server)
+    try:
+        available = osl_server.get_available_node_types()
+        assert available == [
+            NodeType(id="AlgorithmPlugin", subtype=AddinType.ALGORITHM_PLUGIN),
+            NodeType(id="Sensitivity", subtype=AddinType.BUILT_IN),
+            NodeType(id="Python2", subtype=AddinType.BUILT_IN),
+            NodeType(id="NodePlugin", subtype=AddinType.PYTHON_BASED_NODE_PLUGIN),
+        ]
+        assert osl_server.get_available_node_types() == available
+        assert server.queries["AVAILABLE_NODES"] == 1
+        osl_server.get_available_node_types(use_cache=False)
+        assert server.queries["AVAILABLE_NODES"] == 2
+    finally:
+        osl_server.dispose()
+
+    # node types stored in the file are used by a new session
+    node_types.set_node_type_registry(NodeTypeRegistry(registry.path))
+    osl_server = _create_osl_server(server)
+    try:
+        assert osl_server.get_available_node_types() == available
+        assert server.queries["AVAILABLE_NODES"] == 2
+    finally:
+        osl_server.dispose()
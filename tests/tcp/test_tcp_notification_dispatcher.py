@@ -0,0 +1,202 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Test dispatching of push notifications by a pool of threads."""
+
+import threading
+import time
+
+import pytest
+
+from ansys.optislang.core.communication_channels import CommunicationChannel
+from ansys.optislang.core.osl_process import ServerNotification
+from ansys.optislang.core.tcp import server_commands as commands
+from ansys.optislang.core.tcp.notification_dispatcher import NotificationDispatcher
+from ansys.optislang.core.tcp.osl_server import TcpOslListener
+from ansys.optislang.core.tcp.stand_in_server import StandInOslServer
+
+
+@pytest.fixture
+def dispatcher():
+    dispatchers = []
+
+    def _create(**kwargs):
+        dispatcher = NotificationDispatcher(**kwargs)
+        dispatchers.append(dispatcher)
+        return dispatcher
+
+    yield _create
+    for dispatcher in dispatchers:
+        dispatcher.shutdown()
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        NotificationDispatcher(max_workers=0)
+    with pytest.raises(ValueError):
+        NotificationDispatcher(max_queue_size=0)
+
+
+def test_order_of_source(dispatcher):
+    dispatcher = dispatcher(max_workers=4, coalesced_notifications=[])
+    executed = []
+    for i in range(100):
+        dispatcher.dispatch("listener", {"type": "LOG_INFO", "index": i}, executed.append)
+    assert dispatcher.join(timeout=5)
+    assert [notification["index"] for notification in executed] == list(range(100))
+    assert dispatcher.stats.executed == 100
+
+
+def test_sources_executed_concurrently(dispatcher):
+    dispatcher = dispatcher(max_workers=2)
+    barrier = threading.Barrier(2, timeout=5)
+    # both callbacks wait for each other, they must run at the same time
+    dispatcher.dispatch("first", {"type": "LOG_INFO"}, lambda notification: barrier.wait())
+    dispatcher.dispatch("second", {"type": "LOG_INFO"}, lambda notification: barrier.wait())
+    assert dispatcher.join(timeout=5)
+    assert dispatcher.stats.errors == 0
+
+
+def test_coalescing(dispatcher):
+    dispatcher = dispatcher(max_workers=1)
+    assert dispatcher.coalesced_notifications == {"ACTOR_DATA_CHANGED"}
+    release = threading.Event()
+    executed = []
+    dispatcher.dispatch("listener", {"type": "LOG_INFO"}, lambda notification: release.wait(5))
+    for i in range(10):
+        for uid in ("a", "b"):
+            dispatcher.dispatch(
+                "listener", {"type": "ACTOR_DATA_CHANGED", "uid": uid, "i": i}, executed.append
+            )
+    dispatcher.dispatch("listener", {"type": "LOG_INFO"}, executed.append)
+    release.set()
+    assert dispatcher.join(timeout=5)
+    assert executed == [
+        {"type": "ACTOR_DATA_CHANGED", "uid": "a", "i": 9},
+        {"type": "ACTOR_DATA_CHANGED", "uid": "b", "i": 9},
+        {"type": "LOG_INFO"},
+    ]
+    stats = dispatcher.stats
+    assert (stats.received, stats.coalesced, stats.executed, stats.max_queued) == (22, 18, 4, 4)
+
+
+def test_back_pressure(dispatcher):
+    dispatcher = dispatcher(
+        max_workers=1,
+        max_queue_size=2,
+        coalesced_notifications=[ServerNotification.ACTOR_STATE_CHANGED],
+    )
+    executed = []
+
+    def slow_callback(notification):
+        time.sleep(0.05)
+        executed.append(notification)
+
+    for i in range(5):
+        dispatcher.dispatch("listener", {"type": "ACTOR_DATA_CHANGED", "i": i}, slow_callback)
+    assert dispatcher.join(timeout=5)
+    assert len(executed) == 5
+    stats = dispatcher.stats
+    assert stats.max_queued == 2
+    assert stats.blocked >= 2
+    assert stats.blocked_time > 0
+    assert stats.max_delay >= 0.05
+
+
+def test_errors_and_shutdown(dispatcher):
+    dispatcher = dispatcher(max_workers=1)
+
+    def failing_callback(notification):
+        raise RuntimeError("Callback failed.")
+
+    dispatcher.dispatch("listener", {"type": "LOG_INFO"}, failing_callback)
+    assert dispatcher.join(timeout=5)
+    assert (dispatcher.stats.executed, dispatcher.stats.errors) == (1, 1)
+
+    dispatcher.shutdown()
+    assert dispatcher.is_shutdown
+    # notifications dispatched after the shutdown are executed by the calling thread
+    threads = []
+    dispatcher.dispatch(
+        "listener", {"type": "LOG_INFO"}, lambda notification: threads.append(threading.get_ident())
+    )
+    assert threads == [threading.get_ident()]
+
+
+def test_listener_callbacks_do_not_block_delivery(dispatcher):
+    dispatcher = dispatcher()
+    release = threading.Event()
+    received = []
+
+    def slow_callback(sender, response):
+        release.wait(5)
+        received.append(response)
+
+    listener = TcpOslListener(
+        timeout=5,
+        name="Test",
+        communication_channel=CommunicationChannel.TCP,
+        host="127.0.0.1",
+    )
+    listener.dispatcher = dispatcher
+    listener.add_callback(slow_callback, ())
+    with StandInOslServer() as server:
+        osl_server = server.create_osl_server()
+        try:
+            osl_server.send_command(
+                commands.register_listener(
+                    host="127.0.0.1",
+                    port=listener.port,
+                    notifications=["ACTOR_DATA_CHANGED"],
+                    listener_uid="uid",
+                )
+            )
+            listener.start_listening()
+            # all notifications are acknowledged while the first callback is still running
+            for i in range(20):
+                assert server.send_notification("ACTOR_DATA_CHANGED", uid=f"node-{i % 2}") == 1
+            release.set()
+            assert dispatcher.join(timeout=5)
+        finally:
+            listener.stop_listening()
+            listener.dispose()
+            osl_server.dispose()
+    stats = dispatcher.stats
+    assert stats.received == 20
+    assert len(received) + stats.coalesced == 20
+    assert {response["uid"] for response in received} == {"node-0", "node-1"}
+
+
+def test_enable_notification_dispatcher():
+    with StandInOslServer() as server:
+        osl_server = server.create_osl_server()
+        try:
+            dispatcher = osl_server.enable_notification_dispatcher()
+            assert osl_server.notification_dispatcher is dispatcher
+            osl_server.start(wait_for_finished=True)
+            assert server.project_state == "FINISHED"
+            assert dispatcher.stats.executed >= 1
+        finally:
+            osl_server.dispose()
+    assert dispatcher.is_shutdown
+    assert osl_server.notification_dispatcher is None
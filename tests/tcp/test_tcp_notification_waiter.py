@@ -0,0 +1,100 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Test waiting for push notifications of the optiSLang server."""
+
+import json
+import socket
+import struct
+import threading
+import time
+
+from ansys.optislang.core.communication_channels import CommunicationChannel
+from ansys.optislang.core.osl_process import ServerNotification
+from ansys.optislang.core.tcp.osl_server import NotificationWaiter, TcpOslServer
+
+
+def _create_osl_server(port: int) -> TcpOslServer:
+    return TcpOslServer(
+        host="127.0.0.1",
+        port=port,
+        communication_channel=CommunicationChannel.TCP,
+        listeners_refresh_interval=3600,
+    )
+
+
+def _send_notification(port: int, notification: dict) -> None:
+    data = json.dumps(notification).encode()
+    with socket.create_connection(("127.0.0.1", port), timeout=5) as connection:
+        connection.sendall(struct.pack("!QQ", len(data), len(data)) + data)
+        # wait for the acknowledgement, i.e. until the notification was processed
+        connection.recv(16)
+
+
+def test_notification_waiter():
+    notification_waiter = NotificationWaiter([ServerNotification.ACTOR_DATA_CHANGED])
+    assert notification_waiter.notifications == (ServerNotification.ACTOR_DATA_CHANGED,)
+    assert notification_waiter.count == 0
+    assert not notification_waiter.wait(0, timeout=0.01)
+
+    # notification received before waiting is not missed
+    notification_waiter.notify()
+    assert notification_waiter.wait(0, timeout=0)
+    assert not notification_waiter.wait(notification_waiter.count, timeout=0.01)
+
+    timer = threading.Timer(0.05, notification_waiter.notify)
+    timer.start()
+    start = time.perf_counter()
+    assert notification_waiter.wait(1, timeout=5)
+    assert time.perf_counter() - start < 1
+    timer.join()
+    assert notification_waiter.count == 2
+
+
+def test_create_notification_waiter(framed_server):
+    server = framed_server()
+    osl_server = _create_osl_server(server.port)
+    try:
+        notification_waiter = osl_server.create_notification_waiter(
+            [ServerNotification.ACTOR_DATA_CHANGED, ServerNotification.EXECUTION_FINISHED]
+        )
+        register_command = server.commands[-1]
+        assert register_command["command"] == "REGISTER_LISTENER"
+        assert register_command["args"]["notifications"] == [
+            "ACTOR_DATA_CHANGED",
+            "EXECUTION_FINISHED",
+        ]
+
+        count = notification_waiter.count
+        _send_notification(
+            register_command["args"]["port"], {"type": "ACTOR_DATA_CHANGED", "uid": "uid"}
+        )
+        assert notification_waiter.wait(count, timeout=5)
+
+        osl_server.delete_notification_waiter(notification_waiter)
+        assert server.commands[-1]["command"] == "UNREGISTER_LISTENER"
+        commands_count = len(server.commands)
+        osl_server.delete_notification_waiter(notification_waiter)
+        assert len(server.commands) == commands_count
+    finally:
+        osl_server.dispose()
@@ -0,0 +1,281 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Test persistent connections of ``TcpOslServer`` against a minimal in-process server."""
+
+import threading
+import time
+
+import pytest
+
+from ansys.optislang.core.communication_channels import CommunicationChannel
+from ansys.optislang.core.tcp import server_commands as commands
+from ansys.optislang.core.tcp import server_queries as queries
+import ansys.optislang.core.tcp.osl_server as tos
+
+
+def _create_osl_server(port: int, **kwargs) -> tos.TcpOslServer:
+    return tos.TcpOslServer(
+        host="127.0.0.1",
+        port=port,
+        communication_channel=CommunicationChannel.TCP,
+        listeners_refresh_interval=3600,
+        **kwargs,
+    )
+
+
+def test_single_use_connections(framed_server):
+    server = framed_server()
+    osl_server = _create_osl_server(server.port)
+    try:
+        assert osl_server.connection_pool is None
+        connections = server.connections
+        for _ in range(5):
+            osl_server.get_server_info()
+        assert server.connections - connections == 5
+    finally:
+        osl_server.dispose()
+
+
+def test_persistent_connections_are_reused(framed_server):
+    server = framed_server()
+    osl_server = _create_osl_server(server.port, persistent_connections=True)
+    try:
+        assert isinstance(osl_server.connection_pool, tos.TcpConnectionPool)
+        for _ in range(10):
+            assert osl_server.get_server_info()["application"]["version"] == "25.1.0 (123)"
+        assert server.connections == 1
+        assert osl_server.connection_pool.idle_connections == 1
+    finally:
+        osl_server.dispose()
+    assert osl_server.connection_pool.idle_connections == 0
+
+
+def test_persistent_connections_reconnect(framed_server):
+    server = framed_server(close_after_response=True)
+    osl_server = _create_osl_server(server.port, persistent_connections=True)
+    try:
+        requests = server.requests
+        for _ in range(5):
+            osl_server.get_server_info()
+        assert server.requests - requests == 5
+    finally:
+        osl_server.dispose()
+
+
+class _FakeClient:
+    def __init__(self):
+        self.is_connected = True
+        self.dropped = False
+
+    def disconnect(self):
+        self.is_connected = False
+
+    def is_connection_dropped(self):
+        return self.dropped
+
+
+def _create_pool(**kwargs):
+    clients = []
+
+    def connect(timeout):
+        clients.append(_FakeClient())
+        return clients[-1]
+
+    return tos.TcpConnectionPool(connect=connect, **kwargs), clients
+
+
+def test_connection_pool_arguments():
+    with pytest.raises(ValueError):
+        _create_pool(max_connections=0)
+    with pytest.raises(ValueError):
+        _create_pool(idle_timeout=0)
+
+
+def test_connection_pool_reuse():
+    pool, clients = _create_pool(max_connections=2)
+    first, reused = pool.acquire()
+    assert not reused
+    pool.release(first)
+    client, reused = pool.acquire()
+    assert reused and client is first
+    pool.discard(client)
+    assert not client.is_connected
+    statistics = pool.statistics
+    assert statistics.created_connections == 1
+    assert statistics.reused_connections == 1
+    assert statistics.open_connections == 0
+    assert statistics.in_use_connections == 0
+
+
+def test_connection_pool_bounded():
+    pool, clients = _create_pool(max_connections=1)
+    client, _ = pool.acquire()
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.1)
+
+    def release():
+        time.sleep(0.2)
+        pool.release(client)
+
+    thread = threading.Thread(target=release)
+    thread.start()
+    reused_client, reused = pool.acquire(timeout=5)
+    thread.join()
+    assert reused and reused_client is client
+    statistics = pool.statistics
+    assert len(clients) == 1
+    assert statistics.waits == 1
+    assert statistics.wait_timeouts == 1
+    assert statistics.max_wait_time >= 0.1
+    assert statistics.utilization == 1.0
+    pool.release(reused_client)
+    assert pool.statistics.utilization == 0.0
+
+
+def test_connection_pool_health_check():
+    pool, clients = _create_pool(max_connections=1)
+    client, _ = pool.acquire()
+    pool.release(client)
+    client.dropped = True
+    new_client, reused = pool.acquire()
+    assert not reused and new_client is not client
+    assert not client.is_connected
+    assert pool.statistics.failed_health_checks == 1
+    assert pool.statistics.open_connections == 1
+
+
+def test_connection_pool_idle_eviction():
+    pool, clients = _create_pool(max_connections=2, idle_timeout=0.1)
+    client, _ = pool.acquire()
+    pool.release(client)
+    assert pool.evict_idle_connections() == 0
+    time.sleep(0.2)
+    assert pool.evict_idle_connections() == 1
+    assert not client.is_connected
+    assert pool.statistics.evicted_connections == 1
+    assert pool.statistics.open_connections == 0
+
+
+def test_connection_pool_reconnect():
+    pool, clients = _create_pool(max_connections=1)
+    client, _ = pool.acquire()
+    new_client = pool.reconnect(client)
+    assert not client.is_connected
+    assert pool.statistics.open_connections == 1
+    pool.release(new_client)
+    pool.clear()
+    assert not new_client.is_connected
+    assert pool.statistics.open_connections == 0
+
+
+def test_persistent_connections_concurrent_requests(framed_server):
+    server = framed_server()
+    osl_server = _create_osl_server(
+        server.port, persistent_connections=True, max_persistent_connections=2
+    )
+    try:
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(20):
+                    osl_server.get_server_info()
+            except Exception as ex:
+                errors.append(ex)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+        assert server.connections <= 2
+        statistics = osl_server.connection_pool.statistics
+        assert statistics.peak_in_use_connections <= 2
+        assert statistics.acquisitions >= 80
+    finally:
+        osl_server.dispose()
+
+
+@pytest.mark.parametrize("persistent_connections", [False, True])
+def test_send_commands(framed_server, persistent_connections):
+    server = framed_server()
+    osl_server = _create_osl_server(server.port, persistent_connections=persistent_connections)
+    try:
+        connections, requests = server.connections, server.requests
+        responses = osl_server.send_commands(
+            [
+                queries.server_is_alive(),
+                commands.save(),
+                commands.reset(),
+                commands.new(),
+                queries.actor_status_info(uid="uid", hid="0.1"),
+                commands.stop(),
+            ]
+        )
+        assert server.connections - connections == (0 if persistent_connections else 4)
+        assert server.requests - requests == 4
+        assert responses[0]["what"] == "SERVER_IS_ALIVE"
+        assert [response[0]["command"] for response in responses[1:4]] == ["SAVE", "RESET", "NEW"]
+        assert responses[4]["hid"] == "0.1"
+        assert responses[5][0]["command"] == "STOP"
+        assert osl_server.send_commands([]) == []
+    finally:
+        osl_server.dispose()
+
+
+def test_get_actor_states_status_info_pipelined(framed_server):
+    server = framed_server()
+    osl_server = _create_osl_server(server.port, persistent_connections=True)
+    try:
+        hids = [f"0.{idx}" for idx in range(1, 501)]
+        status_info = osl_server.get_actor_states_status_info("uid", hids)
+        assert [info["hid"] for info in status_info] == hids
+        assert server.connections == 1
+    finally:
+        osl_server.dispose()
+
+
+@pytest.mark.parametrize("persistent_connections", [False, True])
+def test_get_actor_states_status_info_connection_per_request(framed_server, persistent_connections):
+    server = framed_server(close_after_response=True)
+    osl_server = _create_osl_server(server.port, persistent_connections=persistent_connections)
+    try:
+        hids = ["0", "0.1", "0.2"]
+        for _ in range(2):
+            status_info = osl_server.get_actor_states_status_info("uid", hids)
+            assert [info["hid"] for info in status_info] == hids
+        assert server.queries["ACTOR_STATUS_INFO"] == 6
+    finally:
+        osl_server.dispose()
+
+
+def test_send_commands_registers(framed_server):
+    server = framed_server()
+    osl_server = _create_osl_server(server.port)
+    try:
+        assert osl_server.timeouts_register.get_value("send_commands") == 30
+        assert osl_server.max_request_attempts_register.get_value("send_commands") == 1
+    finally:
+        osl_server.dispose()
@@ -0,0 +1,237 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Test the client-side cache of the project tree."""
+
+import json
+import socket
+import struct
+import time
+
+import pytest
+
+from ansys.optislang.core.communication_channels import CommunicationChannel
+from ansys.optislang.core.json_codec import StdlibJsonCodec
+from ansys.optislang.core.tcp import server_commands as commands
+from ansys.optislang.core.tcp import server_queries as queries
+from ansys.optislang.core.tcp.osl_server import ProjectTreeCache, TcpOslServer
+from ansys.optislang.core.tcp.project import TcpProjectProxy
+
+PROJECT_TREE = {
+    "projects": [
+        {
+            "connections": [],
+            "system": {
+                "kind": "system",
+                "name": "Root",
+                "nodes": [
+                    {
+                        "kind": "system",
+                        "name": "Sensitivity",
+                        "nodes": [
+                            {
+                                "kind": "actor",
+                                "name": "Calculator",
+                                "properties": {},
+                                "type": "CalculatorSet",
+                                "uid": "calculator-uid",
+                            }
+                        ],
+                        "properties": {"ParameterManager": {}},
+                        "type": "Sensitivity",
+                        "uid": "sensitivity-uid",
+                    }
+                ],
+                "properties": {},
+                "type": "RunnableSystem",
+                "uid": "root-uid",
+            },
+        }
+    ]
+}
+
+FULL_PROJECT_TREE_WITH_PROPERTIES = "FULL_PROJECT_TREE_WITH_PROPERTIES"
+
+
+class _RecordingJsonCodec(StdlibJsonCodec):
+    def __init__(self):
+        self.decoded = []
+
+    def loads(self, data):
+        self.decoded.append(data)
+        return super().loads(data)
+
+
+def _create_osl_server(port: int, json_codec=None) -> TcpOslServer:
+    return TcpOslServer(
+        host="127.0.0.1",
+        port=port,
+        communication_channel=CommunicationChannel.TCP,
+        listeners_refresh_interval=3600,
+        json_codec=json_codec,
+    )
+
+
+def _send_notification(port: int, notification: dict) -> None:
+    data = json.dumps(notification).encode()
+    with socket.create_connection(("127.0.0.1", port), timeout=5) as connection:
+        connection.sendall(struct.pack("!QQ", len(data), len(data)) + data)
+        # wait for the acknowledgement, i.e. until the notification was processed
+        connection.recv(16)
+
+
+def test_project_tree_cache():
+    fetched = []
+
+    def fetch():
+        fetched.append(True)
+        return {"tree": len(fetched)}
+
+    cache = ProjectTreeCache(ttl=None)
+    assert not cache.is_valid
+    assert cache.get(fetch) == {"tree": 1}
+    assert cache.get(fetch) == {"tree": 1}
+    assert cache.is_valid
+    assert (cache.hits, cache.misses, cache.invalidations) == (1, 1, 0)
+
+    generation = cache.generation
+    cache.invalidate()
+    assert not cache.is_valid
+    assert cache.generation > generation
+    assert cache.get(fetch) == {"tree": 2}
+    assert (cache.hits, cache.misses, cache.invalidations) == (1, 2, 1)
+
+
+def test_project_tree_cache_ttl():
+    cache = ProjectTreeCache(ttl=0.05)
+    cache.get(dict)
+    assert cache.is_valid
+    time.sleep(0.1)
+    assert not cache.is_valid
+    with pytest.raises(ValueError):
+        ProjectTreeCache(ttl=0)
+
+
+def test_project_tree_cache_invalidated_while_fetching():
+    cache = ProjectTreeCache(ttl=None)
+
+    def fetch():
+        cache.invalidate()
+        return {}
+
+    cache.get(fetch)
+    assert not cache.is_valid
+
+
+def test_enable_project_tree_cache(framed_server):
+    server = framed_server(query_responses={FULL_PROJECT_TREE_WITH_PROPERTIES: PROJECT_TREE})
+    osl_server = _create_osl_server(server.port)
+    try:
+        project = TcpProjectProxy(osl_server=osl_server, uid="root-uid")
+        assert not project.project_tree_cache_enabled
+        project.root_system.get_nodes()
+        project.root_system.get_nodes()
+        assert server.queries[FULL_PROJECT_TREE_WITH_PROPERTIES] == 2
+
+        project.enable_project_tree_cache(use_notifications=False)
+        assert project.project_tree_cache_enabled
+        sensitivity = project.root_system.find_node_by_uid("sensitivity-uid")
+        calculator = project.root_system.find_node_by_uid("calculator-uid", search_depth=2)
+        assert [node.uid for node in calculator.get_ancestors()] == ["root-uid", "sensitivity-uid"]
+        assert [node.uid for node in sensitivity.get_nodes()] == ["calculator-uid"]
+        assert calculator.get_parent().uid == "sensitivity-uid"
+        assert [node.uid for node in project.root_system.find_nodes_by_name("Calculator")] == []
+        assert [node.uid for node in project.root_system.find_nodes_by_name("Calculator", 2)] == [
+            "calculator-uid"
+        ]
+        assert server.queries[FULL_PROJECT_TREE_WITH_PROPERTIES] == 3
+
+        project_tree_index = osl_server.get_project_tree_index()
+        assert osl_server.get_project_tree_index() is project_tree_index
+        assert server.queries[FULL_PROJECT_TREE_WITH_PROPERTIES] == 3
+
+        # commands sent by the client invalidate the cached tree, queries don't
+        osl_server.get_server_info()
+        project.root_system.get_nodes()
+        assert server.queries[FULL_PROJECT_TREE_WITH_PROPERTIES] == 3
+        osl_server.reset()
+        project.root_system.get_nodes()
+        assert server.queries[FULL_PROJECT_TREE_WITH_PROPERTIES] == 4
+        assert osl_server.get_project_tree_index() is not project_tree_index
+
+        project.disable_project_tree_cache()
+        assert not project.project_tree_cache_enabled
+        project.root_system.get_nodes()
+        assert server.queries[FULL_PROJECT_TREE_WITH_PROPERTIES] == 5
+    finally:
+        osl_server.dispose()
+
+
+def test_project_tree_cache_requests_not_decoded(framed_server):
+    server = framed_server(query_responses={FULL_PROJECT_TREE_WITH_PROPERTIES: PROJECT_TREE})
+    codec = _RecordingJsonCodec()
+    osl_server = _create_osl_server(server.port, json_codec=codec)
+    try:
+        project = TcpProjectProxy(osl_server=osl_server, uid="root-uid")
+        project.enable_project_tree_cache(use_notifications=False)
+        project.root_system.get_nodes()
+        osl_server.get_server_info()
+        project.root_system.get_nodes()
+        assert server.queries[FULL_PROJECT_TREE_WITH_PROPERTIES] == 1
+        osl_server.send_command(commands.reset(password="password"))
+        project.root_system.get_nodes()
+        assert server.queries[FULL_PROJECT_TREE_WITH_PROPERTIES] == 2
+        # requests are recognized as queries or commands without decoding them
+        assert queries.server_info() not in codec.decoded
+        assert commands.reset(password="password") not in codec.decoded
+    finally:
+        osl_server.dispose()
+
+
+def test_project_tree_cache_notifications(framed_server):
+    server = framed_server(query_responses={FULL_PROJECT_TREE_WITH_PROPERTIES: PROJECT_TREE})
+    osl_server = _create_osl_server(server.port)
+    try:
+        cache = osl_server.enable_project_tree_cache(ttl=None)
+        register_command = server.commands[-1]
+        assert register_command["command"] == "REGISTER_LISTENER"
+        assert set(register_command["args"]["notifications"]) == {
+            "ACTOR_CONTENTS_CHANGED",
+            "ACTOR_NAME_CHANGED",
+            "ACTOR_STATE_CHANGED",
+        }
+
+        osl_server.get_full_project_tree_with_properties()
+        assert cache.is_valid
+        _send_notification(
+            register_command["args"]["port"], {"type": "ACTOR_NAME_CHANGED", "uid": "uid"}
+        )
+        assert not cache.is_valid
+        osl_server.get_full_project_tree_with_properties()
+        assert server.queries[FULL_PROJECT_TREE_WITH_PROPERTIES] == 2
+
+        osl_server.disable_project_tree_cache()
+        assert osl_server.project_tree_cache is None
+        assert server.commands[-1]["command"] == "UNREGISTER_LISTENER"
+    finally:
+        osl_server.dispose()
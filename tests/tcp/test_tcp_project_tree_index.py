@@ -0,0 +1,107 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Test the flattened index over the project tree."""
+
+import pytest
+
+from ansys.optislang.core.tcp.project_tree_index import ProjectTreeIndex
+
+
+def _node(uid: str, name: str, nodes=None) -> dict:
+    node = {"kind": "actor", "name": name, "type": "CalculatorSet", "uid": uid}
+    if nodes is not None:
+        node.update(kind="system", nodes=nodes, type="Sensitivity")
+    return node
+
+
+@pytest.fixture
+def project_tree_index() -> ProjectTreeIndex:
+    system_tree = _node(
+        "root",
+        "Root",
+        [
+            _node("a", "System", [_node("a1", "Calculator"), _node("a2", "System", [])]),
+            _node("b", "Calculator"),
+            _node("c", "System", [_node("c1", "System", [_node("c11", "Calculator")])]),
+        ],
+    )
+    return ProjectTreeIndex.from_project_tree({"projects": [{"system": system_tree}]})
+
+
+def test_lookups(project_tree_index: ProjectTreeIndex):
+    assert project_tree_index.root_uid == "root"
+    assert len(project_tree_index) == 8
+    assert "c11" in project_tree_index
+    assert "unknown" not in project_tree_index
+    assert project_tree_index.get_node("c1")["nodes"][0]["uid"] == "c11"
+    assert project_tree_index.get_node("unknown") is None
+    assert project_tree_index.get_parent_uid("c11") == "c1"
+    assert project_tree_index.get_parent_uid("root") is None
+    assert project_tree_index.get_depth("root") == 0
+    assert project_tree_index.get_depth("c11") == 3
+    assert project_tree_index.get_depth("unknown") is None
+
+
+def test_get_uids_by_name(project_tree_index: ProjectTreeIndex):
+    assert project_tree_index.get_uids_by_name("System") == ("a", "a2", "c", "c1")
+    assert project_tree_index.get_uids_by_name("Calculator") == ("a1", "b", "c11")
+    assert project_tree_index.get_uids_by_name("Root") == ()
+
+
+def test_get_ancestor_uids(project_tree_index: ProjectTreeIndex):
+    assert project_tree_index.get_ancestor_uids("c11") == ("root", "c", "c1")
+    assert project_tree_index.get_ancestor_uids("b") == ("root",)
+    assert project_tree_index.get_ancestor_uids("root") == ()
+    assert project_tree_index.get_ancestor_uids("unknown") == ()
+
+
+@pytest.mark.parametrize(
+    "uid, ancestor_uid, max_depth, expected",
+    [
+        ("a1", "root", 1, False),
+        ("a1", "root", 2, True),
+        ("a1", "root", -1, True),
+        ("c11", "c", -1, True),
+        ("c11", "a", -1, False),
+        ("a", "a", -1, False),
+        ("root", "a", -1, False),
+        ("unknown", "root", -1, False),
+    ],
+)
+def test_is_descendant(project_tree_index, uid, ancestor_uid, max_depth, expected):
+    assert project_tree_index.is_descendant(uid, ancestor_uid, max_depth=max_depth) is expected
+
+
+def test_deep_tree():
+    system_tree = _node("0", "Root", [])
+    leaf = system_tree
+    for depth in range(1, 5000):
+        child = _node(str(depth), "System", [])
+        leaf["nodes"].append(child)
+        leaf = child
+
+    project_tree_index = ProjectTreeIndex(system_tree)
+
+    assert project_tree_index.get_depth("4999") == 4999
+    assert len(project_tree_index.get_ancestor_uids("4999")) == 4999
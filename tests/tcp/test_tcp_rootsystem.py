@@ -126,3 +126,18 @@ def test_design_structure(optislang: Optislang):
         assert isinstance(undefined, tuple)
         assert missing == expected_outputs[index][0]
         assert undefined == expected_outputs[index][1]
+
+
+def test_evaluate_design_evaluation_cache(optislang: Optislang):
+    """Test ``evaluate_design`` with enabled evaluation cache."""
+    root_system = optislang.project.root_system
+    assert root_system.evaluation_cache is None
+    cache = root_system.enable_evaluation_cache()
+    assert root_system.evaluation_cache is cache
+    first = root_system.evaluate_design(design=Design(parameters=parameters))
+    second = root_system.evaluate_design(design=Design(parameters=parameters))
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert second.responses == first.responses
+    assert second.status == DesignStatus.SUCCEEDED
+    root_system.disable_evaluation_cache()
+    assert root_system.evaluation_cache is None
@@ -0,0 +1,219 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Test pool of pre-started optiSLang servers."""
+
+from pathlib import Path
+import threading
+
+import pytest
+
+from ansys.optislang.core.communication_channels import CommunicationChannel
+from ansys.optislang.core.errors import OslDisposedError
+from ansys.optislang.core.tcp.server_pool import ServerResetMode, TcpOslServerPool
+
+
+class _Server:
+    """Stand-in for ``TcpOslServer`` started by the pool."""
+
+    def __init__(self, index, executable, **kwargs):
+        self.index = index
+        self.executable = executable
+        self.kwargs = kwargs
+        self.local_server_id = f"server_{index}"
+        self.host = None
+        self.port = None
+        self.alive = True
+        self.fail_reset = False
+        self.calls = []
+
+    def get_server_is_alive(self):
+        return self.alive
+
+    def new(self):
+        self.calls.append("new")
+        if self.fail_reset:
+            raise RuntimeError("Reset failed.")
+
+    def reset(self):
+        self.calls.append("reset")
+
+    def shutdown(self, force=False):
+        self.calls.append("shutdown")
+
+    def dispose(self):
+        self.calls.append("dispose")
+
+
+class _ServerFactory:
+    def __init__(self):
+        self.servers = []
+        self.lock = threading.Lock()
+
+    def __call__(self, executable=None, **kwargs):
+        with self.lock:
+            server = _Server(len(self.servers), executable, **kwargs)
+            self.servers.append(server)
+        return server
+
+
+@pytest.fixture
+def factory():
+    return _ServerFactory()
+
+
+def create_pool(factory, **kwargs):
+    kwargs.setdefault("health_check_interval", None)
+    return TcpOslServerPool(server_factory=factory, **kwargs)
+
+
+def test_fill_starts_servers(factory):
+    pool = create_pool(factory, size=3, ini_timeout=30)
+    pool.fill()
+    assert pool.get_idle_count() == 3
+    assert len(factory.servers) == 3
+    for server in factory.servers:
+        assert server.kwargs == {"shutdown_on_finished": False, "ini_timeout": 30}
+    pool.dispose()
+    assert pool.get_idle_count() == 0
+    assert all(server.calls == ["shutdown", "dispose"] for server in factory.servers)
+
+
+def test_acquire_and_release(factory):
+    pool = create_pool(factory, size=1)
+    pool.fill()
+    server = pool.acquire()
+    assert server.owner is factory.servers[0]
+    assert server.uses == 1
+    assert pool.leased_count == 1
+    assert pool.get_idle_count() == 0
+    assert server.connection_kwargs == {
+        "local_server_id": "server_0",
+        "communication_channel": CommunicationChannel.LOCAL_DOMAIN,
+    }
+    pool.release(server)
+    assert pool.leased_count == 0
+    assert pool.get_idle_count() == 1
+    assert server.owner.calls == ["new"]
+    assert pool.acquire() is server
+    assert server.uses == 2
+    pool.dispose()
+
+
+def test_acquire_starts_server_if_none_idle(factory):
+    pool = create_pool(factory, size=0)
+    server = pool.acquire(executable="osl.exe")
+    assert server.executable == Path("osl.exe")
+    assert factory.servers[0].executable == Path("osl.exe")
+    # pool of size 0 does not keep released servers
+    pool.release(server)
+    assert factory.servers[0].calls == ["new", "shutdown", "dispose"]
+    pool.dispose()
+
+
+def test_idle_servers_per_executable(factory):
+    pool = create_pool(factory, size=1)
+    pool.fill(executable="a.exe")
+    pool.fill(executable="b.exe")
+    assert pool.get_idle_count(executable="a.exe") == 1
+    assert pool.get_idle_count(executable="b.exe") == 1
+    assert pool.get_idle_count() == 0
+    assert pool.acquire(executable="b.exe").owner is factory.servers[1]
+    pool.dispose()
+
+
+def test_dead_server_is_replaced(factory):
+    pool = create_pool(factory, size=1)
+    pool.fill()
+    factory.servers[0].alive = False
+    server = pool.acquire()
+    assert server.owner is factory.servers[1]
+    assert factory.servers[0].calls == ["shutdown", "dispose"]
+    pool.dispose()
+
+
+def test_failed_reset_shuts_down_server(factory):
+    pool = create_pool(factory, size=1)
+    server = pool.acquire()
+    server.owner.fail_reset = True
+    pool.release(server)
+    assert pool.get_idle_count() == 0
+    assert server.owner.calls == ["new", "shutdown", "dispose"]
+    pool.dispose()
+
+
+def test_expired_server_is_not_reused(factory):
+    pool = create_pool(factory, size=1, max_lifetime=1e-9)
+    server = pool.acquire()
+    pool.release(server)
+    assert pool.get_idle_count() == 0
+    assert server.owner.calls == ["shutdown", "dispose"]
+    pool.dispose()
+
+
+@pytest.mark.parametrize(
+    "reset_mode, calls",
+    [
+        (ServerResetMode.NEW, ["new"]),
+        (ServerResetMode.RESET, ["reset"]),
+        (ServerResetMode.NONE, []),
+    ],
+)
+def test_reset_mode(factory, reset_mode, calls):
+    pool = create_pool(factory, size=1, reset_mode=reset_mode)
+    server = pool.acquire()
+    pool.release(server)
+    assert server.owner.calls == calls
+    pool.dispose()
+
+
+def test_maintenance_refills_pool(factory):
+    pool = create_pool(factory, size=2, health_check_interval=0.05)
+    pool.fill()
+    pool.acquire()
+    for _ in range(100):
+        if pool.get_idle_count() == 2:
+            break
+        threading.Event().wait(0.05)
+    assert pool.get_idle_count() == 2
+    assert len(factory.servers) == 3
+    pool.dispose()
+
+
+def test_released_after_dispose(factory):
+    pool = create_pool(factory, size=1)
+    server = pool.acquire()
+    pool.dispose()
+    with pytest.raises(OslDisposedError):
+        pool.acquire()
+    pool.release(server)
+    assert server.owner.calls == ["shutdown", "dispose"]
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        TcpOslServerPool(size=-1, health_check_interval=None)
+    with pytest.raises(ValueError):
+        TcpOslServerPool(max_lifetime=0, health_check_interval=None)
+    with pytest.raises(ValueError):
+        TcpOslServerPool(health_check_interval=0)
@@ -0,0 +1,194 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Test recording and replaying of optiSLang server sessions."""
+
+import gzip
+import json
+import time
+
+import pytest
+
+from ansys.optislang.core.communication_channels import CommunicationChannel
+from ansys.optislang.core.errors import OslCommandError
+from ansys.optislang.core.tcp import server_queries as queries
+from ansys.optislang.core.tcp.session_recording import (
+    RecordedNotification,
+    RecordedRequest,
+    SessionRecorder,
+    SessionRecording,
+)
+from ansys.optislang.core.tcp.stand_in_server import (
+    ReplayOslServer,
+    ReplayTiming,
+    StandInOslServer,
+    create_project_tree,
+)
+
+
+def record_session(path, communication_channel=CommunicationChannel.TCP):
+    """Record session with the stand-in server and return results of the requests."""
+    with StandInOslServer(
+        project_tree=create_project_tree(systems=2), communication_channel=communication_channel
+    ) as server:
+        osl_server = server.create_osl_server()
+        try:
+            recorder = osl_server.enable_recording(path)
+            results = [
+                osl_server.get_full_project_tree_with_properties(),
+                osl_server.get_actor_status_info("system-2", "0", include_designs=True),
+                list(osl_server.send_command_stream(queries.basic_project_info(), [("projects",)])),
+            ]
+            osl_server.start(wait_for_finished=True)
+            results.append(osl_server.get_basic_project_info()["projects"][0]["state"])
+        finally:
+            osl_server.dispose()
+    assert recorder.closed
+    return results
+
+
+@pytest.mark.parametrize(
+    "communication_channel", [CommunicationChannel.TCP, CommunicationChannel.LOCAL_DOMAIN]
+)
+def test_record_and_replay(tmp_path, communication_channel):
+    path = tmp_path / "session.jsonl.gz"
+    expected = record_session(path, communication_channel)
+
+    recording = SessionRecording.from_file(path)
+    assert recording.metadata == {"osl_version": "25.1.0 (123)"}
+    notifications = [
+        json.loads(record.notification)
+        for record in recording.records
+        if isinstance(record, RecordedNotification)
+    ]
+    assert notifications == [{"type": "PROCESSING_STARTED"}, {"type": "EXECUTION_FINISHED"}]
+
+    with ReplayOslServer(path, communication_channel=communication_channel) as server:
+        osl_server = server.create_osl_server()
+        try:
+            results = [
+                osl_server.get_full_project_tree_with_properties(),
+                osl_server.get_actor_status_info("system-2", "0", include_designs=True),
+                list(osl_server.send_command_stream(queries.basic_project_info(), [("projects",)])),
+            ]
+            osl_server.start(wait_for_finished=True)
+            results.append(osl_server.get_basic_project_info()["projects"][0]["state"])
+        finally:
+            osl_server.dispose()
+    assert results == expected
+    assert server.unmatched_requests == []
+    assert osl_server.osl_version_string == "25.1.0 (123)"
+
+
+def test_replay_requests(tmp_path):
+    path = tmp_path / "session.jsonl.gz"
+    with SessionRecorder(path) as recorder:
+        for state in ("IDLE", "FINISHED"):
+            recorder.record_request(
+                queries.basic_project_info(password="secret"),
+                '{"projects":[{"state":"%s"}]}' % state,
+                duration=0.05,
+            )
+    assert recorder.requests == 2
+
+    with ReplayOslServer(path, timing=ReplayTiming.RECORDED) as server:
+        osl_server = server.create_osl_server()
+        try:
+            # recorded responses are returned in order, the last one repeatedly
+            assert [
+                osl_server.get_basic_project_info()["projects"][0]["state"] for _ in range(3)
+            ] == [
+                "IDLE",
+                "FINISHED",
+                "FINISHED",
+            ]
+            with pytest.raises(OslCommandError, match="Request was not recorded."):
+                osl_server.get_full_project_tree_with_properties()
+        finally:
+            osl_server.dispose()
+    assert [request["What"] for request in server.unmatched_requests] == [
+        "FULL_PROJECT_TREE_WITH_PROPERTIES"
+    ]
+
+
+def test_replay_notification_recorded_before_request(tmp_path, monkeypatch):
+    path = tmp_path / "session.jsonl.gz"
+    with SessionRecorder(path) as recorder:
+        recorder.record_request(queries.basic_project_info(), '{"projects":[]}', duration=0.0)
+        # notification sent while the next request was processed, i.e. recorded before it
+        recorder.record_notification(b'{"type":"PROCESSING_STARTED"}')
+        recorder.record_request(queries.full_project_tree_with_properties(), "{}", duration=10.0)
+
+    sent = []
+    monkeypatch.setattr(
+        ReplayOslServer, "send_notification", lambda self, type_, **data: sent.append(type_)
+    )
+    with ReplayOslServer(path) as server:
+        osl_server = server.create_osl_server()
+        try:
+            osl_server.get_basic_project_info()
+            time.sleep(0.2)
+            assert sent == []
+            osl_server.get_full_project_tree_with_properties()
+            time.sleep(0.2)
+            assert sent == ["PROCESSING_STARTED"]
+        finally:
+            osl_server.dispose()
+
+
+def test_session_recorder(tmp_path):
+    path = tmp_path / "session.jsonl.gz"
+    recorder = SessionRecorder(path, metadata={"project": "calculator"})
+    recorder.record_notification(b'{"type":"ACTOR_DATA_CHANGED"}')
+    # the same notification received by several listeners is recorded once
+    recorder.record_notification(b'{"type":"ACTOR_DATA_CHANGED"}')
+    recorder.record_request('{"What":"SERVER_IS_ALIVE"}', b'{"status":"success"}', 10.0)
+    recorder.record_notification(b'{"type":"ACTOR_DATA_CHANGED"}')
+    recorder.close()
+    recorder.record_request('{"What":"SERVER_INFO"}', b"{}", 0.001)
+    assert (recorder.requests, recorder.notifications) == (1, 2)
+
+    recording = SessionRecording.from_file(path)
+    assert len(recording) == 3
+    assert recording.metadata == {"project": "calculator"}
+    request = recording.records[1]
+    assert isinstance(request, RecordedRequest)
+    assert (request.request, request.response, request.duration) == (
+        '{"What":"SERVER_IS_ALIVE"}',
+        '{"status":"success"}',
+        10.0,
+    )
+    # requests are recorded with the time they were sent at
+    assert request.time == 0.0
+
+
+def test_session_recording_invalid_file(tmp_path):
+    path = tmp_path / "session.jsonl.gz"
+    with gzip.open(path, "wt") as file:
+        file.write('{"What":"SERVER_INFO"}\n')
+    with pytest.raises(ValueError, match="is not a session recording"):
+        SessionRecording.from_file(path)
+    with gzip.open(path, "wt") as file:
+        file.write('{"format":"pyoptislang-session","version":99}\n')
+    with pytest.raises(ValueError, match="Version 99"):
+        SessionRecording.from_file(path)
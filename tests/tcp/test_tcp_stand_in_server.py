@@ -0,0 +1,199 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Test the local stand-in of the optiSLang server."""
+
+import queue
+import time
+
+import pytest
+
+from ansys.optislang.core.communication_channels import CommunicationChannel
+from ansys.optislang.core.errors import OslCommandError
+from ansys.optislang.core.tcp import server_commands as commands
+from ansys.optislang.core.tcp.managers import TcpDesignManagerProxy
+from ansys.optislang.core.tcp.osl_server import TcpOslListener
+from ansys.optislang.core.tcp.project import TcpProjectProxy
+from ansys.optislang.core.tcp.stand_in_server import (
+    StandInOslServer,
+    create_project_tree,
+    create_status_info,
+)
+
+
+@pytest.fixture
+def stand_in_server():
+    servers = []
+
+    def _create(**kwargs):
+        server = StandInOslServer(**kwargs)
+        servers.append(server)
+        return server
+
+    yield _create
+    for server in servers:
+        server.close()
+
+
+def test_create_project_tree():
+    project_tree = create_project_tree(systems=3, nodes_per_system=2)
+    systems = project_tree["projects"][0]["system"]["nodes"]
+    assert [system["uid"] for system in systems] == ["system-1", "system-2", "system-3"]
+    assert [node["uid"] for node in systems[1]["nodes"]] == ["node-2-1", "node-2-2"]
+    assert all("ParameterManager" in system["properties"] for system in systems)
+
+
+def test_create_status_info():
+    status_info = create_status_info(designs=3, parameters=4, responses=2, hid="0")
+    assert [status["id"] for status in status_info["design_status"]] == ["0.1", "0.2", "0.3"]
+    assert status_info["designs"]["parameter_names"] == ["X1", "X2", "X3", "X4"]
+    assert len(status_info["designs"]["values"][2]["parameter_values"]) == 4
+    assert status_info["designs"]["values"][2]["response_values"] == [3.0, 6.0]
+
+
+def test_node_proxies(stand_in_server):
+    server = stand_in_server(project_tree=create_project_tree(2, 3), designs=20)
+    osl_server = server.create_osl_server()
+    try:
+        assert osl_server.osl_version_string == "25.1.0 (123)"
+        project = TcpProjectProxy(osl_server=osl_server, uid="root")
+        assert project.get_status() == "IDLE"
+        systems = project.root_system.get_nodes()
+        assert [system.get_name() for system in systems] == ["Sensitivity 1", "Sensitivity 2"]
+        assert [node.uid for node in systems[1].get_nodes()] == [
+            "node-2-1",
+            "node-2-2",
+            "node-2-3",
+        ]
+        assert systems[0].get_nodes()[0].get_status() == "Idle"
+        designs = TcpDesignManagerProxy(uid="system-1", osl_server=osl_server).get_designs()
+        assert [design.id for design in designs][:3] == ["0.1", "0.2", "0.3"]
+        assert len(designs) == 20
+        assert "properties" not in osl_server.get_full_project_tree()["projects"][0]["system"]
+    finally:
+        osl_server.dispose()
+
+
+def test_unsupported_requests(stand_in_server):
+    server = stand_in_server()
+    osl_server = server.create_osl_server()
+    try:
+        with pytest.raises(OslCommandError, match="No such actor"):
+            osl_server.get_actor_info("unknown")
+        with pytest.raises(OslCommandError, match="Unknown query"):
+            osl_server.get_placeholder_ids()
+        with pytest.raises(OslCommandError, match="Unknown command"):
+            osl_server.save()
+
+        server.set_query_handler("GET_PLACEHOLDER_IDS", lambda query: {"placeholder_ids": ["a"]})
+        server.set_command_handler("SAVE", lambda command: {"status": "success"})
+        assert osl_server.get_placeholder_ids() == ["a"]
+        osl_server.save()
+        assert server.commands["SAVE"] == 2
+
+        server.set_query_handler("SERVER_INFO", None)
+        with pytest.raises(OslCommandError):
+            osl_server.get_server_info()
+    finally:
+        osl_server.dispose()
+
+
+def test_set_designs(stand_in_server):
+    server = stand_in_server()
+    osl_server = server.create_osl_server()
+    try:
+        designs = [{"hid": "0.1", "responses": [{"name": "Y1", "value": 1.0}]}]
+        osl_server.set_designs(actor_uid="system-1", designs=designs)
+        assert server.get_received_designs("system-1") == designs
+        with pytest.raises(OslCommandError):
+            osl_server.set_designs(actor_uid="unknown", designs=designs)
+        osl_server.reset()
+        assert server.get_received_designs("system-1") == []
+    finally:
+        osl_server.dispose()
+
+
+def test_latency(stand_in_server):
+    server = stand_in_server(latency=0.1)
+    osl_server = server.create_osl_server()
+    try:
+        start = time.perf_counter()
+        osl_server.get_server_is_alive()
+        assert time.perf_counter() - start >= 0.1
+
+        server.latency = lambda request: 0.2 if request.get("What") == "ACTOR_INFO" else 0
+        start = time.perf_counter()
+        osl_server.get_server_is_alive()
+        assert time.perf_counter() - start < 0.1
+        start = time.perf_counter()
+        osl_server.get_actor_info("root")
+        assert time.perf_counter() - start >= 0.2
+    finally:
+        osl_server.dispose()
+
+
+def test_push_notifications(stand_in_server):
+    server = stand_in_server()
+    osl_server = server.create_osl_server()
+    listener = TcpOslListener(
+        timeout=5,
+        name="Test",
+        communication_channel=CommunicationChannel.TCP,
+        host="127.0.0.1",
+    )
+    received = queue.Queue()
+    listener.add_callback(lambda sender, response: received.put(response["type"]), ())
+    try:
+        osl_server.send_command(
+            commands.register_listener(
+                host="127.0.0.1",
+                port=listener.port,
+                notifications=["ACTOR_DATA_CHANGED"],
+                listener_uid="uid",
+            )
+        )
+        assert server.listeners["uid"] == (
+            "127.0.0.1",
+            listener.port,
+            None,
+            ["ACTOR_DATA_CHANGED"],
+        )
+        listener.start_listening()
+        assert server.send_notification("ACTOR_NAME_CHANGED") == 0
+        assert server.send_notification("ACTOR_DATA_CHANGED", uid="system-1") == 1
+        assert received.get(timeout=5) == "ACTOR_DATA_CHANGED"
+    finally:
+        listener.stop_listening()
+        listener.dispose()
+        osl_server.dispose()
+
+
+def test_start(stand_in_server):
+    server = stand_in_server()
+    osl_server = server.create_osl_server()
+    try:
+        osl_server.start(wait_for_finished=True)
+        assert server.project_state == "FINISHED"
+        assert server.commands["START"] == 1
+    finally:
+        osl_server.dispose()
@@ -0,0 +1,190 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Test execution of proxy solver callbacks by the parametric design study."""
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ansys.optislang.core.evaluation_cache import EvaluationCache
+from ansys.optislang.core.project_parametric import Design, DesignVariable
+from ansys.optislang.parametric.design_study import (
+    ParametricDesignStudy,
+    ProxySolverExecutorType,
+)
+
+
+class _Project:
+    def __init__(self, proxy_solver):
+        self.__proxy_solver = proxy_solver
+
+    def start(self, wait_for_finished=True):
+        pass
+
+    def get_status(self):
+        return "FINISHED" if self.__proxy_solver.is_finished() else "PROCESSING"
+
+
+class _ProxySolver:
+    """Hand out batches of designs, next batch once all designs of a batch were solved."""
+
+    uid = "proxy_solver"
+
+    def __init__(self, batches):
+        self.batches = [list(batch) for batch in batches]
+        self.results = []
+        self.__lock = threading.Lock()
+        self.__unsolved = set()
+
+    def is_finished(self):
+        with self.__lock:
+            return not self.batches and not self.__unsolved
+
+    def get_designs(self):
+        with self.__lock:
+            if self.__unsolved or not self.batches:
+                return []
+            batch = self.batches.pop(0)
+            self.__unsolved.update(batch)
+        return [
+            {"hid": hid, "parameters": [{"name": "X1", "value": float(hid.split(".")[1])}]}
+            for hid in batch
+        ]
+
+    def set_designs(self, designs):
+        with self.__lock:
+            for design in designs:
+                self.__unsolved.remove(design["hid"])
+                self.results.append(design)
+
+
+def _solve(design: Design) -> Design:
+    value = design.parameters[0].value
+    if value == 1:
+        time.sleep(0.2)
+    return Design(responses=[DesignVariable("Y", 2 * value)], design_id=design.id)
+
+
+def _solve_batch(designs):
+    return [_solve(design) for design in designs]
+
+
+def _execute_proxy_solver(proxy_solver, callback, **kwargs):
+    osl_instance = SimpleNamespace(
+        application=SimpleNamespace(project=_Project(proxy_solver)),
+        osl_server=None,
+        log=logging.getLogger(__name__),
+    )
+    study = ParametricDesignStudy(osl_instance, [], **kwargs)
+    study._ParametricDesignStudy__execute_proxy_solver(proxy_solver, callback)
+
+
+def test_execute_proxy_solver_batches():
+    proxy_solver = _ProxySolver([["0.1", "0.2"], ["0.3"]])
+    _execute_proxy_solver(proxy_solver, _solve_batch)
+    assert [design["hid"] for design in proxy_solver.results] == ["0.1", "0.2", "0.3"]
+    assert proxy_solver.results[2]["responses"] == [{"name": "Y", "value": 6.0}]
+
+
+@pytest.mark.parametrize("executor", [ProxySolverExecutorType.THREAD_POOL, "instance"])
+def test_execute_proxy_solver_executor(executor):
+    proxy_solver = _ProxySolver([["0.1", "0.2", "0.3"], ["0.4"]])
+    thread_pool = ThreadPoolExecutor(max_workers=3)
+    try:
+        _execute_proxy_solver(
+            proxy_solver,
+            _solve,
+            executor=thread_pool if executor == "instance" else executor,
+            max_workers=3,
+        )
+        # fast designs are sent while the slow one is still being solved
+        assert [design["hid"] for design in proxy_solver.results][-2:] == ["0.1", "0.4"]
+        assert sorted(design["hid"] for design in proxy_solver.results) == [
+            "0.1",
+            "0.2",
+            "0.3",
+            "0.4",
+        ]
+        # executor given by the user is not shut down
+        assert thread_pool.submit(int).result() == 0
+    finally:
+        thread_pool.shutdown()
+
+
+def test_execute_proxy_solver_process_pool():
+    proxy_solver = _ProxySolver([["0.2", "0.3"]])
+    _execute_proxy_solver(
+        proxy_solver, _solve, executor=ProxySolverExecutorType.PROCESS_POOL, max_workers=2
+    )
+    assert sorted(design["responses"][0]["value"] for design in proxy_solver.results) == [4, 6]
+
+
+@pytest.mark.parametrize("executor", [None, ProxySolverExecutorType.THREAD_POOL])
+def test_execute_proxy_solver_evaluation_cache(executor):
+    cache = EvaluationCache()
+    calls = []
+
+    def solve(design):
+        calls.append(design.id)
+        return _solve(design)
+
+    proxy_solver = _ProxySolver([["0.2", "0.3"], ["1.2"], ["2.3", "3.4"]])
+    _execute_proxy_solver(
+        proxy_solver,
+        solve if executor else lambda designs: [solve(design) for design in designs],
+        executor=executor,
+        evaluation_cache=cache,
+    )
+    # designs 1.2 and 2.3 have the same parameters as 0.2 and 0.3
+    assert sorted(calls) == ["0.2", "0.3", "3.4"]
+    assert (cache.hits, cache.misses) == (2, 3)
+    results = {design["hid"]: design["responses"] for design in proxy_solver.results}
+    assert results["1.2"] == results["0.2"] == [{"name": "Y", "value": 4.0}]
+    assert results["2.3"] == [{"name": "Y", "value": 6.0}]
+
+
+def test_execute_proxy_solver_executor_failure():
+    solved = []
+
+    def solve(design):
+        if design.id == "0.2":
+            time.sleep(0.1)
+            raise ValueError("Solver failed.")
+        result = _solve(design)
+        solved.append(design.id)
+        return result
+
+    proxy_solver = _ProxySolver([["0.1", "0.2", "0.3"], ["0.4"]])
+    with pytest.raises(RuntimeError, match="design 0.2") as exc_info:
+        _execute_proxy_solver(
+            proxy_solver, solve, executor=ProxySolverExecutorType.THREAD_POOL, max_workers=3
+        )
+    assert isinstance(exc_info.value.__cause__, ValueError)
+    # results finished before the failure are sent, running callbacks are waited for
+    assert [design["hid"] for design in proxy_solver.results] == ["0.3"]
+    assert sorted(solved) == ["0.1", "0.3"]
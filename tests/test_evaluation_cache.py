@@ -0,0 +1,106 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Test cache of evaluation results."""
+
+import pytest
+
+from ansys.optislang.core.evaluation_cache import EvaluationCache
+from ansys.optislang.core.json_codec import get_available_json_codecs
+
+
+def test_get_put():
+    cache = EvaluationCache()
+    assert cache.get({"a": 1, "b": 2.5}) is None
+    cache.put({"a": 1, "b": 2.5}, [{"name": "Y", "value": 3.5}])
+    # order of parameters and integral floats don't matter
+    assert cache.get([("b", 2.5), ("a", 1.0)]) == [{"name": "Y", "value": 3.5}]
+    assert cache.get({"a": 1, "b": 2.6}) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert len(cache) == 1
+
+
+def test_namespaces():
+    cache = EvaluationCache()
+    cache.put({"a": 1}, 1, namespace="first")
+    cache.put({"a": 1}, 2, namespace="second")
+    assert cache.get({"a": 1}, namespace="first") == 1
+    assert cache.get({"a": 1}, namespace="second") == 2
+    assert cache.get({"a": 1}) is None
+    cache.clear(namespace="first")
+    assert len(cache) == 1
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_non_numeric_values():
+    cache = EvaluationCache(tolerance=0.1)
+    cache.put({"a": "x", "b": True, "c": float("nan")}, 1)
+    assert cache.get({"a": "x", "b": True, "c": float("nan")}) == 1
+    assert cache.get({"a": "x", "b": 1, "c": float("nan")}) is None
+
+
+@pytest.mark.parametrize("json_codec", get_available_json_codecs())
+def test_create_key(json_codec):
+    cache = EvaluationCache(json_codec=json_codec)
+    key = cache.create_key({"b": "ü", "a": {"y": 1, "x": [2]}, "c": float("inf")})
+    assert key == '[["a",{"x":[2],"y":1}],["b","\\u00fc"],["c","inf"]]'
+
+
+def test_tolerance():
+    cache = EvaluationCache(tolerance=1e-6)
+    cache.put({"a": 1.0}, "result")
+    assert cache.get({"a": 1.0 + 1e-8}) == "result"
+    assert cache.get({"a": 1.0 + 1e-5}) is None
+
+
+def test_lru_eviction():
+    cache = EvaluationCache(max_entries=2)
+    cache.put({"a": 1}, 1)
+    cache.put({"a": 2}, 2)
+    assert cache.get({"a": 1}) == 1
+    cache.put({"a": 3}, 3)
+    assert len(cache) == 2
+    assert cache.get({"a": 2}) is None
+    assert cache.get({"a": 1}) == 1
+    assert cache.get({"a": 3}) == 3
+
+
+def test_persistence(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = EvaluationCache(path, max_entries=2)
+    cache.put({"a": 1}, 1)
+    cache.put({"a": 2}, 2)
+    cache.close()
+    cache = EvaluationCache(path, max_entries=2)
+    assert cache.path == path
+    assert cache.get({"a": 1}) == 1
+    # least recently used entry is evicted after reopening too
+    cache.put({"a": 3}, 3)
+    assert cache.get({"a": 2}) is None
+    cache.close()
+
+
+@pytest.mark.parametrize("kwargs", [{"max_entries": 0}, {"tolerance": -1}])
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        EvaluationCache(**kwargs)
@@ -0,0 +1,168 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Test evaluation of designs by a farm of optiSLang servers."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ansys.optislang.core.errors import OslCommunicationError, OslServerStartError
+from ansys.optislang.core.evaluation_farm import EvaluationFarm
+from ansys.optislang.core.project_parametric import Design, DesignVariable
+
+
+class _Optislang:
+    """Evaluate ``Y = 2 * X1``, failing after ``fail_after`` evaluated designs."""
+
+    def __init__(self, index, project_path, delay=0.0, fail_after=None):
+        self.index = index
+        self.project_path = project_path
+        self.delay = delay
+        self.fail_after = fail_after
+        self.evaluated = []
+        self.disposed = False
+        self.application = SimpleNamespace(
+            project=SimpleNamespace(root_system=SimpleNamespace(evaluate_designs=self.evaluate))
+        )
+
+    def evaluate(self, designs, chunk_size):
+        results = []
+        for design in designs:
+            if self.fail_after is not None and len(self.evaluated) >= self.fail_after:
+                raise OslCommunicationError("Server died.")
+            time.sleep(self.delay)
+            value = design.parameters[0].value
+            if value < 0:
+                raise ValueError("Negative value.")
+            self.evaluated.append(value)
+            results.append(
+                Design(
+                    parameters=design.parameters,
+                    responses=[DesignVariable("Y", 2 * value)],
+                    design_id=self.index,
+                )
+            )
+        return iter(results)
+
+    def dispose(self):
+        self.disposed = True
+
+
+class _Factory:
+    def __init__(self, kwargs=None):
+        self.kwargs = dict(kwargs or {})
+        self.instances = []
+        self.lock = threading.Lock()
+
+    def __call__(self, index, project_path):
+        with self.lock:
+            # failing instances are replaced by working ones
+            kwargs = self.kwargs.pop(index, {})
+        instance = _Optislang(index, project_path, **kwargs)
+        with self.lock:
+            self.instances.append(instance)
+        return instance
+
+
+def _designs(count):
+    return [Design(parameters={"X1": value}) for value in range(count)]
+
+
+def test_evaluate_designs_in_order():
+    factory = _Factory()
+    with EvaluationFarm(workers=4, optislang_factory=factory, chunk_size=3) as farm:
+        results = list(farm.evaluate_designs(_designs(100)))
+        assert [design.responses[0].value for design in results] == [2 * i for i in range(100)]
+        assert farm.evaluate_design(Design(parameters={"X1": 5})).responses[0].value == 10
+    assert len(factory.instances) == 4
+    assert all(instance.disposed for instance in factory.instances)
+
+
+def test_load_aware_scheduling():
+    factory = _Factory({0: {"delay": 0.02}})
+    with EvaluationFarm(workers=2, optislang_factory=factory) as farm:
+        list(farm.evaluate_designs(_designs(40)))
+    slow, fast = sorted(factory.instances, key=lambda instance: instance.index)
+    assert len(fast.evaluated) > len(slow.evaluated)
+
+
+def test_restart_failed_worker():
+    factory = _Factory({0: {"fail_after": 2}})
+    with EvaluationFarm(workers=2, optislang_factory=factory, max_restarts=1) as farm:
+        results = list(farm.evaluate_designs(_designs(20)))
+        assert [design.responses[0].value for design in results] == [2 * i for i in range(20)]
+        assert farm.restarts >= 1
+    assert sum(len(instance.evaluated) for instance in factory.instances) == 20
+
+
+def test_all_workers_failed():
+    factory = _Factory({0: {"fail_after": 1}})
+    with EvaluationFarm(workers=1, optislang_factory=factory, max_restarts=0) as farm:
+        futures = [farm.submit(design) for design in _designs(3)]
+        assert futures[0].result().responses[0].value == 0
+        with pytest.raises(RuntimeError):
+            futures[1].result()
+        assert farm.alive_workers == 0
+        with pytest.raises(RuntimeError):
+            farm.submit(Design(parameters={"X1": 1}))
+
+
+def test_design_error():
+    with EvaluationFarm(workers=2, optislang_factory=_Factory()) as farm:
+        with pytest.raises(ValueError):
+            farm.evaluate_design(Design(parameters={"X1": -1}))
+        assert farm.evaluate_design(Design(parameters={"X1": 1})).responses[0].value == 2
+        assert farm.restarts == 0
+
+
+def test_start_failure():
+    def factory(index, project_path):
+        raise OslServerStartError("License not available.")
+
+    with pytest.raises(OslServerStartError):
+        EvaluationFarm(workers=2, optislang_factory=factory, max_restarts=1)
+
+
+def test_project_copies(tmp_path):
+    project = tmp_path / "project.opf"
+    project.write_text("project")
+    factory = _Factory()
+    with EvaluationFarm(
+        project, workers=2, working_dir=tmp_path / "farm", optislang_factory=factory
+    ):
+        pass
+    paths = sorted(instance.project_path for instance in factory.instances)
+    assert paths == [tmp_path / "farm" / f"worker_{i}" / "project.opf" for i in range(2)]
+    assert all(path.read_text() == "project" for path in paths)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, {"project_path": "p.opf", "workers": 0}, {"project_path": "p.opf", "chunk_size": 0}],
+)
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        EvaluationFarm(**kwargs)
@@ -0,0 +1,128 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Test JSON codecs."""
+
+import json
+import math
+
+import pytest
+
+from ansys.optislang.core import json_codec
+from ansys.optislang.core.json_codec import (
+    JsonCodec,
+    StdlibJsonCodec,
+    get_available_json_codecs,
+    get_json_codec,
+    set_default_json_codec,
+)
+from ansys.optislang.core.tcp import server_commands, server_queries
+
+DOCUMENT = {
+    "b": [1, -2.5, 1e-300, True, None, "äöü €"],
+    "a": {"nested": [{"y": 1, "x": 2}], "empty": {}},
+}
+
+
+@pytest.fixture
+def default_codec():
+    yield
+    set_default_json_codec(None)
+
+
+@pytest.mark.parametrize("name", get_available_json_codecs())
+def test_round_trip(name):
+    codec = get_json_codec(name)
+    assert isinstance(codec, JsonCodec)
+    assert codec.name == name
+    encoded = codec.dumps(DOCUMENT)
+    assert isinstance(encoded, str)
+    assert "äöü €" in encoded
+    assert json.loads(encoded) == DOCUMENT
+    assert codec.loads(encoded) == DOCUMENT
+    assert codec.loads(encoded.encode("utf-8")) == DOCUMENT
+    assert codec.loads(bytearray(encoded.encode("utf-8"))) == DOCUMENT
+
+
+@pytest.mark.parametrize("name", get_available_json_codecs())
+def test_sort_keys(name):
+    codec = get_json_codec(name)
+    assert codec.dumps(DOCUMENT, sort_keys=True) == codec.dumps(
+        json.loads(json.dumps(DOCUMENT, sort_keys=True))
+    )
+    assert codec.dumps({"b": 1, "a": 2}, sort_keys=True).index('"a"') < codec.dumps(
+        {"b": 1, "a": 2}, sort_keys=True
+    ).index('"b"')
+
+
+@pytest.mark.parametrize("name", get_available_json_codecs())
+def test_stdlib_fallback(name):
+    codec = get_json_codec(name)
+    assert json.loads(codec.dumps({"big": pow(2, 70), 1: "int key"})) == {
+        "big": pow(2, 70),
+        "1": "int key",
+    }
+    with pytest.raises(TypeError):
+        codec.dumps({"set": {1}})
+
+
+@pytest.mark.parametrize("name", get_available_json_codecs())
+def test_invalid_document(name):
+    with pytest.raises(ValueError):
+        get_json_codec(name).loads(b'{"a": ')
+
+
+def test_get_json_codec():
+    assert get_available_json_codecs()[-1] == "json"
+    assert get_json_codec("auto").name == get_available_json_codecs()[0]
+    assert get_json_codec("json") is get_json_codec("json")
+    codec = StdlibJsonCodec()
+    assert get_json_codec(codec) is codec
+    with pytest.raises(ValueError):
+        get_json_codec("unknown")
+
+
+def test_unavailable_codec(monkeypatch):
+    monkeypatch.setattr(json_codec.MsgspecCodec, "is_available", classmethod(lambda cls: False))
+    monkeypatch.delitem(json_codec._codec_instances, "msgspec", raising=False)
+    assert "msgspec" not in get_available_json_codecs()
+    with pytest.raises(ImportError):
+        get_json_codec("msgspec")
+
+
+def test_set_default_json_codec(default_codec):
+    codec = StdlibJsonCodec()
+    set_default_json_codec(codec)
+    assert get_json_codec() is codec
+    assert server_queries.server_info() == '{"What": "SERVER_INFO"}'
+    set_default_json_codec(None)
+    assert get_json_codec().name == "json"
+
+
+def test_default_json_codec_non_finite_floats():
+    codec = get_json_codec()
+    document = {"values": [float("inf"), float("-inf")]}
+    assert codec.dumps(document) == '{"values": [Infinity, -Infinity]}'
+    assert codec.loads(codec.dumps(document)) == document
+    assert math.isnan(codec.loads('{"value": NaN}')["value"])
+    assert '"X": NaN' in server_commands.evaluate_design({"X": float("nan")})
@@ -0,0 +1,88 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test that importing the package does not load modules before they are needed."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+_HEAVY_MODULES = [
+    "ansys.optislang.core.optislang",
+    "ansys.optislang.core.tcp.osl_server",
+    "ansys.optislang.core.tcp.nodes",
+    "ansys.optislang.core.project_parametric",
+    "ansys.optislang.core.node_types",
+    "importlib.metadata",
+]
+
+
+def _get_loaded_modules(code: str) -> list:
+    script = f"import json, sys\n{code}\nprint(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, check=True, env=os.environ.copy()
+    ).stdout
+    return json.loads(output.decode().splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import ansys.optislang.core",
+        "from ansys.optislang.core import utils",
+        "import ansys.optislang.parametric",
+    ],
+)
+def test_import_does_not_load_heavy_modules(code):
+    loaded = _get_loaded_modules(code)
+    assert not set(_HEAVY_MODULES) & set(loaded)
+
+
+def test_lazy_attributes():
+    import ansys.optislang.core as core
+
+    assert "Optislang" in dir(core)
+    assert core.Optislang.__name__ == "Optislang"
+    assert core.UserLevel.__name__ == "UserLevel"
+    assert isinstance(core.__version__, str)
+    assert os.path.isdir(os.environ["OSL_EXAMPLES"])
+    with pytest.raises(AttributeError):
+        core.NotExisting
+
+
+def test_examples_path_is_set_on_access():
+    script = (
+        "import os\n"
+        "import ansys.optislang.core\n"
+        "assert 'OSL_EXAMPLES' not in os.environ\n"
+        "from ansys.optislang.core import Optislang\n"
+        "print(os.environ['OSL_EXAMPLES'])"
+    )
+    env = os.environ.copy()
+    env.pop("OSL_EXAMPLES", None)
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, check=True, env=env
+    ).stdout
+    assert os.path.isdir(output.decode().strip())
@@ -22,9 +22,12 @@
 
 from __future__ import annotations
 
+import operator
+
 import pytest
 
-from ansys.optislang.core.node_types import AddinType, NodeType
+from ansys.optislang.core import node_types
+from ansys.optislang.core.node_types import AddinType, NodeType, NodeTypeRegistry
 
 
 @pytest.mark.parametrize(
@@ -79,3 +82,78 @@ def test_node_type_class():
     assert not node_type == node_type_neq1
     assert not node_type == node_type_neq2
     assert node_type != "foo"
+
+
+def test_get_node_type_from_str():
+    """Test resolving predefined and custom node types."""
+    assert node_types.get_node_type_from_str("DLS") is node_types.DLS
+    custom = node_types.get_node_type_from_str("CustomMop_my_mop")
+    assert custom == NodeType(id="my_mop", subtype=AddinType.PYTHON_BASED_MOP_NODE_PLUGIN)
+    # node types are created only once
+    assert node_types.get_node_type_from_str("CustomMop_my_mop") is custom
+    assert node_types.get_node_type_from_str("Custom_") == NodeType(
+        id="Custom", subtype=AddinType.BUILT_IN
+    )
+    assert node_types.get_node_type_from_str("Unknown") == NodeType(
+        id="Unknown", subtype=AddinType.BUILT_IN
+    )
+
+
+def test_node_type_registry_available_node_types(tmp_path):
+    """Test storing available node types per version in a file."""
+    path = tmp_path / "available_nodes.json"
+    registry = NodeTypeRegistry(path)
+    assert registry.get_available_node_types("25.1.0") is None
+    available = registry.set_available_node_types(
+        "25.1.0",
+        {"builtin_nodes": ["Sensitivity"], "python_based_node_plugins": ["plugin"], "other": ["x"]},
+    )
+    assert available == [
+        NodeType(id="Sensitivity", subtype=AddinType.BUILT_IN),
+        NodeType(id="plugin", subtype=AddinType.PYTHON_BASED_NODE_PLUGIN),
+    ]
+    assert path.is_file()
+    # node types are created once per version, returned lists may be modified by the caller
+    stored = registry.get_available_node_types("25.1.0")
+    assert stored == available and stored is not available
+    assert all(map(operator.is_, stored, available))
+    stored.clear()
+    assert registry.get_available_node_types("25.1.0") == available
+
+    # node types are loaded from the file by a new registry
+    loaded = NodeTypeRegistry(path)
+    assert loaded.get_available_node_types("25.1.0") == available
+    assert all(
+        map(
+            operator.is_,
+            loaded.get_available_node_types("25.1.0"),
+            loaded.get_available_node_types("25.1.0"),
+        )
+    )
+    assert loaded.get_available_node_types("24.2.0") is None
+    loaded.clear("25.1.0")
+    assert loaded.get_available_node_types("25.1.0") is None
+    assert NodeTypeRegistry(path).get_available_node_types("25.1.0") is None
+
+
+def test_node_type_registry_invalid_file(tmp_path):
+    """Test that an invalid file is ignored."""
+    path = tmp_path / "available_nodes.json"
+    path.write_text("{invalid")
+    registry = NodeTypeRegistry(path)
+    assert registry.get_available_node_types("25.1.0") is None
+    registry.set_available_node_types("25.1.0", {"builtin_nodes": ["Sensitivity"]})
+    assert len(NodeTypeRegistry(path).get_available_node_types("25.1.0")) == 1
+
+
+def test_set_node_type_registry(tmp_path):
+    """Test replacing the default registry."""
+    default = node_types.get_node_type_registry()
+    registry = NodeTypeRegistry(tmp_path / "available_nodes.json")
+    try:
+        assert node_types.set_node_type_registry(registry) is registry
+        assert node_types.get_node_type_registry() is registry
+    finally:
+        node_types.set_node_type_registry(default)
+    assert node_types.set_node_type_registry() is not default
+    node_types.set_node_type_registry(default)
@@ -29,6 +29,7 @@ from ansys.optislang.core.application import Application
 from ansys.optislang.core.communication_channels import CommunicationChannel
 from ansys.optislang.core.osl_server import OslServer
 from ansys.optislang.core.project import Project
+from ansys.optislang.core.tcp.server_pool import TcpOslServerPool
 
 pytestmark = pytest.mark.local_osl
 
@@ -130,3 +131,15 @@ def test_tcp_any_ipv6():
     )
     assert osl.osl_server.host == "::1"
     osl.dispose()
+
+
+def test_server_pool():
+    "Test ``Optislang`` using a pool of pre-started servers."
+    pool = TcpOslServerPool(size=1, ini_timeout=90)
+    pool.fill()
+    with Optislang(server_pool=pool) as osl:
+        assert pool.leased_count == 1
+        assert osl.application.project is not None
+    assert pool.leased_count == 0
+    assert pool.get_idle_count() == 1
+    pool.dispose()
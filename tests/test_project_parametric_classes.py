@@ -23,6 +23,7 @@
 from __future__ import annotations
 
 import copy
+import sys
 from typing import TYPE_CHECKING, Any
 
 import pytest
@@ -35,7 +36,9 @@ from ansys.optislang.core.project_parametric import (
     CriterionValueType,
     DependentParameter,
     Design,
+    DesignSchema,
     DesignStatus,
+    DesignTable,
     DesignVariable,
     DistributionType,
     LimitStateCriterion,
@@ -1268,4 +1271,168 @@ def test_set_parameter_value(design: Design):
         assert parameter.value in [15, 20]
 
 
+@pytest.fixture
+def design_schema() -> DesignSchema:
+    return DesignSchema(parameters=["X1", "X2", "X2"], responses=["Y"])
+
+
+def test_design_schema(design_schema: DesignSchema):
+    """Test ``DesignSchema``."""
+    assert design_schema.parameters_names == ("X1", "X2", "X2")
+    assert design_schema.responses_names == ("Y",)
+    assert design_schema.constraints_names == ()
+    assert design_schema == DesignSchema(parameters=("X1", "X2", "X2"), responses=("Y",))
+    assert design_schema != DesignSchema(parameters=["X1", "X2", "X2"])
+    with pytest.raises(ValueError):
+        Design.from_schema(design_schema, parameters=[1, 2])
+
+
+def test_design_from_schema(design_schema: DesignSchema):
+    """Test designs sharing ``DesignSchema``."""
+    values = [1.0, 2.0, 3.0]
+    design = Design.from_schema(
+        design_schema, parameters=values, responses=[4.0], design_id="0.1", feasibility=True
+    )
+    other = Design.from_schema(design_schema, parameters=[5.0, 6.0, 7.0], responses=[8.0])
+    assert design.parameters_names is other.parameters_names
+    assert design.parameters == (
+        DesignVariable("X1", 1.0),
+        DesignVariable("X2", 2.0),
+        DesignVariable("X2", 3.0),
+    )
+    assert design == Design(
+        parameters=[
+            DesignVariable("X1", 1.0),
+            DesignVariable("X2", 2.0),
+            DesignVariable("X2", 3.0),
+        ],
+        responses={"Y": 4.0},
+        design_id="0.1",
+        feasibility=True,
+    )
+    assert copy.deepcopy(design.responses) == (DesignVariable("Y", 4.0),)
+
+    design.set_parameter_by_name("X1", 10.0)
+    assert values[0] == 10.0
+    assert design.responses[0].value is None
+    assert design.feasibility is None
+    with pytest.raises(RuntimeError):
+        design.set_parameter_by_name("X2", 10.0)
+
+    design.parameters[2].name = "X3"
+    design.set_parameter(DesignVariable("X4", 11.0))
+    design.remove_parameter("X1")
+    assert design.parameters_names == ("X2", "X3", "X4")
+    assert [parameter.value for parameter in design.parameters] == [2.0, 3.0, 11.0]
+    assert other.parameters_names == ("X1", "X2", "X2")
+    assert design.copy_unevaluated_design().parameters == design.parameters
+    design.clear_parameters()
+    assert design.parameters == ()
+
+
+@pytest.mark.parametrize("compact", [True, False])
+def test_design_variable_after_remove_parameter(compact: bool):
+    """Test design variables of a design keep their names and values when one is removed."""
+    if compact:
+        design = Design.from_schema(DesignSchema(parameters=["a", "b", "c"]), parameters=[1, 2, 3])
+    else:
+        design = Design(parameters={"a": 1, "b": 2, "c": 3})
+    removed, parameter = design.parameters[:2]
+    design.remove_parameter("a")
+    assert (removed.name, removed.value) == ("a", 1)
+    assert (parameter.name, parameter.value) == ("b", 2)
+    parameter.value = 5
+    assert design.parameters == (DesignVariable("b", 5), DesignVariable("c", 3))
+    removed.value = 6
+    assert design.parameters == (DesignVariable("b", 5), DesignVariable("c", 3))
+
+
+@pytest.mark.parametrize("compact", [True, False])
+def test_design_variable_after_clear_parameters(compact: bool):
+    """Test design variables of a design keep their names and values when it's cleared."""
+    if compact:
+        design = Design.from_schema(DesignSchema(parameters=["a", "b", "c"]), parameters=[1, 2, 3])
+    else:
+        design = Design(parameters={"a": 1, "b": 2, "c": 3})
+    parameter = design.parameters[1]
+    design.clear_parameters()
+    assert (parameter.name, parameter.value) == ("b", 2)
+    parameter.name = "d"
+    assert parameter == DesignVariable("d", 2)
+    assert design.parameters == ()
+
+
+# endregion
+
+
+# region TEST DESIGN TABLE
+@pytest.fixture
+def design_table() -> DesignTable:
+    return DesignTable(
+        ids=["0.1", "0.2"],
+        feasibility=[True, False],
+        status=["SUCCEEDED", "FAILED"],
+        pareto_design=[False, False],
+        objectives={"Y": [0.5, None]},
+        parameters={"X": [1.0, 2.0], "S": ["a", "b"]},
+        responses={"Y": [0.5, None], "V": [[1, 2], [3, 4]]},
+    )
+
+
+def test_design_table(design_table: DesignTable):
+    """Test ``DesignTable``."""
+    assert len(design_table) == 2
+    assert design_table.ids == ["0.1", "0.2"]
+    assert design_table.parameters["X"] == [1.0, 2.0]
+    assert design_table.constraints == {}
+    assert list(design_table.to_dict()) == [
+        "id",
+        "feasible",
+        "status",
+        "pareto_design",
+        "Y",
+        "X",
+        "S",
+        "responses.Y",
+        "V",
+    ]
+    assert "Designs: 2" in str(design_table)
+    with pytest.raises(ValueError):
+        DesignTable(ids=["0.1"], feasibility=[], status=[], pareto_design=[])
+
+
+def test_design_table_to_numpy(design_table: DesignTable):
+    """Test ``DesignTable.to_numpy``."""
+    numpy = pytest.importorskip("numpy")
+    array = design_table.to_numpy()
+    assert array.shape == (2,)
+    assert array["X"].dtype == numpy.float64
+    assert list(array["S"]) == ["a", "b"]
+    assert array["V"][1] == [3, 4]
+
+
+def test_design_table_to_pandas(design_table: DesignTable):
+    """Test ``DesignTable.to_pandas``."""
+    pytest.importorskip("pandas")
+    data_frame = design_table.to_pandas()
+    assert data_frame.shape == (2, 9)
+    assert list(data_frame["X"]) == [1.0, 2.0]
+
+
+def test_design_table_to_arrow(design_table: DesignTable):
+    """Test ``DesignTable.to_arrow``."""
+    pytest.importorskip("pyarrow")
+    table = design_table.to_arrow()
+    assert table.num_rows == 2
+    assert table.column("X").to_pylist() == [1.0, 2.0]
+
+
+@pytest.mark.parametrize("method, module", [("to_numpy", "numpy"), ("to_pandas", "pandas")])
+def test_design_table_missing_dependency(design_table: DesignTable, monkeypatch, method, module):
+    """Test that missing optional dependencies are reported."""
+    monkeypatch.setitem(sys.modules, module, None)
+    with pytest.raises(ImportError, match=module):
+        getattr(design_table, method)()
+
+
 # endregion
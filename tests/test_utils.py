@@ -21,6 +21,7 @@
 # SOFTWARE.
 
 from enum import Enum
+import os
 from socket import getaddrinfo, gethostname
 
 import pytest
@@ -82,3 +83,79 @@ def test_is_localhost(loopback_addresses, localhost_addresses):
 
     for random_address in random_addresses:
         assert utils.is_localhost(random_address) == (random_address in localhost_address)
+
+
+@pytest.fixture
+def awp_root(tmp_path, monkeypatch):
+    """Create a fake Ansys installation referenced by the ``AWP_ROOT999`` variable."""
+    for name in list(os.environ):
+        if name.startswith("AWP_ROOT"):
+            monkeypatch.delenv(name)
+    osl_dir = tmp_path / "v999" / "optiSLang"
+    osl_dir.mkdir(parents=True)
+    for exec_name in ("optislang", "optislang.com"):
+        (osl_dir / exec_name).touch()
+    monkeypatch.setenv("AWP_ROOT999", str(tmp_path / "v999"))
+    utils.invalidate_osl_exec_cache()
+    yield osl_dir
+    utils.disable_osl_exec_file_cache()
+    utils.invalidate_osl_exec_cache()
+
+
+def test_find_all_osl_exec_is_cached(awp_root, monkeypatch):
+    osl_execs = utils.find_all_osl_exec()
+    assert 999 in osl_execs
+    assert osl_execs[999][0].parent == awp_root
+    # returned dictionary is a copy
+    osl_execs.clear()
+
+    def fail():
+        raise AssertionError("Installation directories searched again.")
+
+    monkeypatch.setattr(utils, "_find_all_osl_exec", fail)
+    assert 999 in utils.find_all_osl_exec()
+    assert utils.get_osl_exec(999)[1].parent == awp_root
+
+
+def test_osl_exec_cache_invalidation(awp_root, monkeypatch):
+    assert 999 in utils.find_all_osl_exec()
+    monkeypatch.delenv("AWP_ROOT999")
+    # changed environment variables are detected
+    assert 999 not in utils.find_all_osl_exec()
+    monkeypatch.setenv("AWP_ROOT999", str(awp_root.parent))
+    assert 999 in utils.find_all_osl_exec()
+    for exec_path in awp_root.iterdir():
+        exec_path.unlink()
+    assert 999 in utils.find_all_osl_exec()
+    assert 999 not in utils.find_all_osl_exec(use_cache=False)
+    assert 999 not in utils.find_all_osl_exec()
+    (awp_root / "optislang").touch()
+    (awp_root / "optislang.com").touch()
+    utils.invalidate_osl_exec_cache()
+    assert 999 in utils.find_all_osl_exec()
+
+
+def test_osl_exec_file_cache(awp_root, tmp_path, monkeypatch):
+    cache_file = utils.enable_osl_exec_file_cache(tmp_path / "cache" / "osl_executables.json")
+    assert 999 in utils.find_all_osl_exec()
+    assert cache_file.is_file()
+
+    # cache file is used by a new process
+    searches = []
+    find_all_osl_exec = utils._find_all_osl_exec
+    monkeypatch.setattr(
+        utils, "_find_all_osl_exec", lambda: searches.append(1) or find_all_osl_exec()
+    )
+    monkeypatch.setattr(utils, "_osl_exec_memo", {})
+    assert 999 in utils.find_all_osl_exec()
+    assert searches == []
+
+    # modified directory of the executable makes the cache file invalid
+    monkeypatch.setattr(utils, "_osl_exec_memo", {})
+    (awp_root / "optislang").unlink()
+    (awp_root / "optislang.com").unlink()
+    assert 999 not in utils.find_all_osl_exec()
+    assert searches == [1]
+
+    utils.invalidate_osl_exec_cache()
+    assert not cache_file.exists()